@@ -5,6 +5,10 @@ import codecs
 import math
 import sys
 from keybench import CandidateClustererC
+from util import HierarchicalClustering
+from util import LINKAGE_STRATEGY
+from util import minhash_overlap_similarities
+from util import word_overlap_similarities
 
 ################################################################################
 # HierarchicalClusterer
@@ -16,6 +20,21 @@ def create_terminology_clusters(terminology_clusters_filepath,
                                 encoding,
                                 tokenize_function):
   """
+  Loads the term variant clusters of a terminology. The clusters sharing
+  variants are merged (union-find over an index of the clusters of each term).
+
+  @param    terminology_clusters_filepath:  The path of the term variant
+                                            clusters file (each cluster starts
+                                            with its "T" line).
+  @type     terminology_clusters_filepath:  C{string}
+  @param    encoding:                       The encoding of the file.
+  @type     encoding:                       C{string}
+  @param    tokenize_function:              The function used to tokenize the
+                                            terms.
+  @type     tokenize_function:              C{function(string) : string}
+
+  @return:  The term variant clusters (lists of tokenized terms).
+  @rtype:   C{list(list(string))}
   """
 
   terminology_clusters = []
@@ -31,24 +50,46 @@ def create_terminology_clusters(terminology_clusters_filepath,
 
     if line != "":
       if line[0] == "T":
-        tv_clusters.append(current_cluster)
+        if len(current_cluster) > 0:
+          tv_clusters.append(current_cluster)
         current_cluster = []
 
       current_cluster.append(tokenize_function(line[1:]))
+  if len(current_cluster) > 0:
+    tv_clusters.append(current_cluster)
 
   # grouping of clusters having common variants
-  deprecated_clusters = []
-  for i, i_cluster in enumerate(tv_clusters[:-1]):
-    for j, j_cluster in enumerate(tv_clusters[i + 1:]):
-      if len(list(set() & set())) > 0:
-        tv_clusters[j] = list(set(i_cluster) | set(j_cluster))
+  parents = range(len(tv_clusters))
+  term_clusters = {}
 
-        deprecated_clusters.append(i)
+  def find(cluster):
+    while parents[cluster] != cluster:
+      parents[cluster] = parents[parents[cluster]]
+      cluster = parents[cluster]
+    return cluster
+
+  for i, cluster in enumerate(tv_clusters):
+    for term in cluster:
+      if term not in term_clusters:
+        term_clusters[term] = i
+      else:
+        root1 = find(term_clusters[term])
+        root2 = find(i)
+
+        # the first cluster represents the merged clusters
+        parents[max(root1, root2)] = min(root1, root2)
 
   # clustering
+  merged_clusters = {}
   for i, cluster in enumerate(tv_clusters):
-    if i not in deprecated_clusters:
-      terminology_clusters.append(cluster)
+    root = find(i)
+
+    if root not in merged_clusters:
+      merged_clusters[root] = []
+      terminology_clusters.append(merged_clusters[root])
+    for term in cluster:
+      if term not in merged_clusters[root]:
+        merged_clusters[root].append(term)
 
   terminology_clusters_file.close()
 
@@ -102,15 +143,40 @@ class TermVariantClusterer(CandidateClustererC):
 
   def terminology_clusters(self):
     """
+    Getter of the term variant clusters of the terminology.
+
+    @return:  The term variant clusters.
+    @rtype:   C{list(list(string))}
     """
 
     return self._terminology_clusters
 
   def set_terminology_clusters(self, terminology_clusters):
     """
+    Setter of the term variant clusters of the terminology. The cluster of each
+    term is indexed.
+
+    @param  terminology_clusters: The new term variant clusters (without common
+                                  terms).
+    @type   terminology_clusters: C{list(list(string))}
     """
 
     self._terminology_clusters = terminology_clusters
+    self._term_clusters = {}
+
+    for index, terminology_cluster in enumerate(terminology_clusters):
+      for term in terminology_cluster:
+        self._term_clusters[term] = index
+
+  def term_clusters(self):
+    """
+    Getter of the index of the term variant clusters.
+
+    @return:  The index of the term variant cluster of each term.
+    @rtype:   C{dict(string, int)}
+    """
+
+    return self._term_clusters
 
   def candidate_clustering(self, pre_processed_file, candidates):
     """
@@ -125,9 +191,9 @@ class TermVariantClusterer(CandidateClustererC):
     @rtype:   C{list(list(string))}
     """
 
-    clusters = []
-    untagged_candidates = {}
+    clusters = {}
 
+    # only the candidates of the document are looked up in the terminology
     for candidate in candidates:
       untagged_candidate = ""
 
@@ -136,30 +202,17 @@ class TermVariantClusterer(CandidateClustererC):
           untagged_candidate += " "
         untagged_candidate += wt.rsplit(pre_processed_file.tag_separator(), 1)[0]
 
-      if untagged_candidate not in untagged_candidates:
-        untagged_candidates[untagged_candidate] = []
-      untagged_candidates[untagged_candidate].append(candidate)
-
-    for terminology_cluster in self.terminology_clusters():
-      cluster = list(set(terminology_cluster) & set(untagged_candidates.keys()))
-
-      if len(cluster) > 0:
-        full_cluster = []
+      if untagged_candidate in self.term_clusters():
+        index = self.term_clusters()[untagged_candidate]
 
-        for untagged_candidate in cluster:
-          for candidate in untagged_candidates[untagged_candidate]:
-            full_cluster.append(candidate)
-        clusters.append(full_cluster)
+        if index not in clusters:
+          clusters[index] = []
+        clusters[index].append(candidate)
 
-    return clusters
+    return [clusters[index] for index in sorted(clusters)]
 
 ################################################################################
 
-class LINKAGE_STRATEGY:
-  SINGLE    = 0
-  AVERAGE   = 1
-  COMPLETE  = 2
-
 class StemOverlapHierarchicalClusterer(CandidateClustererC):
   """
   Component performing a hierarchical clustering of candidates. The clustering
@@ -175,7 +228,8 @@ class StemOverlapHierarchicalClusterer(CandidateClustererC):
                debug,
                mode,
                similarity_threshold,
-               stemmer):
+               stemmer,
+               use_sparse_matrix=False):
     """
     Constructor of the component.
 
@@ -212,6 +266,10 @@ class StemOverlapHierarchicalClusterer(CandidateClustererC):
     @type   similarity_threshold: C{float}
     @param  stemmer:              The stemmer used to stem words.
     @type   stemmer:              C{nltk.stem.api.StemmerI}
+    @param  use_sparse_matrix:    True if the stem overlap similarities must be
+                                  computed with a sparse matrix product (SciPy),
+                                  False if they must be computed with sets.
+    @type   use_sparse_matrix:    C{bool}
     """
 
     super(StemOverlapHierarchicalClusterer, self).__init__(name,
@@ -222,6 +280,7 @@ class StemOverlapHierarchicalClusterer(CandidateClustererC):
     self.set_mode(mode)
     self.set_similarity_threshold(similarity_threshold)
     self.set_stemmer(stemmer)
+    self.set_use_sparse_matrix(use_sparse_matrix)
 
   def mode(self):
     """
@@ -284,6 +343,29 @@ class StemOverlapHierarchicalClusterer(CandidateClustererC):
 
     self._stemmer = stemmer
 
+  def use_sparse_matrix(self):
+    """
+    Getter of the use of a sparse matrix product to compute the similarities.
+
+    @return:  True if the similarities are computed with a sparse matrix
+              product, False if they are computed with sets.
+    @rtype:   C{bool}
+    """
+
+    return self._use_sparse_matrix
+
+  def set_use_sparse_matrix(self, use_sparse_matrix):
+    """
+    Setter of the use of a sparse matrix product to compute the similarities.
+
+    @param  use_sparse_matrix:  True if the similarities must be computed with a
+                                sparse matrix product, False if they must be
+                                computed with sets.
+    @type   use_sparse_matrix:  C{bool}
+    """
+
+    self._use_sparse_matrix = use_sparse_matrix
+
   def pos_tagged_candidate_stemming(self, pos_tagged_candidate, tag_separator):
     """
     Provides the stemmed version of a POS tagged candidate.
@@ -331,6 +413,21 @@ class StemOverlapHierarchicalClusterer(CandidateClustererC):
 
     return (float(len(intersection)) / float(len(union)))
 
+  def stem_overlap_similarities(self, stem_words):
+    """
+    Computes the overlap similarities between the stems of the candidates. Only
+    the candidates sharing stems have a similarity.
+
+    @param    stem_words: The stems of each candidate.
+    @type     stem_words: C{list(frozenset(string))}
+
+    @return:  The non-null similarity of each candidate with the following
+              candidates (similarities[i][j], for i < j).
+    @rtype:   C{list(dict(int, float))}
+    """
+
+    return word_overlap_similarities(stem_words, self.use_sparse_matrix())
+
   def candidate_clustering(self, pre_processed_file, candidates):
     """
     Clusters the candidates that have been extracted from an analysed file.
@@ -344,129 +441,208 @@ class StemOverlapHierarchicalClusterer(CandidateClustererC):
     @rtype:   C{list(list(string))}
     """
 
-    nodes = []
-    clusters = {}
-    lazy_pairs = {}
-    lazy_stems = {}
-    lazy_t_t_sims = {}
-    lazy_max_t_n_sims = {}
-    lazy_average_t_n_sims = {}
-    lazy_min_t_n_sims = {}
-
-    # fill the structures for the lazy loading and initialize the nodes
+    stem_words = self.candidate_stem_words(pre_processed_file, candidates)
+
+    return self.similarity_clustering(candidates,
+                                      self.stem_overlap_similarities(stem_words))
+
+  def candidate_stem_words(self, pre_processed_file, candidates):
+    """
+    Gives the stems of the candidates.
+
+    @param    pre_processed_file: The pre-processed analysed file.
+    @type     pre_processed_file: C{PreProcessedFile}
+    @param    candidates:         The candidates to stem.
+    @type     candidates:         C{list(string)}
+
+    @return:  The stems of each candidate.
+    @rtype:   C{list(frozenset(string))}
+    """
+
+    stem_words = []
+
     for candidate in candidates:
       stem = self.pos_tagged_candidate_stemming(candidate,
                                                 pre_processed_file.tag_separator())
-      lazy_stems[candidate] = stem
-      lazy_t_t_sims[stem] = {}
-      lazy_max_t_n_sims[stem] = {}
-      lazy_average_t_n_sims[stem] = {}
-      lazy_min_t_n_sims[stem] = {}
-
-      nodes.append([candidate])
-
-    # start the clustering
-    stabilized = False
-    while not stabilized:
-      best_node1 = []
-      best_node1_index = 0
-      best_node2 = []
-      best_node2_index = 0
-      best_sim = -1.0
-
-      ##### computing all similarity pairs #####################################
-      for node1_index, node1 in enumerate(nodes):
-        key1 = hash(str(node1))
-
-        if not lazy_pairs.has_key(key1):
-          lazy_pairs[key1] = {}
-
-        for node2_index, node2 in enumerate(nodes[node1_index:]):
-          # the given index is not related to the nodes list (fix it)
-          node2_index += node1_index
-
-          if node2 != node1:
-            key2 = hash(str(node2))
-            max_sim_n1_n2 = 0.0
-            average_sim_n1_n2 = 0.0
-            min_sim_n1_n2 = 1.0
-
-            if not lazy_pairs.has_key(key2):
-              lazy_pairs[key2] = {}
-
-            if not lazy_pairs[key1].has_key(key2):
-              for candidate1 in node1:
-                stem1 = lazy_stems[candidate1]
-                max_sim_t1_n2 = 0.0
-                average_sim_t1_n2 = 0.0
-                min_sim_t1_n2 = 1.0
-
-                if not lazy_max_t_n_sims[stem1].has_key(key2):
-                  for candidate2 in node2:
-                    stem2 = lazy_stems[candidate2]
-                    sim_t1_t2 = 0.0
-
-                    # compute the similarity between stem1 and stem2
-                    if not lazy_t_t_sims[stem1].has_key(stem2):
-                      sim_t1_t2 = self.simple_word_overlap_similarity(stem1,
-                                                                      stem2)
-                      lazy_t_t_sims[stem1][stem2] = sim_t1_t2
-                      lazy_t_t_sims[stem2][stem1] = sim_t1_t2
-                    else:
-                      sim_t1_t2 = lazy_t_t_sims[stem1][stem2]
-                    max_sim_t1_n2 = max(max_sim_t1_n2, sim_t1_t2)
-                    average_sim_t1_n2 += sim_t1_t2
-                    min_sim_t1_n2 = min(min_sim_t1_n2, sim_t1_t2)
-
-                  lazy_max_t_n_sims[stem1][key2] = max_sim_t1_n2
-                  lazy_average_t_n_sims[stem1][key2] = average_sim_t1_n2
-                  lazy_min_t_n_sims[stem1][key2] = min_sim_t1_n2
-                else:
-                  max_sim_t1_n2 = lazy_max_t_n_sims[stem1][key2]
-                  average_sim_t1_n2 += lazy_average_t_n_sims[stem1][key2]
-                  min_sim_t1_n2 = lazy_min_t_n_sims[stem1][key2]
-
-                # re-compute similarities between nodes (clusters)
-                max_sim_n1_n2 = max(max_sim_n1_n2, max_sim_t1_n2)
-                average_sim_n1_n2 += average_sim_t1_n2
-                min_sim_n1_n2 = min(min_sim_n1_n2, min_sim_t1_n2)
-
-              average_sim_n1_n2 /= float(len(node1) * len(node2))
-
-              # choice of the effective similarity according to the mode
-              if self.mode() == LINKAGE_STRATEGY.SINGLE:
-                sim_n1_n2 = min_sim_n1_n2
-              else:
-                if self.mode() == LINKAGE_STRATEGY.AVERAGE:
-                  sim_n1_n2 = average_sim_n1_n2
-                else:
-                  sim_n1_n2 = max_sim_n1_n2
-
-              lazy_pairs[key1][key2] = sim_n1_n2
-              lazy_pairs[key2][key1] = sim_n1_n2
-            else:
-              sim_n1_n2 = lazy_pairs[key1][key2]
-
-            if sim_n1_n2 > best_sim:
-              best_node1 = node1
-              best_node1_index = node1_index
-              best_node2 = node2
-              best_node2_index = node2_index
-              best_sim = sim_n1_n2
-
-      ##### selecting the nodes to group #######################################
-      if best_sim >= self.similarity_threshold():
-        nodes.pop(best_node1_index)
-        # the index is decreased after the best_node1 removal
-        nodes.pop(best_node2_index - 1)
-
-        for candidate in best_node2:
-          best_node1.append(candidate)
-        nodes.append(best_node1)
-      else:
-        stabilized = True
 
-    # reordered so the first nodes are the last created
-    nodes.reverse()
-    return nodes
+      stem_words.append(frozenset(stem.split()))
+
+    return stem_words
+
+  def similarity_clustering(self, candidates, similarities):
+    """
+    Clusters candidates given their similarities.
+
+    @param    candidates:   The candidates to cluster.
+    @type     candidates:   C{list(string)}
+    @param    similarities: The non-null similarity of each candidate with the
+                            following candidates (similarities[i][j], for
+                            i < j).
+    @type     similarities: C{list(dict(int, float))}
+
+    @return:  A list of clusters (lists of candidates), the last created first.
+    @rtype:   C{list(list(string))}
+    """
+
+    clustering = HierarchicalClustering(self.mode(),
+                                        self.similarity_threshold())
+
+    return [[candidates[i] for i in cluster] \
+            for cluster in clustering.cluster(len(candidates), similarities)]
+
+################################################################################
+
+class MinHashStemOverlapClusterer(StemOverlapHierarchicalClusterer):
+  """
+  Component performing an approximate hierarchical clustering of candidates,
+  for documents having too many candidates to compare every pair of candidates
+  sharing stems. The pairs of candidates to compare are proposed by
+  locality-sensitive hashing of the MinHash signatures of their stems, so that
+  the pairs of dissimilar candidates are probably not compared. More bands give
+  a clustering closer to the one of C{StemOverlapHierarchicalClusterer}, larger
+  bands give a faster clustering.
+  """
+
+  def __init__(self,
+               name,
+               is_lazy,
+               lazy_directory,
+               debug,
+               mode,
+               similarity_threshold,
+               stemmer,
+               nb_bands,
+               band_size):
+    """
+    Constructor of the component.
+
+    @param  name:                 The name of the component.
+    @type   name:                 C{string}
+    @param  is_lazy:              True if the component must load previous data,
+                                  False if data must be computed tought they
+                                  have already been computed.
+    @type   is_lazy:              C{bool}
+    @param  lazy_directory:       The directory used to store previously
+                                  computed data.
+    @type   lazy_directory:       C{string}
+    @param  debug:                True if the component is in debug mode, else
+                                  False. When the component is in debug mode, it
+                                  will output each step of its processing.
+    @type   debug:                C{bool}
+    @param  mode:                 The linkage strategy to use for the
+                                  clustering.
+    @type   mode:                 C{LINKAGE_STRATEGY}
+    @param  similarity_threshold: The similarity threshold to respect when
+                                  clustering.
+    @type   similarity_threshold: C{float}
+    @param  stemmer:              The stemmer used to stem words.
+    @type   stemmer:              C{nltk.stem.api.StemmerI}
+    @param  nb_bands:             The number of bands of the MinHash signatures.
+    @type   nb_bands:             C{int}
+    @param  band_size:            The number of MinHash values of each band.
+    @type   band_size:            C{int}
+    """
+
+    super(MinHashStemOverlapClusterer, self).__init__(name,
+                                                      is_lazy,
+                                                      lazy_directory,
+                                                      debug,
+                                                      mode,
+                                                      similarity_threshold,
+                                                      stemmer)
+
+    self.set_nb_bands(nb_bands)
+    self.set_band_size(band_size)
+
+  def nb_bands(self):
+    """
+    Getter of the number of bands of the MinHash signatures.
+
+    @return:  The number of bands.
+    @rtype:   C{int}
+    """
+
+    return self._nb_bands
+
+  def set_nb_bands(self, nb_bands):
+    """
+    Setter of the number of bands of the MinHash signatures.
+
+    @param  nb_bands: The new number of bands.
+    @type   nb_bands: C{int}
+    """
+
+    self._nb_bands = nb_bands
+
+  def band_size(self):
+    """
+    Getter of the number of MinHash values of each band.
+
+    @return:  The size of the bands.
+    @rtype:   C{int}
+    """
+
+    return self._band_size
+
+  def set_band_size(self, band_size):
+    """
+    Setter of the number of MinHash values of each band.
+
+    @param  band_size: The new size of the bands.
+    @type   band_size: C{int}
+    """
+
+    self._band_size = band_size
+
+  def stem_overlap_similarities(self, stem_words):
+    """
+    Computes the overlap similarities between the stems of the candidates. Only
+    the candidates proposed by the locality-sensitive hashing have a similarity.
+
+    @param    stem_words: The stems of each candidate.
+    @type     stem_words: C{list(frozenset(string))}
+
+    @return:  The non-null similarity of each candidate with the following
+              proposed candidates (similarities[i][j], for i < j).
+    @rtype:   C{list(dict(int, float))}
+    """
+
+    return minhash_overlap_similarities(stem_words,
+                                        self.nb_bands(),
+                                        self.band_size())
+
+  def divergence(self, pre_processed_file, candidates):
+    """
+    Measures how much the approximate clustering diverges from the exact
+    clustering, as the proportion of pairs of candidates clustered together by
+    only one of the two clusterings (among the pairs clustered together by at
+    least one of them).
+
+    @param    pre_processed_file: The pre-processed analysed file.
+    @type     pre_processed_file: C{PreProcessedFile}
+    @param    candidates:         The candidates to cluster.
+    @type     candidates:         C{list(string)}
+
+    @return:  The divergence, between 0 (same clusters) and 1.
+    @rtype:   C{float}
+    """
 
+    stem_words = self.candidate_stem_words(pre_processed_file, candidates)
+    exact_similarities = word_overlap_similarities(stem_words,
+                                                   self.use_sparse_matrix())
+    approximate_similarities = self.stem_overlap_similarities(stem_words)
+    pairs = []
+
+    for similarities in (exact_similarities, approximate_similarities):
+      clusters = self.similarity_clustering(candidates, similarities)
+      clustered_pairs = set()
+
+      for cluster in clusters:
+        for i, candidate1 in enumerate(cluster):
+          for candidate2 in cluster[i + 1:]:
+            clustered_pairs.add(frozenset([candidate1, candidate2]))
+      pairs.append(clustered_pairs)
+
+    if len(pairs[0] | pairs[1]) == 0:
+      return 0.0
+    return float(len(pairs[0] ^ pairs[1])) / float(len(pairs[0] | pairs[1]))
@@ -2,15 +2,28 @@
 # -*- encoding: utf-8 -*-
 
 import codecs
+import pickle
 import re
+from hashlib import md5
+from inspect import isclass
 from keybench import CandidateExtractorC
 from keybench.default import NGramExtractor
-from keybench.default.util import n_to_m_grams
 from multiprocessing import Pool
 from nltk import Tree
 from nltk.chunk.regexp import RegexpParser
 from os import path
 from os import listdir
+from os import getpid
+from os import makedirs
+from os import rename
+from os import stat
+from util import compile_tagged_word_patterns
+from util import contiguous_count
+from util import NounPhraseIndex
+from util import TagChunker
+from util import TermAutomaton
+from util import UNKNOWN_TAG_ID
+from util import vocabulary
 
 ################################################################################
 # NPChunkExtractor
@@ -24,6 +37,35 @@ from os import listdir
 
 ################################################################################
 
+def pattern_match_span(sentence, match):
+  """
+  Gives the candidate matched by a regular expression in a POS tagged sentence,
+  along with its token offsets.
+
+  @param    sentence: The POS tagged sentence.
+  @type     sentence: C{string}
+  @param    match:    The match of the regular expression in the sentence.
+  @type     match:    C{re.MatchObject}
+
+  @return:  The matched candidate, its start token offset and its end token
+            offset.
+  @rtype:   C{tuple(string, int, int)}
+  """
+
+  matched_text = match.group(0)
+  candidate = matched_text.strip()
+  start_character = match.start() + len(matched_text) - len(matched_text.lstrip())
+  preceding_text = sentence[:start_character]
+  start = len(preceding_text.split())
+
+  # the match starts within a word
+  if preceding_text != "" and not preceding_text[-1].isspace():
+    start -= 1
+
+  return candidate, start, start + len(candidate.split())
+
+################################################################################
+
 class NPChunkExtractor(CandidateExtractorC):
   """
   Component performing candidate terms extraction. It extracts NP chunks (based
@@ -56,6 +98,13 @@ class NPChunkExtractor(CandidateExtractorC):
 
     self.set_np_chunker(RegexpParser("NP: " + rule))
 
+    # the rule is compiled into a tag sequence matcher, when possible, to avoid
+    # building parse trees
+    try:
+      self._tag_chunker = TagChunker(rule)
+    except ValueError:
+      self._tag_chunker = None
+
   def np_chunker(self):
     """
     Getter of the chunker used to extract the NP chunks.
@@ -83,15 +132,20 @@ class NPChunkExtractor(CandidateExtractorC):
     @param    pre_processed_file: The pre-processed analysed file.
     @type     pre_processed_file: C{PreProcessedFile}
 
-    @return:  A list of candidates.
-    @rtype:   C{list(string)}
+    @return:  A list of candidate spans (candidate, sentence index, start token
+              offset, end token offset).
+    @rtype:   C{list(tuple(string, int, int, int))}
     """
 
+    if self.tag_chunker() != None:
+      return self.tag_chunker_candidate_extraction(pre_processed_file)
+
     sentences = pre_processed_file.full_text()
-    candidates = []
+    candidate_spans = []
     
-    for sentence in sentences:
+    for sentence_index, sentence in enumerate(sentences):
       sentence_tree = []
+      position = 0
 
       for wt in sentence.split():
         sentence_tree.append(tuple(wt.rsplit(pre_processed_file.tag_separator(),
@@ -109,9 +163,55 @@ class NPChunkExtractor(CandidateExtractorC):
               candidate += word + pre_processed_file.tag_separator() + tag
 
             if self.filtering(candidate, pre_processed_file.tag_separator()):
-              candidates.append(candidate)
+              candidate_spans.append((candidate,
+                                      sentence_index,
+                                      position,
+                                      position + len(child.leaves())))
+          position += len(child.leaves())
+        else:
+          position += 1
+
+    return candidate_spans
+
+  def tag_chunker(self):
+    """
+    Getter of the matcher compiled from the chunk rule.
+
+    @return:  The compiled chunker, or None if the rule can not be compiled
+              (the NLTK parser is used instead).
+    @rtype:   C{TagChunker}
+    """
+
+    return self._tag_chunker
+
+  def tag_chunker_candidate_extraction(self, pre_processed_file):
+    """
+    Extracts the candidates from a pre-processed file, using the compiled
+    chunker. The whole document is chunked at once.
+
+    @param    pre_processed_file: The pre-processed analysed file.
+    @type     pre_processed_file: C{PreProcessedFile}
+
+    @return:  A list of candidate spans (candidate, sentence index, start token
+              offset, end token offset).
+    @rtype:   C{list(tuple(string, int, int, int))}
+    """
+
+    tagged_sentences = []
+    tag_sequences = []
+    candidate_spans = []
+
+    for tagged_words, words, tags in pre_processed_file.full_text_tokens():
+      tagged_sentences.append(tagged_words)
+      tag_sequences.append(tags)
+
+    for sentence_index, start, end in self.tag_chunker().chunks(tag_sequences):
+      candidate = " ".join(tagged_sentences[sentence_index][start:end])
 
-    return candidates
+      if self.filtering(candidate, pre_processed_file.tag_separator()):
+        candidate_spans.append((candidate, sentence_index, start, end))
+
+    return candidate_spans
 
   def filtering(self, term, tag_separator):
     """
@@ -182,23 +282,23 @@ class STFilteredNGramExtractor(NGramExtractor):
 
   def stop_words(self):
     """
-    Getter of the list of stop words.
+    Getter of the set of stop words.
 
-    @return:  The list of stop words used to filter the n-grams.
-    @rtype:   C{list(string)}
+    @return:  The (shared) set of stop words used to filter the n-grams.
+    @rtype:   C{frozenset(string)}
     """
 
     return self._stop_words
 
   def set_stop_words(self, stop_words):
     """
-    Setter of the list of stop words.
+    Setter of the set of stop words.
 
-    @param  stop_words: The new list of stop words used to filter the n-grams.
+    @param  stop_words: The new stop words used to filter the n-grams.
     @type   stop_words: C{list(string)}
     """
 
-    self._stop_words = stop_words
+    self._stop_words = vocabulary(stop_words)
 
   def filtering(self, term, tag_separator):
     """
@@ -225,7 +325,7 @@ class STFilteredNGramExtractor(NGramExtractor):
       # only candidate with first and last words not included into the stop word
       # list are accepted
       if i == 0 or i == (len(tagged_words) - 1):
-        if self.stop_words().count(word) > 0:
+        if word in self.stop_words():
           return False
 
       # FIXME semeval trick
@@ -285,6 +385,25 @@ class PatternMatchingExtractor(CandidateExtractorC):
 
     self._patterns = patterns
 
+    # the patterns are compiled into one automaton matching all of them at once
+    # over the tags, when they are expressed with tagged words
+    try:
+      self._pattern_automaton, self._pattern_tag_separator = compile_tagged_word_patterns(patterns)
+    except ValueError:
+      self._pattern_automaton = None
+      self._pattern_tag_separator = None
+
+  def pattern_automaton(self):
+    """
+    Getter of the automaton recognizing the patterns.
+
+    @return:  The automaton recognizing the patterns, or None if the patterns
+              can not be compiled (regular expressions are used instead).
+    @rtype:   C{TagAutomaton}
+    """
+
+    return self._pattern_automaton
+
   def candidate_extraction(self, pre_processed_file):
     """
     Extracts the candidates from a pre-processed file.
@@ -295,18 +414,22 @@ class PatternMatchingExtractor(CandidateExtractorC):
     @param    pre_processed_file: The pre-processed analysed file.
     @type     pre_processed_file: C{PreProcessedFile}
 
-    @return:  A list of candidates.
-    @rtype:   C{list(string)}
+    @return:  A list of candidate spans (candidate, sentence index, start token
+              offset, end token offset).
+    @rtype:   C{list(tuple(string, int, int, int))}
     """
 
+    if self.pattern_automaton() != None:
+      return self.automaton_candidate_extraction(pre_processed_file)
+
     sentences = pre_processed_file.full_text()
-    candidates = []
+    candidate_spans = []
 
-    for sentence in sentences:
+    for sentence_index, sentence in enumerate(sentences):
       # pattern matching
       for pattern in self.patterns():
         for match in re.finditer(pattern, sentence):
-          candidate = match.group(0).strip()
+          candidate, start, end = pattern_match_span(sentence, match)
           accepted = True
           
           if candidate != "":
@@ -317,9 +440,55 @@ class PatternMatchingExtractor(CandidateExtractorC):
                 accepted = False
 
             if accepted:
-              candidates.append(candidate)
+              candidate_spans.append((candidate, sentence_index, start, end))
+
+    return candidate_spans
+
+  def automaton_candidate_extraction(self, pre_processed_file):
+    """
+    Extracts the candidates from a pre-processed file, using the automaton
+    compiled from the patterns. The candidates are the same as the ones given by
+    the regular expressions, in the same order (pattern by pattern).
+
+    @param    pre_processed_file: The pre-processed analysed file.
+    @type     pre_processed_file: C{PreProcessedFile}
+
+    @return:  A list of candidate spans (candidate, sentence index, start token
+              offset, end token offset).
+    @rtype:   C{list(tuple(string, int, int, int))}
+    """
+
+    automaton = self.pattern_automaton()
+    pattern_tag_separator = self._pattern_tag_separator
+    tag_separator = pre_processed_file.tag_separator()
+    candidate_spans = []
 
-    return candidates
+    for sentence_index, sentence in enumerate(pre_processed_file.full_text()):
+      # the tokens are delimited as the regular expressions do it
+      tokens = sentence.split(" ")
+      tag_ids = []
+      short_words = []
+      word_offsets = [0] # offset of each token among the non empty tokens
+
+      for token in tokens:
+        word_and_tag = token.rsplit(pattern_tag_separator, 1)
+
+        if len(word_and_tag) == 2 and word_and_tag[0] != "":
+          tag_ids.append(automaton.tag_id(word_and_tag[1]))
+        else:
+          tag_ids.append(UNKNOWN_TAG_ID)
+        # FIXME semeval trick
+        short_words.append(len(token.rsplit(tag_separator, 1)[0]) <= 2)
+        word_offsets.append(word_offsets[-1] + int(token != ""))
+
+      for pattern_index, start, end in automaton.matches(tag_ids):
+        if not any(short_words[start:end]):
+          candidate_spans.append((" ".join(tokens[start:end]),
+                                  sentence_index,
+                                  word_offsets[start],
+                                  word_offsets[end]))
+
+    return candidate_spans
 
 ################################################################################
 
@@ -341,8 +510,9 @@ def noun_phrase_extraction_pool_worker(arguments):
 def train_clarit(train_directory,
                  file_extension,
                  pre_processor,
-                 candidate_extractor): # must be a noun phrase extractor
-  working_pool = Pool()
+                 candidate_extractor, # must be a noun phrase extractor
+                 nb_processes=None):
+  working_pool = Pool(nb_processes)
   pool_args = []
   nps = []
 
@@ -356,6 +526,8 @@ def train_clarit(train_directory,
 
   noun_phrase_sets = working_pool.map(noun_phrase_extraction_pool_worker,
                                       pool_args)
+  working_pool.close()
+  working_pool.join()
 
   for noun_phrases in noun_phrase_sets:
     for noun_phrase in noun_phrases:
@@ -364,6 +536,176 @@ def train_clarit(train_directory,
 
   return nps
 
+##### Training models ##########################################################
+
+# version of the stored CLARIT'96 models (must be changed when the content of
+# the models changes)
+CLARIT96_MODEL_VERSION = 1
+
+# CLARIT'96 models (training noun phrase indexes) loaded by the process, by
+# model file. The models are loaded once and shared by all the extractors (and
+# by the workers forked after they are loaded)
+clarit96_models = {}
+
+def pre_processor_configuration(pre_processor):
+  """
+  Describes the configuration of a pre-processor: its class, its encoding, its
+  tag separator and the class and the simple settings (strings, numbers and
+  booleans) of its tools (tokenizers, POS tagger, file representation).
+
+  @param    pre_processor:  The pre-processor to describe.
+  @type     pre_processor:  C{PreProcessorC}
+
+  @return:  The description of the pre-processor.
+  @rtype:   C{tuple}
+  """
+
+  tools = []
+
+  for attribute, tool in sorted(vars(pre_processor).items()):
+    if isclass(tool):
+      tools.append((attribute, tool.__module__, tool.__name__))
+    elif hasattr(tool, "__dict__"):
+      settings = sorted((setting, value) \
+                        for setting, value in vars(tool).items() \
+                        if isinstance(value, (basestring, int, long, float)))
+
+      tools.append((attribute,
+                    tool.__class__.__module__,
+                    tool.__class__.__name__,
+                    settings))
+
+  return (pre_processor.__class__.__module__,
+          pre_processor.__class__.__name__,
+          pre_processor.encoding(),
+          pre_processor.tag_separator(),
+          tools)
+
+def clarit96_model_filepath(model_directory,
+                            train_directory,
+                            file_extension,
+                            pre_processor,
+                            candidate_extractor):
+  """
+  Gives the path of the CLARIT'96 model trained on a given corpus with a given
+  pre-processor and a given noun phrase extractor. The training documents are
+  identified by their name, size and last modification, so that a model is
+  trained again when a document changes.
+
+  @param    model_directory:      The directory where the models are stored.
+  @type     model_directory:      C{string}
+  @param    train_directory:      The directory of the training documents.
+  @type     train_directory:      C{string}
+  @param    file_extension:       The extension of the training documents.
+  @type     file_extension:       C{string}
+  @param    pre_processor:        The pre-processor of the training documents.
+  @type     pre_processor:        C{PreProcessorC}
+  @param    candidate_extractor:  The noun phrase extractor.
+  @type     candidate_extractor:  C{PatternMatchingExtractor}
+
+  @return:  The path of the model file.
+  @rtype:   C{string}
+  """
+
+  train_files = []
+
+  for filename in listdir(train_directory):
+    if filename.rfind(file_extension) >= 0 \
+       and len(filename) - filename.rfind(file_extension) == len(file_extension):
+      train_stat = stat(path.join(train_directory, filename))
+
+      train_files.append((filename, train_stat.st_size, train_stat.st_mtime))
+
+  configuration = repr((path.abspath(train_directory),
+                        file_extension,
+                        sorted(train_files),
+                        pre_processor_configuration(pre_processor),
+                        candidate_extractor.__class__.__name__,
+                        candidate_extractor.patterns()))
+
+  return path.join(model_directory,
+                   "clarit96_v%d_%s.mdl"%(CLARIT96_MODEL_VERSION,
+                                          md5(configuration).hexdigest()))
+
+def train_clarit96_model(train_directory,
+                         file_extension,
+                         pre_processor,
+                         candidate_extractor, # must be a noun phrase extractor
+                         model_directory,
+                         nb_processes=None):
+  """
+  Trains the CLARIT'96 model (index of the training noun phrases) of a corpus,
+  unless it has already been trained and stored. The model is written to a
+  temporary file first, so that an interrupted training leaves no model.
+
+  @param    train_directory:      The directory of the training documents.
+  @type     train_directory:      C{string}
+  @param    file_extension:       The extension of the training documents.
+  @type     file_extension:       C{string}
+  @param    pre_processor:        The pre-processor of the training documents.
+  @type     pre_processor:        C{PreProcessorC}
+  @param    candidate_extractor:  The noun phrase extractor.
+  @type     candidate_extractor:  C{PatternMatchingExtractor}
+  @param    model_directory:      The directory where the models are stored.
+  @type     model_directory:      C{string}
+  @param    nb_processes:         The number of training documents processed
+                                  simultaneously (the number of CPUs if None).
+  @type     nb_processes:         C{int}
+
+  @return:  The path of the model file, to give to C{CLARIT96Extractor}.
+  @rtype:   C{string}
+  """
+
+  model_filepath = clarit96_model_filepath(model_directory,
+                                           train_directory,
+                                           file_extension,
+                                           pre_processor,
+                                           candidate_extractor)
+
+  if not path.exists(model_filepath):
+    model = NounPhraseIndex(train_clarit(train_directory,
+                                         file_extension,
+                                         pre_processor,
+                                         candidate_extractor,
+                                         nb_processes))
+    temporary_filepath = "%s.%d.tmp"%(model_filepath, getpid())
+
+    if not path.exists(model_directory):
+      makedirs(model_directory)
+    model_file = open(temporary_filepath, "wb")
+    pickle.dump((CLARIT96_MODEL_VERSION, model),
+                model_file,
+                pickle.HIGHEST_PROTOCOL)
+    model_file.close()
+    rename(temporary_filepath, model_filepath)
+
+    clarit96_models[model_filepath] = model
+
+  return model_filepath
+
+def load_clarit96_model(model_filepath):
+  """
+  Gives a CLARIT'96 model, loading it if it is not already loaded.
+
+  @param    model_filepath: The path of the model file.
+  @type     model_filepath: C{string}
+
+  @return:  The index of the training noun phrases.
+  @rtype:   C{NounPhraseIndex}
+  """
+
+  if model_filepath not in clarit96_models:
+    model_file = open(model_filepath, "rb")
+    version, model = pickle.load(model_file)
+    model_file.close()
+
+    if version != CLARIT96_MODEL_VERSION:
+      raise ValueError("%s is a version %d CLARIT'96 model (version %d expected)"%(model_filepath, version, CLARIT96_MODEL_VERSION))
+
+    clarit96_models[model_filepath] = model
+
+  return clarit96_models[model_filepath]
+
 ################################################################################
 
 class CLARIT96Extractor(PatternMatchingExtractor):
@@ -380,7 +722,7 @@ class CLARIT96Extractor(PatternMatchingExtractor):
                lexical_atom_patterns,
                special_phrase_patterns,
                impossible_phrase_patterns,
-               train_noun_phrases):
+               train_model_filepath):
     """
     Constructor of the component.
 
@@ -397,8 +739,9 @@ class CLARIT96Extractor(PatternMatchingExtractor):
                             When the component is in debug mode, it will output
                             each step of its processing.
     @type   debug:          C{bool}
-    TODO train_noun_phrases
-    TODO train_noun_phrases
+    @param  train_model_filepath: The path of the trained model (see
+                                  C{train_clarit96_model}).
+    @type   train_model_filepath: C{string}
     TODO noun_phrase_patterns
     TODO noun_phrase_patterns
     TODO
@@ -418,7 +761,7 @@ class CLARIT96Extractor(PatternMatchingExtractor):
     self.set_lexical_atom_patterns(lexical_atom_patterns)
     self.set_special_phrase_patterns(special_phrase_patterns)
     self.set_impossible_phrase_patterns(impossible_phrase_patterns)
-    self.set_train_noun_phrases(train_noun_phrases)
+    self.set_train_model_filepath(train_model_filepath)
 
   def lexical_atom_patterns(self):
     """
@@ -456,17 +799,36 @@ class CLARIT96Extractor(PatternMatchingExtractor):
 
     self._impossible_phrase_patterns = impossible_phrase_patterns
 
-  def train_noun_phrases(self):
+  def train_model_filepath(self):
     """
+    Getter of the path of the trained model.
+
+    @return:  The path of the model file.
+    @rtype:   C{string}
     """
 
-    return self._train_noun_phrases
+    return self._train_model_filepath
 
-  def set_train_noun_phrases(self, train_noun_phrases):
+  def set_train_model_filepath(self, train_model_filepath):
     """
+    Setter of the path of the trained model. Only the path is kept by the
+    component, so that the model is not copied with it to the workers.
+
+    @param  train_model_filepath: The path of the new model file.
+    @type   train_model_filepath: C{string}
     """
 
-    self._train_noun_phrases = train_noun_phrases
+    self._train_model_filepath = train_model_filepath
+
+  def train_noun_phrase_index(self):
+    """
+    Getter of the index of the training noun phrases (the trained model).
+
+    @return:  The word and word pair counts of the training noun phrases.
+    @rtype:   C{NounPhraseIndex}
+    """
+
+    return load_clarit96_model(self.train_model_filepath())
 
   def continuous_frequencies(self):
     """
@@ -565,234 +927,182 @@ class CLARIT96Extractor(PatternMatchingExtractor):
 
     return False
 
-  def frequency(self, phrase, noun_phrases, lazy_dic):
+  def phrase_words(self, phrase):
     """
-    """
-
-    if phrase not in lazy_dic:
-      phrase_count = 0.0
+    Splits a (possibly grouped) phrase into its POS tagged words.
 
-      for noun_phrase in noun_phrases:
-        phrase_count += float(noun_phrase.count(phrase))
-      lazy_dic[phrase] = phrase_count
+    @param    phrase: The phrase to split.
+    @type     phrase: C{string}
 
-      return phrase_count
-    else:
-      return lazy_dic[phrase]
-
-  def continuous_frequency(self, pair, noun_phrases, sub_lazy_dic):
-    """
+    @return:  The words of the phrase.
+    @rtype:   C{tuple(string)}
     """
 
-    phrase1 = pair[0].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
-    phrase2 = pair[1].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
-    pair_phrase = "%s %s"%(phrase1, phrase2)
-
-    return self.frequency(pair_phrase, noun_phrases, sub_lazy_dic)
+    return tuple(phrase.replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").split())
 
-  def discontinuous_frequency(self, pair, noun_phrases, lazy_dic):
+  def frequency(self, phrase, noun_phrase_index):
     """
     """
 
-    if str(pair) not in lazy_dic:
-      discontinuous_count = 0.0
-      phrase1 = pair[0].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
-      phrase2 = pair[1].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
-
-      for noun_phrase in noun_phrases:
-        discontinuous_count += float(len(re.findall("%s .*? %s"%(re.escape(phrase1),
-                                                                 re.escape(phrase2)),
-                                                    noun_phrase)))
-      lazy_dic[str(pair)] = discontinuous_count
-
-      return discontinuous_count
-    else:
-      return lazy_dic[str(pair)]
+    return float(noun_phrase_index.frequency(self.phrase_words(phrase)))
 
-  def left_discontinuous_frequency(self, w, p1, p2, noun_phrases, cf_lazy_dic, df_lazy_dic):
+  def continuous_frequency(self, pair, noun_phrase_index):
     """
     """
 
-    f_w_p1 = self.continuous_frequency((w, p1), noun_phrases, cf_lazy_dic)
-    df_w_p2 = self.discontinuous_frequency((w, p2), noun_phrases, df_lazy_dic)
-
-    return min(f_w_p1, df_w_p2)
+    return float(noun_phrase_index.frequency(self.phrase_words(pair[0]) \
+                                             + self.phrase_words(pair[1])))
 
-  def right_discontinuous_frequency(self, p1, p2, w, noun_phrases, cf_lazy_dic, df_lazy_dic):
+  def discontinuous_frequency(self, pair, noun_phrase_index):
     """
     """
 
-    df_p1_w = self.discontinuous_frequency((p1, w), noun_phrases, df_lazy_dic)
-    f_p2_w = self.continuous_frequency((p2, w), noun_phrases, cf_lazy_dic)
-
-    return min(df_p1_w, f_p2_w)
+    return float(noun_phrase_index.gapped_frequency(self.phrase_words(pair[0]),
+                                                    self.phrase_words(pair[1])))
 
-  def maximum_left_discontinuous_frequency(self, pair, word_noun_phrases, word_bag, cf_lazy_dic, df_lazy_dic, lazy_dic):
+  def left_discontinuous_frequencies(self, pair, noun_phrase_index, lazy_dic):
     """
+    Gives the non-null left discontinuous frequencies of a pair, for every word
+    preceding its first phrase (the other words have a null frequency).
     """
 
     if str(pair) not in lazy_dic:
-      max_ldf = 0.0
+      ldfs = []
       phrase1 = pair[0].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
       phrase2 = pair[1].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
+      words2 = self.phrase_words(phrase2)
 
-      # compute max_lfd
-      for word in word_bag:
+      for word, f_w_p1 in noun_phrase_index.left_neighbours(self.phrase_words(phrase1)).items():
         if word != phrase1 and word != phrase2:
-          ldf = self.left_discontinuous_frequency(word, phrase1, phrase2, word_noun_phrases[word], cf_lazy_dic, df_lazy_dic)
+          df_w_p2 = noun_phrase_index.gapped_frequency((word,), words2)
+          ldf = float(min(f_w_p1, df_w_p2))
 
-          max_ldf = max(max_ldf, ldf)
-      lazy_dic[str(pair)] = max_ldf
+          if ldf != 0.0:
+            ldfs.append(ldf)
+      lazy_dic[str(pair)] = ldfs
 
-      return max_ldf
-    else:
-      return lazy_dic[str(pair)]
+    return lazy_dic[str(pair)]
 
-  def maximum_right_discontinuous_frequency(self, pair, word_noun_phrases, word_bag, cf_lazy_dic, df_lazy_dic, lazy_dic):
+  def right_discontinuous_frequencies(self, pair, noun_phrase_index, lazy_dic):
     """
+    Gives the non-null right discontinuous frequencies of a pair, for every word
+    following its second phrase (the other words have a null frequency).
     """
 
     if str(pair) not in lazy_dic:
-      max_rdf = 0.0
+      rdfs = []
       phrase1 = pair[0].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
       phrase2 = pair[1].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
+      words1 = self.phrase_words(phrase1)
 
-      # compute max_rfd
-      for word in word_bag:
+      for word, f_p2_w in noun_phrase_index.right_neighbours(self.phrase_words(phrase2)).items():
         if word != phrase1 and word != phrase2:
-          rdf = self.right_discontinuous_frequency(phrase1, phrase2, word, word_noun_phrases[word], cf_lazy_dic, df_lazy_dic)
+          df_p1_w = noun_phrase_index.gapped_frequency(words1, (word,))
+          rdf = float(min(df_p1_w, f_p2_w))
 
-          max_rdf = max(max_rdf, rdf)
-      lazy_dic[str(pair)] = max_rdf
+          if rdf != 0.0:
+            rdfs.append(rdf)
+      lazy_dic[str(pair)] = rdfs
 
-      return max_rdf
-    else:
-      return lazy_dic[str(pair)]
+    return lazy_dic[str(pair)]
 
-  def average_left_discontinuous_frequency(self, pair, word_noun_phrases, word_bag, cf_lazy_dic, df_lazy_dic, lazy_dic):
+  def maximum_left_discontinuous_frequency(self, pair, noun_phrase_index, lazy_dics):
     """
     """
 
-    if str(pair) not in lazy_dic:
-      max_ldf = 0.0
-      ld = 1.0
-      phrase1 = pair[0].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
-      phrase2 = pair[1].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
-
-      # compute max_lfd
-      for word in word_bag:
-        if word != phrase1 and word != phrase2:
-          ldf = self.left_discontinuous_frequency(word, phrase1, phrase2, word_noun_phrases[word], cf_lazy_dic, df_lazy_dic)
-
-          if ldf != 0.0:
-            ld += 1.0
+    return max([0.0] + self.left_discontinuous_frequencies(pair,
+                                                           noun_phrase_index,
+                                                           lazy_dics["ldf"]))
 
-          max_ldf = max(max_ldf, ldf)
-      lazy_dic[str(pair)] = max_ldf / ld
+  def maximum_right_discontinuous_frequency(self, pair, noun_phrase_index, lazy_dics):
+    """
+    """
 
-      return max_ldf / ld
-    else:
-      return lazy_dic[str(pair)]
+    return max([0.0] + self.right_discontinuous_frequencies(pair,
+                                                            noun_phrase_index,
+                                                            lazy_dics["rdf"]))
 
-  def average_right_discontinuous_frequency(self, pair, word_noun_phrases, word_bag, cf_lazy_dic, df_lazy_dic, lazy_dic):
+  def average_left_discontinuous_frequency(self, pair, noun_phrase_index, lazy_dics):
     """
     """
 
-    if str(pair) not in lazy_dic:
-      max_rdf = 0.0
-      rd = 1.0
-      phrase1 = pair[0].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
-      phrase2 = pair[1].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
+    ldfs = self.left_discontinuous_frequencies(pair,
+                                               noun_phrase_index,
+                                               lazy_dics["ldf"])
 
-      # compute max_rfd
-      for word in word_bag:
-        if word != phrase1 and word != phrase2:
-          rdf = self.right_discontinuous_frequency(phrase1, phrase2, word, word_noun_phrases[word], cf_lazy_dic, df_lazy_dic)
+    return max([0.0] + ldfs) / (1.0 + len(ldfs))
 
-          if rdf != 0.0:
-            rd += 1.0
+  def average_right_discontinuous_frequency(self, pair, noun_phrase_index, lazy_dics):
+    """
+    """
 
-          max_rdf = max(max_rdf, rdf)
-      lazy_dic[str(pair)] = max_rdf / rd
+    rdfs = self.right_discontinuous_frequencies(pair,
+                                                noun_phrase_index,
+                                                lazy_dics["rdf"])
 
-      return max_rdf / rd
-    else:
-      return lazy_dic[str(pair)]
+    return max([0.0] + rdfs) / (1.0 + len(rdfs))
 
-  def association(self, pair, noun_phrases, cf_lazy_dic, df_lazy_dic):
+  def association(self, pair, noun_phrase_index):
     """
     """
 
-    phrase1 = pair[0].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
-    phrase2 = pair[1].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
     lambda2 = 1000.0 # FIXME this is the default threshold
-    frequency1 = self.frequency(phrase1, noun_phrases, cf_lazy_dic)
-    frequency2 = self.frequency(phrase2, noun_phrases, cf_lazy_dic)
-    frequency12 = self.continuous_frequency(pair, noun_phrases, cf_lazy_dic)
+    frequency1 = self.frequency(pair[0], noun_phrase_index)
+    frequency2 = self.frequency(pair[1], noun_phrase_index)
+    frequency12 = self.continuous_frequency(pair, noun_phrase_index)
 
     return (lambda2 / (frequency1 + frequency2 - (2.0 * frequency12) + lambda2))
 
-  def association_score(self, pair, noun_phrases, word_noun_phrases, word_bag, cf_lazy_dic, df_lazy_dic, avg_ldf_lazy_dic, avg_rdf_lazy_dic):
+  def association_score(self, pair, noun_phrase_index, lazy_dics):
     """
     """
 
-    lambda1 = 5.0 # FIXME this is the default threshold
-    avg_ldf = self.average_left_discontinuous_frequency(pair, word_noun_phrases, word_bag, cf_lazy_dic, df_lazy_dic, avg_ldf_lazy_dic)
-    avg_rdf = self.average_right_discontinuous_frequency(pair, word_noun_phrases, word_bag, cf_lazy_dic, df_lazy_dic, avg_rdf_lazy_dic)
-    f = self.continuous_frequency(pair, noun_phrases, cf_lazy_dic)
-    df = self.discontinuous_frequency(pair, noun_phrases, df_lazy_dic)
-    a = self.association(pair, noun_phrases, cf_lazy_dic, df_lazy_dic)
+    if str(pair) not in lazy_dics["association_score"]:
+      lambda1 = 5.0 # FIXME this is the default threshold
+      avg_ldf = self.average_left_discontinuous_frequency(pair, noun_phrase_index, lazy_dics)
+      avg_rdf = self.average_right_discontinuous_frequency(pair, noun_phrase_index, lazy_dics)
+      f = self.continuous_frequency(pair, noun_phrase_index)
+      df = self.discontinuous_frequency(pair, noun_phrase_index)
+      a = self.association(pair, noun_phrase_index)
 
-    return (((lambda1 + avg_ldf + avg_rdf) / ((lambda1 * f) + df )) * a)
+      lazy_dics["association_score"][str(pair)] = (((lambda1 + avg_ldf + avg_rdf) / ((lambda1 * f) + df )) * a)
 
-  def locally_dominant_count(self, pair, noun_phrases, word_noun_phrases, word_bag, cf_lazy_dic, df_lazy_dic, avg_ldf_lazy_dic, avg_rdf_lazy_dic, lazy_dic):
-    if str(pair) not in lazy_dic:
+    return lazy_dics["association_score"][str(pair)]
+
+  def locally_dominant_count(self, pair, noun_phrase_index, lazy_dics):
+    if str(pair) not in lazy_dics["ldc"]:
       dominant_count = 0.0
-      phrase1 = pair[0].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
-      phrase2 = pair[1].replace(CLARIT96_INNER_GROUP_SEPARATOR, " ").strip()
-      pair_phrase = "%s %s"%(phrase1, phrase2)
-      pair_word_bag = list(set(phrase1.split()) | set(phrase2.split()))
+      pair_words = self.phrase_words(pair[0]) + self.phrase_words(pair[1])
       association_score = self.association_score(pair,
-                                                 noun_phrases,
-                                                 word_noun_phrases,
-                                                 word_bag,
-                                                 cf_lazy_dic,
-                                                 df_lazy_dic,
-                                                 avg_ldf_lazy_dic,
-                                                 avg_rdf_lazy_dic)
-
-      for noun_phrase in word_noun_phrases[pair_word_bag[0]]: # reduce the amount of phrase to browse
-        if noun_phrase.count(pair_phrase) > 0:
+                                                 noun_phrase_index,
+                                                 lazy_dics)
+
+      # only the noun phrases containing the pair's first word are browsed
+      for noun_phrase, count in noun_phrase_index.noun_phrases_containing(pair_words[0]).items():
+        if contiguous_count(noun_phrase, pair_words) > 0:
           max_score = association_score
 
-          for i, wt in enumerate(noun_phrase.split()[:-1]):
-            p = (wt, noun_phrase.split()[i + 1])
+          for i, wt in enumerate(noun_phrase[:-1]):
+            p = (wt, noun_phrase[i + 1])
             max_score = max(max_score, self.association_score(p,
-                                                              noun_phrases,
-                                                              word_noun_phrases,
-                                                              word_bag,
-                                                              cf_lazy_dic,
-                                                              df_lazy_dic,
-                                                              avg_ldf_lazy_dic,
-                                                              avg_rdf_lazy_dic))
+                                                              noun_phrase_index,
+                                                              lazy_dics))
 
             if max_score != association_score:
               break
 
           if max_score == association_score:
-            dominant_count += 1.0
-      lazy_dic[str(pair)] = dominant_count
+            dominant_count += float(count)
+      lazy_dics["ldc"][str(pair)] = dominant_count
 
-      return dominant_count
-    else:
-      return lazy_dic[str(pair)]
+    return lazy_dics["ldc"][str(pair)]
 
-  def preference_score(self, pair, noun_phrases, word_noun_phrases, word_bag, cf_lazy_dic, df_lazy_dic, avg_ldf_lazy_dic, avg_rdf_lazy_dic, ldc_lazy_dic):
+  def preference_score(self, pair, noun_phrase_index, lazy_dics):
     """
     """
 
-    ldc = self.locally_dominant_count(pair, noun_phrases, word_noun_phrases, word_bag, cf_lazy_dic, df_lazy_dic, avg_ldf_lazy_dic, avg_rdf_lazy_dic, ldc_lazy_dic)
-    f = self.continuous_frequency(pair, noun_phrases, cf_lazy_dic)
+    ldc = self.locally_dominant_count(pair, noun_phrase_index, lazy_dics)
+    f = self.continuous_frequency(pair, noun_phrase_index)
 
     return (ldc / f)
 
@@ -803,41 +1113,39 @@ class CLARIT96Extractor(PatternMatchingExtractor):
     @param    pre_processed_file: The pre-processed analysed file.
     @type     pre_processed_file: C{PreProcessedFile}
 
-    @return:  A list of candidates.
-    @rtype:   C{list(string)}
+    @return:  A list of candidate spans (candidate, sentence index, start token
+              offset, end token offset).
+    @rtype:   C{list(tuple(string, int, int, int))}
     """
 
-    noun_phrases = list(self.train_noun_phrases())
     candidates = []
-    word_bag = []
-    word_noun_phrases = {}
-    # 'lazy loading' structures
-    continuous_frequencies = {}
-    discontinuous_frequencies = {}
-    maximum_left_discontinuous_frequencies = {}
-    maximum_right_discontinuous_frequencies = {}
-    average_left_discontinuous_frequencies = {}
-    average_right_discontinuous_frequencies = {}
-    locally_dominant_counts = {}
+    candidate_spans = []
+    noun_phrase_spans = {}
+    # 'lazy loading' structures (the counts themselves come from the index)
+    lazy_dics = {"ldf": {},
+                 "rdf": {},
+                 "association_score": {},
+                 "ldc": {}}
 
     # extract candidates and add them to the whole noun phrases
-    for candidate in super(CLARIT96Extractor, self).candidate_extraction(pre_processed_file):
-      noun_phrases.append(candidate)
-      candidates.append(candidate)
+    for candidate_span in super(CLARIT96Extractor, self).candidate_extraction(pre_processed_file):
+      candidate, sentence_index, start, end = candidate_span
 
-    # create the bag of words
-    for noun_phrase in noun_phrases:
-      for word in set(noun_phrase.split()):
-        if word not in word_noun_phrases:
-          word_noun_phrases[word] = []
-        word_noun_phrases[word].append(noun_phrase)
-        word_bag.append(word)
-    word_bag = list(set(word_bag))
+      candidates.append(candidate)
+      candidate_spans.append(candidate_span)
+      if candidate not in noun_phrase_spans:
+        noun_phrase_spans[candidate] = []
+      noun_phrase_spans[candidate].append((sentence_index, start, end))
+    noun_phrase_index = NounPhraseIndex(candidates,
+                                        self.train_noun_phrase_index())
 
     # add noun phrases' subcompounds
     candidate_set = list(set(candidates))
     for noun_phrase in candidate_set:
-      if len(noun_phrase.split()) > 2:
+      noun_phrase_words = noun_phrase.split()
+      occurrences = noun_phrase_spans[noun_phrase]
+
+      if len(noun_phrase_words) > 2:
         lexical_atoms = []
         previous_groups = None
         current_groups = []
@@ -855,23 +1163,15 @@ class CLARIT96Extractor(PatternMatchingExtractor):
           # find lexical atoms
           for pair in pairs:
             continuous_frequency = self.continuous_frequency(pair,
-                                                             noun_phrases,
-                                                             continuous_frequencies)
+                                                             noun_phrase_index)
             discontinuous_frequency = self.discontinuous_frequency(pair,
-                                                                   noun_phrases,
-                                                                   discontinuous_frequencies)
+                                                                   noun_phrase_index)
             max_ldf = self.maximum_left_discontinuous_frequency(pair,
-                                                                word_noun_phrases,
-                                                                word_bag,
-                                                                continuous_frequencies,
-                                                                discontinuous_frequencies,
-                                                                maximum_left_discontinuous_frequencies)
+                                                                noun_phrase_index,
+                                                                lazy_dics)
             max_rdf = self.maximum_right_discontinuous_frequency(pair,
-                                                                 word_noun_phrases,
-                                                                 word_bag,
-                                                                 continuous_frequencies,
-                                                                 discontinuous_frequencies,
-                                                                 maximum_right_discontinuous_frequencies)
+                                                                 noun_phrase_index,
+                                                                 lazy_dics)
             heuristique_1 = (continuous_frequency > max_ldf) and (continuous_frequency > max_rdf)
             heuristique_2 = (continuous_frequency - discontinuous_frequency) > 0.0 # FIXME must be a threshold
 
@@ -897,23 +1197,12 @@ class CLARIT96Extractor(PatternMatchingExtractor):
                 s = 0.0
               else:
                 s = self.association_score(pair,
-                                           noun_phrases,
-                                           word_noun_phrases,
-                                           word_bag,
-                                           continuous_frequencies,
-                                           discontinuous_frequencies,
-                                           average_left_discontinuous_frequencies,
-                                           average_right_discontinuous_frequencies)
+                                           noun_phrase_index,
+                                           lazy_dics)
               ips = 0.0
               ps = self.preference_score(pair,
-                                         noun_phrases,
-                                         word_noun_phrases,
-                                         word_bag,
-                                         continuous_frequencies,
-                                         discontinuous_frequencies,
-                                         average_left_discontinuous_frequencies,
-                                         average_right_discontinuous_frequencies,
-                                         locally_dominant_counts)
+                                         noun_phrase_index,
+                                         lazy_dics)
               if ps != 0.0:
                 ips = 1.0 / ps
 
@@ -937,11 +1226,21 @@ class CLARIT96Extractor(PatternMatchingExtractor):
             noun_phrase = noun_phrase.replace("%s %s"%(left, right),
                                               "%s%s%s"%(left, CLARIT96_INNER_GROUP_SEPARATOR, right))
             current_groups.append((left, right))
-            # the pair is added as a candidate
-            candidates.append("%s %s"%(left.replace(CLARIT96_INNER_GROUP_SEPARATOR, " "),
-                                       right.replace(CLARIT96_INNER_GROUP_SEPARATOR, " ")))
-
-    return candidates
+            # the pair is added as a candidate, wherever it is in the
+            # occurrences of the noun phrase
+            subcompound = "%s %s"%(left.replace(CLARIT96_INNER_GROUP_SEPARATOR, " "),
+                                   right.replace(CLARIT96_INNER_GROUP_SEPARATOR, " "))
+            length = len(subcompound.split())
+
+            for offset in range(len(noun_phrase_words) - length + 1):
+              if " ".join(noun_phrase_words[offset:offset + length]) == subcompound:
+                for sentence_index, start, end in occurrences:
+                  candidate_spans.append((subcompound,
+                                          sentence_index,
+                                          start + offset,
+                                          start + offset + length))
+
+    return candidate_spans
 
 ################################################################################
 
@@ -974,18 +1273,40 @@ class FromTerminologyExtractor(CandidateExtractorC):
 
     super(FromTerminologyExtractor, self).__init__(name, is_lazy, lazy_directory, debug)
 
-    terminology = {}
-    terminology_file = codecs.open(terminology_filepath, "r", encoding)
+    # the tokenized terminology and its automaton are cached, with respect to
+    # the terminology file (and its last modification) and to the tokenization
+    terminology_stat = stat(terminology_filepath)
+    lazy_filename = "%s.%s.trm"%(path.split(terminology_filepath)[1],
+                                 md5(repr((path.abspath(terminology_filepath),
+                                           terminology_stat.st_size,
+                                           terminology_stat.st_mtime,
+                                           encoding,
+                                           tokenize_function.__module__,
+                                           tokenize_function.__name__))).hexdigest())
+
+    if super(FromTerminologyExtractor, self).is_lazy() \
+       and super(FromTerminologyExtractor, self).is_cached(lazy_filename):
+      terminology, term_automaton = super(FromTerminologyExtractor,
+                                          self).load(lazy_filename)
+
+      self._terminology = terminology
+      self._term_automaton = term_automaton
+    else:
+      terminology = {}
+      terminology_file = codecs.open(terminology_filepath, "r", encoding)
 
-    for term in terminology_file.read().split("\n"):
-      term = term.strip()
+      for term in terminology_file.read().split("\n"):
+        term = term.strip()
 
-      if term != "":
-        terminology[tokenize_function(term)] = True
+        if term != "":
+          terminology[tokenize_function(term)] = True
 
-    terminology_file.close()
+      terminology_file.close()
 
-    self.set_terminology(terminology)
+      self.set_terminology(terminology)
+      super(FromTerminologyExtractor, self).store(lazy_filename,
+                                                  (self.terminology(),
+                                                   self.term_automaton()))
 
   def terminology(self):
     """
@@ -998,6 +1319,17 @@ class FromTerminologyExtractor(CandidateExtractorC):
     """
 
     self._terminology = terminology
+    self._term_automaton = TermAutomaton(terminology.keys())
+
+  def term_automaton(self):
+    """
+    Getter of the automaton finding the terms of the terminology.
+
+    @return:  The Aho-Corasick automaton of the tokenized terms.
+    @rtype:   C{TermAutomaton}
+    """
+
+    return self._term_automaton
 
   def candidate_extraction(self, pre_processed_file):
     """
@@ -1006,29 +1338,28 @@ class FromTerminologyExtractor(CandidateExtractorC):
     @param    pre_processed_file: The pre-processed analysed file.
     @type     pre_processed_file: C{PreProcessedFile}
 
-    @return:  A list of candidates.
-    @rtype:   C{list(string)}
+    @return:  A list of candidate spans (candidate, sentence index, start token
+              offset, end token offset).
+    @rtype:   C{list(tuple(string, int, int, int))}
     """
 
-    candidates = []
-    sentences = pre_processed_file.full_text()
-
-    for sentence in sentences:
-      for candidate in n_to_m_grams(sentence.split(), 1, len(sentence.split())):
-        untagged_candidate = ""
+    candidate_spans = []
 
-        for word in candidate.split():
-          if untagged_candidate != "":
-            untagged_candidate += " "
-          untagged_candidate += word.rsplit(pre_processed_file.tag_separator(), 1)[0]
+    for sentence_index, (tagged_words, words, tags) in enumerate(pre_processed_file.full_text_tokens()):
+      # every term occurrence is found within one pass over the sentence
+      for start, end in self.term_automaton().matches(words):
+        candidate_spans.append((" ".join(tagged_words[start:end]),
+                                sentence_index,
+                                start,
+                                end))
 
-        if untagged_candidate in self.terminology():
-          candidates.append(candidate)
-
-    return candidates
+    return candidate_spans
 
 ################################################################################
 
+# key marking the end of a POS sequence in the POS sequence trie
+POS_SEQUENCE_END = None
+
 class POSSequenceExtractor(CandidateExtractorC):
   """
   Component performing candidate terms extraction. It extracts NP chunks (based
@@ -1066,23 +1397,23 @@ class POSSequenceExtractor(CandidateExtractorC):
 
   def stop_words(self):
     """
-    Getter of the list of stop words.
+    Getter of the set of stop words.
 
-    @return:  The list of stop words used to filter the n-grams.
-    @rtype:   C{list(string)}
+    @return:  The (shared) set of stop words used to filter the n-grams.
+    @rtype:   C{frozenset(string)}
     """
 
     return self._stop_words
 
   def set_stop_words(self, stop_words):
     """
-    Setter of the list of stop words.
+    Setter of the set of stop words.
 
-    @param  stop_words: The new list of stop words used to filter the n-grams.
+    @param  stop_words: The new stop words used to filter the n-grams.
     @type   stop_words: C{list(string)}
     """
 
-    self._stop_words = stop_words
+    self._stop_words = vocabulary(stop_words)
 
   def pos_sequences(self):
     """
@@ -1096,34 +1427,62 @@ class POSSequenceExtractor(CandidateExtractorC):
 
     self._pos_sequences = pos_sequences
 
+    # prefix trie of the POS sequences: each node maps a tag to its child node,
+    # the POS_SEQUENCE_END key marking the end of a sequence
+    self._pos_sequence_trie = {}
+
+    for pos_sequence in pos_sequences:
+      node = self._pos_sequence_trie
+
+      for tag in pos_sequence.split(" "):
+        node = node.setdefault(tag, {})
+      node[POS_SEQUENCE_END] = True
+
+  def pos_sequence_trie(self):
+    """
+    Getter of the prefix trie of the POS sequences.
+
+    @return:  The prefix trie of the POS sequences, as nested dictionaries.
+    @rtype:   C{dict}
+    """
+
+    return self._pos_sequence_trie
+
   def candidate_extraction(self, pre_processed_file):
     """
-    Extracts the candidates from a pre-processed file.
+    Extracts the candidates from a pre-processed file. The prefix trie of the
+    POS sequences is walked from each token of a sentence, until no POS sequence
+    can be matched anymore.
 
     @param    pre_processed_file: The pre-processed analysed file.
     @type     pre_processed_file: C{PreProcessedFile}
 
-    @return:  A list of candidates.
-    @rtype:   C{list(string)}
+    @return:  A list of candidate spans (candidate, sentence index, start token
+              offset, end token offset).
+    @rtype:   C{list(tuple(string, int, int, int))}
     """
 
-    sentences = pre_processed_file.full_text()
-    candidates = []
+    trie = self.pos_sequence_trie()
+    candidate_spans = []
     
-    for sentence in sentences:
-      for candidate in n_to_m_grams(sentence.split(), 1, len(sentence.split())):
-        tag_sequence = ""
+    for sentence_index, (tagged_words, words, tags) in enumerate(pre_processed_file.full_text_tokens()):
+      for start in range(len(tagged_words)):
+        node = trie
+        end = start
+
+        while end < len(tagged_words) \
+              and tags[end] != None \
+              and tags[end] in node:
+          node = node[tags[end]]
+          end += 1
 
-        for wt in candidate.split(" "):
-          if tag_sequence != "":
-            tag_sequence += " "
-          tag_sequence += wt.rsplit(pre_processed_file.tag_separator(), 1)[1]
+          if POS_SEQUENCE_END in node:
+            candidate = " ".join(tagged_words[start:end])
 
-        if tag_sequence in self.pos_sequences():
-          if self.filtering(candidate, pre_processed_file.tag_separator()):
-            candidates.append(candidate)
+            if self.filtering(candidate, pre_processed_file.tag_separator()):
+              candidate_spans.append((candidate, sentence_index, start, end))
 
-    return candidates
+    return candidate_spans
 
   def filtering(self, term, tag_separator):
     """
@@ -1147,7 +1506,7 @@ class POSSequenceExtractor(CandidateExtractorC):
       # only candidate with first and last words not included into the stop word
       # list are accepted
       if i == 0 or i == (len(tagged_words) - 1):
-        if self.stop_words().count(word) > 0:
+        if word in self.stop_words():
           return False
 
       # FIXME semeval trick
@@ -1199,19 +1558,24 @@ class POSBoundaryBasedCandidateExtractor(CandidateExtractorC):
     @param    pre_processed_file: The pre-processed analysed file.
     @type     pre_processed_file: C{PreProcessedFile}
 
-    @return:  A list of candidates.
-    @rtype:   C{list(string)}
+    @return:  A list of candidate spans (candidate, sentence index, start token
+              offset, end token offset).
+    @rtype:   C{list(tuple(string, int, int, int))}
     """
 
     sentences = pre_processed_file.full_text()
-    candidates = []
+    candidate_spans = []
     
-    for sentence in sentences:
+    for sentence_index, sentence in enumerate(sentences):
       current_candidate = []
-      for wt in sentence.split(" "):
+      current_start = 0 # offset of the first word of the current candidate
+      for position, wt in enumerate(sentence.split(" ")):
         w = wt.rsplit(pre_processed_file.tag_separator(), 1)[0]
         t = wt.rsplit(pre_processed_file.tag_separator(), 1)[1]
 
+        if len(current_candidate) == 0:
+          current_start = position
+
         if t in self._pos_boundaries:
           # do not consider exception cases yet
           if w not in self._pos_boundaries[t]:
@@ -1220,6 +1584,7 @@ class POSBoundaryBasedCandidateExtractor(CandidateExtractorC):
               while current_candidate[0].rsplit(pre_processed_file.tag_separator(), 1)[1] in self._pos_boundaries:
                 if len(current_candidate) > 1:
                   current_candidate = current_candidate[1:]
+                  current_start += 1
                 else:
                   current_candidate = []
                   break
@@ -1233,15 +1598,18 @@ class POSBoundaryBasedCandidateExtractor(CandidateExtractorC):
                     break
               if len(current_candidate) > 0:
                 candidate = " ".join(current_candidate)
-                current_candidate = []
                 if self.filtering(candidate, pre_processed_file.tag_separator()):
-                  candidates.append(candidate)
+                  candidate_spans.append((candidate,
+                                          sentence_index,
+                                          current_start,
+                                          current_start + len(current_candidate)))
+                current_candidate = []
           else:
             current_candidate.append(wt)
         else:
           current_candidate.append(wt)
 
-    return candidates
+    return candidate_spans
 
   def filtering(self, term, tag_separator):
     """
@@ -1265,6 +1633,11 @@ class POSBoundaryBasedCandidateExtractor(CandidateExtractorC):
 
 ################################################################################
 
+# number of most frequent core words to expand
+NB_CORE_WORDS = 50
+# maximum number of words of an expanded core word
+CORE_WORD_EXPANSION_MAX_LENGTH = 4
+
 class ExpandedCoreWordExtractor(CandidateExtractorC):
   """
   Component performing candidate terms extraction. It extracts NP chunks (based
@@ -1292,8 +1665,8 @@ class ExpandedCoreWordExtractor(CandidateExtractorC):
 
     super(ExpandedCoreWordExtractor, self).__init__(name, is_lazy, lazy_directory, debug)
 
-    self._stop_words = stop_words
-    self._verb_tags = verb_tags
+    self._stop_words = vocabulary(stop_words)
+    self._verb_tags = vocabulary(verb_tags)
     self._stemmer = stemmer
 
   def candidate_extraction(self, pre_processed_file):
@@ -1303,68 +1676,99 @@ class ExpandedCoreWordExtractor(CandidateExtractorC):
     @param    pre_processed_file: The pre-processed analysed file.
     @type     pre_processed_file: C{PreProcessedFile}
 
-    @return:  A list of candidates.
-    @rtype:   C{list(string)}
+    @return:  A list of candidate spans (candidate, sentence index, start token
+              offset, end token offset).
+    @rtype:   C{list(tuple(string, int, int, int))}
+    """
+
+    tagged_sentences = [tagged_words \
+                        for tagged_words, words, tags in pre_processed_file.full_text_tokens()]
+    candidate_spans = []
+
+    for sent_pos, start, end in self.core_word_spans(tagged_sentences,
+                                                     pre_processed_file.tag_separator()):
+      candidate_spans.append((" ".join(tagged_sentences[sent_pos][start:end]),
+                              sent_pos,
+                              start,
+                              end))
+
+    return candidate_spans
+
+  def core_word_spans(self, tagged_sentences, tag_separator):
+    """
+    Expands the occurrences of the most frequent core words (non stop words)
+    with their frequent neighbours.
+
+    @param    tagged_sentences: The POS tagged words of each sentence.
+    @type     tagged_sentences: C{list(list(string))}
+    @param    tag_separator:    The character used to separate a words from its
+                                tag.
+    @type     tag_separator:    C{string}
+
+    @return:  The expanded core words, as (sentence index, start offset, end
+              offset).
+    @rtype:   C{list(tuple(int, int, int))}
     """
 
-    tagged_sentences = pre_processed_file.full_text()
-    stemmed_words = {}
+    stemmed_words = {} # None if the word is filtered
     stem_positions = {}
-    candidates = []
+    sentence_stems = []
+    spans = []
 
     # create reverse indexes
     for sent_pos, tagged_sentence in enumerate(tagged_sentences):
-      for pos, tagged_word in enumerate(tagged_sentence.split()):
+      stems = []
+
+      for pos, tagged_word in enumerate(tagged_sentence):
         if tagged_word not in stemmed_words:
+          stemmed_word = None
+
           # only if it is not a stop word
-          if self.filtering(tagged_word, pre_processed_file.tag_separator()):
-            word = tagged_word.rsplit(pre_processed_file.tag_separator(), 1)[0]
+          if self.filtering(tagged_word, tag_separator):
+            word = tagged_word.rsplit(tag_separator, 1)[0]
             stemmed_word = self._stemmer.stem(word)
-            stemmed_words[tagged_word] = stemmed_word
-            if stemmed_word not in stem_positions:
-              stem_positions[stemmed_word] = []
-            stem_positions[stemmed_word].append((sent_pos, pos))
-        else:
-          stemmed_word = stemmed_words[tagged_word]
+          stemmed_words[tagged_word] = stemmed_word
+
+        stemmed_word = stemmed_words[tagged_word]
+        if stemmed_word != None:
+          if stemmed_word not in stem_positions:
+            stem_positions[stemmed_word] = []
           stem_positions[stemmed_word].append((sent_pos, pos))
+        stems.append(stemmed_word)
+
+      sentence_stems.append(stems)
+
+    # only the non stop words occurring more than once expand the core words
+    expandable_words = []
+    for stems in sentence_stems:
+      expandable_words.append([stem != None and len(stem_positions[stem]) > 1 \
+                               for stem in stems])
 
     # generate candidates from core words
     core_word_ordering = sorted(stem_positions.items(),
                                 key=lambda (c, p): len(p),
                                 reverse=True)
-    for core_word_stem, positions in core_word_ordering[:50]:
+    for core_word_stem, positions in core_word_ordering[:NB_CORE_WORDS]:
       for sent_pos, pos in positions:
-        candidate = tagged_sentences[sent_pos].split()[pos]
-        forward_position = pos + 1
+        expandables = expandable_words[sent_pos]
+
         # forward expansion
-              # maximum candidate size
-              # check index
-              # check non stop word
-              # frequency requirement
-        while len(candidate.split()) < 4 \
-              and forward_position < len(tagged_sentences[sent_pos].split()) \
-              and tagged_sentences[sent_pos].split()[forward_position] in stemmed_words \
-              and len(stem_positions[stemmed_words[tagged_sentences[sent_pos].split()[forward_position]]]) > 1:
-          candidate += " " + tagged_sentences[sent_pos].split()[forward_position]
-          forward_position += 1
-        candidates.append(candidate)
-
-        candidate = tagged_sentences[sent_pos].split()[pos]
-        backward_position = pos - 1
+        end = pos + 1
+        while end - pos < CORE_WORD_EXPANSION_MAX_LENGTH \
+              and end < len(expandables) \
+              and expandables[end]:
+          end += 1
+        spans.append((sent_pos, pos, end))
+
         # backward expansion
-              # maximum candidate size
-              # check index
-              # check non stop word
-              # frequency requirement
-        while len(candidate.split()) < 4 \
-              and backward_position >= 0 \
-              and tagged_sentences[sent_pos].split()[backward_position] in stemmed_words \
-              and len(stem_positions[stemmed_words[tagged_sentences[sent_pos].split()[backward_position]]]) > 1:
-          candidate = tagged_sentences[sent_pos].split()[backward_position] + " " + candidate
-          backward_position -= 1
-        candidates.append(candidate)
-
-    return candidates
+        start = pos
+        while pos + 1 - start < CORE_WORD_EXPANSION_MAX_LENGTH \
+              and start > 0 \
+              and expandables[start - 1]:
+          start -= 1
+        spans.append((sent_pos, start, pos + 1))
+
+    return spans
 
   def filtering(self, term, tag_separator):
     """
@@ -1392,8 +1796,8 @@ class ExpandedCoreWordExtractor(CandidateExtractorC):
       # only candidate with first and last words not included into the stop word
       # list are accepted
       if i == 0 or i == (len(tagged_words) - 1):
-        if self._stop_words.count(word) > 0 \
-           or self._verb_tags.count(tag) > 0:
+        if word in self._stop_words \
+           or tag in self._verb_tags:
           return False
 
       # FIXME semeval trick
@@ -1467,23 +1871,30 @@ class NounAndADJRExtractor(CandidateExtractorC):
     @param    pre_processed_file: The pre-processed analysed file.
     @type     pre_processed_file: C{PreProcessedFile}
 
-    @return:  A list of candidates.
-    @rtype:   C{list(string)}
+    @return:  A list of candidate spans (candidate, sentence index, start token
+              offset, end token offset).
+    @rtype:   C{list(tuple(string, int, int, int))}
     """
 
     sentences = pre_processed_file.full_text()
     non_filtered_candidate_counts = {}
-    candidates = []
+    non_filtered_candidate_occurrences = {}
+    selected_slices = [] # candidates and slices of their words
+    candidate_spans = []
 
-    for sentence in sentences:
+    for sentence_index, sentence in enumerate(sentences):
       # pattern matching
       for pattern in self.patterns():
         for match in re.finditer(pattern, sentence):
-          candidate = match.group(0).strip()
+          candidate, start, end = pattern_match_span(sentence, match)
 
           if candidate not in non_filtered_candidate_counts:
             non_filtered_candidate_counts[candidate] = 0
+            non_filtered_candidate_occurrences[candidate] = []
           non_filtered_candidate_counts[candidate] += 1
+          non_filtered_candidate_occurrences[candidate].append((sentence_index,
+                                                                start,
+                                                                end))
 
     # split the component to the non-relational adjectives
     for candidate in non_filtered_candidate_counts:
@@ -1495,11 +1906,11 @@ class NounAndADJRExtractor(CandidateExtractorC):
           sub_candidate = " ".join(candidate.split()[:-1])
 
           if sub_candidate not in non_filtered_candidate_counts:
-            candidates.append(candidate)
+            selected_slices.append((candidate, 0, len(candidate.split())))
           elif non_filtered_candidate_counts[candidate] > non_filtered_candidate_counts[sub_candidate]:
-            candidates.append(candidate)
+            selected_slices.append((candidate, 0, len(candidate.split())))
         else:
-          candidates.append(candidate)
+          selected_slices.append((candidate, 0, len(candidate.split())))
       else:
         start = 0
         for pos, wt in enumerate(candidate.split()):
@@ -1509,10 +1920,20 @@ class NounAndADJRExtractor(CandidateExtractorC):
           if tag in self._adj_tags \
              and not self._is_adjr_function(word):
             if pos != 0 and start != (len(candidate.split()) - 1):
-              candidates.append(" ".join(candidate.split()[start:pos]))
+              selected_slices.append((candidate, start, pos))
             start = pos + 1
           elif pos == (len(candidate.split()) - 1):
-            candidates.append(" ".join(candidate.split()[start:]))
+            selected_slices.append((candidate, start, len(candidate.split())))
+
+    # the selected slices are located within the occurrences of their candidate
+    for candidate, slice_start, slice_end in selected_slices:
+      sub_candidate = " ".join(candidate.split()[slice_start:slice_end])
+
+      for sentence_index, start, end in non_filtered_candidate_occurrences[candidate]:
+        candidate_spans.append((sub_candidate,
+                                sentence_index,
+                                start + slice_start,
+                                start + slice_end))
 
-    return candidates
+    return candidate_spans
 
@@ -2,6 +2,10 @@
 # -*- encoding:utf-8 -*-
 
 from textrank import TextRank
+from pagerank import PAGERANK_SOLVER
+from pagerank import CONVERGENCE_CRITERION
+from pagerank import MAX_ITERATIONS
+from pagerank import PageRankSolver
 from textrank_strategies import TextRankStrategy
 from textrank_strategies import SingleRankStrategy
 from topicrank_strategies import CompleteGraphStrategy
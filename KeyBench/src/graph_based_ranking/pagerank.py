@@ -0,0 +1,632 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+import math
+
+# NumPy is optional, the sparse matrix solver falls back to the dictionary
+# solver without it
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+################################################################################
+# PageRankSolver
+#
+# Graph-based ranking methods (e.g. TextRank [1]) compute the scores of the
+# nodes of a graph by iterating a PageRank-like formula [2] until the scores are
+# stable. Every formula used in KeyBench is linear: the score of a node is a
+# constant (e.g. the random walk) plus the scores of its source nodes, weighted
+# by transition coefficients (e.g. the damping factor times the weight of the
+# edge, normalized by the weighted degree of the source node).
+#
+# [1] Rada Mihalcea and Paul Tarau. 2004. TextRank: Bringing Order Into Texts.
+#     In Dekang Lin and Dekai Wu, editors, Proceedings of the 2004 Conference on
+#     Empirical Methods in Natural Language Processing, pages 404–411,
+#     Barcelona, Spain, July. Association for Computational Linguistics.
+# [2] Sergey Brin and Lawrence Page. 1998. The Anatomy of a Large-Scale
+#     Hypertextual Web Search Engine. Computer Networks and ISDN Systems,
+#     30(1):107-117.
+
+class PAGERANK_SOLVER:
+  DICTIONARY    = 0 # Jacobi iterations over the in edges of each node
+  SPARSE_MATRIX = 1 # vectorized Jacobi iterations over a CSR matrix (NumPy)
+  GAUSS_SEIDEL  = 2 # Gauss-Seidel iterations over the in edges of each node
+
+class CONVERGENCE_CRITERION:
+  ABSOLUTE  = 0 # maximum absolute change of a node's score
+  L1        = 1 # sum of the absolute changes of the nodes' score
+  RELATIVE  = 2 # sum of the absolute changes, divided by the sum of the scores
+
+# default maximum number of iterations (the scores of the documents which do
+# not converge are given after this number of iterations)
+MAX_ITERATIONS = 1000
+# number of iterations between two extrapolations, when the acceleration is
+# used
+ACCELERATION_PERIOD = 10
+# maximum number of statistics kept (those of the last solved graphs)
+MAX_NB_STATISTICS = 1000
+# maximum number of previous scores kept for the warm starts (they are reset
+# when the scores of a new graph would exceed it)
+MAX_NB_PREVIOUS_SCORES = 100000
+
+class PageRankSolver(object):
+  """
+  Iterative solver of the PageRank-like formulas. The scores are iterated until
+  the convergence criterion is under the convergence threshold, or until the
+  maximum number of iterations is reached. The number of iterations and the
+  residual (value of the convergence criterion) of the last solved graphs are
+  kept as statistics.
+
+  The iterations can be accelerated with an Aitken extrapolation of the scores
+  and started from the scores of the previously solved graph (warm start), for
+  the nodes which were already in it. Both only change the number of iterations
+  when the formula has a unique solution (e.g. with a damping factor). The
+  previous scores belong to the solver: a copy of the solver (e.g. one pickled
+  into each task of a multi-processing pool) starts from its own scores.
+  """
+
+  def __init__(self,
+               solver=PAGERANK_SOLVER.DICTIONARY,
+               convergence_threshold=0.0001,
+               convergence_criterion=CONVERGENCE_CRITERION.ABSOLUTE,
+               max_iterations=MAX_ITERATIONS,
+               acceleration=False,
+               warm_start=False):
+    """
+    Constructor.
+
+    @param  solver:                 The iteration method.
+    @type   solver:                 C{PAGERANK_SOLVER}
+    @param  convergence_threshold:  The threshold under which the scores are
+                                    stable.
+    @type   convergence_threshold:  C{float}
+    @param  convergence_criterion:  The criterion compared to the convergence
+                                    threshold.
+    @type   convergence_criterion:  C{CONVERGENCE_CRITERION}
+    @param  max_iterations:         The maximum number of iterations, in case
+                                    the scores do not converge.
+    @type   max_iterations:         C{int}
+    @param  acceleration:           True if the scores must be extrapolated
+                                    during the iterations, else False.
+    @type   acceleration:           C{bool}
+    @param  warm_start:             True if the iterations must start from the
+                                    scores of the previously solved graph, else
+                                    False.
+    @type   warm_start:             C{bool}
+    """
+
+    super(PageRankSolver, self).__init__()
+
+    self.set_solver(solver)
+    self.set_convergence_threshold(convergence_threshold)
+    self.set_convergence_criterion(convergence_criterion)
+    self.set_max_iterations(max_iterations)
+    self.set_acceleration(acceleration)
+    self.set_warm_start(warm_start)
+    self.set_previous_scores({})
+    self.set_statistics([])
+
+  def solver(self):
+    """
+    Getter of the iteration method.
+
+    @return:  The iteration method.
+    @rtype:   C{PAGERANK_SOLVER}
+    """
+
+    return self._solver
+
+  def set_solver(self, solver):
+    """
+    Setter of the iteration method.
+
+    @param  solver: The new iteration method (the sparse matrix solver requires
+                    NumPy).
+    @type   solver: C{PAGERANK_SOLVER}
+    """
+
+    self._solver = solver
+
+  def convergence_threshold(self):
+    """
+    Getter of the threshold under which the scores are stable.
+
+    @return:  The convergence threshold.
+    @rtype:   C{float}
+    """
+
+    return self._convergence_threshold
+
+  def set_convergence_threshold(self, convergence_threshold):
+    """
+    Setter of the threshold under which the scores are stable.
+
+    @param  convergence_threshold:  The new convergence threshold.
+    @type   convergence_threshold:  C{float}
+    """
+
+    self._convergence_threshold = convergence_threshold
+
+  def convergence_criterion(self):
+    """
+    Getter of the criterion compared to the convergence threshold.
+
+    @return:  The convergence criterion.
+    @rtype:   C{CONVERGENCE_CRITERION}
+    """
+
+    return self._convergence_criterion
+
+  def set_convergence_criterion(self, convergence_criterion):
+    """
+    Setter of the criterion compared to the convergence threshold.
+
+    @param  convergence_criterion:  The new convergence criterion.
+    @type   convergence_criterion:  C{CONVERGENCE_CRITERION}
+    """
+
+    self._convergence_criterion = convergence_criterion
+
+  def max_iterations(self):
+    """
+    Getter of the maximum number of iterations.
+
+    @return:  The maximum number of iterations.
+    @rtype:   C{int}
+    """
+
+    return self._max_iterations
+
+  def set_max_iterations(self, max_iterations):
+    """
+    Setter of the maximum number of iterations.
+
+    @param  max_iterations: The new maximum number of iterations.
+    @type   max_iterations: C{int}
+    """
+
+    self._max_iterations = max_iterations
+
+  def acceleration(self):
+    """
+    Getter of the use of the extrapolation of the scores.
+
+    @return:  True if the scores are extrapolated, else False.
+    @rtype:   C{bool}
+    """
+
+    return self._acceleration
+
+  def set_acceleration(self, acceleration):
+    """
+    Setter of the use of the extrapolation of the scores.
+
+    @param  acceleration: True if the scores must be extrapolated, else False.
+    @type   acceleration: C{bool}
+    """
+
+    self._acceleration = acceleration
+
+  def warm_start(self):
+    """
+    Getter of the use of the previous scores to start the iterations.
+
+    @return:  True if the iterations start from the previous scores, else False.
+    @rtype:   C{bool}
+    """
+
+    return self._warm_start
+
+  def set_warm_start(self, warm_start):
+    """
+    Setter of the use of the previous scores to start the iterations.
+
+    @param  warm_start: True if the iterations must start from the previous
+                        scores, else False.
+    @type   warm_start: C{bool}
+    """
+
+    self._warm_start = warm_start
+
+  def previous_scores(self):
+    """
+    Getter of the latest scores of the nodes of the previously solved graphs
+    (at most C{MAX_NB_PREVIOUS_SCORES} nodes).
+
+    @return:  The previous score of each node.
+    @rtype:   C{dict(object, float)}
+    """
+
+    return self._previous_scores
+
+  def set_previous_scores(self, previous_scores):
+    """
+    Setter of the scores of the previously solved graph.
+
+    @param  previous_scores:  The new previous score of each node.
+    @type   previous_scores:  C{dict(object, float)}
+    """
+
+    self._previous_scores = previous_scores
+
+  def statistics(self):
+    """
+    Getter of the statistics of the last solved graphs (at most
+    C{MAX_NB_STATISTICS}, or the size of the last batch).
+
+    @return:  The number of iterations, the residual and the convergence (True
+              if the scores are stable, else False) of each of the last solved
+              graphs.
+    @rtype:   C{list(tuple(int, float, bool))}
+    """
+
+    return self._statistics
+
+  def set_statistics(self, statistics):
+    """
+    Setter of the statistics of the solved graphs.
+
+    @param  statistics: The new number of iterations, residual and convergence
+                        of each solved graph.
+    @type   statistics: C{list(tuple(int, float, bool))}
+    """
+
+    self._statistics = statistics
+
+  def residual(self, max_difference, differences_sum, scores_sum):
+    """
+    Computes the value of the convergence criterion for an iteration.
+
+    @param    max_difference:   The maximum absolute change of a node's score.
+    @type     max_difference:   C{float}
+    @param    differences_sum:  The sum of the absolute changes of the nodes'
+                                score.
+    @type     differences_sum:  C{float}
+    @param    scores_sum:       The sum of the absolute scores of the nodes.
+    @type     scores_sum:       C{float}
+
+    @return:  The value of the convergence criterion.
+    @rtype:   C{float}
+    """
+
+    if self.convergence_criterion() == CONVERGENCE_CRITERION.L1:
+      return differences_sum
+    elif self.convergence_criterion() == CONVERGENCE_CRITERION.RELATIVE:
+      if scores_sum > 0.0:
+        return differences_sum / scores_sum
+      else:
+        return differences_sum
+    else:
+      return max_difference
+
+  def solve(self, transitions, constants, initial_scores):
+    """
+    Computes the scores of the nodes of a graph.
+
+    @param    transitions:    The transition coefficients, the target node
+                              associated with the source node associated with
+                              the coefficient.
+    @type     transitions:    C{dict(object, dict(object, float))}
+    @param    constants:      The constant of each node.
+    @type     constants:      C{dict(object, float)}
+    @param    initial_scores: The score of each node before the iterations.
+    @type     initial_scores: C{dict(object, float)}
+
+    @return:  The score of each node.
+    @rtype:   C{dict(object, float)}
+    """
+
+    return self.solve_batch([(transitions, constants, initial_scores)])[0]
+
+  def solve_batch(self, graphs):
+    """
+    Computes the scores of the nodes of several graphs. With the sparse matrix
+    solver, the graphs are solved together as one block-diagonal system: each
+    iteration is vectorized over every graph and the graphs stop being iterated
+    as soon as their own scores are stable, so each graph gets the scores (and
+    statistics) it would get alone. With warm starts, each graph must start from
+    the scores of the graphs before it, so the graphs are solved one after the
+    other, as with successive calls to C{solve}.
+
+    @param    graphs: The transition coefficients, the constants and the
+                      initial scores of each graph.
+    @type     graphs: C{list(tuple(dict(object, dict(object, float)),
+                      dict(object, float), dict(object, float)))}
+
+    @return:  The score of each node of each graph.
+    @rtype:   C{list(dict(object, float))}
+    """
+
+    results = []
+
+    # graphs solved together can not start from each other's scores
+    if self.warm_start():
+      blocks = [[graph] for graph in graphs]
+    else:
+      blocks = [graphs]
+
+    for block in blocks:
+      warm_graphs = []
+      block_results = []
+
+      for transitions, constants, initial_scores in block:
+        scores = initial_scores.copy()
+
+        if self.warm_start():
+          previous_scores = self.previous_scores()
+
+          for node in scores:
+            if previous_scores.has_key(node):
+              scores[node] = previous_scores[node]
+
+        warm_graphs.append((transitions, constants, scores))
+
+      if self.solver() == PAGERANK_SOLVER.SPARSE_MATRIX and numpy != None:
+        block_results = self.sparse_matrix_iterations(warm_graphs)
+      else:
+        for transitions, constants, scores in warm_graphs:
+          block_results.append(self.dictionary_iterations(transitions,
+                                                          constants,
+                                                          scores))
+
+      for scores, nb_iterations, residual in block_results:
+        self.statistics().append((nb_iterations,
+                                  residual,
+                                  residual <= self.convergence_threshold()))
+
+        if self.warm_start():
+          if len(self.previous_scores()) + len(scores) \
+             > MAX_NB_PREVIOUS_SCORES:
+            self.set_previous_scores({})
+          self.previous_scores().update(scores)
+
+      results.extend(block_results)
+
+    # the statistics of the whole batch are kept, for the callers to read them
+    del self.statistics()[:-max(MAX_NB_STATISTICS, len(results))]
+
+    return [scores for scores, nb_iterations, residual in results]
+
+  def dictionary_iterations(self, transitions, constants, scores):
+    """
+    Iterates the formula over the in edges of each node, with Jacobi (the scores
+    of an iteration are computed from the scores of the previous iteration) or
+    Gauss-Seidel (the scores are computed from the latest scores) updates.
+
+    @param    transitions:  The transition coefficients, the target node
+                            associated with the source node associated with the
+                            coefficient.
+    @type     transitions:  C{dict(object, dict(object, float))}
+    @param    constants:    The constant of each node.
+    @type     constants:    C{dict(object, float)}
+    @param    scores:       The score of each node before the iterations.
+    @type     scores:       C{dict(object, float)}
+
+    @return:  The score of each node, the number of iterations and the residual.
+    @rtype:   C{tuple(dict(object, float), int, float)}
+    """
+
+    gauss_seidel = (self.solver() == PAGERANK_SOLVER.GAUSS_SEIDEL)
+    previous_iterations = []
+    residual = float("inf")
+    nb_iterations = 0
+
+    while residual > self.convergence_threshold() \
+          and nb_iterations < self.max_iterations():
+      previous_scores = scores
+      max_difference = 0.0
+      differences_sum = 0.0
+      scores_sum = 0.0
+
+      if not gauss_seidel:
+        scores = previous_scores.copy()
+
+      for node, node_transitions in transitions.items():
+        previous_score = scores[node]
+        new_score = constants[node]
+
+        for in_node, coefficient in node_transitions.items():
+          new_score += coefficient * previous_scores[in_node]
+
+        difference = math.fabs(new_score - previous_score)
+        max_difference = max(max_difference, difference)
+        differences_sum += difference
+        scores_sum += math.fabs(new_score)
+
+        scores[node] = new_score
+
+      residual = self.residual(max_difference, differences_sum, scores_sum)
+      nb_iterations += 1
+
+      # Aitken extrapolation of the three last iterations
+      if self.acceleration() and residual > self.convergence_threshold():
+        previous_iterations.append(scores.copy())
+
+        if len(previous_iterations) > 3:
+          previous_iterations.pop(0)
+        if nb_iterations % ACCELERATION_PERIOD == 0 \
+           and len(previous_iterations) == 3:
+          scores0, scores1, scores2 = previous_iterations
+
+          for node in scores:
+            difference1 = scores1[node] - scores0[node]
+            difference2 = scores2[node] - scores1[node]
+
+            # only the monotonically converging scores are extrapolated
+            if difference1 * difference2 > 0.0 \
+               and math.fabs(difference2) < math.fabs(difference1):
+              scores[node] = scores2[node] \
+                             - ((difference2 ** 2) \
+                                / (difference2 - difference1))
+          previous_iterations = []
+
+    return scores, nb_iterations, residual
+
+  def sparse_matrix_iterations(self, graphs):
+    """
+    Iterates the formula with Jacobi updates, vectorized over the (CSR)
+    block-diagonal transition matrix of several graphs. The scores of a graph
+    are not updated anymore once they are stable.
+
+    @param    graphs: The transition coefficients, the constants and the scores
+                      before the iterations of each graph.
+    @type     graphs: C{list(tuple(dict(object, dict(object, float)),
+                      dict(object, float), dict(object, float)))}
+
+    @return:  The score of each node, the number of iterations and the residual
+              of each graph.
+    @rtype:   C{list(tuple(dict(object, float), int, float))}
+    """
+
+    ##### Block-diagonal system ################################################
+    graph_nodes = []
+    row_offsets = [numpy.zeros(1, dtype=numpy.int64)]
+    column_indexes = []
+    values = []
+    constant_vector = []
+    score_vector = []
+    block_starts = []
+    block_sizes = []
+    nb_nodes = 0
+    nb_values = 0
+
+    for transitions, constants, scores in graphs:
+      nodes = list(transitions)
+      block_row_offsets, block_column_indexes, block_values = csr_matrix(nodes,
+                                                                         transitions)
+
+      graph_nodes.append(nodes)
+      row_offsets.append(block_row_offsets[1:] + nb_values)
+      column_indexes.append(block_column_indexes + nb_nodes)
+      values.append(block_values)
+      constant_vector.extend(constants[node] for node in nodes)
+      score_vector.extend(scores[node] for node in nodes)
+      block_starts.append(nb_nodes)
+      block_sizes.append(len(nodes))
+      nb_nodes += len(nodes)
+      nb_values += len(block_values)
+
+    row_offsets = numpy.concatenate(row_offsets)
+    column_indexes = numpy.concatenate(column_indexes + [numpy.zeros(0, dtype=numpy.int64)])
+    values = numpy.concatenate(values + [numpy.zeros(0, dtype=numpy.float64)])
+    constant_vector = numpy.array(constant_vector, dtype=numpy.float64)
+    score_vector = numpy.array(score_vector, dtype=numpy.float64)
+    block_starts = numpy.array(block_starts, dtype=numpy.int64)
+    block_sizes = numpy.array(block_sizes, dtype=numpy.int64)
+    # row of each value, for the matrix-vector products
+    rows = numpy.repeat(numpy.arange(nb_nodes), numpy.diff(row_offsets))
+
+    ##### Iterations ###########################################################
+    residuals = numpy.zeros(len(graphs), dtype=numpy.float64)
+    nb_iterations = numpy.zeros(len(graphs), dtype=numpy.int64)
+    # the empty graphs are stable after one iteration
+    active_blocks = block_sizes > 0
+    residuals[~active_blocks] = 0.0
+    nb_iterations[~active_blocks] = min(1, self.max_iterations())
+    residuals[active_blocks] = float("inf")
+    # the reductions by graph are done over the non-empty graphs only
+    reduction_starts = block_starts[active_blocks]
+    reduction_blocks = numpy.nonzero(active_blocks)[0]
+    previous_iterations = []
+    iteration = 0
+
+    while active_blocks.any() and iteration < self.max_iterations():
+      new_score_vector = constant_vector \
+                         + numpy.bincount(rows,
+                                          weights=values * score_vector[column_indexes],
+                                          minlength=nb_nodes)
+      differences = numpy.fabs(new_score_vector - score_vector)
+      max_differences = numpy.maximum.reduceat(differences, reduction_starts)
+      differences_sums = numpy.add.reduceat(differences, reduction_starts)
+
+      if self.convergence_criterion() == CONVERGENCE_CRITERION.L1:
+        block_residuals = differences_sums
+      elif self.convergence_criterion() == CONVERGENCE_CRITERION.RELATIVE:
+        scores_sums = numpy.add.reduceat(numpy.fabs(new_score_vector),
+                                         reduction_starts)
+        block_residuals = numpy.where(scores_sums > 0.0,
+                                      differences_sums \
+                                      / numpy.where(scores_sums > 0.0,
+                                                    scores_sums,
+                                                    1.0),
+                                      differences_sums)
+      else:
+        block_residuals = max_differences
+
+      # only the graphs which are not stable yet are updated
+      updated_blocks = reduction_blocks[active_blocks[reduction_blocks]]
+      updated_nodes = numpy.repeat(active_blocks, block_sizes)
+      residuals[updated_blocks] = block_residuals[active_blocks[reduction_blocks]]
+      nb_iterations[updated_blocks] += 1
+      score_vector = numpy.where(updated_nodes, new_score_vector, score_vector)
+      active_blocks = active_blocks & (residuals > self.convergence_threshold())
+      iteration += 1
+
+      # Aitken extrapolation of the three last iterations (of the graphs which
+      # are not stable yet)
+      if self.acceleration() and active_blocks.any():
+        previous_iterations.append(score_vector)
+
+        if len(previous_iterations) > 3:
+          previous_iterations.pop(0)
+        if iteration % ACCELERATION_PERIOD == 0 \
+           and len(previous_iterations) == 3:
+          scores0, scores1, scores2 = previous_iterations
+          differences1 = scores1 - scores0
+          differences2 = scores2 - scores1
+          # only the monotonically converging scores are extrapolated
+          extrapolable = ((differences1 * differences2) > 0.0) \
+                         & (numpy.fabs(differences2) < numpy.fabs(differences1)) \
+                         & numpy.repeat(active_blocks, block_sizes)
+          score_vector = scores2.copy()
+          score_vector[extrapolable] -= (differences2[extrapolable] ** 2) \
+                                        / (differences2 - differences1)[extrapolable]
+          previous_iterations = []
+
+    ##### Scores of each graph #################################################
+    results = []
+    score_list = score_vector.tolist()
+
+    for index, nodes in enumerate(graph_nodes):
+      start = block_starts[index]
+
+      results.append((dict(zip(nodes, score_list[start:start + len(nodes)])),
+                      int(nb_iterations[index]),
+                      float(residuals[index])))
+
+    return results
+
+################################################################################
+
+def csr_matrix(nodes, transitions):
+  """
+  Gives the transition matrix of a graph in the compressed sparse row format:
+  the row of a node contains the transition coefficients of its in edges.
+
+  @param    nodes:        The nodes of the graph, in the order of the rows (and
+                          columns) of the matrix.
+  @type     nodes:        C{list(object)}
+  @param    transitions:  The transition coefficients, the target node
+                          associated with the source node associated with the
+                          coefficient.
+  @type     transitions:  C{dict(object, dict(object, float))}
+
+  @return:  The row offsets, the column indexes and the values of the matrix.
+  @rtype:   C{tuple(numpy.array, numpy.array, numpy.array)}
+  """
+
+  node_indexes = dict((node, index) for index, node in enumerate(nodes))
+  row_offsets = [0]
+  column_indexes = []
+  values = []
+
+  for node in nodes:
+    for in_node, coefficient in transitions[node].items():
+      column_indexes.append(node_indexes[in_node])
+      values.append(coefficient)
+    row_offsets.append(len(values))
+
+  return (numpy.array(row_offsets, dtype=numpy.int64),
+          numpy.array(column_indexes, dtype=numpy.int64),
+          numpy.array(values, dtype=numpy.float64))
@@ -2,7 +2,9 @@
 # -*- encoding: utf-8 -*-
 
 import collections
-import math
+from pagerank import MAX_ITERATIONS
+from pagerank import PAGERANK_SOLVER
+from pagerank import PageRankSolver
 
 class TextRank(object):
   """
@@ -33,7 +35,8 @@ class TextRank(object):
                scoring_function,
                convergence_threshold=0.0001,
                recomendation_weight=0.85,
-               max_ranking_iterations=1000000):
+               max_ranking_iterations=MAX_ITERATIONS,
+               solver=PAGERANK_SOLVER.DICTIONARY):
     """
     Constructor.
 
@@ -54,15 +57,18 @@ class TextRank(object):
                                     the weight computation, in case the ranking
                                     does not reach a stable state.
     @type   max_ranking_iteration:  C{int}
+    @param  solver:                 The solver used for the weight computation.
+    @type   solver:                 C{PAGERANK_SOLVER}
     """
 
     super(TextRank, self).__init__()
 
+    self.set_pagerank_solver(PageRankSolver(solver,
+                                            convergence_threshold,
+                                            max_iterations=max_ranking_iterations))
     self.set_strategy(strategy)
     self.set_scoring_function(scoring_function)
-    self.set_convergence_threshold(convergence_threshold)
     self.set_recomendation_weight(recomendation_weight)
-    self.set_max_ranking_iterations(max_ranking_iterations)
 
   def strategy(self):
     """
@@ -118,7 +124,7 @@ class TextRank(object):
     @rtype:   C{float}
     """
 
-    return self._convergence_threshold
+    return self.pagerank_solver().convergence_threshold()
 
   def set_convergence_threshold(self, convergence_threshold):
     """
@@ -130,7 +136,7 @@ class TextRank(object):
     @type   convergence_threshold:  C{float}
     """
 
-    self._convergence_threshold = convergence_threshold
+    self.pagerank_solver().set_convergence_threshold(convergence_threshold)
 
   def recomendation_weight(self):
     """
@@ -164,7 +170,7 @@ class TextRank(object):
     @rtype:   max_ranking_iterations: C{int}
     """
 
-    return self._max_ranking_iterations
+    return self.pagerank_solver().max_iterations()
 
   def set_max_ranking_iterations(self, max_ranking_iterations):
     """
@@ -176,7 +182,50 @@ class TextRank(object):
     @type   max_ranking_iterations: C{int}
     """
 
-    self._max_ranking_iterations = max_ranking_iterations
+    self.pagerank_solver().set_max_iterations(max_ranking_iterations)
+
+  def solver(self):
+    """
+    Getter of the solver used for the weight computation.
+
+    @return:  The solver computing the nodes' score.
+    @rtype:   C{PAGERANK_SOLVER}
+    """
+
+    return self.pagerank_solver().solver()
+
+  def set_solver(self, solver):
+    """
+    Setter of the solver used for the weight computation.
+
+    @param  solver: The new solver computing the nodes' score (the sparse matrix
+                    solver requires NumPy).
+    @type   solver: C{PAGERANK_SOLVER}
+    """
+
+    self.pagerank_solver().set_solver(solver)
+
+  def pagerank_solver(self):
+    """
+    Getter of the iterative solver used for the weight computation (it also
+    gives the iteration statistics of the ranked documents).
+
+    @return:  The iterative solver computing the nodes' score.
+    @rtype:   C{PageRankSolver}
+    """
+
+    return self._pagerank_solver
+
+  def set_pagerank_solver(self, pagerank_solver):
+    """
+    Setter of the iterative solver used for the weight computation.
+
+    @param  pagerank_solver:  The new iterative solver computing the nodes'
+                              score.
+    @type   pagerank_solver:  C{PageRankSolver}
+    """
+
+    self._pagerank_solver = pagerank_solver
 
   def rank(self, tokens, context):
     """
@@ -194,6 +243,33 @@ class TextRank(object):
     @rtype:   C{List(tuple(string, float))}
     """
 
+    graph = self.graph(tokens, context)
+    token_ids, strategy_tokens, transitions, random_walks, scores = graph
+
+    ##### Score computation ####################################################
+    scores = self.pagerank_solver().solve(transitions, random_walks, scores)
+
+    return self.token_scores(tokens, context, graph, scores)
+
+  def graph(self, tokens, context):
+    """
+    Creates the graph of the given tokens, to be solved by the PageRank solver
+    (several graphs can be solved at once with the solver's C{solve_batch}).
+
+    @param    tokens:   The textual units to rank.
+    @type     tokens:   C{list(string)}
+    @param    context:  The text (POS tagged sentences) in wich the given tokens
+                        are extracted from.
+    @type     context:  C{list(string)}
+
+    @return:  The graph: the tokens of the strategy organized by identifier, the
+              tokens of the strategy, the transition coefficients, the random
+              walk constants and the initial scores of the nodes.
+    @rtype:   C{tuple(dict(string, list(string)), list(string),
+              dict(string, dict(string, float)), dict(string, float),
+              dict(string, float))}
+    """
+
     ##### Strategy reinitialization ############################################
     self.strategy().reset(tokens, context)
 
@@ -201,48 +277,57 @@ class TextRank(object):
     token_ids = self.strategy().token_ids()
     in_edges = {}
     weighted_degrees = {}
+    transitions = {}
+    random_walks = {}
     scores = {}
 
     for identifier in token_ids:
       in_edges[identifier] = {}
       weighted_degrees[identifier] = 0.0
+      transitions[identifier] = {}
+      random_walks[identifier] = (1 - self.recomendation_weight()) \
+                                 * self.strategy().random_walk(identifier)
       scores[identifier] = 0.0
 
     ##### Graph creation #######################################################
-    for out_token_id in token_ids:
-      for in_token_id in token_ids:
-        if in_token_id != out_token_id:
-          weight = self.strategy().recomendation(in_token_id, out_token_id)
-
-          if weight != 0.0:
-            in_edges[out_token_id][in_token_id] = weight
-            weighted_degrees[in_token_id] += weight
-
-    ##### Score computation ####################################################
-    stabilized = False
-    nb_iterations = 0
+    for out_token_id, recomendations in self.strategy().recomendations().items():
+      for in_token_id, weight in recomendations.items():
+        if weight != 0.0:
+          in_edges[out_token_id][in_token_id] = weight
+          weighted_degrees[in_token_id] += weight
 
-    while not stabilized and nb_iterations < self.max_ranking_iterations():
-      stabilized = True
-      previous_scores = scores.copy()
-
-      for identifier in token_ids:
-        previous_score = previous_scores[identifier]
-        new_score = 0.0
-        recomendation_sum = 0.0
-        random_walk = self.strategy().random_walk(identifier)
-
-        for in_identifier, recomendation in in_edges[identifier].items():
-          recomendation_sum += (recomendation * previous_scores[in_identifier])\
-                               / weighted_degrees[in_identifier]
+    for identifier in token_ids:
+      for in_identifier, recomendation in in_edges[identifier].items():
+        transitions[identifier][in_identifier] = (self.recomendation_weight() \
+                                                  * recomendation) \
+                                                 / weighted_degrees[in_identifier]
+
+    return (token_ids,
+            list(self.strategy().tokens()),
+            transitions,
+            random_walks,
+            scores)
+
+  def token_scores(self, tokens, context, graph, scores):
+    """
+    Gives the scores of the given tokens, from the scores of the nodes of their
+    graph.
 
-        new_score = ((1 - self.recomendation_weight()) * random_walk)\
-                    + (self.recomendation_weight() * recomendation_sum)
+    @param    tokens:   The textual units to rank.
+    @type     tokens:   C{list(string)}
+    @param    context:  The text (POS tagged sentences) in wich the given tokens
+                        are extracted from.
+    @type     context:  C{list(string)}
+    @param    graph:    The graph of the tokens (see C{graph}).
+    @type     graph:    C{tuple}
+    @param    scores:   The score of each node of the graph.
+    @type     scores:   C{dict(string, float)}
 
-        if math.fabs(new_score - previous_score) > self.convergence_threshold():
-          stabilized = False
+    @return:  The given tokens associated with there score.
+    @rtype:   C{List(tuple(string, float))}
+    """
 
-        scores[identifier] = new_score
+    token_ids, strategy_tokens, transitions, random_walks, initial_scores = graph
 
     ##### Associate scores to tokens according to their identifier #############
     token_scores = []
@@ -270,9 +355,12 @@ class TextRank(object):
     #    inputs[token_ids[i][0]] = True
     ############################################################################
 
-    return self.granularity_checking(tokens, context, token_scores)
+    return self.granularity_checking(tokens,
+                                     context,
+                                     token_scores,
+                                     strategy_tokens)
 
-  def granularity_checking(self, tokens, context, scores):
+  def granularity_checking(self, tokens, context, scores, strategy_tokens=None):
     """
     Check if the strategy works on the same type of tokens (same granularity).
     If not, the scores of the tokens will be computed using the scoring_function
@@ -284,6 +372,9 @@ class TextRank(object):
     @type   context:  C{string}
     @param  scores:   The tokens associated with there score.
     @type   scores:   C{list(tuple(string, float))}
+    @param  strategy_tokens:  The tokens the strategy worked on (the current
+                              tokens of the strategy by default).
+    @type   strategy_tokens:  C{list(string)}
 
     @return:  The correct scores.
     @rtype:   C{list(tuple(string, float))}.
@@ -291,7 +382,10 @@ class TextRank(object):
 
     token_scores = scores
     working_tokens = set(tokens)
-    strategy_tokens = set(self.strategy().tokens())
+
+    if strategy_tokens == None:
+      strategy_tokens = self.strategy().tokens()
+    strategy_tokens = set(strategy_tokens)
 
     if strategy_tokens != working_tokens:
       token_scores = []
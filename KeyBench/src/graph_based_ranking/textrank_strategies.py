@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
+from util import vocabulary
+
 class TextRankStrategy(object):
   """
   Strategy to use with the TextRank graph-based ranking algorithm [1]. It allows
@@ -156,7 +158,7 @@ class TextRankStrategy(object):
     given POS tags are ranked).
 
     @return:  The POS tagged used to filter the words to rank.
-    @rtype:   C{list(string)}
+    @rtype:   C{frozenset(string)}
     """
 
     return self._accepted_tags
@@ -170,7 +172,7 @@ class TextRankStrategy(object):
     @rtype:   C{list(string)}
     """
 
-    self._accepted_tags = accepted_tags
+    self._accepted_tags = vocabulary(accepted_tags)
 
   def indexed_sentences(self):
     """
@@ -277,6 +279,7 @@ class TextRankStrategy(object):
 
     ##### Data structures ######################################################
     tokens = []
+    added_tokens = set()
     token_ids = {}
     indexed_sentences = []
     indexed_token_ids = {}
@@ -290,11 +293,12 @@ class TextRankStrategy(object):
       for j, wt in enumerate(s.split()):
         tag = wt.rsplit(self.tag_separator(), 1)[1]
 
-        if self.accepted_tags().count(tag) > 0:
+        if tag in self.accepted_tags():
           w_id = self.identifier(wt)
 
-          if tokens.count(wt) <= 0:
+          if wt not in added_tokens:
             tokens.append(wt)
+            added_tokens.add(wt)
             if not token_ids.has_key(w_id):
               token_ids[w_id] = []
             token_ids[w_id].append(wt)
@@ -359,6 +363,91 @@ class TextRankStrategy(object):
 
     return weight
 
+  def co_occurrence_weight(self, nb_co_occurrences):
+    """
+    Gives the weight of the edge between two groups of tokens (using the tokens'
+    identifier) which co-occur within the window. By default, the graph is not
+    weighted.
+
+    @param  nb_co_occurrences:  The number of co-occurrences of the two groups
+                                of tokens within the window.
+    @type   nb_co_occurrences:  C{int}
+
+    @return:  The weight of the edge.
+    @rtype:   C{float}
+    """
+
+    return 1.0
+
+  def recomendations(self):
+    """
+    Computes the recomendation scores of every linked groups of tokens (using
+    the tokens' identifier), within a single pass over the indexed sentences:
+    only the tokens co-occurring within the window are linked. The strategies
+    redefining C{recomendation} must also redefine this method (e.g. by using
+    C{pairwise_recomendations}).
+
+    @return:  The weights of the edges, the target's identifier associated with
+              the source's identifier associated with the edge's weight.
+    @rtype:   C{dict(string, dict(string, float))}
+    """
+
+    nb_co_occurrences = {}
+    recomendations = {}
+
+    for token_id in self.token_ids():
+      nb_co_occurrences[token_id] = {}
+
+    for s in self.indexed_sentences():
+      occurrences = sorted((j, token_id) \
+                           for token_id, positions in s.items() \
+                           for j in positions)
+
+      for a, (j, in_token_id) in enumerate(occurrences):
+        for k, out_token_id in occurrences[a + 1:]:
+          if k - j >= self.window():
+            break
+
+          if in_token_id != out_token_id:
+            in_counts = nb_co_occurrences[in_token_id]
+            out_counts = nb_co_occurrences[out_token_id]
+
+            in_counts[out_token_id] = in_counts.get(out_token_id, 0) + 1
+            out_counts[in_token_id] = out_counts.get(in_token_id, 0) + 1
+
+    for out_token_id, counts in nb_co_occurrences.items():
+      recomendations[out_token_id] = {}
+
+      for in_token_id, nb in counts.items():
+        recomendations[out_token_id][in_token_id] = self.co_occurrence_weight(nb)
+
+    return recomendations
+
+  def pairwise_recomendations(self):
+    """
+    Computes the recomendation scores of every linked groups of tokens (using
+    the tokens' identifier), by computing the recomendation score of every pair
+    of groups of tokens.
+
+    @return:  The weights of the edges, the target's identifier associated with
+              the source's identifier associated with the edge's weight.
+    @rtype:   C{dict(string, dict(string, float))}
+    """
+
+    recomendations = {}
+
+    for out_token_id in self.token_ids():
+      recomendations[out_token_id] = {}
+
+      for in_token_id in self.token_ids():
+        if in_token_id != out_token_id:
+          weight = self.recomendation(in_token_id, out_token_id)
+
+          if weight != 0.0:
+            recomendations[out_token_id][in_token_id] = weight
+
+    return recomendations
+
   def random_walk(self, token_id):
     """
     Gives the random walk value for a given group of tokens (using the token's
@@ -419,3 +508,18 @@ class SingleRankStrategy(TextRankStrategy):
 
     return weight
 
+  def co_occurrence_weight(self, nb_co_occurrences):
+    """
+    Gives the weight of the edge between two groups of tokens (using the tokens'
+    identifier) which co-occur within the window. The graph is weighted by the
+    number of co-occurrences.
+
+    @param  nb_co_occurrences:  The number of co-occurrences of the two groups
+                                of tokens within the window.
+    @type   nb_co_occurrences:  C{int}
+
+    @return:  The weight of the edge.
+    @rtype:   C{float}
+    """
+
+    return float(nb_co_occurrences)
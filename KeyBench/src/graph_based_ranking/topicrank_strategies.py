@@ -3,8 +3,18 @@
 
 import math
 from textrank_strategies import TextRankStrategy
+from util import TermAutomaton
+
+# NumPy is optional, the distance weights are computed pair by pair without it
+try:
+  import numpy
+except ImportError:
+  numpy = None
 
 ID_TAG = "id"
+# maximum number of inverse distances computed at once (the distances between
+# the positions are computed by blocks of positions)
+DISTANCE_BLOCK_NB_ELEMENTS = 4194304
 
 class CompleteGraphStrategy(TextRankStrategy):
   """
@@ -26,6 +36,7 @@ class CompleteGraphStrategy(TextRankStrategy):
 
     ##### Data structures ######################################################
     tokens = []             # filled
+    added_tokens = set()    # filled
     token_ids = {}          # filled
     indexed_sentences = []  # unfilled
     indexed_token_ids = {}  # filled
@@ -39,11 +50,12 @@ class CompleteGraphStrategy(TextRankStrategy):
       for wt in s.split():
         tag = wt.rsplit(self.tag_separator(), 1)[1]
 
-        if self.accepted_tags().count(tag) > 0:
+        if tag in self.accepted_tags():
           w_id = self.identifier(wt)
 
-          if tokens.count(wt) <= 0:
+          if wt not in added_tokens:
             tokens.append(wt)
+            added_tokens.add(wt)
             if not token_ids.has_key(w_id):
               token_ids[w_id] = []
             token_ids[w_id].append(wt)
@@ -97,6 +109,70 @@ class CompleteGraphStrategy(TextRankStrategy):
 
     return weight
 
+  def recomendations(self):
+    """
+    Computes the recomendation scores of every linked groups of tokens (using
+    the tokens' identifier). The graph being complete, the recomendation score
+    of every pair of groups of tokens is computed. With NumPy, the inverse
+    distances between every pair of positions are computed by blocks of
+    positions and summed by groups of tokens with matrix products, instead of
+    computing the recomendation score of each pair of groups separately.
+
+    @return:  The weights of the edges, the target's identifier associated with
+              the source's identifier associated with the edge's weight.
+    @rtype:   C{dict(string, dict(string, float))}
+    """
+
+    if numpy == None:
+      return self.pairwise_recomendations()
+
+    token_ids = list(self.token_ids())
+    positions = []
+    memberships = []
+    offsets = [] # offset of the first position of each group of tokens
+
+    for index, token_id in enumerate(token_ids):
+      offsets.append(len(positions))
+
+      for position in self.indexed_token_ids()[token_id]:
+        positions.append(position)
+        memberships.append(index)
+
+    positions = numpy.array(positions, dtype=numpy.float64)
+    memberships = numpy.array(memberships, dtype=numpy.int64)
+    weights = numpy.zeros((len(token_ids), len(token_ids)),
+                          dtype=numpy.float64)
+    block_size = max(1, DISTANCE_BLOCK_NB_ELEMENTS / max(1, len(positions)))
+
+    for start in range(0, len(positions), block_size):
+      end = min(start + block_size, len(positions))
+      distances = numpy.fabs(positions[start:end, numpy.newaxis] \
+                             - positions[numpy.newaxis, :])
+      inverse_distances = numpy.zeros(distances.shape, dtype=numpy.float64)
+
+      numpy.divide(1.0, distances, out=inverse_distances, where=distances > 0.0)
+
+      # the positions of a group of tokens are contiguous: the inverse distances
+      # are summed by group of tokens along the positions, then along the
+      # positions of the block
+      numpy.add.at(weights,
+                   memberships[start:end],
+                   numpy.add.reduceat(inverse_distances, offsets, axis=1))
+
+    recomendations = {}
+
+    # the weights are symmetric, the row of a group of tokens gives the weights
+    # of its in edges
+    for out_index, in_weights in enumerate(weights.tolist()):
+      out_token_id = token_ids[out_index]
+      recomendations[out_token_id] = {}
+
+      for in_index, weight in enumerate(in_weights):
+        if in_index != out_index and weight != 0.0:
+          recomendations[out_token_id][token_ids[in_index]] = weight
+
+    return recomendations
+
 ################################################################################
 
 class TopicRankStrategy(TextRankStrategy):
@@ -132,6 +208,7 @@ class TopicRankStrategy(TextRankStrategy):
 
     self.set_stemmer(stemmer)
     self.set_clusters([])
+    self.set_occurrences(None)
     self.set_reverted_token_ids(None)
 
     self.strategy().set_accepted_tags([ID_TAG])
@@ -188,7 +265,7 @@ class TopicRankStrategy(TextRankStrategy):
     given POS tags are ranked).
 
     @return:  The POS tagged used to filter the words to rank.
-    @rtype:   C{list(string)}
+    @rtype:   C{frozenset(string)}
     """
 
     return self.strategy().accepted_tags()
@@ -333,6 +410,30 @@ class TopicRankStrategy(TextRankStrategy):
 
     self._clusters = clusters
 
+  def occurrences(self):
+    """
+    Getter of the occurrences of the clustered tokens.
+
+    @return:  The occurrences of each token, as (sentence index, start offset,
+              end offset), or None if the tokens must be searched in the
+              context.
+    @rtype:   C{dict(string, list(tuple(int, int, int)))}
+    """
+
+    return self._occurrences
+
+  def set_occurrences(self, occurrences):
+    """
+    Setter of the occurrences of the clustered tokens (e.g. the occurrences of
+    the candidates given by the candidate extractor).
+
+    @param  occurrences:  The new occurrences of each token, or None if the
+                          tokens must be searched in the context.
+    @type   occurrences:  C{dict(string, list(tuple(int, int, int)))}
+    """
+
+    self._occurrences = occurrences
+
   def reverted_token_ids(self):
     """
     Getter of the reverted version of the _token_ids attribute.
@@ -384,26 +485,58 @@ class TopicRankStrategy(TextRankStrategy):
     modified_context = []
     token_ids = {}
     reverted_token_ids = {}
+    cluster_indexes = {}
 
-    # modify the context for the decorated strategy
-    # FIXME the replacement may remove some tokens because of overlapping from
-    #       different clusters
+    # cluster of each token (the smaller cluster, if a token is in several
+    # clusters)
+    for index, cluster_tokens in sorted(enumerate(self.clusters()),
+                                        key=lambda (i, c): len(c)):
+      for token in cluster_tokens:
+        if not cluster_indexes.has_key(token):
+          cluster_indexes[token] = index
+
+    # longest occurrence (end and cluster) starting at each position, by
+    # sentence. The given occurrences are used as is, otherwise the tokens are
+    # searched within one pass over each sentence
+    sentence_occurrences = [{} for sentence in context]
+
+    if self.occurrences() != None:
+      for token, index in cluster_indexes.items():
+        for i, start, end in self.occurrences().get(token, []):
+          if end > sentence_occurrences[i].get(start, (start, None))[0]:
+            sentence_occurrences[i][start] = (end, index)
+    else:
+      term_automaton = TermAutomaton(cluster_indexes.keys())
+
+      for i, sentence in enumerate(context):
+        words = sentence.split()
+
+        for start, end in term_automaton.matches(words):
+          if end > sentence_occurrences[i].get(start, (start, None))[0]:
+            sentence_occurrences[i][start] = (end,
+                                              cluster_indexes[" ".join(words[start:end])])
+
+    # modify the context for the decorated strategy, replacing the occurrences
+    # of the tokens by the identifier of their cluster (the overlapping
+    # occurrences are resolved by keeping the first one, and the longest one if
+    # several start at the same position)
     for i, sentence in enumerate(context):
-      modified_sentence = sentence
-
-      # replacement, starting with the smaller clusters
-      for index, cluster_tokens in sorted(enumerate(self.clusters()),
-                                          key=lambda (i, c): len(c)):
-        # replacement, staring with the bigger terms
-        for token in sorted(cluster_tokens,
-                            key=lambda t: len(t.split()),
-                            reverse=True):
-          new_token = "%d%s%s"%(index,
-                                self.tag_separator(),
-                                ID_TAG)
-          modified_sentence = modified_sentence.replace(token, new_token)
-
-      modified_context.append(modified_sentence)
+      words = sentence.split()
+      occurrences = sentence_occurrences[i]
+      modified_words = []
+      j = 0
+
+      while j < len(words):
+        if occurrences.has_key(j):
+          end, index = occurrences[j]
+
+          modified_words.append("%d%s%s"%(index, self.tag_separator(), ID_TAG))
+          j = end
+        else:
+          modified_words.append(words[j])
+          j += 1
+
+      modified_context.append(" ".join(modified_words))
 
     # the strategy will work on words, but the results will be like a work on
     # terms
@@ -444,15 +577,40 @@ class TopicRankStrategy(TextRankStrategy):
     @rtype:   C{float}
     """
 
-    # FIXME some tokens may have been removed because of overlapping from
-    #       different clusters when doing context modification in the reset
-    #       function
+    # the clusters whose occurrences all overlap occurrences of other clusters
+    # are not in the context modified by the reset function
     if self.strategy().token_ids().has_key(in_token_id) \
        and self.strategy().token_ids().has_key(out_token_id):
       return self.strategy().recomendation(in_token_id, out_token_id)
     else:
       return 0.0
 
+  def recomendations(self):
+    """
+    Computes the recomendation scores of every linked groups of tokens (using
+    the tokens' identifier), with the decorated strategy. Only the edges between
+    the candidate clusters are kept.
+
+    @return:  The weights of the edges, the target's identifier associated with
+              the source's identifier associated with the edge's weight.
+    @rtype:   C{dict(string, dict(string, float))}
+    """
+
+    recomendations = {}
+    strategy_recomendations = self.strategy().recomendations()
+
+    for out_token_id in self.token_ids():
+      recomendations[out_token_id] = {}
+
+      # the clusters whose occurrences all overlap occurrences of other clusters
+      # are not in the context modified by the reset function
+      if strategy_recomendations.has_key(out_token_id):
+        for in_token_id, weight in strategy_recomendations[out_token_id].items():
+          if self.token_ids().has_key(in_token_id):
+            recomendations[out_token_id][in_token_id] = weight
+
+    return recomendations
+
   def random_walk(self, token_id):
     """
     Gives the random walk value for a given group of tokens (using the token's
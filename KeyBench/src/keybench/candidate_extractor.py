@@ -38,7 +38,9 @@ class CandidateExtractorC(BenchmarkComponent):
 
   def extract_candidates(self, filepath, pre_processed_file):
     """
-    Extracts the candidates from a pre-processed file.
+    Extracts the candidates from a pre-processed file. The candidates are given
+    in the order of their first occurrence and their occurrences are cached with
+    them (see C{extract_candidate_occurrences}).
 
     @param    filepath:           The path of the analysed file.
     @type     filepath:           C{string}
@@ -49,23 +51,52 @@ class CandidateExtractorC(BenchmarkComponent):
     @rtype:   C{list(string)}
     """
 
+    return self.extract_candidate_occurrences(filepath, pre_processed_file)[0]
+
+  def extract_candidate_occurrences(self, filepath, pre_processed_file):
+    """
+    Extracts the candidates from a pre-processed file, along with their
+    occurrences, so that the candidates do not have to be searched again in the
+    document.
+
+    @param    filepath:           The path of the analysed file.
+    @type     filepath:           C{string}
+    @param    pre_processed_file: The pre-processed analysed file.
+    @type     pre_processed_file: C{PreProcessedFile}
+
+    @return:  The candidates, in the order of their first occurrence, and the
+              occurrences of each candidate, as (sentence index, start token
+              offset, end token offset), in the order of the document. The
+              occurrences are None if the candidates were cached before their
+              occurrences were.
+    @rtype:   C{tuple(list(string), dict(string, list(tuple(int, int, int))))}
+    """
+
     lazy_filename = path.split(filepath)[1] + ".cdt"
+    lazy_occurrence_filename = path.split(filepath)[1] + ".occ"
     candidates = []
+    occurrences = None
 
     if super(CandidateExtractorC, self).is_lazy() \
        and super(CandidateExtractorC, self).is_cached(lazy_filename):
       candidates = super(CandidateExtractorC, self).load(lazy_filename)
+
+      if super(CandidateExtractorC, self).is_cached(lazy_occurrence_filename):
+        occurrences = super(CandidateExtractorC,
+                            self).load(lazy_occurrence_filename)
     else:
       # extraction
       super(CandidateExtractorC,
             self).log("Extracting candidates of %s..."%filepath)
-      candidates = list(set(self.candidate_extraction(pre_processed_file)))
+      candidates, occurrences = self.candidate_occurrences(self.candidate_extraction(pre_processed_file))
 
       # serialization
       super(CandidateExtractorC,
             self).log("Puting %s's candidates into cache..."%filepath)
       super(CandidateExtractorC,
             self).store(lazy_filename, candidates)
+      super(CandidateExtractorC,
+            self).store(lazy_occurrence_filename, occurrences)
 
       # store string representation
       super(CandidateExtractorC,
@@ -77,18 +108,53 @@ class CandidateExtractorC(BenchmarkComponent):
         string_rep += c
       super(CandidateExtractorC, self).store_string(lazy_filename, string_rep)
 
-    return candidates
+    return candidates, occurrences
+
+  def candidate_occurrences(self, candidate_spans):
+    """
+    Gathers the occurrences of the candidates from the spans given by the
+    candidate extraction.
+
+    @param    candidate_spans:  The extracted candidates, as (candidate, sentence
+                                index, start token offset, end token offset).
+    @type     candidate_spans:  C{list(tuple(string, int, int, int))}
+
+    @return:  The candidates, without duplicates, ordered by first occurrence,
+              and the occurrences of each candidate.
+    @rtype:   C{tuple(list(string), dict(string, list(tuple(int, int, int))))}
+    """
+
+    occurrences = {}
+    candidates = []
+
+    for candidate, sentence_index, start, end in candidate_spans:
+      if candidate not in occurrences:
+        occurrences[candidate] = set()
+        candidates.append(candidate)
+      occurrences[candidate].add((sentence_index, start, end))
+
+    for candidate in candidates:
+      occurrences[candidate] = sorted(occurrences[candidate])
+
+    # the sort is stable, the candidates occurring first at the same position
+    # stay in the extraction order
+    candidates = sorted(candidates, key=lambda c: occurrences[c][0][:2])
+
+    return candidates, occurrences
 
   def candidate_extraction(self, pre_processed_file):
     """
-    Extracts the candidates from a pre-processed file.
+    Extracts the candidates from a pre-processed file. Each occurrence of a
+    candidate is given with its position in the document (the POS tagged words
+    of the candidate are the words of the sentence between the start and the end
+    offsets).
 
     @param    pre_processed_file: The pre-processed analysed file.
     @type     pre_processed_file: C{PreProcessedFile}
 
-    @return:  A list of candidates.
-    @rtype:   C{list(string)}
+    @return:  A list of candidate spans (candidate, sentence index, start token
+              offset, end token offset).
+    @rtype:   C{list(tuple(string, int, int, int))}
     """
 
     raise NotImplementedError()
-
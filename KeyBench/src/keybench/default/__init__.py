@@ -2,6 +2,7 @@
 # -*- encoding: utf-8 -*-
 
 import util
+from composite_extractor import CompositeExtractor
 from fake_clusterer import FakeClusterer
 from n_gram_extractor import NGramExtractor
 from prf_evaluator import PRFEvaluator
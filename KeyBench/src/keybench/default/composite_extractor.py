@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+from keybench.candidate_extractor import CandidateExtractorC
+from multiprocessing import Pool
+from os import listdir
+from os import path
+
+##### Multi-processing #########################################################
+
+# pre-processor and composite extractor of the worker processes, given once to
+# each worker when the pool is created instead of with each file (can't be
+# modified globally outside list)
+worker_extraction = [None]
+
+def composite_extraction_pool_initializer(pre_processor, composite_extractor):
+  """
+  Initialization of a candidate extraction worker.
+
+  @param  pre_processor:        The pre-processor of the files to analyse.
+  @type   pre_processor:        C{PreProcessorC}
+  @param  composite_extractor:  The composite extractor of the files to analyse.
+  @type   composite_extractor:  C{CompositeExtractor}
+  """
+
+  worker_extraction[0] = (pre_processor, composite_extractor)
+
+def composite_extraction_pool_worker(filepath):
+  """
+  Remote candidate extraction. It extracts the candidates of one file with every
+  candidate extractor of the worker's composite extractor.
+
+  @param  filepath: The path of the file to analyse.
+  @type   filepath: C{string}
+  """
+
+  pre_processor, composite_extractor = worker_extraction[0]
+
+  composite_extractor.extract_all_candidates(filepath, pre_processor)
+
+################################################################################
+
+class CompositeExtractor(CandidateExtractorC):
+  """
+  Component running several candidate extractors over the same documents. Each
+  document is pre-processed (or loaded from the cache) once, then given to every
+  candidate extractor, which stores its own candidates into its cache. The
+  candidates of the composite extractor are the candidates of all its
+  extractors.
+  """
+
+  def __init__(self, name, is_lazy, lazy_directory, debug, candidate_extractors):
+    """
+    Constructor of the component.
+
+    @param  name:                 The name of the component.
+    @type   name:                 C{string}
+    @param  is_lazy:              True if the component must load previous data,
+                                  False if data must be computed tought they
+                                  have already been computed.
+    @type   is_lazy:              C{bool}
+    @param  lazy_directory:       The directory used to store previously
+                                  computed data.
+    @type   lazy_directory:       C{string}
+    @param  debug:                True if the component is in debug mode, else
+                                  False. When the component is in debug mode, it
+                                  will output each step of its processing.
+    @type   debug:                C{bool}
+    @param  candidate_extractors: The candidate extractors to run.
+    @type   candidate_extractors: C{list(CandidateExtractorC)}
+    """
+
+    super(CompositeExtractor, self).__init__(name,
+                                             is_lazy,
+                                             lazy_directory,
+                                             debug)
+
+    self.set_candidate_extractors(candidate_extractors)
+
+  def candidate_extractors(self):
+    """
+    Getter of the candidate extractors to run.
+
+    @return:  The candidate extractors.
+    @rtype:   C{list(CandidateExtractorC)}
+    """
+
+    return self._candidate_extractors
+
+  def set_candidate_extractors(self, candidate_extractors):
+    """
+    Setter of the candidate extractors to run.
+
+    @param  candidate_extractors: The new candidate extractors.
+    @type   candidate_extractors: C{list(CandidateExtractorC)}
+    """
+
+    self._candidate_extractors = candidate_extractors
+
+  def extract_candidate_occurrences(self, filepath, pre_processed_file):
+    """
+    Extracts the candidates from a pre-processed file, along with their
+    occurrences, with every candidate extractor (each one uses its own cache).
+
+    @param    filepath:           The path of the analysed file.
+    @type     filepath:           C{string}
+    @param    pre_processed_file: The pre-processed analysed file.
+    @type     pre_processed_file: C{PreProcessedFile}
+
+    @return:  The candidates of all the candidate extractors, in the order of
+              their first occurrence, and the occurrences of each candidate. The
+              occurrences are None if the candidates of one of the extractors
+              were cached before their occurrences were.
+    @rtype:   C{tuple(list(string), dict(string, list(tuple(int, int, int))))}
+    """
+
+    candidates = []
+    candidate_spans = []
+    located = True
+
+    for candidate_extractor in self.candidate_extractors():
+      extracted_candidates, occurrences = candidate_extractor.extract_candidate_occurrences(filepath,
+                                                                                           pre_processed_file)
+
+      if occurrences == None:
+        located = False
+      else:
+        for candidate in extracted_candidates:
+          for sentence_index, start, end in occurrences[candidate]:
+            candidate_spans.append((candidate, sentence_index, start, end))
+      candidates.extend(extracted_candidates)
+
+    if not located:
+      unique_candidates = []
+      seen_candidates = set()
+
+      for candidate in candidates:
+        if candidate not in seen_candidates:
+          seen_candidates.add(candidate)
+          unique_candidates.append(candidate)
+
+      return unique_candidates, None
+
+    return self.candidate_occurrences(candidate_spans)
+
+  def extract_all_candidates(self, filepath, pre_processor):
+    """
+    Extracts the candidates of a file with the candidate extractors which do not
+    have them in cache. The file is pre-processed only if at least one candidate
+    extractor needs it, then its split sentences (see
+    C{PreProcessedFile.full_text_tokens}) are shared by the candidate
+    extractors.
+
+    @param  filepath:       The path of the analysed file.
+    @type   filepath:       C{string}
+    @param  pre_processor:  The pre-processor of the file.
+    @type   pre_processor:  C{PreProcessorC}
+    """
+
+    lazy_filename = path.split(filepath)[1] + ".cdt"
+    pre_processed_file = None
+
+    for candidate_extractor in self.candidate_extractors():
+      if not candidate_extractor.is_lazy() \
+         or not candidate_extractor.is_cached(lazy_filename):
+        if pre_processed_file == None:
+          pre_processed_file = pre_processor.pre_process_file(filepath)
+
+        candidate_extractor.extract_candidates(filepath, pre_processed_file)
+
+  def extract_corpus_candidates(self,
+                                corpus_directory,
+                                extension,
+                                pre_processor,
+                                nb_processes=None):
+    """
+    Extracts the candidates of all the files of a corpus, with every candidate
+    extractor, so that the candidates are then loaded from the caches. The
+    candidate extractors (with their models, terminologies, etc.) are given once
+    to each worker process.
+
+    @param  corpus_directory: The path of the directory containing the corpus'
+                              files.
+    @type   corpus_directory: C{string}
+    @param  extension:        The extension of the corpus files (to avoid other
+                              files).
+    @type   extension:        C{string}
+    @param  pre_processor:    The pre-processor of the corpus files.
+    @type   pre_processor:    C{PreProcessorC}
+    @param  nb_processes:     The number of files processed simultaneously (the
+                              number of CPUs if None).
+    @type   nb_processes:     C{int}
+    """
+
+    working_pool = Pool(nb_processes,
+                        composite_extraction_pool_initializer,
+                        (pre_processor, self))
+    filepaths = []
+
+    for filename in listdir(corpus_directory):
+      if filename.rfind(extension) >= 0 \
+         and len(filename) - filename.rfind(extension) == len(extension):
+        filepaths.append(path.join(corpus_directory, filename))
+    working_pool.map(composite_extraction_pool_worker, filepaths)
+    working_pool.close()
+    working_pool.join()
+
+  def candidate_extraction(self, pre_processed_file):
+    """
+    Extracts the candidates from a pre-processed file.
+
+    @param    pre_processed_file: The pre-processed analysed file.
+    @type     pre_processed_file: C{PreProcessedFile}
+
+    @return:  A list of candidate spans (candidate, sentence index, start token
+              offset, end token offset).
+    @rtype:   C{list(tuple(string, int, int, int))}
+    """
+
+    candidate_spans = []
+
+    for candidate_extractor in self.candidate_extractors():
+      candidate_spans.extend(candidate_extractor.candidate_extraction(pre_processed_file))
+
+    return candidate_spans
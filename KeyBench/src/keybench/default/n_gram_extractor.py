@@ -2,8 +2,7 @@
 # -*- encoding utf-8 -*-
 
 from keybench.candidate_extractor import CandidateExtractorC
-from keybench.default.util import n_grams
-from keybench.default.util import n_to_m_grams
+from keybench.default.util import n_gram_slices
 
 class NGramExtractor(CandidateExtractorC):
   """
@@ -64,20 +63,26 @@ class NGramExtractor(CandidateExtractorC):
     @param    pre_processed_file: The pre-processed analysed file.
     @type     pre_processed_file: C{PreProcessedFile}
 
-    @return:  A list of candidates.
-    @rtype:   C{list(string)}
+    @return:  A list of candidate spans (candidate, sentence index, start token
+              offset, end token offset).
+    @rtype:   C{list(tuple(string, int, int, int))}
     """
 
-    candidates = []
+    candidate_spans = []
+    accepted_terms = {}
 
-    for sentence in pre_processed_file.full_text():
-      words = sentence.split()
-      
-      for term in n_to_m_grams(words, 1, self.n()):
-        if self.filtering(term, pre_processed_file.tag_separator()):
-          candidates.append(term)
+    for sentence_index, (tagged_words, words, tags) in enumerate(pre_processed_file.full_text_tokens()):
+      # every occurrence is kept, but each term is filtered only once
+      for start, end in n_gram_slices(tagged_words, 1, self.n()):
+        term = " ".join(tagged_words[start:end])
 
-    return candidates
+        if term not in accepted_terms:
+          accepted_terms[term] = self.filtering(term,
+                                                pre_processed_file.tag_separator())
+        if accepted_terms[term]:
+          candidate_spans.append((term, sentence_index, start, end))
+
+    return candidate_spans
 
   def filtering(self, term, tag_separator):
     """
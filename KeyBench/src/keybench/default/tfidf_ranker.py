@@ -2,9 +2,11 @@
 # -*- encoding utf-8 -*-
 
 import math
+from collections import Counter
 from keybench.ranker import RankerC
 from keybench.default.util import document_frequencies
-from keybench.default.util import n_to_m_grams
+from keybench.default.util import hash_n_gram
+from keybench.default.util import n_gram_slices
 
 class TFIDFRanker(RankerC):
   """
@@ -159,37 +161,31 @@ class TFIDFRanker(RankerC):
     else:
       doc_len = len(pre_processed_file.full_text_words())
       sentences = pre_processed_file.full_text()
-      term_counts = {}
+      term_counts = Counter()
       max_candidate_length = 0
 
       # compute the maximum length of a candidate
       for candidate in candidates:
         max_candidate_length = max(max_candidate_length, len(candidate.split()))
 
-      # count all possible terms occurrences
+      # count all possible terms occurrences (each POS tagged term is counted
+      # once per sentence) under the integer key of their normalized form
       for sentence in sentences:
-        for term in n_to_m_grams(sentence.split(), 1, max_candidate_length):
-          normalized_term = ""
+        tagged_words = sentence.split()
+        normalized_words = [w.lower().rsplit(pre_processed_file.tag_separator(), 1)[0] for w in tagged_words]
 
-          for word in term.split():
-            if normalized_term != "":
-              normalized_term += " "
-            normalized_term += word.lower().rsplit(pre_processed_file.tag_separator(), 1)[0]
-
-          if not term_counts.has_key(normalized_term):
-            term_counts[normalized_term] = 0.0
-          term_counts[normalized_term] += 1.0
+        for start, end in n_gram_slices(tagged_words,
+                                        1,
+                                        max_candidate_length,
+                                        True):
+          term_counts[hash_n_gram(normalized_words[start:end])] += 1.0
 
       # compute TF-IDFs
       for candidate in candidates:
-        untagged_candidate = ""
-
-        for word in candidate.split():
-          if untagged_candidate != "":
-            untagged_candidate += " "
-          untagged_candidate += word.rsplit(pre_processed_file.tag_separator(), 1)[0]
+        untagged_words = [w.rsplit(pre_processed_file.tag_separator(), 1)[0] for w in candidate.split()]
+        untagged_candidate = " ".join(untagged_words)
 
-        tf = term_counts[untagged_candidate] / doc_len
+        tf = term_counts[hash_n_gram(untagged_words)] / doc_len
         try:
           idf = -math.log((self.document_frequencies()[untagged_candidate] + 1.0) / (self.nb_documents() + 1.0), 2)
         except:
@@ -1,6 +1,10 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
+from n_gram import count_n_grams
+from n_gram import hash_n_gram
+from n_gram import iter_n_grams
+from n_gram import n_gram_slices
 from n_gram import n_grams
 from n_gram import n_to_m_grams
 from word_frequency import document_frequencies
@@ -1,6 +1,124 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
+from collections import Counter
+
+################################################################################
+# Lazy n-gram enumeration
+#
+# The n-grams are enumerated as slices of a token list (or of a list of token
+# ids), by increasing length and then by position. Nothing but the needed
+# tuples are built, so callers which only need counts or membership checks never
+# build n-gram strings.
+
+def n_gram_slices(tokens, n, m, unique=False):
+  """
+  Enumerates the slices of the N-grams for N = n..m.
+
+  @param    tokens: The tokens (or token ids) to enumerate the n-grams of.
+  @type     tokens: C{list}
+  @param    n:      The minimum length of a n-gram.
+  @type     n:      C{int}
+  @param    m:      The maximum length of a n-gram.
+  @type     m:      C{int}
+  @param    unique: True if the slices of the same n-gram must only be given
+                    once (first occurrence), else False.
+  @type     unique: C{bool}
+
+  @return:  A generator of the (start, end) offsets of the n-grams.
+  @rtype:   C{generator(tuple(int, int))}
+  """
+
+  nb_tokens = len(tokens)
+  seen = set()
+
+  for k in range(max(n, 1), min(m, nb_tokens) + 1):
+    for start in range(nb_tokens - k + 1):
+      end = start + k
+
+      if unique:
+        n_gram = tuple(tokens[start:end])
+
+        if n_gram in seen:
+          continue
+        seen.add(n_gram)
+
+      yield start, end
+
+def hash_n_gram(n_gram):
+  """
+  Gives the integer key of a n-gram, as given by the hashed enumerations.
+
+  @param    n_gram: The tokens (or token ids) of the n-gram.
+  @type     n_gram: C{list}
+
+  @return:  The hash of the n-gram.
+  @rtype:   C{int}
+  """
+
+  return hash(tuple(n_gram))
+
+def iter_n_grams(tokens, n, m, unique=False, hashed=False):
+  """
+  Enumerates the N-grams for N = n..m.
+
+  @param    tokens: The tokens (or token ids) to enumerate the n-grams of.
+  @type     tokens: C{list}
+  @param    n:      The minimum length of a n-gram.
+  @type     n:      C{int}
+  @param    m:      The maximum length of a n-gram.
+  @type     m:      C{int}
+  @param    unique: True if each n-gram must only be given once, else False.
+  @type     unique: C{bool}
+  @param    hashed: True if the n-grams must be given as integer keys (see
+                    C{hash_n_gram}), for the callers which only need counts or
+                    membership checks, else False.
+  @type     hashed: C{bool}
+
+  @return:  A generator of the n-grams, as tuples of tokens (or as integers).
+  @rtype:   C{generator(tuple)}
+  """
+
+  for start, end in n_gram_slices(tokens, n, m, unique):
+    if hashed:
+      yield hash_n_gram(tokens[start:end])
+    else:
+      yield tuple(tokens[start:end])
+
+def count_n_grams(token_lists, n, m, unique=False, counts=None, hashed=False):
+  """
+  Counts the N-grams, for N = n..m, of several token lists (e.g. sentences).
+
+  @param    token_lists:  The token lists to count the n-grams of.
+  @type     token_lists:  C{list(list)}
+  @param    n:            The minimum length of a n-gram.
+  @type     n:            C{int}
+  @param    m:            The maximum length of a n-gram.
+  @type     m:            C{int}
+  @param    unique:       True if an n-gram must be counted only once per token
+                          list, else False.
+  @type     unique:       C{bool}
+  @param    counts:       The counter to update (a new one is created if None).
+  @type     counts:       C{Counter}
+  @param    hashed:       True if the n-grams must be counted by integer key
+                          (see C{hash_n_gram}), else False.
+  @type     hashed:       C{bool}
+
+  @return:  The count of each n-gram (tuple of tokens, or integer key).
+  @rtype:   C{Counter}
+  """
+
+  if counts == None:
+    counts = Counter()
+
+  for tokens in token_lists:
+    counts.update(iter_n_grams(tokens, n, m, unique, hashed))
+
+  return counts
+
+################################################################################
+# String n-grams
+
 def n_grams(tokens, n):
   """
   Extracts n-grams from a list of tokens.
@@ -14,20 +132,7 @@ def n_grams(tokens, n):
   @type:    C{list(string)}
   """
 
-  result = []
-
-  for i in range(n - 1, len(tokens)):
-    dec = n - 1
-    n_gram = ""
-    
-    while dec >= 0:
-      n_gram += tokens[i - dec]
-      if dec > 0:
-        n_gram += " "
-      dec -= 1
-    result.append(n_gram)
-
-  return result
+  return [" ".join(n_gram) for n_gram in iter_n_grams(tokens, n, n)]
 
 def n_to_m_grams(tokens, n, m):
   """
@@ -43,10 +148,5 @@ def n_to_m_grams(tokens, n, m):
   @return:  A list n..m-grams generated from the list of tokens.
   @rtype:   C{list(string)}
   """
-  keyphrases = []
-
-  for k in range(n, m + 1):
-    keyphrases = list(set(keyphrases) | set(n_grams(tokens, k)))
-
-  return keyphrases
 
+  return [" ".join(n_gram) for n_gram in iter_n_grams(tokens, n, m, True)]
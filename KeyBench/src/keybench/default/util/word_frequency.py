@@ -1,7 +1,7 @@
 #/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
-from keybench.default.util import n_to_m_grams
+from keybench.default.util import n_gram_slices
 from multiprocessing import Pool
 from os import listdir
 from os import path
@@ -19,32 +19,23 @@ def term_bag_extraction_pool_worker(arguments):
     pre_processed_file = pre_processor.pre_process_file(filepath)
     candidates = candidate_extractor.extract_candidates(filepath, pre_processed_file)
     sentences = pre_processed_file.full_text()
-    normalized_candidates = {}
+    normalized_candidates = set()
     max_len = 0
     bag = []
 
     for candidate in candidates:
       max_len = max(max_len, len(candidate.split()))
-      normalized_candidate = ""
-
-      for word in candidate.split():
-        if normalized_candidate != "":
-          normalized_candidate += " "
-        normalized_candidate += word.rsplit(pre_processed_file.tag_separator(), 1)[0]
-
-      normalized_candidates[normalized_candidate] = True
+      normalized_candidates.add(tuple(word.rsplit(pre_processed_file.tag_separator(), 1)[0] for word in candidate.split()))
 
+    # only the n-grams matching a candidate are turned into strings
     for sentence in sentences:
-      for term in n_to_m_grams(sentence.split(), 1, max_len):
-        normalized_term = ""
+      normalized_words = [word.lower().rsplit(pre_processed_file.tag_separator(), 1)[0] for word in sentence.split()]
 
-        for word in term.split():
-          if normalized_term != "":
-            normalized_term += " "
-          normalized_term += word.lower().rsplit(pre_processed_file.tag_separator(), 1)[0]
+      for start, end in n_gram_slices(normalized_words, 1, max_len, True):
+        normalized_term = tuple(normalized_words[start:end])
 
-        if normalized_candidates.has_key(normalized_term):
-          bag.append(normalized_term)
+        if normalized_term in normalized_candidates:
+          bag.append(" ".join(normalized_term))
   else:
     pre_processed_file = pre_processor.pre_process_file(filepath)
     words = pre_processed_file.full_text_words()
@@ -29,11 +29,16 @@ def keyphrase_extraction_pool_worker(arguments):
   # pre-processing
   pre_processed_text = pp.pre_process_file(filepath)
   # candidate extraction
-  candidates = ce.extract_candidates(filepath, pre_processed_text)
+  candidates, occurrences = ce.extract_candidate_occurrences(filepath,
+                                                             pre_processed_text)
   # candidate clustering
   clusters = cc.cluster_candidates(filepath, pre_processed_text, candidates)
   # ranking
-  ranked_candidates = r.rank(filepath, pre_processed_text, candidates, clusters)
+  ranked_candidates = r.rank(filepath,
+                             pre_processed_text,
+                             candidates,
+                             clusters,
+                             occurrences)
   # selection
   extracted_keyphrases = s.select(filepath,
                                   pre_processed_text,
@@ -42,6 +42,7 @@ class PreProcessedFile(object):
     self._abstract_words = []
     self._body_words = []
     self._full_text_words = []
+    self._full_text_tokens = []
 
   def encoding(self):
     """
@@ -82,6 +83,8 @@ class PreProcessedFile(object):
     """
 
     self._tag_separator = tag_separator
+    # reset lazy loading
+    self._full_text_tokens = []
 
   def title(self):
     """
@@ -108,6 +111,7 @@ class PreProcessedFile(object):
     self._title_words = []
     self._full_text = []
     self._full_text_words = []
+    self._full_text_tokens = []
 
   def abstract(self):
     """
@@ -134,6 +138,7 @@ class PreProcessedFile(object):
     self._abstract_words = []
     self._full_text = []
     self._full_text_words = []
+    self._full_text_tokens = []
 
   def body(self):
     """
@@ -160,6 +165,7 @@ class PreProcessedFile(object):
     self._body_words = []
     self._full_text = []
     self._full_text_words = []
+    self._full_text_tokens = []
 
   def title_words(self):
     """
@@ -241,3 +247,35 @@ class PreProcessedFile(object):
 
     return self._full_text_words
 
+  def full_text_tokens(self):
+    """
+    Gives the POS tagged words of each sentence of all the text's attributes
+    (title, abstract and body), along with their words and their POS tags. The
+    sentences are split once, then shared by every component working on them.
+
+    @return:  The POS tagged words, the words and the POS tags (None for a word
+              without POS tag) of each sentence.
+    @rtype:   C{list(tuple(list(string), list(string), list(string)))}
+    """
+
+    # the pre-processed files cached before the tokens existed do not have them
+    if getattr(self, "_full_text_tokens", []) == []:
+      self._full_text_tokens = []
+
+      for sentence in self.full_text():
+        tagged_words = sentence.split()
+        words = []
+        tags = []
+
+        for tagged_word in tagged_words:
+          word_and_tag = tagged_word.rsplit(self.tag_separator(), 1)
+
+          words.append(word_and_tag[0])
+          if len(word_and_tag) == 2:
+            tags.append(word_and_tag[1])
+          else:
+            tags.append(None)
+
+        self._full_text_tokens.append((tagged_words, words, tags))
+
+    return self._full_text_tokens
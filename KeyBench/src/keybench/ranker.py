@@ -34,18 +34,54 @@ class RankerC(BenchmarkComponent):
                                   path.join(lazy_directory, "rankings"),
                                   debug)
 
-  def rank(self, filepath, pre_processed_file, candidates, clusters):
+    self.set_candidate_occurrences(None)
+
+  def candidate_occurrences(self):
+    """
+    Getter of the occurrences of the candidates of the ranked text.
+
+    @return:  The occurrences of each candidate, as (sentence index, start token
+              offset, end token offset), or None if they are not known.
+    @rtype:   C{dict(string, list(tuple(int, int, int)))}
+    """
+
+    return self._candidate_occurrences
+
+  def set_candidate_occurrences(self, candidate_occurrences):
+    """
+    Setter of the occurrences of the candidates of the ranked text.
+
+    @param  candidate_occurrences:  The new occurrences of each candidate, or
+                                    None if they are not known.
+    @type   candidate_occurrences:  C{dict(string, list(tuple(int, int, int)))}
+    """
+
+    self._candidate_occurrences = candidate_occurrences
+
+  def rank(self,
+           filepath,
+           pre_processed_file,
+           candidates,
+           clusters,
+           candidate_occurrences=None):
     """
     Weights and ordered the candidates of a pre-processed text.
 
-    @param    filepath:           The path of the analysed file.
-    @type     filepath:           C{string}
-    @param    pre_processed_file: The pre-processed file.
-    @type     pre_processed_file: C{PreProcessedFile}
-    @param    candidates:         The keyphrase candidates.
-    @type     candidates:         C{list(string)}
-    @param    clusters:           The clustered candidates.
-    @type     clusters:           C{list(list(string))}
+    @param    filepath:               The path of the analysed file.
+    @type     filepath:               C{string}
+    @param    pre_processed_file:     The pre-processed file.
+    @type     pre_processed_file:     C{PreProcessedFile}
+    @param    candidates:             The keyphrase candidates.
+    @type     candidates:             C{list(string)}
+    @param    clusters:               The clustered candidates.
+    @type     clusters:               C{list(list(string))}
+    @param    candidate_occurrences:  The occurrences of the candidates, as
+                                      given by the candidate extractor (the
+                                      weighting can use them instead of
+                                      searching the candidates in the text), or
+                                      None if they are not known.
+    @type     candidate_occurrences:  C{dict(string, list(tuple(int, int,
+                                      int)))}
 
     @return:  A list of candidates and their weight (no more POS tags).
     @rtype:   C{list(tuple(string, float))}
@@ -60,33 +96,61 @@ class RankerC(BenchmarkComponent):
     else:
       # weighting
       super(RankerC, self).log("Ranking of %s's terms..."%filepath)
+      self.set_candidate_occurrences(candidate_occurrences)
       weights = self.weighting(pre_processed_file, candidates, clusters)
-      # list cleaning by removing the word tags
-      clean_weights = {}
-      for t, w in weights.items():
-        term = ""
-        for wt in t.split():
-          if term != "":
-            term += " "
-          term += wt.rsplit(pre_processed_file.tag_separator(), 1)[0]
-        clean_weights[term] = w
-      # ordering
-      super(RankerC, self).log("Ordering %s's terms..."%filepath)
-      ordered_weights = self.ordering(clean_weights, clusters)
-
-      # serialization
-      super(RankerC, self).log("Putting %s's terms into cache..."%filepath)
-      super(RankerC, self).store(lazy_filename, ordered_weights)
-
-      # save string representation
-      super(RankerC,
-            self).log("Saving the readable list of %s's terms..."%filepath)
-      string_rep = ""
-      for c in ordered_weights:
-        if string_rep != "":
-          string_rep += "\n"
-        string_rep += str(c)
-      super(RankerC, self).store_string(lazy_filename, string_rep)
+      ordered_weights = self.store_ranking(filepath,
+                                           pre_processed_file,
+                                           weights,
+                                           clusters)
+
+    return ordered_weights
+
+  def store_ranking(self, filepath, pre_processed_file, weights, clusters):
+    """
+    Orders the weighted candidates of a pre-processed text and puts them into
+    the cache.
+
+    @param    filepath:           The path of the analysed file.
+    @type     filepath:           C{string}
+    @param    pre_processed_file: The pre-processed file.
+    @type     pre_processed_file: C{PreProcessedFile}
+    @param    weights:            A dictionary of weighted candidates.
+    @type     weights:            C{dict(string, float)}
+    @param    clusters:           The clustered candidates.
+    @type     clusters:           C{list(list(string))}
+
+    @return:  A list of candidates and their weight (no more POS tags).
+    @rtype:   C{list(tuple(string, float))}
+    """
+
+    lazy_filename = path.split(filepath)[1] + ".rnk"
+
+    # list cleaning by removing the word tags
+    clean_weights = {}
+    for t, w in weights.items():
+      term = ""
+      for wt in t.split():
+        if term != "":
+          term += " "
+        term += wt.rsplit(pre_processed_file.tag_separator(), 1)[0]
+      clean_weights[term] = w
+    # ordering
+    super(RankerC, self).log("Ordering %s's terms..."%filepath)
+    ordered_weights = self.ordering(clean_weights, clusters)
+
+    # serialization
+    super(RankerC, self).log("Putting %s's terms into cache..."%filepath)
+    super(RankerC, self).store(lazy_filename, ordered_weights)
+
+    # save string representation
+    super(RankerC,
+          self).log("Saving the readable list of %s's terms..."%filepath)
+    string_rep = ""
+    for c in ordered_weights:
+      if string_rep != "":
+        string_rep += "\n"
+      string_rep += str(c)
+    super(RankerC, self).store_string(lazy_filename, string_rep)
 
     return ordered_weights
 
@@ -13,16 +13,18 @@ from candidate_extractors import STFilteredNGramExtractor
 from candidate_extractors import PatternMatchingExtractor
 from candidate_extractors import CLARIT96Extractor
 from candidate_extractors import CLARIT96_LEXATOM_TAG
-from candidate_extractors import train_clarit
+from candidate_extractors import train_clarit96_model
 from candidate_clusterers import StemOverlapHierarchicalClusterer
 from candidate_clusterers import TermVariantClusterer
 from candidate_clusterers import LINKAGE_STRATEGY
 from evaluators import StandardPRFMEvaluator
 from keybench import KeyphraseExtractor
 from keybench import KeyBenchWorker
+from keybench import set_nb_documents_per_run
+from keybench.default import CompositeExtractor
 from keybench.default import FakeClusterer
 from keybench.default.util import document_frequencies
-from keybench.default.util import n_to_m_grams
+from keybench.default.util import n_gram_slices
 from keybench.default import TFIDFRanker
 from multiprocessing import Queue
 from pre_processors import FrenchPreProcessor
@@ -38,6 +40,7 @@ from graph_based_ranking import TextRankStrategy
 from graph_based_ranking import SingleRankStrategy
 from graph_based_ranking import TopicRankStrategy
 from graph_based_ranking import CompleteGraphStrategy
+from graph_based_ranking import PAGERANK_SOLVER
 from util import INISTFileRep
 from util import DEFTFileRep
 from util import InspecFileRep
@@ -46,11 +49,13 @@ from util import SemEvalFileRep
 from util import DUCFileRep
 from util import term_scoring
 from util import WikiNewsFileRep
+from util import ADJRClassifier
 from util import bonsai_tokenization
 from util import french_stemmed_adjr
 from util import french_adjr_stem_ending_counts
 from util import english_stemmed_adjr
 from util import english_adjr_stem_ending_counts
+from util import stop_word_vocabulary
 from nltk.stem import PorterStemmer
 from nltk.stem.snowball import FrenchStemmer
 from nltk.tokenize.treebank import TreebankWordTokenizer
@@ -251,6 +256,11 @@ LAZY_CANDIDATE_EXTRACTION = True
 LAZY_CANDIDATE_CLUSTERING = True
 LAZY_RANKING = False
 LAZY_SELECTION = False
+NB_PROCESSES = 8 # number of documents processed simultaneously
+SOLVER = PAGERANK_SOLVER.DICTIONARY # solver of the TextRank-like runs (with
+                                    # the sparse matrix solver and
+                                    # LAZY_RANKING, their documents are
+                                    # ranked by batches before the runs)
 
 ##### runs possibilities #######################################################
 
@@ -431,30 +441,9 @@ french_pos_boundaries = {
 ################################################################################
 
 def extract_stop_words(stop_words_filepath):
-  st_file = codecs.open(stop_words_filepath, "r", "utf-8")
-  stop_words = st_file.read().split("\n")
-
-  st_file.close()
-
-  for i, st in enumerate(stop_words):
-    stop_words[i] = st.replace("\r", "")
-
-  stop_words.append(",")
-  stop_words.append(".")
-  stop_words.append("!")
-  stop_words.append("?")
-  # NEWLY ADDED
-  stop_words.append("]")
-  stop_words.append("[")
-  stop_words.append("=")
-  stop_words.append("..")
-  stop_words.append("...")
-  stop_words.append(";")
-  stop_words.append("(")
-  stop_words.append(")")
-  stop_words.append(":")
-
-  return stop_words
+  # the stop words (and punctuation marks) are loaded once and shared by every
+  # component
+  return stop_word_vocabulary(stop_words_filepath)
 
 def english_tokenization(term):
   word_tokenizer = TreebankWordTokenizer()
@@ -467,65 +456,41 @@ def english_tokenization(term):
 
   return tokenized_term
 
-def is_french_adjr(word): # TODO change adjr tests
-  stemmer = FrenchStemmer()
-  # suffixes with gender and number flexions
-  suffixes = [
-    u"ain", u"ains", u"aine", u"aines",
-    u"aire", u"aires",
-    u"al", u"aux", u"als", u"ale", u"ales",
-    u"el", u"els", u"elle", u"elles",
-    u"esque", u"esques",
-    u"estre", u"estres",
-    u"eux", u"euse", u"euses",
-    u"é", u"és", u"ée", u"ées",
-    u"ien", u"iens", u"ienne", u"iennes",
-    u"ier", u"iers", u"ière", u"ières",
-    u"if", u"ifs", u"ive", u"ives",
-    u"il", u"ils",
-    u"in", u"ins", u"ine", u"ines",
-    u"ique", u"iques",
-    u"ois", u"oise", u"oises"
-  ]
-  stem = stemmer.stem(word)
-  stem_ending = ""
-  if word.replace(u"é", "e").replace(u"è", "e").startswith(stem.replace(u"é", "e").replace(u"è", "e")):
-    stem_ending = word.replace(u"é", "e").replace(u"è", "e").split(stem.replace(u"é", "e").replace(u"è", "e"), 1)[1]
+# relational adjective classifiers (shared by all the documents and, when they
+# are forked, by all the workers)
+french_adjr_classifier = ADJRClassifier(FrenchStemmer(),
+                                        french_stemmed_adjr,
+                                        # suffixes with gender and number
+                                        # flexions
+                                        [u"ain", u"ains", u"aine", u"aines",
+                                         u"aire", u"aires",
+                                         u"al", u"aux", u"als", u"ale", u"ales",
+                                         u"el", u"els", u"elle", u"elles",
+                                         u"esque", u"esques",
+                                         u"estre", u"estres",
+                                         u"eux", u"euse", u"euses",
+                                         u"é", u"és", u"ée", u"ées",
+                                         u"ien", u"iens", u"ienne", u"iennes",
+                                         u"ier", u"iers", u"ière", u"ières",
+                                         u"if", u"ifs", u"ive", u"ives",
+                                         u"il", u"ils",
+                                         u"in", u"ins", u"ine", u"ines",
+                                         u"ique", u"iques",
+                                         u"ois", u"oise", u"oises"])
+english_adjr_classifier = ADJRClassifier(PorterStemmer(),
+                                         english_stemmed_adjr,
+                                         [u"al",
+                                          u"ant",
+                                          u"ary",
+                                          u"ic",
+                                          u"ous",
+                                          u"ive"])
 
-  if stem in french_stemmed_adjr:
-    return True
-  for suffix in suffixes:
-    if word[-len(suffix):] == suffix:
-      return True
-  # TODO change adjr tests
-  #if stem_ending in french_adjr_stem_ending_counts:
-  #  return True
-  return False
+def is_french_adjr(word): # TODO change adjr tests
+  return french_adjr_classifier.is_adjr(word)
 
 def is_english_adjr(word): # TODO change adjr tests
-  stemmer = PorterStemmer()
-  suffixes = [
-    u"al",
-    u"ant",
-    u"ary",
-    u"ic",
-    u"ous",
-    u"ive"
-  ]
-  stem = stemmer.stem(word)
-  stem_ending = ""
-  if word.startswith(stem):
-    stem_ending = word.split(stem, 1)[1]
-
-  if stem in english_stemmed_adjr:
-    return True
-  for suffix in suffixes:
-    if word[-len(suffix):] == suffix:
-      return True
-  # TODO change adjr tests
-  #if stem_ending in english_adjr_stem_ending_counts:
-  #  return True
-  return False
+  return english_adjr_classifier.is_adjr(word)
 
 def learn_tag_sequences(train_docs,
                         ext,
@@ -545,32 +510,28 @@ def learn_tag_sequences(train_docs,
                                    "r",
                                    pre_processed_file.encoding())
       keyphrases = keyphrase_file.read().split(";")
-      tokenized_keyphrases = {}
+      tokenized_keyphrases = set()
+      max_keyphrase_length = 0
 
       # tokenize keyphrases
       for keyphrase in keyphrases:
-        tokenized_keyphrases[tokenize(keyphrase.lower().strip())] = True
-
-      # parse n-grams
-      for sentence in sentences:
-        sentence = sentence.strip()
-
-        for tagged_candidate in n_to_m_grams(sentence.split(), 1, len(sentence.split())):
-          untagged_candidate = ""
-          tag_sequence = ""
+        tokenized_keyphrase = tuple(tokenize(keyphrase.lower().strip()).split(" "))
+        max_keyphrase_length = max(max_keyphrase_length,
+                                   len(tokenized_keyphrase))
 
-          for wt in tagged_candidate.split():
-            if untagged_candidate != "":
-              untagged_candidate += " "
-            untagged_candidate += wt.rsplit(pre_processed_file.tag_separator(),
-                                            1)[0]
+        tokenized_keyphrases.add(tokenized_keyphrase)
 
-            if tag_sequence != "":
-              tag_sequence += " "
-            tag_sequence += wt.rsplit(pre_processed_file.tag_separator(), 1)[1]
+      # parse n-grams (no n-gram can be longer than the longest keyphrase)
+      for sentence in sentences:
+        tagged_words = [wt.rsplit(pre_processed_file.tag_separator(), 1) \
+                        for wt in sentence.strip().split()]
+        words = [wt[0] for wt in tagged_words]
 
+        for start, end in n_gram_slices(words, 1, max_keyphrase_length):
           # add tag sequence if it is a keyphrase
-          if untagged_candidate in tokenized_keyphrases:
+          if tuple(words[start:end]) in tokenized_keyphrases:
+            tag_sequence = " ".join(wt[1] for wt in tagged_words[start:end])
+
             tag_sequences[tag_sequence] = True
 
       keyphrase_file.close()
@@ -947,14 +908,17 @@ def main(argv):
                                                   clarit_lexatom_patterns,
                                                   clarit_special_patterns,
                                                   clarit_impossible_patterns,
-                                                  train_clarit(train_docs,
-                                                               ext,
-                                                               pre_processor,
-                                                               PatternMatchingExtractor(run_name + "_pre",
-                                                                                        LAZY_CANDIDATE_EXTRACTION,
-                                                                                        RUNS_DIR,
-                                                                                        True,
-                                                                                        clarit_np_patterns)))
+                                                  train_clarit96_model(train_docs,
+                                                                       ext,
+                                                                       pre_processor,
+                                                                       PatternMatchingExtractor(run_name + "_pre",
+                                                                                                LAZY_CANDIDATE_EXTRACTION,
+                                                                                                RUNS_DIR,
+                                                                                                True,
+                                                                                                clarit_np_patterns),
+                                                                       path.join(RUNS_DIR,
+                                                                                 "models"),
+                                                                       NB_PROCESSES))
                           else:
                             if candidate == TERM_SUITE_TERMINOLOGY_CA:
                               c = FromTerminologyExtractor(run_name,
@@ -1092,7 +1056,8 @@ def main(argv):
                                           RUNS_DIR,
                                           True,
                                           strategy,
-                                          scoring_function)
+                                          scoring_function,
+                                          solver=SOLVER)
                     elif method == TOPICRANK_PP_ME:
                       add_topicrankpp_graphs_and_models(corpus,
                                                         domain_graph_filepath,
@@ -1220,9 +1185,53 @@ def main(argv):
                                                  s,
                                                  e))
 
+  ##### Candidate extraction ###################################################
+
+  # the candidates of every run are extracted within a single pass over each
+  # corpus, the runs then load them from the cache
+  if LAZY_CANDIDATE_EXTRACTION:
+    corpus_extractors = {}
+
+    for run in runs:
+      if run.candidate_extractor() != None:
+        corpus = (run.input_directory(), run.input_extension())
+
+        if corpus not in corpus_extractors:
+          corpus_extractors[corpus] = (run.pre_processor(), [])
+        corpus_extractors[corpus][1].append(run.candidate_extractor())
+
+    for (docs, ext), (pre_processor, extractors) in corpus_extractors.items():
+      print "EXTRACTION OF THE CANDIDATES OF %d RUNS IN %s..."%(len(extractors),
+                                                              docs)
+      CompositeExtractor("%s_composite"%path.basename(path.normpath(docs)),
+                         LAZY_CANDIDATE_EXTRACTION,
+                         RUNS_DIR,
+                         True,
+                         extractors).extract_corpus_candidates(docs,
+                                                               ext,
+                                                               pre_processor,
+                                                               NB_PROCESSES)
+
+  ##### Batch ranking ##########################################################
+
+  # with lazy rankings, the TextRank-like runs using the sparse matrix solver
+  # rank their documents by batches (one solver pass per batch), the runs then
+  # load the rankings from the cache
+  if LAZY_RANKING:
+    for run in runs:
+      if isinstance(run.ranker(), TextRankRanker) \
+         and run.ranker().solver() == PAGERANK_SOLVER.SPARSE_MATRIX:
+        print "BATCH RANKING OF %s..."%run.ranker().name()
+        run.ranker().rank_corpus(run.input_directory(),
+                                 run.input_extension(),
+                                 run.pre_processor(),
+                                 run.candidate_extractor(),
+                                 run.candidate_clusterer())
+
   ##### Runs' execution ########################################################
 
   print "EXECUTION OF %d RUNS..."%len(runs)
+  set_nb_documents_per_run(NB_PROCESSES)
   queue = Queue()
   for run in runs:
     queue.put(run)
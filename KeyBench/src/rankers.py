@@ -4,12 +4,15 @@
 import codecs
 import math
 import pickle
+from graph_based_ranking import MAX_ITERATIONS
+from graph_based_ranking import PAGERANK_SOLVER
 from graph_based_ranking import TextRank
 from graph_based_ranking import TopicRankStrategy
 from keybench import RankerC
 from multiprocessing import Pool
 from os import listdir
 from os import path
+from util import word_overlap_similarities
 #from sklearn.naive_bayes import MultinomialNB
 from nltk.classify.weka import WekaClassifier
 
@@ -62,18 +65,24 @@ def cluster_centroid(cluster, tag_separator, stemmer):
 
   centroid = None
   max_similarity = -1.0
-
-  for term1 in cluster:
-    stem1 = pos_tagged_term_stemming(term1, tag_separator, stemmer)
+  stems = [frozenset(pos_tagged_term_stemming(term, tag_separator, stemmer).split()) \
+           for term in cluster]
+  # only the pairs of terms sharing stems are compared, both ways
+  similarities = word_overlap_similarities(stems)
+  term_similarities = [{} for term in cluster]
+
+  for i, i_similarities in enumerate(similarities):
+    if len(stems[i]) > 0:
+      term_similarities[i][i] = 1.0
+    for j, similarity in i_similarities.items():
+      term_similarities[i][j] = similarity
+      term_similarities[j][i] = similarity
+
+  for term1, term1_similarities in zip(cluster, term_similarities):
     similarity = 0.0
 
-    for term2 in cluster:
-      stem2 = pos_tagged_term_stemming(term2, tag_separator, stemmer)
-
-      try:
-        similarity += simple_word_overlap_similarity(stem1)(stem2)
-      except:
-        similarity += 0.0
+    for j in sorted(term1_similarities):
+      similarity += term1_similarities[j]
     similarity /= float(len(cluster))
 
     if similarity > max_similarity:
@@ -89,6 +98,9 @@ class ORDERING_CRITERIA:
   FREQUENCY = 1
   CENTROID  = 2
 
+# number of documents ranked together by the batch ranking
+BATCH_SIZE = 64
+
 class TextRankRanker(RankerC):
   """
   Component performing candidate terms ranking based on the TextRank score of
@@ -102,7 +114,8 @@ class TextRankRanker(RankerC):
                debug,
                strategy,
                scoring_function,
-               ordering_criteria=ORDERING_CRITERIA.POSITION):
+               ordering_criteria=ORDERING_CRITERIA.POSITION,
+               solver=PAGERANK_SOLVER.DICTIONARY):
     """
     Constructor of the component.
 
@@ -134,6 +147,8 @@ class TextRankRanker(RankerC):
                                 - Centroid: The centroid of the cluster is
                                 ranked first.
     @type   ordering_criteria: C{ORDERING_CRITERIA}
+    @param  solver:             The solver used to compute the TextRank scores.
+    @type   solver:             C{PAGERANK_SOLVER}
     TODO TODO
     TODO TODO
     TODO TODO
@@ -147,9 +162,93 @@ class TextRankRanker(RankerC):
                               scoring_function,
                               0.0001,
                               0.85,
-                              1000000)
+                              MAX_ITERATIONS,
+                              solver)
     self._ordering_criteria = ordering_criteria
 
+  def solver(self):
+    """
+    Getter of the solver used to compute the TextRank scores.
+
+    @return:  The solver used to compute the TextRank scores.
+    @rtype:   C{PAGERANK_SOLVER}
+    """
+
+    return self._textrank.solver()
+
+  def set_solver(self, solver):
+    """
+    Setter of the solver used to compute the TextRank scores.
+
+    @param  solver: The new solver used to compute the TextRank scores.
+    @type   solver: C{PAGERANK_SOLVER}
+    """
+
+    self._textrank.set_solver(solver)
+
+  def statistics(self, filepath):
+    """
+    Getter of the statistics of the solver for a ranked file, as put into the
+    cache with its ranking.
+
+    @param    filepath: The path of the ranked file.
+    @type     filepath: C{string}
+
+    @return:  The number of iterations, the residual and the convergence (True
+              if the scores are stable, else False) of the file's graph, or None
+              if the file has not been ranked.
+    @rtype:   C{tuple(int, float, bool)}
+    """
+
+    lazy_filename = path.split(filepath)[1] + ".stt"
+
+    if self.is_cached(lazy_filename):
+      return self.load(lazy_filename)
+
+    return None
+
+  def store_ranking(self,
+                    filepath,
+                    pre_processed_file,
+                    weights,
+                    clusters,
+                    statistics=None):
+    """
+    Orders the weighted candidates of a pre-processed text and puts them into
+    the cache, with the statistics of the solver for the text's graph.
+
+    @param    filepath:           The path of the analysed file.
+    @type     filepath:           C{string}
+    @param    pre_processed_file: The pre-processed file.
+    @type     pre_processed_file: C{PreProcessedFile}
+    @param    weights:            A dictionary of weighted candidates.
+    @type     weights:            C{dict(string, float)}
+    @param    clusters:           The clustered candidates.
+    @type     clusters:           C{list(list(string))}
+    @param    statistics:         The number of iterations, the residual and the
+                                  convergence of the text's graph, or None for
+                                  those of the last solved graph (the one of
+                                  the text weighted by C{weighting}).
+    @type     statistics:         C{tuple(int, float, bool)}
+
+    @return:  A list of candidates and their weight (no more POS tags).
+    @rtype:   C{list(tuple(string, float))}
+    """
+
+    lazy_filename = path.split(filepath)[1] + ".stt"
+
+    if statistics == None:
+      statistics = self._textrank.pagerank_solver().statistics()[-1]
+
+    self.store(lazy_filename, statistics)
+    self.store_string(lazy_filename,
+                      "%d iterations, residual=%e, converged=%s"%statistics)
+
+    return super(TextRankRanker, self).store_ranking(filepath,
+                                                     pre_processed_file,
+                                                     weights,
+                                                     clusters)
+
   def weighting(self, pre_processed_file, candidates, clusters):
     """
     Takes a pre-processed text (list of POS-tagged sentences) and gives a weight
@@ -166,17 +265,185 @@ class TextRankRanker(RankerC):
     @rtype:   C{dict(string, float)}
     """
 
-    # sheat to reset clusters for TopicRank
+    # sheat to reset clusters (and their occurrences) for TopicRank
     if isinstance(self._textrank.strategy(), TopicRankStrategy):
       self._strategy.set_clusters(clusters)
+      self._strategy.set_occurrences(self.candidate_occurrences())
     ranking = self._textrank.rank(candidates, pre_processed_file.full_text())
     weighted_candidates = {}
 
+    if self.debug():
+      nb_iterations, residual, converged = self._textrank.pagerank_solver().statistics()[-1]
+
+      self.log("%d iterations, residual=%e, converged=%s"%(nb_iterations,
+                                                           residual,
+                                                           converged))
+
     for candidate, score in ranking:
       weighted_candidates[candidate] = score
 
     return weighted_candidates
 
+  def batch_weighting(self, documents):
+    """
+    Gives a weight to the candidate keyphrases of several pre-processed texts.
+    The graphs of the texts are solved together (see
+    C{PageRankSolver.solve_batch}), so the sparse matrix solver iterates once
+    for all of them (unless the solver warm starts, then they are solved one
+    after the other). Each text gets the weights given by C{weighting}.
+
+    @param    documents:  The pre-processed files, with their keyphrase
+                          candidates, their clustered candidates and the
+                          occurrences of their candidates (or None).
+    @type     documents:  C{list(tuple(PreProcessedFile, list(string),
+                          list(list(string)), dict(string, list(tuple(int, int,
+                          int)))))}
+
+    @return:  A dictionary of terms as key and weight as value, for each
+              document.
+    @rtype:   C{list(dict(string, float))}
+    """
+
+    graphs = []
+    weighted_documents = []
+
+    for pre_processed_file, candidates, clusters, occurrences in documents:
+      # sheat to reset clusters (and their occurrences) for TopicRank
+      if isinstance(self._textrank.strategy(), TopicRankStrategy):
+        self._strategy.set_clusters(clusters)
+        self._strategy.set_occurrences(occurrences)
+      graphs.append(self._textrank.graph(candidates,
+                                         pre_processed_file.full_text()))
+
+    pagerank_solver = self._textrank.pagerank_solver()
+    batch_scores = pagerank_solver.solve_batch([graph[2:] for graph in graphs])
+    batch_statistics = pagerank_solver.statistics()[-len(documents):]
+
+    if self.debug():
+      for nb_iterations, residual, converged in batch_statistics:
+        self.log("%d iterations, residual=%e, converged=%s"%(nb_iterations,
+                                                             residual,
+                                                             converged))
+
+    for index, (pre_processed_file, candidates, clusters, occurrences) in enumerate(documents):
+      ranking = self._textrank.token_scores(candidates,
+                                            pre_processed_file.full_text(),
+                                            graphs[index],
+                                            batch_scores[index])
+      weighted_candidates = {}
+
+      for candidate, score in ranking:
+        weighted_candidates[candidate] = score
+
+      weighted_documents.append(weighted_candidates)
+
+    return weighted_documents
+
+  def batch_rank(self, documents):
+    """
+    Weights and orders the candidates of several pre-processed texts, with one
+    batch weighting for the texts which are not already ranked in the cache.
+    The statistics of the solver for each text are put into the cache with its
+    ranking (see C{statistics}).
+
+    @param    documents:  The paths of the analysed files, with the
+                          pre-processed files, their keyphrase candidates, their
+                          clustered candidates and the occurrences of their
+                          candidates (or None).
+    @type     documents:  C{list(tuple(string, PreProcessedFile, list(string),
+                          list(list(string)), dict(string, list(tuple(int, int,
+                          int)))))}
+
+    @return:  A list of candidates and their weight (no more POS tags), for
+              each document.
+    @rtype:   C{list(list(tuple(string, float)))}
+    """
+
+    ordered_weights = [None] * len(documents)
+    unranked_indexes = []
+
+    for index, (filepath, pre_processed_file, candidates, clusters, occurrences) in enumerate(documents):
+      lazy_filename = path.split(filepath)[1] + ".rnk"
+
+      if self.is_lazy() and self.is_cached(lazy_filename):
+        ordered_weights[index] = self.load(lazy_filename)
+      else:
+        unranked_indexes.append(index)
+
+    if len(unranked_indexes) > 0:
+      self.log("Ranking of the terms of %d files..."%len(unranked_indexes))
+      batch_weights = self.batch_weighting([documents[index][1:] \
+                                            for index in unranked_indexes])
+      pagerank_solver = self._textrank.pagerank_solver()
+      batch_statistics = pagerank_solver.statistics()[-len(unranked_indexes):]
+
+      for index, weights, statistics in zip(unranked_indexes,
+                                            batch_weights,
+                                            batch_statistics):
+        filepath, pre_processed_file, candidates, clusters, occurrences = documents[index]
+        ordered_weights[index] = self.store_ranking(filepath,
+                                                    pre_processed_file,
+                                                    weights,
+                                                    clusters,
+                                                    statistics)
+
+    return ordered_weights
+
+  def rank_corpus(self,
+                  corpus_directory,
+                  extension,
+                  pre_processor,
+                  candidate_extractor,
+                  candidate_clusterer,
+                  batch_size=BATCH_SIZE):
+    """
+    Ranks the candidates of all the files of a corpus, by batches of files, so
+    that the rankings are then loaded from the cache. It is meant for corpora of
+    short documents, whose graphs are too small to make the most of the
+    vectorized solver one by one.
+
+    @param  corpus_directory:     The path of the directory containing the
+                                  corpus' files.
+    @type   corpus_directory:     C{string}
+    @param  extension:            The extension of the corpus files (to avoid
+                                  other files).
+    @type   extension:            C{string}
+    @param  pre_processor:        The pre-processor of the corpus files.
+    @type   pre_processor:        C{PreProcessorC}
+    @param  candidate_extractor:  The candidate extractor of the corpus files.
+    @type   candidate_extractor:  C{CandidateExtractorC}
+    @param  candidate_clusterer:  The candidate clusterer of the corpus files.
+    @type   candidate_clusterer:  C{CandidateClustererC}
+    @param  batch_size:           The number of files ranked together.
+    @type   batch_size:           C{int}
+    """
+
+    documents = []
+
+    for filename in sorted(listdir(corpus_directory)):
+      if filename.rfind(extension) >= 0 \
+         and len(filename) - filename.rfind(extension) == len(extension):
+        filepath = path.join(corpus_directory, filename)
+        pre_processed_file = pre_processor.pre_process_file(filepath)
+        candidates, occurrences = candidate_extractor.extract_candidate_occurrences(filepath,
+                                                                                    pre_processed_file)
+        clusters = candidate_clusterer.cluster_candidates(filepath,
+                                                          pre_processed_file,
+                                                          candidates)
+
+        documents.append((filepath,
+                          pre_processed_file,
+                          candidates,
+                          clusters,
+                          occurrences))
+
+        if len(documents) == batch_size:
+          self.batch_rank(documents)
+          documents = []
+
+    if len(documents) > 0:
+      self.batch_rank(documents)
+
   def ordering(self, weights, clusters):
     """
     Takes the weighted terms of the analysed text and ordered them.
@@ -382,7 +382,7 @@ class UnredundantTextRankSelector(SelectorC):
               strings.append(string)
             strings.append(w)
 
-            if weighted_keywords.keys().count(w) <= 0:
+            if w not in weighted_keywords:
               only_keywords = False
 
           if only_keywords:
@@ -5,6 +5,9 @@ import math
 import networkx
 import pickle
 
+from graph_based_ranking import MAX_ITERATIONS
+from graph_based_ranking import PAGERANK_SOLVER
+from graph_based_ranking import PageRankSolver
 from keybench import RankerC
 from keybench.default import util as keybench_util
 from util import semeval2010
@@ -115,7 +118,7 @@ class TopicRankPPRanker(RankerC):
                nb_controlled_keyphrases=float("inf"),
                convergence_threshold=0.001,
                # TODO test multiple values
-               max_iterations=1000000):
+               max_iterations=MAX_ITERATIONS):
     """
     """
 
@@ -127,10 +130,33 @@ class TopicRankPPRanker(RankerC):
     self._graphs_and_models_key = graphs_and_models_key
     self._stemmer = stemmer
     self._nb_controlled_keyphrases = nb_controlled_keyphrases
-    self._convergence_threshold = convergence_threshold
     self._lambda_k = lambda_k
     self._lambda_t = lambda_t
-    self._max_iterations = max_iterations
+    self._pagerank_solver = PageRankSolver(PAGERANK_SOLVER.DICTIONARY,
+                                           convergence_threshold,
+                                           max_iterations=max_iterations)
+
+  def pagerank_solver(self):
+    """
+    Getter of the iterative solver used for the random walk (it also gives the
+    iteration statistics of the ranked documents).
+
+    @return:  The iterative solver computing the nodes' score.
+    @rtype:   C{PageRankSolver}
+    """
+
+    return self._pagerank_solver
+
+  def set_pagerank_solver(self, pagerank_solver):
+    """
+    Setter of the iterative solver used for the random walk.
+
+    @param  pagerank_solver:  The new iterative solver computing the nodes'
+                              score.
+    @type   pagerank_solver:  C{PageRankSolver}
+    """
+
+    self._pagerank_solver = pagerank_solver
 
   def weighting(self, pre_processed_file, candidates, clusters):
     """
@@ -155,12 +181,23 @@ class TopicRankPPRanker(RankerC):
     graph = networkx.DiGraph(topicrankpp_graphs[self_graphs_and_models_key])
     reference_keyphrases = list(graph.nodes())
 
-    # index topics with sentence appearances
+    # index topics with sentence appearances (the sentences' n-grams are not
+    # longer than the longest candidate, and are compared by integer key)
+    hashed_clusters = [set(keybench_util.hash_n_gram(c.split(" ")) \
+                           for c in topic) \
+                       for topic in clusters]
+    max_candidate_length = max([0] + [len(c.split(" ")) \
+                                      for topic in clusters \
+                                      for c in topic])
+
     for sentence_index, sentence in enumerate(sentences):
-      ngrams = keybench_util.n_to_m_grams(sentence.split(" "), 1, len(sentence.split(" ")))
+      ngrams = set(keybench_util.iter_n_grams(sentence.split(" "),
+                                              1,
+                                              max_candidate_length,
+                                              hashed=True))
 
-      for topic_id, topic in enumerate(clusters):
-        if len(set(topic) & set(ngrams)) > 0:
+      for topic_id, topic in enumerate(hashed_clusters):
+        if not topic.isdisjoint(ngrams):
           if topic_id not in topic_indexing:
             topic_indexing[topic_id] = []
           topic_indexing[topic_id].append(sentence_index)
@@ -231,11 +268,11 @@ class TopicRankPPRanker(RankerC):
     #output_file.close()
 
     #-- random walk ------------------------------------------------------------
-    stabilized = False
-    nb_iterations = 0
     in_edge_indexing = {}
     out_edge_indexing = {}
     out_sum_indexing = {}
+    transitions = {}
+    constants = {}
     scores = {}
 
     # in and out edge indexing for faster processing
@@ -262,47 +299,34 @@ class TopicRankPPRanker(RankerC):
         for target, weight in out_edge_indexing[node][edge_type]:
           out_sum_indexing[node][edge_type] += weight
 
-    while not stabilized and nb_iterations < self._max_iterations:
-      stabilized = True
-      previous_scores = scores.copy()
-
-      for node, data in graph.nodes(data=True):
-        previous_score = previous_scores[node]
-        new_score = 0.0
-
-        intra_recommendation_sum = 0.0
-        extra_recommendation_sum = 0.0
-
-        # compute the intra-recommendation
-        for source, weight1 in in_edge_indexing[node]["intra"]:
-          out_sum = out_sum_indexing[source]["intra"]
+    # transition coefficients of the intra-recommendation and of the
+    # extra-recommendation
+    for node, data in graph.nodes(data=True):
+      lambda_value = self._lambda_k
+      if data["type"] == "topic":
+        lambda_value = self._lambda_t
 
-          intra_recommendation_sum += (weight1 * previous_scores[source]) \
-                                      / out_sum
-        # compute the extra-recommendation
-        for source, weight1 in in_edge_indexing[node]["extra"]:
-          out_sum = out_sum_indexing[source]["extra"]
+      transitions[node] = {}
+      constants[node] = 0.0
 
-          extra_recommendation_sum += (weight1 * previous_scores[source]) \
-                                      / out_sum
+      for source, weight1 in in_edge_indexing[node]["intra"]:
+        out_sum = out_sum_indexing[source]["intra"]
 
-        lambda_value = -1.0
-        if data["type"] == "topic":
-          lambda_value = self._lambda_t
-        else:
-          lambda_value = self._lambda_k
-        if lambda_value == -1:
-          print "<<<<<<<<<<<<<<<<<<< WHAT IS THE FUCK!!! >>>>>>>>>>>>>>>>>>>>>>"
-        new_score = ((1.0 - lambda_value) * extra_recommendation_sum) \
-                    + (lambda_value * intra_recommendation_sum)
+        transitions[node][source] = transitions[node].get(source, 0.0) \
+                                    + ((lambda_value * weight1) / out_sum)
+      for source, weight1 in in_edge_indexing[node]["extra"]:
+        out_sum = out_sum_indexing[source]["extra"]
 
-        # look for convergence
-        if math.fabs(new_score - previous_score) > self._convergence_threshold:
-          stabilized = False
+        transitions[node][source] = transitions[node].get(source, 0.0) \
+                                    + (((1.0 - lambda_value) * weight1) \
+                                       / out_sum)
 
-        scores[node] = new_score
+    scores = self._pagerank_solver.solve(transitions, constants, scores)
+    nb_iterations, residual, converged = self._pagerank_solver.statistics()[-1]
 
-      nb_iterations += 1
+    self.log("%d iterations, residual=%e, converged=%s"%(nb_iterations,
+                                                         residual,
+                                                         converged))
 
     ##-- determine the minimum depth from a domain keyphrase to a topic --------
     generalization_degree = {}
@@ -19,4 +19,18 @@ from wonef_adjr import french_adjr_stem_ending_counts
 from wordnet_adjr import english_adjr
 from wordnet_adjr import english_stemmed_adjr
 from wordnet_adjr import english_adjr_stem_ending_counts
-
+from tag_automaton import TagAutomaton
+from tag_automaton import UNKNOWN_TAG_ID
+from tag_automaton import compile_tagged_word_patterns
+from noun_phrase_index import NounPhraseIndex
+from noun_phrase_index import contiguous_count
+from adjr_classifier import ADJRClassifier
+from term_automaton import TermAutomaton
+from tag_chunker import TagChunker
+from vocabulary import vocabulary
+from vocabulary import stop_word_vocabulary
+from hierarchical_clustering import HierarchicalClustering
+from hierarchical_clustering import LINKAGE_STRATEGY
+from hierarchical_clustering import word_overlap_similarities
+from hierarchical_clustering import sparse_word_overlap_similarities
+from hierarchical_clustering import minhash_overlap_similarities
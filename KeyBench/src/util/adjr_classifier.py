@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+import re
+
+################################################################################
+# ADJRClassifier
+
+class ADJRClassifier(object):
+  """
+  Classifier telling if adjectives are relational adjectives. An adjective is
+  relational if it ends with one of the relational adjective suffixes or if its
+  stem is known as a relational adjective.
+
+  The suffixes are compiled into a single regular expression and the result of
+  each classified word is kept, so that the stemmer is applied at most once per
+  word. The classifier is meant to be created once and used for every document.
+  """
+
+  def __init__(self, stemmer, stemmed_adjr, suffixes):
+    """
+    Constructor.
+
+    @param  stemmer:      The stemmer used to stem the adjectives.
+    @type   stemmer:      C{nltk.stem.api.StemmerI}
+    @param  stemmed_adjr: The known relational adjectives, indexed by stem.
+    @type   stemmed_adjr: C{dict(string, bool)}
+    @param  suffixes:     The suffixes of the relational adjectives.
+    @type   suffixes:     C{list(string)}
+    """
+
+    super(ADJRClassifier, self).__init__()
+
+    self._stemmer = stemmer
+    self._stemmed_adjr = stemmed_adjr
+    # the longest suffixes first, so that the alternation never stops early
+    self._suffix_regex = re.compile(u"(%s)$"%u"|".join(re.escape(suffix) \
+                                                       for suffix in sorted(suffixes, key=len, reverse=True)),
+                                    re.UNICODE)
+    self._classified_words = {}
+
+  def stemmed_adjr(self):
+    """
+    Getter of the known relational adjectives.
+
+    @return:  The known relational adjectives, indexed by stem.
+    @rtype:   C{dict(string, bool)}
+    """
+
+    return self._stemmed_adjr
+
+  def is_adjr(self, word):
+    """
+    Tells if an adjective is a relational adjective.
+
+    @param    word: The adjective.
+    @type     word: C{string}
+
+    @return:  True if the adjective is a relational adjective, else False.
+    @rtype:   C{bool}
+    """
+
+    if word not in self._classified_words:
+      is_adjr = self._suffix_regex.search(word) != None \
+                or self._stemmer.stem(word) in self.stemmed_adjr()
+
+      self._classified_words[word] = is_adjr
+
+    return self._classified_words[word]
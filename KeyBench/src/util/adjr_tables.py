@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+import codecs
+from collections import Mapping
+from os import getpid
+from os import path
+from os import rename
+
+################################################################################
+# Relational adjective tables
+#
+# The relational adjectives are stored in data files (one file per language),
+# together with their precomputed stem and stem ending:
+#   #nltk <version of NLTK used to stem the adjectives>
+#   <adjective>\t<stem>\t<stem ending>
+# When the data file has been stemmed with another version of NLTK, the stems
+# are computed again once, so that they match the stems of the running stemmers,
+# and stored in a cache file next to the data file for the next loadings.
+
+ADJR_DIRECTORY = path.join(path.dirname(path.abspath(__file__)),
+                           "..",
+                           "..",
+                           "res",
+                           "adjr")
+STEMMER_VERSION_HEADER = "#nltk "
+
+def read_adjr_file(filepath):
+  """
+  Reads the relational adjectives of a data file.
+
+  @param    filepath: The path of the data file.
+  @type     filepath: C{string}
+
+  @return:  The header of the data file (stemmer version) and the relational
+            adjectives, with their stem and stem ending.
+  @rtype:   C{tuple(string, list(tuple(string, string, string)))}
+  """
+
+  adjr_file = codecs.open(filepath, "r", "utf-8")
+  lines = adjr_file.read().split("\n")
+  adjrs = []
+
+  adjr_file.close()
+
+  for line in lines[1:]:
+    if line != "":
+      adjrs.append(tuple(line.split("\t")))
+
+  return lines[0], adjrs
+
+def load_adjr_file(filepath, stem_function):
+  """
+  Loads the relational adjectives of a data file. If the data file has been
+  stemmed with another version of NLTK, the adjectives are loaded from the
+  cache file stemmed with the running version, or stemmed again and stored in
+  this cache file.
+
+  @param    filepath:       The path of the data file.
+  @type     filepath:       C{string}
+  @param    stem_function:  The function giving the stem and the stem ending of
+                            an adjective (used if the data file has been stemmed
+                            with another version of NLTK).
+  @type     stem_function:  C{function(string) : tuple(string, string)}
+
+  @return:  The relational adjectives, with their stem and stem ending.
+  @rtype:   C{list(tuple(string, string, string))}
+  """
+
+  # NLTK is only imported when the tables are needed
+  import nltk
+
+  stemmer_version_header = STEMMER_VERSION_HEADER + nltk.__version__
+  header, adjrs = read_adjr_file(filepath)
+
+  if header != stemmer_version_header:
+    cache_filepath = "%s.nltk-%s"%(filepath, nltk.__version__)
+    cached_adjrs = None
+
+    # the cache is only used if it has the adjectives of the data file
+    if path.exists(cache_filepath):
+      cache_header, cached_adjrs = read_adjr_file(cache_filepath)
+
+      if cache_header != stemmer_version_header \
+         or sorted(adjr for adjr, stem, stem_ending in cached_adjrs) \
+            != sorted(adjr for adjr, stem, stem_ending in adjrs):
+        cached_adjrs = None
+
+    if cached_adjrs == None:
+      cached_adjrs = [(adjr,) + stem_function(adjr) \
+                      for adjr, stem, stem_ending in adjrs]
+
+      # the tables still work when the cache can not be written
+      try:
+        store_adjr_file(cache_filepath, cached_adjrs)
+      except (IOError, OSError):
+        pass
+
+    adjrs = cached_adjrs
+
+  return adjrs
+
+def store_adjr_file(filepath, adjrs):
+  """
+  Stores stemmed relational adjectives in a data file, with the running version
+  of NLTK. The data file is written to a temporary file first, so that an
+  interrupted storage leaves no incomplete data file.
+
+  @param  filepath: The path of the data file.
+  @type   filepath: C{string}
+  @param  adjrs:    The relational adjectives, with their stem and stem ending.
+  @type   adjrs:    C{list(tuple(string, string, string))}
+  """
+
+  import nltk
+
+  temporary_filepath = "%s.%d.tmp"%(filepath, getpid())
+  adjr_file = codecs.open(temporary_filepath, "w", "utf-8")
+
+  adjr_file.write(STEMMER_VERSION_HEADER + nltk.__version__ + "\n")
+  for adjr, stem, stem_ending in sorted(adjrs):
+    adjr_file.write("%s\t%s\t%s\n"%(adjr, stem, stem_ending))
+
+  adjr_file.close()
+  rename(temporary_filepath, filepath)
+
+class LazyADJRTable(Mapping):
+  """
+  Read-only dictionary view of a relational adjective table, which loads the
+  tables on first access. It lets the tables be imported as dictionaries without
+  loading them at import time.
+  """
+
+  def __init__(self, load_function, table_index):
+    """
+    Constructor.
+
+    @param  load_function:  The function loading the tables of a language.
+    @type   load_function:  C{function() : tuple(dict)}
+    @param  table_index:    The index of the table among the loaded tables.
+    @type   table_index:    C{int}
+    """
+
+    super(LazyADJRTable, self).__init__()
+
+    self._load_function = load_function
+    self._table_index = table_index
+
+  def table(self):
+    """
+    Gives the table, loading it if it is not loaded yet.
+
+    @return:  The table.
+    @rtype:   C{dict}
+    """
+
+    return self._load_function()[self._table_index]
+
+  def __getitem__(self, key):
+    return self.table()[key]
+
+  def __contains__(self, key):
+    return key in self.table()
+
+  def __iter__(self):
+    return iter(self.table())
+
+  def __len__(self):
+    return len(self.table())
+
+def adjr_stem_ending_counts(adjrs):
+  """
+  Counts the stem endings of relational adjectives.
+
+  @param    adjrs:  The relational adjectives, with their stem and stem ending.
+  @type     adjrs:  C{list(tuple(string, string, string))}
+
+  @return:  The number of relational adjectives of each (non-empty) stem
+            ending.
+  @rtype:   C{dict(string, float)}
+  """
+
+  stem_ending_counts = {}
+
+  for adjr, stem, stem_ending in adjrs:
+    if stem_ending != "":
+      if stem_ending not in stem_ending_counts:
+        stem_ending_counts[stem_ending] = 0.0
+      stem_ending_counts[stem_ending] += 1.0
+
+  return stem_ending_counts
@@ -0,0 +1,514 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+from random import Random
+
+# SciPy is optional, the similarities are computed with sets without it
+try:
+  import numpy
+  from scipy import sparse
+except ImportError:
+  sparse = None
+
+################################################################################
+# Word overlap similarity
+
+def sparse_word_overlap_similarities(word_sets):
+  """
+  Computes the overlap similarities (Jaccard) between sets of words, with SciPy.
+  Each set is a row of a sparse word incidence matrix A (CSR), so that the
+  intersections are given by the non-null entries of A.A^T and the unions by
+  |a| + |b| - intersection. Only the pairs sharing at least one word are stored
+  by the product.
+
+  @param    word_sets:  The sets of words to compare.
+  @type     word_sets:  C{list(frozenset(string))}
+
+  @return:  The non-null similarity of each set with the following sets
+            (similarities[i][j], for i < j).
+  @rtype:   C{list(dict(int, float))}
+  """
+
+  word_ids = {}
+  word_indices = []
+  row_offsets = [0]
+  similarities = [{} for words in word_sets]
+
+  for words in word_sets:
+    for word in words:
+      if word not in word_ids:
+        word_ids[word] = len(word_ids)
+      word_indices.append(word_ids[word])
+    row_offsets.append(len(word_indices))
+
+  if len(word_indices) > 0:
+    incidences = sparse.csr_matrix((numpy.ones(len(word_indices),
+                                               dtype=numpy.int32),
+                                    numpy.array(word_indices,
+                                                dtype=numpy.int32),
+                                    numpy.array(row_offsets,
+                                                dtype=numpy.int32)),
+                                   shape=(len(word_sets), len(word_ids)))
+    sizes = numpy.diff(incidences.indptr)
+    intersections = sparse.triu(incidences.dot(incidences.T), 1).tocoo()
+    rows = intersections.row
+    columns = intersections.col
+    values = intersections.data.astype(numpy.float64) \
+             / (sizes[rows] + sizes[columns] - intersections.data)
+
+    for i, j, similarity in zip(rows.tolist(),
+                                columns.tolist(),
+                                values.tolist()):
+      similarities[i][j] = similarity
+
+  return similarities
+
+def word_overlap_similarities(word_sets, use_sparse_matrix=False):
+  """
+  Computes the overlap similarities (Jaccard) between sets of words. Only the
+  pairs sharing at least one word are compared: the sets are indexed by word
+  and the pairs are taken from the posting lists, so that the null similarities
+  are never computed. On request, the similarities are computed at once from a
+  sparse matrix product when SciPy is available (see
+  C{sparse_word_overlap_similarities}).
+
+  @param    word_sets:          The sets of words to compare.
+  @type     word_sets:          C{list(frozenset(string))}
+  @param    use_sparse_matrix:  True if the similarities must be computed with a
+                                sparse matrix product, False if they must be
+                                computed with sets.
+  @type     use_sparse_matrix:  C{bool}
+
+  @return:  The non-null similarity of each set with the following sets
+            (similarities[i][j], for i < j).
+  @rtype:   C{list(dict(int, float))}
+  """
+
+  postings = {}
+  similarities = []
+
+  if use_sparse_matrix and sparse != None:
+    return sparse_word_overlap_similarities(word_sets)
+
+  for i, words in enumerate(word_sets):
+    for word in words:
+      if word not in postings:
+        postings[word] = []
+      postings[word].append(i)
+
+  for i, words1 in enumerate(word_sets):
+    neighbours = set()
+
+    for word in words1:
+      for j in postings[word]:
+        if j > i:
+          neighbours.add(j)
+
+    similarities.append({})
+    for j in neighbours:
+      words2 = word_sets[j]
+
+      similarities[i][j] = float(len(words1 & words2)) \
+                           / float(len(words1 | words2))
+
+  return similarities
+
+################################################################################
+# MinHash word overlap similarity
+
+# modulus of the MinHash hash functions (Mersenne prime)
+MINHASH_PRIME = (1 << 61) - 1
+
+def minhash_signatures(word_sets, nb_hashes, seed=0):
+  """
+  Computes the MinHash signatures of sets of words. The probability that two
+  signatures have the same value for a given hash function is the overlap
+  similarity (Jaccard) of the two sets.
+
+  @param    word_sets:  The sets of words.
+  @type     word_sets:  C{list(frozenset(string))}
+  @param    nb_hashes:  The number of hash functions (size of the signatures).
+  @type     nb_hashes:  C{int}
+  @param    seed:       The seed of the random hash functions.
+  @type     seed:       C{int}
+
+  @return:  The signature of each set (None for the empty sets).
+  @rtype:   C{list(tuple(int))}
+  """
+
+  generator = Random(seed)
+  hash_functions = [(generator.randint(1, MINHASH_PRIME - 1),
+                     generator.randint(0, MINHASH_PRIME - 1)) \
+                    for k in range(nb_hashes)]
+  word_hashes = {}
+  signatures = []
+
+  for words in word_sets:
+    signature = None
+
+    if len(words) > 0:
+      hashes = []
+
+      for word in words:
+        if word not in word_hashes:
+          word_hashes[word] = hash(word) % MINHASH_PRIME
+        hashes.append(word_hashes[word])
+
+      signature = tuple(min((a * h + b) % MINHASH_PRIME for h in hashes) \
+                        for a, b in hash_functions)
+
+    signatures.append(signature)
+
+  return signatures
+
+def minhash_overlap_similarities(word_sets, nb_bands, band_size, seed=0):
+  """
+  Computes the overlap similarities (Jaccard) of the pairs of sets of words
+  proposed by locality-sensitive hashing. The MinHash signatures are split into
+  bands and the sets having the same values in at least one band are compared.
+  A pair of similarity s is proposed with probability 1 - (1 - s^r)^b (b bands
+  of r values): more bands find more pairs, larger bands propose less
+  dissimilar pairs.
+
+  @param    word_sets:  The sets of words to compare.
+  @type     word_sets:  C{list(frozenset(string))}
+  @param    nb_bands:   The number of bands of the signatures.
+  @type     nb_bands:   C{int}
+  @param    band_size:  The number of values of each band.
+  @type     band_size:  C{int}
+  @param    seed:       The seed of the random hash functions.
+  @type     seed:       C{int}
+
+  @return:  The non-null similarity of each set with the following proposed
+            sets (similarities[i][j], for i < j).
+  @rtype:   C{list(dict(int, float))}
+  """
+
+  signatures = minhash_signatures(word_sets, nb_bands * band_size, seed)
+  similarities = [{} for words in word_sets]
+
+  for band in range(nb_bands):
+    buckets = {}
+
+    for i, signature in enumerate(signatures):
+      if signature != None:
+        key = signature[band * band_size:(band + 1) * band_size]
+
+        if key not in buckets:
+          buckets[key] = []
+        buckets[key].append(i)
+
+    for bucket in buckets.values():
+      for index, i in enumerate(bucket):
+        words1 = word_sets[i]
+
+        for j in bucket[index + 1:]:
+          if j not in similarities[i]:
+            words2 = word_sets[j]
+            similarity = float(len(words1 & words2)) \
+                         / float(len(words1 | words2))
+
+            # (different sets may have the same values in a band)
+            if similarity > 0.0:
+              similarities[i][j] = similarity
+
+  return similarities
+
+################################################################################
+# HierarchicalClustering
+
+class LINKAGE_STRATEGY:
+  SINGLE    = 0
+  AVERAGE   = 1
+  COMPLETE  = 2
+
+# number of decimals of the similarities ordering the merges (the sums of
+# similarities of the average linkage are not exact, so equal averages may
+# otherwise differ), the threshold is compared to the exact similarities
+SIMILARITY_PRECISION = 12
+
+class HierarchicalClustering(object):
+  """
+  Agglomerative hierarchical clustering. The two most similar clusters are
+  merged until no two clusters are similar enough. The similarities between the
+  clusters are kept in a matrix updated after each merge (Lance-Williams
+  updates), and the candidate merges are kept in a priority queue, so that the
+  clustering does not compare every pair of clusters again after each merge.
+
+  The linkage strategies are the ones of C{StemOverlapHierarchicalClusterer}:
+    - Single: minimum similarity between the elements of the two clusters.
+    - Average: average similarity between the elements of the two clusters.
+    - Complete: maximum similarity between the elements of the two clusters.
+
+  Among equally similar pairs of clusters, the pair merged first is the one of
+  the oldest clusters (the clusters are ordered by creation, the initial
+  elements first).
+  """
+
+  def __init__(self, mode, similarity_threshold):
+    """
+    Constructor.
+
+    @param  mode:                 The linkage strategy.
+    @type   mode:                 C{LINKAGE_STRATEGY}
+    @param  similarity_threshold: The minimum similarity of two clusters to
+                                  merge.
+    @type   similarity_threshold: C{float}
+    """
+
+    super(HierarchicalClustering, self).__init__()
+
+    self._mode = mode
+    self._similarity_threshold = similarity_threshold
+
+  def mode(self):
+    """
+    Getter of the linkage strategy.
+
+    @return:  The linkage strategy.
+    @rtype:   C{LINKAGE_STRATEGY}
+    """
+
+    return self._mode
+
+  def similarity_threshold(self):
+    """
+    Getter of the minimum similarity of two clusters to merge.
+
+    @return:  The similarity threshold.
+    @rtype:   C{float}
+    """
+
+    return self._similarity_threshold
+
+  def linkage_similarity(self, linkage, size1, size2):
+    """
+    Gives the similarity of two clusters from their linkage value (the sum of
+    the similarities of their elements for the average linkage, the similarity
+    itself for the other strategies).
+
+    @param    linkage:  The linkage value of the two clusters.
+    @type     linkage:  C{float}
+    @param    size1:    The number of elements of the first cluster.
+    @type     size1:    C{int}
+    @param    size2:    The number of elements of the second cluster.
+    @type     size2:    C{int}
+
+    @return:  The similarity of the two clusters.
+    @rtype:   C{float}
+    """
+
+    if self.mode() == LINKAGE_STRATEGY.AVERAGE:
+      linkage /= float(size1 * size2)
+
+    return linkage
+
+  def merged_linkage(self, linkage1, linkage2):
+    """
+    Gives the linkage value between a cluster and the merge of two clusters
+    (Lance-Williams update).
+
+    @param    linkage1: The linkage value between the cluster and the first
+                        merged cluster.
+    @type     linkage1: C{float}
+    @param    linkage2: The linkage value between the cluster and the second
+                        merged cluster.
+    @type     linkage2: C{float}
+
+    @return:  The linkage value between the cluster and the merged cluster.
+    @rtype:   C{float}
+    """
+
+    if self.mode() == LINKAGE_STRATEGY.SINGLE:
+      return min(linkage1, linkage2)
+    if self.mode() == LINKAGE_STRATEGY.AVERAGE:
+      return linkage1 + linkage2
+    return max(linkage1, linkage2)
+
+  def cluster(self, nb_elements, similarities):
+    """
+    Clusters elements.
+
+    @param    nb_elements:  The number of elements to cluster.
+    @type     nb_elements:  C{int}
+    @param    similarities: The similarity of each element with the following
+                            elements (similarities[i][j], for i < j). Missing
+                            similarities are null, they are only considered if
+                            the similarity threshold is not positive.
+    @type     similarities: C{list(dict(int, float))}
+
+    @return:  The clusters (lists of element indexes), the last created first.
+    @rtype:   C{list(list(int))}
+    """
+
+    # with the maximum similarity as linkage, the clusters are the connected
+    # components of the pairs reaching the threshold
+    if self.mode() == LINKAGE_STRATEGY.COMPLETE \
+       and self.similarity_threshold() > 0.0:
+      return self.threshold_components(nb_elements, similarities)
+
+    clusters = {} # cluster identifier (creation order) -> elements
+    linkages = {} # cluster identifier -> (cluster identifier -> linkage value)
+    merges = []   # candidate merges (-rounded similarity, cluster1, cluster2,
+                  # similarity)
+    rounded_threshold = round(self.similarity_threshold(), SIMILARITY_PRECISION)
+
+    for i in range(nb_elements):
+      clusters[i] = [i]
+      linkages[i] = {}
+
+    for i in range(nb_elements):
+      neighbours = similarities[i].keys()
+
+      # null similarities can only be reached by a non-positive threshold
+      if self.similarity_threshold() <= 0.0:
+        neighbours = range(i + 1, nb_elements)
+
+      for j in neighbours:
+        similarity = similarities[i].get(j, 0.0)
+
+        linkages[i][j] = similarity
+        linkages[j][i] = similarity
+        similarity = self.linkage_similarity(similarity, 1, 1)
+        merges.append((-round(similarity, SIMILARITY_PRECISION),
+                       i,
+                       j,
+                       similarity))
+    heapify(merges)
+    next_cluster = nb_elements
+
+    while len(merges) > 0:
+      rounded_similarity, cluster1, cluster2, similarity = heappop(merges)
+
+      # the merges of already merged clusters are outdated
+      if cluster1 in clusters and cluster2 in clusters:
+        # (the following merges are rounded lower, so they are all below the
+        # threshold)
+        if -rounded_similarity < rounded_threshold:
+          break
+        if similarity < self.similarity_threshold():
+          continue
+
+        merged_cluster = next_cluster
+        next_cluster += 1
+        clusters[merged_cluster] = clusters.pop(cluster1) + clusters.pop(cluster2)
+        linkages1 = linkages.pop(cluster1)
+        linkages2 = linkages.pop(cluster2)
+        linkages[merged_cluster] = {}
+
+        # only the clusters linked to the merged ones are updated (the others
+        # still have a null similarity)
+        for cluster in set(linkages1) | set(linkages2):
+          if cluster != cluster1 and cluster != cluster2:
+            linkage = self.merged_linkage(linkages1.get(cluster, 0.0),
+                                          linkages2.get(cluster, 0.0))
+
+            linkages[cluster].pop(cluster1, None)
+            linkages[cluster].pop(cluster2, None)
+            linkages[cluster][merged_cluster] = linkage
+            linkages[merged_cluster][cluster] = linkage
+
+            similarity = self.linkage_similarity(linkage,
+                                                 len(clusters[cluster]),
+                                                 len(clusters[merged_cluster]))
+
+            heappush(merges, (-round(similarity, SIMILARITY_PRECISION),
+                              cluster,
+                              merged_cluster,
+                              similarity))
+
+    return [clusters[cluster] for cluster in sorted(clusters, reverse=True)]
+
+  def threshold_components(self, nb_elements, similarities):
+    """
+    Clusters elements with the maximum similarity as linkage (complete linkage
+    strategy), for a positive threshold. The clusters are then the connected
+    components of the pairs of elements reaching the threshold, which are
+    processed from the most similar, with a union-find structure mapping each
+    element to its cluster. Within a similarity level, the clusters are merged
+    in the same order as by C{cluster}, so that the clusters and the order of
+    their elements are the same.
+
+    @param    nb_elements:  The number of elements to cluster.
+    @type     nb_elements:  C{int}
+    @param    similarities: The similarity of each element with the following
+                            elements (similarities[i][j], for i < j). Missing
+                            similarities are null.
+    @type     similarities: C{list(dict(int, float))}
+
+    @return:  The clusters (lists of element indexes), the last created first.
+    @rtype:   C{list(list(int))}
+    """
+
+    parents = range(nb_elements)        # union-find forest of the elements
+    root_clusters = range(nb_elements)  # root element -> cluster
+    cluster_roots = range(nb_elements)  # cluster -> root element
+    clusters = dict((i, [i]) for i in range(nb_elements))
+    levels = {}                         # rounded similarity -> pairs of
+                                        # elements
+    next_cluster = nb_elements
+
+    def find(element):
+      # root of the tree of an element (with path halving)
+      while parents[element] != element:
+        parents[element] = parents[parents[element]]
+        element = parents[element]
+      return element
+
+    for i in range(nb_elements):
+      for j, similarity in similarities[i].items():
+        similarity = self.linkage_similarity(similarity, 1, 1)
+
+        if similarity >= self.similarity_threshold():
+          level = round(similarity, SIMILARITY_PRECISION)
+
+          if level not in levels:
+            levels[level] = []
+          levels[level].append((i, j))
+
+    for similarity in sorted(levels, reverse=True):
+      neighbours = {} # cluster -> clusters linked at this similarity
+      merges = []
+
+      for i, j in levels[similarity]:
+        cluster1 = root_clusters[find(i)]
+        cluster2 = root_clusters[find(j)]
+
+        if cluster1 != cluster2:
+          neighbours.setdefault(cluster1, set()).add(cluster2)
+          neighbours.setdefault(cluster2, set()).add(cluster1)
+      for cluster1 in neighbours:
+        for cluster2 in neighbours[cluster1]:
+          if cluster1 < cluster2:
+            merges.append((cluster1, cluster2))
+      heapify(merges)
+
+      # the oldest clusters are merged first
+      while len(merges) > 0:
+        cluster1, cluster2 = heappop(merges)
+
+        if cluster1 in clusters and cluster2 in clusters:
+          merged_cluster = next_cluster
+          next_cluster += 1
+          clusters[merged_cluster] = clusters.pop(cluster1) \
+                                     + clusters.pop(cluster2)
+          root1 = cluster_roots[cluster1]
+          root2 = cluster_roots[cluster2]
+          parents[root2] = root1
+          root_clusters[root1] = merged_cluster
+          cluster_roots.append(root1)
+
+          neighbours[merged_cluster] = (neighbours.pop(cluster1) \
+                                        | neighbours.pop(cluster2)) \
+                                       - set([cluster1, cluster2])
+          for cluster in neighbours[merged_cluster]:
+            neighbours[cluster].discard(cluster1)
+            neighbours[cluster].discard(cluster2)
+            neighbours[cluster].add(merged_cluster)
+
+            heappush(merges, (cluster, merged_cluster))
+
+    return [clusters[cluster] for cluster in sorted(clusters, reverse=True)]
@@ -0,0 +1,358 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+from collections import Counter
+
+################################################################################
+# NounPhraseIndex
+
+def contiguous_count(tokens, phrase):
+  """
+  Counts the (non-overlapping) occurrences of a phrase in a token sequence.
+
+  @param    tokens: The token sequence to search in.
+  @type     tokens: C{tuple(string)}
+  @param    phrase: The tokens of the phrase to count.
+  @type     phrase: C{tuple(string)}
+
+  @return:  The number of occurrences of the phrase.
+  @rtype:   C{int}
+  """
+
+  phrase_length = len(phrase)
+  count = 0
+  i = 0
+
+  while i + phrase_length <= len(tokens):
+    if tokens[i:i + phrase_length] == phrase:
+      count += 1
+      i += phrase_length
+    else:
+      i += 1
+
+  return count
+
+def gapped_count(tokens, phrase1, phrase2):
+  """
+  Counts the (non-overlapping) occurrences of two phrases separated by at least
+  one token in a token sequence. The closest occurrence of the second phrase is
+  associated to each occurrence of the first one.
+
+  @param    tokens:   The token sequence to search in.
+  @type     tokens:   C{tuple(string)}
+  @param    phrase1:  The tokens of the left phrase.
+  @type     phrase1:  C{tuple(string)}
+  @param    phrase2:  The tokens of the right phrase.
+  @type     phrase2:  C{tuple(string)}
+
+  @return:  The number of gapped occurrences of the two phrases.
+  @rtype:   C{int}
+  """
+
+  length1 = len(phrase1)
+  length2 = len(phrase2)
+  count = 0
+  i = 0
+
+  while i + length1 + 1 + length2 <= len(tokens):
+    if tokens[i:i + length1] == phrase1:
+      j = i + length1 + 1
+
+      while j + length2 <= len(tokens) and tokens[j:j + length2] != phrase2:
+        j += 1
+
+      # no later occurrence of the first phrase can be followed by the second
+      if j + length2 > len(tokens):
+        break
+
+      count += 1
+      i = j + length2
+    else:
+      i += 1
+
+  return count
+
+class NounPhraseIndex(object):
+  """
+  Index of the word and word pair counts of a collection of noun phrases. It
+  gives, for words and phrases (sequences of words), their contiguous counts,
+  their gapped pair counts and the distributions of their left and right
+  neighbours within the noun phrases.
+
+  The counts of the single words are computed when the index is created, the
+  counts of longer phrases are computed from the noun phrases containing their
+  first word and then kept by the queried index. An index can extend a base
+  index (e.g. the noun phrases of a document extending the ones of a training
+  corpus), in which case it gives the counts of both collections and the base
+  index keeps nothing, so that a base index shared by many documents does not
+  grow with them.
+  """
+
+  def __init__(self, noun_phrases, base_index=None):
+    """
+    Constructor.
+
+    @param  noun_phrases: The POS tagged noun phrases to index.
+    @type   noun_phrases: C{list(string)}
+    @param  base_index:   The index to extend, or None.
+    @type   base_index:   C{NounPhraseIndex}
+    """
+
+    super(NounPhraseIndex, self).__init__()
+
+    self._base_index = base_index
+    self._noun_phrase_counts = Counter(tuple(noun_phrase.split()) \
+                                       for noun_phrase in noun_phrases)
+    self._word_noun_phrases = {}
+    self._word_counts = Counter()
+    self._pair_counts = Counter()
+    self._gapped_pair_counts = Counter()
+    self._left_neighbours = {}
+    self._right_neighbours = {}
+    # counts of the phrases of more than one word (this index and its bases)
+    self._phrase_lookups = {}
+
+    for noun_phrase, count in self._noun_phrase_counts.items():
+      gapped_pairs = set()
+
+      for i, word in enumerate(noun_phrase):
+        if word not in self._word_noun_phrases:
+          self._word_noun_phrases[word] = set()
+        self._word_noun_phrases[word].add(noun_phrase)
+        self._word_counts[word] += count
+
+        for right_word in noun_phrase[i + 2:]:
+          gapped_pairs.add((word, right_word))
+
+      for pair in set(zip(noun_phrase[:-1], noun_phrase[1:])):
+        left_word, right_word = pair
+        pair_count = count * contiguous_count(noun_phrase, pair)
+
+        self._pair_counts[pair] += pair_count
+        if right_word not in self._left_neighbours:
+          self._left_neighbours[right_word] = Counter()
+        self._left_neighbours[right_word][left_word] += pair_count
+        if left_word not in self._right_neighbours:
+          self._right_neighbours[left_word] = Counter()
+        self._right_neighbours[left_word][right_word] += pair_count
+
+      for left_word, right_word in gapped_pairs:
+        self._gapped_pair_counts[(left_word, right_word)] += count * gapped_count(noun_phrase, (left_word,), (right_word,))
+
+  def base_index(self):
+    """
+    Getter of the index extended by this one.
+
+    @return:  The extended index, or None.
+    @rtype:   C{NounPhraseIndex}
+    """
+
+    return self._base_index
+
+  def noun_phrases_containing(self, word):
+    """
+    Gives the noun phrases containing a given word.
+
+    @param    word: The POS tagged word.
+    @type     word: C{string}
+
+    @return:  The noun phrases (tuple of words) containing the word, associated
+              with their number of occurrences.
+    @rtype:   C{dict(tuple(string), int)}
+    """
+
+    noun_phrases = {}
+
+    if self._base_index != None:
+      noun_phrases.update(self._base_index.noun_phrases_containing(word))
+
+    for noun_phrase in self._word_noun_phrases.get(word, []):
+      noun_phrases[noun_phrase] = noun_phrases.get(noun_phrase, 0) \
+                                  + self._noun_phrase_counts[noun_phrase]
+
+    return noun_phrases
+
+  def own_lookup(self, lookup, phrase1, phrase2=None):
+    """
+    Computes the counts of a phrase (or of a pair of phrases) within the noun
+    phrases of this index only (not the base index). The counts are computed
+    from the noun phrases containing the first word of the phrase.
+
+    @param    lookup:   The kind of counts ("frequency", "gapped_frequency",
+                        "left_neighbours" or "right_neighbours").
+    @type     lookup:   C{string}
+    @param    phrase1:  The POS tagged words of the (left) phrase.
+    @type     phrase1:  C{tuple(string)}
+    @param    phrase2:  The POS tagged words of the right phrase (gapped
+                        frequency only).
+    @type     phrase2:  C{tuple(string)}
+
+    @return:  The number of occurrences or the neighbour distribution.
+    @rtype:   C{int} or C{Counter}
+    """
+
+    length = len(phrase1)
+    result = 0
+
+    if lookup.endswith("neighbours"):
+      result = Counter()
+
+    for noun_phrase in self._word_noun_phrases.get(phrase1[0], []):
+      count = self._noun_phrase_counts[noun_phrase]
+
+      if lookup == "frequency":
+        result += count * contiguous_count(noun_phrase, phrase1)
+      elif lookup == "gapped_frequency":
+        result += count * gapped_count(noun_phrase, phrase1, phrase2)
+      else:
+        neighbours = set()
+
+        for i in range(len(noun_phrase) - length + 1):
+          if noun_phrase[i:i + length] == phrase1:
+            if lookup == "left_neighbours" and i > 0:
+              neighbours.add(noun_phrase[i - 1])
+            if lookup == "right_neighbours" and i + length < len(noun_phrase):
+              neighbours.add(noun_phrase[i + length])
+
+        for neighbour in neighbours:
+          if lookup == "left_neighbours":
+            neighbour_phrase = (neighbour,) + phrase1
+          else:
+            neighbour_phrase = phrase1 + (neighbour,)
+
+          result[neighbour] += count * contiguous_count(noun_phrase,
+                                                        neighbour_phrase)
+
+    return result
+
+  def phrase_lookup(self, lookup, phrase1, phrase2=None):
+    """
+    Gives the counts of a phrase (or of a pair of phrases) within the noun
+    phrases of this index and of its base indexes. The counts are kept by this
+    index for the next lookups.
+
+    @param    lookup:   The kind of counts ("frequency", "gapped_frequency",
+                        "left_neighbours" or "right_neighbours").
+    @type     lookup:   C{string}
+    @param    phrase1:  The POS tagged words of the (left) phrase.
+    @type     phrase1:  C{tuple(string)}
+    @param    phrase2:  The POS tagged words of the right phrase (gapped
+                        frequency only).
+    @type     phrase2:  C{tuple(string)}
+
+    @return:  The number of occurrences or the neighbour distribution.
+    @rtype:   C{int} or C{Counter}
+    """
+
+    key = (lookup, phrase1, phrase2)
+
+    if key not in self._phrase_lookups:
+      result = 0
+      index = self
+
+      if lookup.endswith("neighbours"):
+        result = Counter()
+
+      while index != None:
+        if lookup.endswith("neighbours"):
+          result.update(index.own_lookup(lookup, phrase1, phrase2))
+        else:
+          result += index.own_lookup(lookup, phrase1, phrase2)
+        index = index.base_index()
+
+      self._phrase_lookups[key] = result
+
+    return self._phrase_lookups[key]
+
+  def frequency(self, phrase):
+    """
+    Gives the number of occurrences of a phrase within the noun phrases.
+
+    @param    phrase: The POS tagged words of the phrase.
+    @type     phrase: C{tuple(string)}
+
+    @return:  The number of occurrences of the phrase.
+    @rtype:   C{int}
+    """
+
+    frequency = 0
+
+    if len(phrase) > 2:
+      return self.phrase_lookup("frequency", phrase)
+
+    if self._base_index != None:
+      frequency = self._base_index.frequency(phrase)
+
+    if len(phrase) == 1:
+      return frequency + self._word_counts[phrase[0]]
+    return frequency + self._pair_counts[phrase]
+
+  def gapped_frequency(self, phrase1, phrase2):
+    """
+    Gives the number of occurrences of two phrases separated by at least one
+    word within the noun phrases.
+
+    @param    phrase1:  The POS tagged words of the left phrase.
+    @type     phrase1:  C{tuple(string)}
+    @param    phrase2:  The POS tagged words of the right phrase.
+    @type     phrase2:  C{tuple(string)}
+
+    @return:  The number of gapped occurrences of the two phrases.
+    @rtype:   C{int}
+    """
+
+    frequency = 0
+
+    if len(phrase1) > 1 or len(phrase2) > 1:
+      return self.phrase_lookup("gapped_frequency", phrase1, phrase2)
+
+    if self._base_index != None:
+      frequency = self._base_index.gapped_frequency(phrase1, phrase2)
+
+    return frequency + self._gapped_pair_counts[(phrase1[0], phrase2[0])]
+
+  def left_neighbours(self, phrase):
+    """
+    Gives the words directly preceding a phrase within the noun phrases.
+
+    @param    phrase: The POS tagged words of the phrase.
+    @type     phrase: C{tuple(string)}
+
+    @return:  The left neighbours of the phrase, associated with the number of
+              occurrences of the phrase they precede.
+    @rtype:   C{Counter}
+    """
+
+    neighbours = Counter()
+
+    if len(phrase) > 1:
+      neighbours.update(self.phrase_lookup("left_neighbours", phrase))
+    else:
+      if self._base_index != None:
+        neighbours.update(self._base_index.left_neighbours(phrase))
+      neighbours.update(self._left_neighbours.get(phrase[0], {}))
+
+    return neighbours
+
+  def right_neighbours(self, phrase):
+    """
+    Gives the words directly following a phrase within the noun phrases.
+
+    @param    phrase: The POS tagged words of the phrase.
+    @type     phrase: C{tuple(string)}
+
+    @return:  The right neighbours of the phrase, associated with the number of
+              occurrences of the phrase they follow.
+    @rtype:   C{Counter}
+    """
+
+    neighbours = Counter()
+
+    if len(phrase) > 1:
+      neighbours.update(self.phrase_lookup("right_neighbours", phrase))
+    else:
+      if self._base_index != None:
+        neighbours.update(self._base_index.right_neighbours(phrase))
+      neighbours.update(self._right_neighbours.get(phrase[0], {}))
+
+    return neighbours
@@ -0,0 +1,452 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+import re
+from collections import deque
+
+################################################################################
+# TagAutomaton
+# compile_tagged_word_patterns
+
+# the tag id given to the tags which are not used by any pattern (and to the
+# tokens that can not be matched at all)
+UNKNOWN_TAG_ID = -1
+# dead state of the automaton (no pattern can match anymore)
+DEAD_STATE = -1
+
+##### Expressions ##############################################################
+# An expression is a nested tuple describing a regular expression over POS tags:
+#   ("tags", frozenset(tags))
+#   ("sequence", [expressions])
+#   ("alternation", [expressions])
+#   ("repetition", expression, minimum, maximum) (maximum is None if unbounded)
+
+def repetition(expression, quantifier):
+  """
+  Creates the expression repeating a given expression according to a regular
+  expression quantifier.
+
+  @param    expression: The expression to repeat.
+  @type     expression: C{tuple}
+  @param    quantifier: The quantifier ('?', '*' or '+').
+  @type     quantifier: C{string}
+
+  @return:  The repetition expression.
+  @rtype:   C{tuple}
+  """
+
+  if quantifier == "?":
+    return ("repetition", expression, 0, 1)
+  if quantifier == "*":
+    return ("repetition", expression, 0, None)
+  return ("repetition", expression, 1, None)
+
+class ExpressionParser(object):
+  """
+  Recursive descent parser turning a tokenized pattern into an expression. The
+  tokens are either a C{frozenset} of POS tags (one tagged word) or one of the
+  regular expression operators '(', ')', '|', '?', '*' and '+'.
+  """
+
+  def __init__(self, tokens):
+    """
+    Constructor.
+
+    @param  tokens: The tokenized pattern.
+    @type   tokens: C{list}
+    """
+
+    super(ExpressionParser, self).__init__()
+
+    self._tokens = tokens
+    self._position = 0
+
+  def peek(self):
+    if self._position < len(self._tokens):
+      return self._tokens[self._position]
+    return None
+
+  def next(self):
+    token = self.peek()
+
+    self._position += 1
+
+    return token
+
+  def parse(self):
+    """
+    Parses the whole pattern.
+
+    @return:  The expression of the pattern.
+    @rtype:   C{tuple}
+    """
+
+    expression = self.alternation()
+
+    if self.peek() != None:
+      raise ValueError("unexpected token %s"%repr(self.peek()))
+
+    return expression
+
+  def alternation(self):
+    alternatives = [self.sequence()]
+
+    while self.peek() == "|":
+      self.next()
+      alternatives.append(self.sequence())
+
+    if len(alternatives) == 1:
+      return alternatives[0]
+    return ("alternation", alternatives)
+
+  def sequence(self):
+    elements = []
+
+    while self.peek() != None and self.peek() != "|" and self.peek() != ")":
+      elements.append(self.quantified())
+
+    if len(elements) == 0:
+      raise ValueError("empty (sub-)pattern")
+    if len(elements) == 1:
+      return elements[0]
+    return ("sequence", elements)
+
+  def quantified(self):
+    token = self.next()
+    expression = None
+
+    if token == "(":
+      expression = self.alternation()
+
+      if self.next() != ")":
+        raise ValueError("unbalanced parenthesis")
+    elif isinstance(token, frozenset):
+      expression = ("tags", token)
+    else:
+      raise ValueError("unexpected token %s"%repr(token))
+
+    while self.peek() in ["?", "*", "+"]:
+      expression = repetition(expression, self.next())
+
+    return expression
+
+##### Automaton ################################################################
+
+class TagAutomaton(object):
+  """
+  Deterministic finite automaton recognizing several POS tag patterns at the
+  same time. The automaton works on tag identifiers, so every pattern is tried
+  at once from each start position (the positions already covered by a match
+  of every pattern are skipped), and the matches are given as token offsets.
+
+  Each pattern is matched as the regular expressions' C{finditer} does it: the
+  matches are searched from left to right and do not overlap. When several
+  matches start at the same position, the longest one is kept (with the greedy
+  quantifiers of noun phrase patterns, it is the one the regular expression
+  would give).
+  """
+
+  def __init__(self, expressions):
+    """
+    Constructor.
+
+    @param  expressions: The expressions of the patterns to recognize.
+    @type   expressions: C{list(tuple)}
+    """
+
+    super(TagAutomaton, self).__init__()
+
+    self._tag_ids = {}
+    self._nb_patterns = len(expressions)
+
+    # identification of the tags
+    for expression in expressions:
+      self.index_tags(expression)
+
+    # non-deterministic automaton (Thompson's construction)
+    self._nfa_transitions = [] # list((frozenset(tag_id), state))
+    self._nfa_epsilons = []    # list(list(state))
+    nfa_starts = []
+    nfa_accepts = {}
+
+    for pattern_index, expression in enumerate(expressions):
+      start, end = self.build_nfa(expression)
+
+      nfa_starts.append(start)
+      nfa_accepts[end] = pattern_index
+
+    # deterministic automaton (subset construction)
+    self.build_dfa(nfa_starts, nfa_accepts)
+
+    # the non-deterministic automaton is no longer useful
+    del self._nfa_transitions
+    del self._nfa_epsilons
+
+  def nb_patterns(self):
+    """
+    Getter of the number of patterns recognized by the automaton.
+
+    @return:  The number of patterns.
+    @rtype:   C{int}
+    """
+
+    return self._nb_patterns
+
+  def tag_id(self, tag):
+    """
+    Gives the identifier of a POS tag.
+
+    @param    tag: The POS tag.
+    @type     tag: C{string}
+
+    @return:  The identifier of the tag (C{UNKNOWN_TAG_ID} if no pattern uses
+              the tag).
+    @rtype:   C{int}
+    """
+
+    return self._tag_ids.get(tag, UNKNOWN_TAG_ID)
+
+  def index_tags(self, expression):
+    if expression[0] == "tags":
+      for tag in expression[1]:
+        if tag not in self._tag_ids:
+          self._tag_ids[tag] = len(self._tag_ids)
+    elif expression[0] == "repetition":
+      self.index_tags(expression[1])
+    else:
+      for sub_expression in expression[1]:
+        self.index_tags(sub_expression)
+
+  def new_nfa_state(self):
+    self._nfa_transitions.append([])
+    self._nfa_epsilons.append([])
+
+    return len(self._nfa_epsilons) - 1
+
+  def build_nfa(self, expression):
+    """
+    Builds the non-deterministic automaton fragment of an expression.
+
+    @param    expression: The expression to build the fragment of.
+    @type     expression: C{tuple}
+
+    @return:  The start and the end states of the fragment.
+    @rtype:   C{tuple(int, int)}
+    """
+
+    start = self.new_nfa_state()
+    end = start
+
+    if expression[0] == "tags":
+      end = self.new_nfa_state()
+      tag_ids = frozenset(self._tag_ids[tag] for tag in expression[1])
+
+      self._nfa_transitions[start].append((tag_ids, end))
+    elif expression[0] == "sequence":
+      for sub_expression in expression[1]:
+        sub_start, sub_end = self.build_nfa(sub_expression)
+
+        self._nfa_epsilons[end].append(sub_start)
+        end = sub_end
+    elif expression[0] == "alternation":
+      end = self.new_nfa_state()
+
+      for sub_expression in expression[1]:
+        sub_start, sub_end = self.build_nfa(sub_expression)
+
+        self._nfa_epsilons[start].append(sub_start)
+        self._nfa_epsilons[sub_end].append(end)
+    else:
+      sub_expression, minimum, maximum = expression[1:]
+
+      # mandatory occurrences
+      for i in range(minimum):
+        sub_start, sub_end = self.build_nfa(sub_expression)
+
+        self._nfa_epsilons[end].append(sub_start)
+        end = sub_end
+
+      if maximum == None:
+        # unbounded occurrences
+        sub_start, sub_end = self.build_nfa(sub_expression)
+        loop_end = self.new_nfa_state()
+
+        self._nfa_epsilons[end].append(sub_start)
+        self._nfa_epsilons[end].append(loop_end)
+        self._nfa_epsilons[sub_end].append(sub_start)
+        self._nfa_epsilons[sub_end].append(loop_end)
+        end = loop_end
+      else:
+        # optional occurrences
+        for i in range(maximum - minimum):
+          sub_start, sub_end = self.build_nfa(sub_expression)
+          optional_end = self.new_nfa_state()
+
+          self._nfa_epsilons[end].append(sub_start)
+          self._nfa_epsilons[end].append(optional_end)
+          self._nfa_epsilons[sub_end].append(optional_end)
+          end = optional_end
+
+    return start, end
+
+  def epsilon_closure(self, states):
+    closure = set(states)
+    stack = list(states)
+
+    while len(stack) > 0:
+      state = stack.pop()
+
+      for next_state in self._nfa_epsilons[state]:
+        if next_state not in closure:
+          closure.add(next_state)
+          stack.append(next_state)
+
+    return frozenset(closure)
+
+  def build_dfa(self, nfa_starts, nfa_accepts):
+    """
+    Builds the deterministic automaton from the non-deterministic one. The
+    transitions are stored as a table indexed by state and tag identifier, with
+    the unknown tags leading to the dead state.
+
+    @param  nfa_starts:   The start state of each pattern.
+    @type   nfa_starts:   C{list(int)}
+    @param  nfa_accepts:  The pattern accepted by each accepting state.
+    @type   nfa_accepts:  C{dict(int, int)}
+    """
+
+    nb_tags = len(self._tag_ids)
+    start = self.epsilon_closure(nfa_starts)
+    dfa_states = {start: 0}
+    pending = deque([start])
+    self._transitions = []
+    self._accepts = []
+
+    while len(pending) > 0:
+      nfa_states = pending.popleft()
+      transitions = [DEAD_STATE] * nb_tags
+
+      for tag_id in range(nb_tags):
+        next_nfa_states = []
+
+        for state in nfa_states:
+          for tag_ids, next_state in self._nfa_transitions[state]:
+            if tag_id in tag_ids:
+              next_nfa_states.append(next_state)
+
+        if len(next_nfa_states) > 0:
+          next_nfa_states = self.epsilon_closure(next_nfa_states)
+
+          if next_nfa_states not in dfa_states:
+            dfa_states[next_nfa_states] = len(dfa_states)
+            pending.append(next_nfa_states)
+          transitions[tag_id] = dfa_states[next_nfa_states]
+
+      self._transitions.append(transitions)
+      self._accepts.append(tuple(sorted(nfa_accepts[state] \
+                                        for state in nfa_states \
+                                        if state in nfa_accepts)))
+
+  def matches(self, tag_ids):
+    """
+    Finds the matches of every pattern in a sequence of tag identifiers. The
+    automaton is run from each start position until it dies, so the cost is the
+    number of tokens times the length of the longest attempt, not linear.
+
+    @param    tag_ids:  The tag identifiers of a sentence's tokens.
+    @type     tag_ids:  C{list(int)}
+
+    @return:  The matches, as (pattern index, start offset, end offset), sorted
+              by pattern and then by position.
+    @rtype:   C{list(tuple(int, int, int))}
+    """
+
+    transitions = self._transitions
+    accepts = self._accepts
+    nb_tokens = len(tag_ids)
+    # a pattern can not match before the end of its previous match
+    next_starts = [0] * self._nb_patterns
+    matches = []
+
+    for start in range(nb_tokens):
+      if min(next_starts) > start:
+        continue
+
+      state = 0
+      position = start
+      ends = {}
+
+      while position < nb_tokens:
+        tag_id = tag_ids[position]
+
+        if tag_id == UNKNOWN_TAG_ID:
+          break
+        state = transitions[state][tag_id]
+        if state == DEAD_STATE:
+          break
+        position += 1
+
+        for pattern_index in accepts[state]:
+          if next_starts[pattern_index] <= start:
+            ends[pattern_index] = position
+
+      for pattern_index, end in ends.items():
+        matches.append((pattern_index, start, end))
+        next_starts[pattern_index] = end
+
+    return sorted(matches)
+
+##### Tagged word patterns #####################################################
+
+# tagged word as expressed in the regular expressions of the benchmark:
+# ([^ ]+\/(tag1|tag2|...)( |$))
+TAGGED_WORD_REGEX = re.compile(r"\(\[\^ \]\+\\?(?P<separator>[^\\\[\]()|?*+ ])"
+                               r"\((?P<tags>[^()\[\]\\ ]+)\)\( \|\$\)\)")
+
+def compile_tagged_word_patterns(patterns):
+  """
+  Compiles regular expressions of tagged words into a C{TagAutomaton}. The
+  regular expressions must be composed of tagged words
+  (C{([^ ]+\/(tag1|tag2|...)( |$))}), grouping parenthesis, alternations and
+  quantifiers ('?', '*' or '+').
+
+  @param    patterns: The regular expressions to compile.
+  @type     patterns: C{list(string)}
+
+  @return:  The automaton recognizing the patterns and the tag separator they
+            use.
+  @rtype:   C{tuple(TagAutomaton, string)}
+
+  @raise    ValueError: If a pattern can not be expressed with tagged words.
+  """
+
+  expressions = []
+  separator = None
+
+  for pattern in patterns:
+    tokens = []
+    position = 0
+
+    while position < len(pattern):
+      tagged_word = TAGGED_WORD_REGEX.match(pattern, position)
+
+      if tagged_word != None:
+        if separator == None:
+          separator = tagged_word.group("separator")
+        elif separator != tagged_word.group("separator"):
+          raise ValueError("several tag separators in %s"%pattern)
+
+        tokens.append(frozenset(tagged_word.group("tags").split("|")))
+        position = tagged_word.end()
+      elif pattern[position] in "()|?*+":
+        tokens.append(pattern[position])
+        position += 1
+      else:
+        raise ValueError("unsupported pattern %s"%pattern)
+
+    expressions.append(ExpressionParser(tokens).parse())
+
+  if separator == None:
+    raise ValueError("no tagged word in the patterns")
+
+  return TagAutomaton(expressions), separator
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+import re
+
+################################################################################
+# TagChunker
+
+# tag patterns of a chunk rule (e.g. <nns|nn>)
+TAG_PATTERN_REGEX = re.compile(r"<([^<>{}]+)>")
+# what a chunk rule may contain out of its tag patterns (grouping, alternations
+# and quantifiers)
+RULE_OPERATORS_REGEX = re.compile(r"^([()|?*+]|\{\d+,?\}|\{\d*,\d+\})*$")
+# character matching any character of a tag in a tag pattern (as in NLTK)
+CHUNK_TAG_CHAR = r"[^\{\}<>]"
+# code of the first character used to represent the tags
+FIRST_TAG_CHARACTER = 0xE000
+
+class TagChunker(object):
+  """
+  Chunker compiling a chunk rule (e.g. C{{<jj>*<nn>+}}) into a matcher over
+  sequences of POS tags. Each tag is represented by one character, so the rule
+  becomes a regular expression over tag strings and the chunks are directly
+  given as token offsets. The chunks are the same as the ones of NLTK's
+  C{RegexpParser} with the same (single) chunk rule.
+  """
+
+  def __init__(self, rule):
+    """
+    Constructor.
+
+    @param  rule: The chunk rule (tag patterns within braces).
+    @type   rule: C{string}
+
+    @raise  ValueError: If the rule is not a single chunk rule, or if its tag
+                        patterns can not be compiled.
+    """
+
+    super(TagChunker, self).__init__()
+
+    # whitespaces are ignored (as in NLTK)
+    rule = re.sub(r"\s", "", rule)
+
+    if len(rule) < 2 or rule[0] != "{" or rule[-1] != "}":
+      raise ValueError("%s is not a chunk rule"%rule)
+    rule = rule[1:-1]
+
+    if not RULE_OPERATORS_REGEX.match(TAG_PATTERN_REGEX.sub("", rule)):
+      raise ValueError("unsupported chunk rule {%s}"%rule)
+
+    self._tag_patterns = []
+    self._rule_parts = []
+    position = 0
+
+    for tag_pattern in TAG_PATTERN_REGEX.finditer(rule):
+      if re.search(r"[\\\[\]]", tag_pattern.group(1)):
+        raise ValueError("unsupported tag pattern %s"%tag_pattern.group(0))
+
+      self._rule_parts.append(rule[position:tag_pattern.start()])
+      self._rule_parts.append(len(self._tag_patterns))
+      self._tag_patterns.append(re.compile(r"(%s)\Z"%tag_pattern.group(1).replace(".", CHUNK_TAG_CHAR)))
+      position = tag_pattern.end()
+    self._rule_parts.append(rule[position:])
+
+    # each tag is represented by the character of the set of tag patterns it
+    # matches (the regular expression is compiled again when a new set appears)
+    self._tag_characters = {}
+    self._pattern_characters = {}
+    self._regex = None
+
+  def tag_character(self, tag):
+    """
+    Gives the character representing a POS tag.
+
+    @param    tag:  The POS tag (None if the token has no tag).
+    @type     tag:  C{string}
+
+    @return:  The character representing the tag.
+    @rtype:   C{unicode}
+    """
+
+    if tag not in self._tag_characters:
+      matched_patterns = ()
+
+      if tag != None:
+        matched_patterns = tuple(i for i, tag_pattern in enumerate(self._tag_patterns) \
+                                 if tag_pattern.match(tag))
+
+      if matched_patterns not in self._pattern_characters:
+        self._pattern_characters[matched_patterns] = unichr(FIRST_TAG_CHARACTER + len(self._pattern_characters))
+        self._regex = None
+
+      self._tag_characters[tag] = self._pattern_characters[matched_patterns]
+
+    return self._tag_characters[tag]
+
+  def regex(self):
+    """
+    Getter of the regular expression of the rule, over the characters of the
+    known tags.
+
+    @return:  The compiled regular expression.
+    @rtype:   C{SRE_Pattern}
+    """
+
+    if self._regex == None:
+      pattern = u""
+
+      for part in self._rule_parts:
+        if isinstance(part, int):
+          characters = [character \
+                        for matched_patterns, character in self._pattern_characters.items() \
+                        if part in matched_patterns]
+
+          if len(characters) > 0:
+            pattern += u"[%s]"%u"".join(characters)
+          else:
+            pattern += u"(?!)"
+        else:
+          pattern += part
+
+      self._regex = re.compile(pattern, re.UNICODE)
+
+    return self._regex
+
+  def chunks(self, tag_sequences):
+    """
+    Chunks sequences of POS tags (e.g. the sentences of a document) at once.
+
+    @param    tag_sequences:  The POS tag sequences to chunk (None for the
+                              tokens which have no tag).
+    @type     tag_sequences:  C{list(list(string))}
+
+    @return:  The chunks of each sequence, as (sequence index, start offset,
+              end offset).
+    @rtype:   C{list(tuple(int, int, int))}
+    """
+
+    # the sequences are separated by a character which can not be chunked
+    separator = self.tag_character(None)
+    tag_string = separator.join(u"".join(self.tag_character(tag) \
+                                         for tag in tag_sequence) \
+                                for tag_sequence in tag_sequences)
+    sequence_starts = []
+    chunks = []
+    start = 0
+
+    for tag_sequence in tag_sequences:
+      sequence_starts.append(start)
+      start += len(tag_sequence) + 1
+
+    sequence_index = 0
+
+    for match in self.regex().finditer(tag_string):
+      # empty chunks are ignored (as in NLTK)
+      if match.end() > match.start():
+        while sequence_index + 1 < len(sequence_starts) \
+              and sequence_starts[sequence_index + 1] <= match.start():
+          sequence_index += 1
+
+        chunks.append((sequence_index,
+                       match.start() - sequence_starts[sequence_index],
+                       match.end() - sequence_starts[sequence_index]))
+
+    return chunks
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+from collections import deque
+
+################################################################################
+# TermAutomaton
+
+class TermAutomaton(object):
+  """
+  Aho-Corasick automaton over token sequences. It is built once from a
+  terminology and finds every occurrence of every term (including overlapping
+  and nested occurrences) within a single pass over a token sequence.
+  """
+
+  def __init__(self, terms):
+    """
+    Constructor.
+
+    @param  terms: The tokenized terms (tokens separated by spaces).
+    @type   terms: C{list(string)}
+    """
+
+    super(TermAutomaton, self).__init__()
+
+    # trie of the terms
+    self._transitions = [{}]  # state -> (token -> state)
+    self._failures = [0]      # state -> longest proper suffix state
+    self._outputs = [()]      # state -> lengths of the terms ending there
+
+    for term in terms:
+      tokens = term.split(" ")
+      state = 0
+
+      for token in tokens:
+        if token not in self._transitions[state]:
+          self._transitions.append({})
+          self._failures.append(0)
+          self._outputs.append(())
+          self._transitions[state][token] = len(self._transitions) - 1
+        state = self._transitions[state][token]
+
+      if len(tokens) not in self._outputs[state]:
+        self._outputs[state] += (len(tokens),)
+
+    # failure links (breadth-first, so that the failure of a state is always
+    # computed before the states reached from it)
+    pending = deque(self._transitions[0].values())
+
+    while len(pending) > 0:
+      state = pending.popleft()
+
+      for token, next_state in self._transitions[state].items():
+        failure = self._failures[state]
+
+        while failure != 0 and token not in self._transitions[failure]:
+          failure = self._failures[failure]
+        self._failures[next_state] = self._transitions[failure].get(token, 0)
+        self._outputs[next_state] += self._outputs[self._failures[next_state]]
+
+        pending.append(next_state)
+
+  def nb_states(self):
+    """
+    Getter of the number of states of the automaton.
+
+    @return:  The number of states.
+    @rtype:   C{int}
+    """
+
+    return len(self._transitions)
+
+  def matches(self, tokens):
+    """
+    Finds the occurrences of the terms in a token sequence.
+
+    @param    tokens: The tokens to search the terms in.
+    @type     tokens: C{list(string)}
+
+    @return:  The (start, end) offsets of the term occurrences, ordered by end.
+    @rtype:   C{list(tuple(int, int))}
+    """
+
+    transitions = self._transitions
+    failures = self._failures
+    outputs = self._outputs
+    matches = []
+    state = 0
+
+    for position, token in enumerate(tokens):
+      while state != 0 and token not in transitions[state]:
+        state = failures[state]
+      state = transitions[state].get(token, 0)
+
+      for length in outputs[state]:
+        matches.append((position + 1 - length, position + 1))
+
+    return matches
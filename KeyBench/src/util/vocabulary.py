@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+import codecs
+from os import path
+
+################################################################################
+# Vocabularies
+#
+# The word lists used to filter the tokens (stop words, accepted POS tags, etc.)
+# are turned into frozen sets, so that each membership test is done in constant
+# time. The frozen sets are shared by every component of the process: equal
+# vocabularies are represented by the same frozen set, and the stop word files
+# are read only once.
+
+# vocabularies in use (each frozen set is its own key)
+vocabularies = {}
+# stop word vocabularies, by stop word file path
+stop_word_vocabularies = {}
+
+# punctuation marks filtered out as stop words
+PUNCTUATION_STOP_WORDS = [",",
+                          ".",
+                          "!",
+                          "?",
+                          "]",
+                          "[",
+                          "=",
+                          "..",
+                          "...",
+                          ";",
+                          "(",
+                          ")",
+                          ":"]
+
+def vocabulary(words):
+  """
+  Gives the shared vocabulary of a collection of words (or POS tags).
+
+  @param    words:  The words of the vocabulary.
+  @type     words:  C{list(string)}
+
+  @return:  The frozen set of the words, shared with the components using the
+            same vocabulary.
+  @rtype:   C{frozenset(string)}
+  """
+
+  if words == None:
+    return None
+
+  words = frozenset(words)
+
+  if words not in vocabularies:
+    vocabularies[words] = words
+
+  return vocabularies[words]
+
+def stop_word_vocabulary(stop_words_filepath):
+  """
+  Gives the stop words of a stop word file (one stop word per line), with the
+  punctuation marks. The file is read on the first call only.
+
+  @param    stop_words_filepath:  The path of the stop word file.
+  @type     stop_words_filepath:  C{string}
+
+  @return:  The shared vocabulary of the stop words.
+  @rtype:   C{frozenset(string)}
+  """
+
+  stop_words_filepath = path.abspath(stop_words_filepath)
+
+  if stop_words_filepath not in stop_word_vocabularies:
+    st_file = codecs.open(stop_words_filepath, "r", "utf-8")
+    stop_words = [st.replace("\r", "") for st in st_file.read().split("\n")]
+
+    st_file.close()
+
+    stop_word_vocabularies[stop_words_filepath] = vocabulary(stop_words + PUNCTUATION_STOP_WORDS)
+
+  return stop_word_vocabularies[stop_words_filepath]
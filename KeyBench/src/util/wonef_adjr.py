@@ -1,2476 +1,74 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
-from nltk.stem import snowball
-
-french_adjr = {
-  u"alaskain": True,
-  u"alaskien": True,
-  u"andalou": True,
-  u"anglo-saxon": True,
-  u"aryen": True,
-  u"asiate": True,
-  u"autrichien": True,
-  u"bavarois": True,
-  u"bhoutanais": True,
-  u"bohémien": True,
-  u"bolivien": True,
-  u"bosnien": True,
-  u"britannique": True,
-  u"british": True,
-  u"béninois": True,
-  u"cambrien": True,
-  u"canadian": True,
-  u"caroline": True,
-  u"caucasien": True,
-  u"celsius": True,
-  u"chrétien": True,
-  u"colombien": True,
-  u"crétacé": True,
-  u"cubain": True,
-  u"cypriote": True,
-  u"cénozoïque": True,
-  u"est-allemand": True,
-  u"estonien": True,
-  u"eurasien": True,
-  u"fahrenheit": True,
-  u"français": True,
-  u"guinéen": True,
-  u"irakien": True,
-  u"iraquien": True,
-  u"israélien": True,
-  u"julien": True,
-  u"jurassique": True,
-  u"kantien": True,
-  u"malais": True,
-  u"mauricien": True,
-  u"mongol": True,
-  u"moravien": True,
-  u"méditerranée": True,
-  u"mésozoïque": True,
-  u"napolitain": True,
-  u"nigérian": True,
-  u"nigérien": True,
-  u"norvégien": True,
-  u"omani": True,
-  u"palestinien": True,
-  u"paléozoïque": True,
-  u"papou": True,
-  u"polynésien": True,
-  u"roman": True,
-  u"saoudien": True,
-  u"serbe": True,
-  u"slave": True,
-  u"sud-coréen": True,
-  u"sénégalais": True,
-  u"tchèque": True,
-  u"trias": True,
-  u"yéménite": True,
-  u"zapotèque": True,
-  u"abdominal": True,
-  u"abkhasien": True,
-  u"abkhaze": True,
-  u"ablatif": True,
-  u"aborigène": True,
-  u"absidal": True,
-  u"absidial": True,
-  u"absolutiste": True,
-  u"abyssal": True,
-  u"accusateur": True,
-  u"accusatif": True,
-  u"accusatoire": True,
-  u"achéen": True,
-  u"acoustique": True,
-  u"acrogène": True,
-  u"actinique": True,
-  u"actuariel": True,
-  u"acétique": True,
-  u"acétylénique": True,
-  u"adamantin": True,
-  u"adjectif": True,
-  u"adjectival": True,
-  u"administratif": True,
-  u"adolescent": True,
-  u"adroit": True,
-  u"adrénergique": True,
-  u"adverbial": True,
-  u"adénoïde": True,
-  u"affine": True,
-  u"affixal": True,
-  u"afghan": True,
-  u"africain": True,
-  u"afrikaans": True,
-  u"afrikander": True,
-  u"afrikaner": True,
-  u"afro-asiatique": True,
-  u"agnostique": True,
-  u"agronomique": True,
-  u"aillé": True,
-  u"alaire": True,
-  u"alaskain": True,
-  u"alaskien": True,
-  u"albanais": True,
-  u"albigeois": True,
-  u"albumineux": True,
-  u"albuminurique": True,
-  u"alchimique": True,
-  u"alexandrin": True,
-  u"algal": True,
-  u"algonkin": True,
-  u"algonquin": True,
-  u"algébrique": True,
-  u"algérien": True,
-  u"alimentaire": True,
-  u"allemand": True,
-  u"allergique": True,
-  u"allergisant": True,
-  u"allergène": True,
-  u"allergénique": True,
-  u"alliacé": True,
-  u"allopathe": True,
-  u"allopathique": True,
-  u"allophone": True,
-  u"allotropique": True,
-  u"alluvial": True,
-  u"alluvionnaire": True,
-  u"alphabétique": True,
-  u"alphanumérique": True,
-  u"alpin": True,
-  u"alsacien": True,
-  u"alvéolaire": True,
-  u"aléoute": True,
-  u"aléoutien": True,
-  u"amarante": True,
-  u"ambulatoire": True,
-  u"amibien": True,
-  u"amitotique": True,
-  u"ammoniac": True,
-  u"ammoniacal": True,
-  u"ammoniaqué": True,
-  u"amniotique": True,
-  u"amnésique": True,
-  u"amphibie": True,
-  u"amphibien": True,
-  u"américain": True,
-  u"amérindien": True,
-  u"anabolique": True,
-  u"anaglyptique": True,
-  u"anagogique": True,
-  u"anagrammatique": True,
-  u"anal": True,
-  u"analytique": True,
-  u"anamnestique": True,
-  u"anaphorique": True,
-  u"anaphylactique": True,
-  u"anarchique": True,
-  u"anarchisant": True,
-  u"anarchiste": True,
-  u"anastigmate": True,
-  u"anastigmatique": True,
-  u"anatomique": True,
-  u"ancestral": True,
-  u"andalou": True,
-  u"andin": True,
-  u"andorran": True,
-  u"androgyne": True,
-  u"androgène": True,
-  u"anecdotique": True,
-  u"anencéphale": True,
-  u"anesthésiant": True,
-  u"anesthésique": True,
-  u"angineux": True,
-  u"angiosperme": True,
-  u"anglais": True,
-  u"anglican": True,
-  u"angliche": True,
-  u"anglo-saxon": True,
-  u"anglosaxon": True,
-  u"angolais": True,
-  u"anguiforme": True,
-  u"anguine": True,
-  u"angulaire": True,
-  u"angélique": True,
-  u"animiste": True,
-  u"annélide": True,
-  u"anodique": True,
-  u"anosmique": True,
-  u"anoxique": True,
-  u"anthropique": True,
-  u"anthropocentrique": True,
-  u"anthropologique": True,
-  u"anthropométrique": True,
-  u"anthropophage": True,
-  u"antibactérien": True,
-  u"antibiotique": True,
-  u"anticancéreux": True,
-  u"anticyclonal": True,
-  u"anticyclonique": True,
-  u"antifongique": True,
-  u"antiguais": True,
-  u"antipollution": True,
-  u"antisatellite": True,
-  u"antisémite": True,
-  u"antithyroïdien": True,
-  u"antivenimeux": True,
-  u"antiviral": True,
-  u"antivénéneux": True,
-  u"antédiluvien": True,
-  u"anémique": True,
-  u"anémié": True,
-  u"anéroïde": True,
-  u"aortique": True,
-  u"apalachien": True,
-  u"aphasique": True,
-  u"aphoristique": True,
-  u"apicole": True,
-  u"apocalyptique": True,
-  u"apocryphe": True,
-  u"aponévrotique": True,
-  u"apoplectique": True,
-  u"apostolique": True,
-  u"appalachien": True,
-  u"appelant": True,
-  u"appendiculaire": True,
-  u"aquatique": True,
-  u"aqueux": True,
-  u"aquifère": True,
-  u"arabe": True,
-  u"arachnoïdien": True,
-  u"araméen": True,
-  u"arbitral": True,
-  u"arbustif": True,
-  u"archaïque": True,
-  u"archaïsant": True,
-  u"archidiocésain": True,
-  u"architectonique": True,
-  u"architectural": True,
-  u"archiépiscopal": True,
-  u"archéologique": True,
-  u"argentin": True,
-  u"argentique": True,
-  u"aristotélicien": True,
-  u"arithmétique": True,
-  u"armorial": True,
-  u"arménien": True,
-  u"aromatique": True,
-  u"arsenical": True,
-  u"arthurien": True,
-  u"articulaire": True,
-  u"articulatoire": True,
-  u"artiste": True,
-  u"artistique": True,
-  u"artériel": True,
-  u"artérioscléreux": True,
-  u"aryen": True,
-  u"aréolaire": True,
-  u"ascitique": True,
-  u"ascomycète": True,
-  u"ascétique": True,
-  u"asiatique": True,
-  u"astral": True,
-  u"astrologique": True,
-  u"astronautique": True,
-  u"astronomique": True,
-  u"astrophysique": True,
-  u"asymptote": True,
-  u"asymptotique": True,
-  u"atavique": True,
-  u"ataxique": True,
-  u"athée": True,
-  u"athénien": True,
-  u"atlantique": True,
-  u"atmosphérique": True,
-  u"atomique": True,
-  u"atonique": True,
-  u"attique": True,
-  u"attractif": True,
-  u"audiovisuel": True,
-  u"auditif": True,
-  u"auditoire": True,
-  u"auriculaire": True,
-  u"aurique": True,
-  u"auroral": True,
-  u"australien": True,
-  u"autarcique": True,
-  u"auto-immun": True,
-  u"auto-immune": True,
-  u"autobiographique": True,
-  u"autographique": True,
-  u"automatique": True,
-  u"automobile": True,
-  u"autopropulsé": True,
-  u"autotrophe": True,
-  u"autotélique": True,
-  u"autrichien": True,
-  u"auxétique": True,
-  u"aversif": True,
-  u"avestique": True,
-  u"aviaire": True,
-  u"avunculaire": True,
-  u"axial": True,
-  u"axile": True,
-  u"axillaire": True,
-  u"axiologique": True,
-  u"axiomatique": True,
-  u"azerbaïdjanais": True,
-  u"azimutal": True,
-  u"azoteux": True,
-  u"azotique": True,
-  u"azoté": True,
-  u"azotémique": True,
-  u"azoïque": True,
-  u"azéri": True,
-  u"aérifère": True,
-  u"aérodynamique": True,
-  u"aéronautique": True,
-  u"babylonien": True,
-  u"bacillaire": True,
-  u"bactérien": True,
-  u"bactériologique": True,
-  u"bactériostatique": True,
-  u"bahamien": True,
-  u"bahreïni": True,
-  u"bahreïnite": True,
-  u"balistique": True,
-  u"balsamique": True,
-  u"bangladais": True,
-  u"banlieusard": True,
-  u"bantou": True,
-  u"baptismal": True,
-  u"barbadien": True,
-  u"barométrique": True,
-  u"baroque": True,
-  u"basaltique": True,
-  u"basilaire": True,
-  u"basilical": True,
-  u"basophile": True,
-  u"batave": True,
-  u"bathyal": True,
-  u"bathymétrique": True,
-  u"batracien": True,
-  u"bavarois": True,
-  u"beethovénien": True,
-  u"behavioriste": True,
-  u"belge": True,
-  u"bengali": True,
-  u"benthique": True,
-  u"benzoïque": True,
-  u"bermudien": True,
-  u"bhotia": True,
-  u"bhoutanais": True,
-  u"biaxe": True,
-  u"bibliographique": True,
-  u"biblique": True,
-  u"bicarré": True,
-  u"bicentenaire": True,
-  u"bifilaire": True,
-  u"bilabial": True,
-  u"biliaire": True,
-  u"bilieux": True,
-  u"bimétalliste": True,
-  u"binaire": True,
-  u"binoculaire": True,
-  u"biochimique": True,
-  u"bioclimatique": True,
-  u"biographique": True,
-  u"biogène": True,
-  u"biogénétique": True,
-  u"biogéographique": True,
-  u"biomédical": True,
-  u"bionique": True,
-  u"biosynthétique": True,
-  u"biotique": True,
-  u"bipolaire": True,
-  u"biquadratique": True,
-  u"birman": True,
-  u"biréfringent": True,
-  u"bitumeux": True,
-  u"bitumineux": True,
-  u"bivalent": True,
-  u"bizarre": True,
-  u"bohème": True,
-  u"bohémien": True,
-  u"bolchevik": True,
-  u"bolchevique": True,
-  u"bolcheviste": True,
-  u"bolivien": True,
-  u"booléen": True,
-  u"bordélique": True,
-  u"borique": True,
-  u"boréal": True,
-  u"bosniaque": True,
-  u"bosnien": True,
-  u"botanique": True,
-  u"bouddhique": True,
-  u"bouddhiste": True,
-  u"boulimique": True,
-  u"bovidé": True,
-  u"bovin": True,
-  u"brachial": True,
-  u"bractéal": True,
-  u"branchial": True,
-  u"britannique": True,
-  u"bromique": True,
-  u"bronchique": True,
-  u"brut": True,
-  u"brésilien": True,
-  u"bubonique": True,
-  u"buccal": True,
-  u"bucolique": True,
-  u"budgétaire": True,
-  u"bulgare": True,
-  u"bureaucratique": True,
-  u"burlesque": True,
-  u"burundais": True,
-  u"butyreux": True,
-  u"butyrique": True,
-  u"byzantin": True,
-  u"béninois": True,
-  u"bénédictin": True,
-  u"béotien": True,
-  u"cachectique": True,
-  u"cachemirien": True,
-  u"cadastral": True,
-  u"cafouilleur": True,
-  u"calcaire": True,
-  u"calcifère": True,
-  u"calcique": True,
-  u"californien": True,
-  u"calligraphique": True,
-  u"calme": True,
-  u"calorimétrique": True,
-  u"calviniste": True,
-  u"cambodgien": True,
-  u"cambrien": True,
-  u"camerounais": True,
-  u"canadien": True,
-  u"cancérigène": True,
-  u"cancérogène": True,
-  u"cancérologique": True,
-  u"canin": True,
-  u"cannibale": True,
-  u"canonial": True,
-  u"cantonal": True,
-  u"capillaire": True,
-  u"capitaliste": True,
-  u"capitalistique": True,
-  u"capitulaire": True,
-  u"caprin": True,
-  u"capétien": True,
-  u"carbocyclique": True,
-  u"carbonifère": True,
-  u"carbonique": True,
-  u"carboné": True,
-  u"carcinogène": True,
-  u"carcinologique": True,
-  u"carcinomateux": True,
-  u"cardial": True,
-  u"cardiaque": True,
-  u"cardio-pulmonaire": True,
-  u"cardio-vasculaire": True,
-  u"cardiopulmonaire": True,
-  u"cardiovasculaire": True,
-  u"caricatural": True,
-  u"carmélite": True,
-  u"carnal": True,
-  u"carolingien": True,
-  u"carotide": True,
-  u"carotidien": True,
-  u"carotte": True,
-  u"carpien": True,
-  u"carthaginois": True,
-  u"cartilagineux": True,
-  u"cartographique": True,
-  u"cartésien": True,
-  u"caryophyllé": True,
-  u"casuistique": True,
-  u"catabolique": True,
-  u"catalan": True,
-  u"cataleptique": True,
-  u"catalytique": True,
-  u"catarrhal": True,
-  u"catarrheux": True,
-  u"catatonique": True,
-  u"cathodique": True,
-  u"catholique": True,
-  u"catoptrique": True,
-  u"catéchistique": True,
-  u"catégorique": True,
-  u"caucasien": True,
-  u"caudal": True,
-  u"cellulaire": True,
-  u"celte": True,
-  u"celtique": True,
-  u"censorial": True,
-  u"centenaire": True,
-  u"centigrade": True,
-  u"centraliste": True,
-  u"centésimal": True,
-  u"cervical": True,
-  u"ceylanais": True,
-  u"chaldéen": True,
-  u"chaotique": True,
-  u"charbonneux": True,
-  u"charitable": True,
-  u"chauviniste": True,
-  u"chilien": True,
-  u"chimioluminescent": True,
-  u"chimiothérapique": True,
-  u"chimérique": True,
-  u"chinois": True,
-  u"chippendale": True,
-  u"chlorophyllien": True,
-  u"chlorotique": True,
-  u"cholérique": True,
-  u"choral": True,
-  u"chorégraphique": True,
-  u"chromatique": True,
-  u"chromosomique": True,
-  u"chronologique": True,
-  u"chrétien": True,
-  u"churchillien": True,
-  u"chylifère": True,
-  u"chypriote": True,
-  u"ciliaire": True,
-  u"cilié": True,
-  u"cingalais": True,
-  u"cinéraire": True,
-  u"circadien": True,
-  u"circonstanciel": True,
-  u"circulatoire": True,
-  u"cireux": True,
-  u"citrique": True,
-  u"civil": True,
-  u"civique": True,
-  u"classificatoire": True,
-  u"climatique": True,
-  u"clitoridien": True,
-  u"clonique": True,
-  u"clérical": True,
-  u"coccygien": True,
-  u"cochléaire": True,
-  u"cockney": True,
-  u"cognitif": True,
-  u"cognitive": True,
-  u"colique": True,
-  u"colloïdal": True,
-  u"collégial": True,
-  u"colombien": True,
-  u"colonial": True,
-  u"colorectal": True,
-  u"colorimétrique": True,
-  u"comateux": True,
-  u"comique": True,
-  u"commercial": True,
-  u"commun": True,
-  u"communicatif": True,
-  u"communisant": True,
-  u"communiste": True,
-  u"commémoratif": True,
-  u"comparatif": True,
-  u"compatissant": True,
-  u"complet": True,
-  u"complétif": True,
-  u"comportemental": True,
-  u"comportementaliste": True,
-  u"composite": True,
-  u"computationnel": True,
-  u"cométaire": True,
-  u"concessif": True,
-  u"condylien": True,
-  u"conflictuel": True,
-  u"confucianiste": True,
-  u"confucéen": True,
-  u"congestif": True,
-  u"congolais": True,
-  u"congréganiste": True,
-  u"congrégationaliste": True,
-  u"congénère": True,
-  u"conique": True,
-  u"conjonctival": True,
-  u"conjugal": True,
-  u"consonantique": True,
-  u"conspirateur": True,
-  u"conspécifique": True,
-  u"constitutionnel": True,
-  u"consubstantiel": True,
-  u"consulaire": True,
-  u"contextuel": True,
-  u"continental": True,
-  u"contractuel": True,
-  u"contrapuntique": True,
-  u"contre-terroriste": True,
-  u"conventionnel": True,
-  u"copte": True,
-  u"coranique": True,
-  u"cornique": True,
-  u"cornouaillais": True,
-  u"cornéen": True,
-  u"coronaire": True,
-  u"coronarien": True,
-  u"corporatif": True,
-  u"corporatiste": True,
-  u"corpusculaire": True,
-  u"corrélationnel": True,
-  u"corse": True,
-  u"cortical": True,
-  u"coréen": True,
-  u"cosmique": True,
-  u"cosmogonique": True,
-  u"cosmologique": True,
-  u"costal": True,
-  u"costaricain": True,
-  u"costaricien": True,
-  u"covalent": True,
-  u"coïtal": True,
-  u"criminologique": True,
-  u"croate": True,
-  u"croissant": True,
-  u"crucifère": True,
-  u"crural": True,
-  u"crustacé": True,
-  u"cryogène": True,
-  u"cryogénique": True,
-  u"cryonique": True,
-  u"cryptobiotique": True,
-  u"cryptogame": True,
-  u"cryptogamique": True,
-  u"cryptographique": True,
-  u"crânien": True,
-  u"crétacé": True,
-  u"cubain": True,
-  u"cubiste": True,
-  u"cubital": True,
-  u"cuivreux": True,
-  u"cuivrique": True,
-  u"culinaire": True,
-  u"cultural": True,
-  u"culturel": True,
-  u"cunéiforme": True,
-  u"cuprique": True,
-  u"cutané": True,
-  u"cybernétique": True,
-  u"cyclique": True,
-  u"cyclonal": True,
-  u"cyclonique": True,
-  u"cyclopéen": True,
-  u"cyclothymique": True,
-  u"cypriote": True,
-  u"cyrillique": True,
-  u"cystique": True,
-  u"cytogénétique": True,
-  u"cytologique": True,
-  u"cytoplasmique": True,
-  u"cytotoxique": True,
-  u"cæcal": True,
-  u"céleste": True,
-  u"cénozoïque": True,
-  u"céphalique": True,
-  u"céphalo-rachidien": True,
-  u"céramique": True,
-  u"cérumineux": True,
-  u"céréalier": True,
-  u"cérébelleux": True,
-  u"cérébral": True,
-  u"cérébro-spinal": True,
-  u"cérébrospinal": True,
-  u"césarien": True,
-  u"cétacé": True,
-  u"cœcal": True,
-  u"cœliaque": True,
-  u"d'aberdeen": True,
-  u"d'allemagne": True,
-  u"d'alsace": True,
-  u"d'arthur": True,
-  u"d'auguste": True,
-  u"d'australasie": True,
-  u"d'australie": True,
-  u"d'autriche": True,
-  u"d'espagne": True,
-  u"d'irlande": True,
-  u"d'israël": True,
-  u"d'italie": True,
-  u"d'orwell": True,
-  u"d'outre-atlantique": True,
-  u"d'adieu": True,
-  u"d'administrateur": True,
-  u"d'administration": True,
-  u"d'ail": True,
-  u"d'albâtre": True,
-  u"d'allemand": True,
-  u"d'ambassadeur": True,
-  u"d'ambiance": True,
-  u"d'antiquaire": True,
-  u"d'attitude": True,
-  u"d'azote": True,
-  u"d'encadrement": True,
-  u"d'enseignement": True,
-  u"d'espace": True,
-  u"d'espagnol": True,
-  u"d'herbes": True,
-  u"d'information": True,
-  u"d'irlandais": True,
-  u"d'italien": True,
-  u"d'opéra": True,
-  u"d'orchestre": True,
-  u"d'organisateur": True,
-  u"d'organisation": True,
-  u"d'égypte": True,
-  u"d'évolution": True,
-  u"dactylique": True,
-  u"dalmate": True,
-  u"danois": True,
-  u"dantesque": True,
-  u"darwinien": True,
-  u"dendritique": True,
-  u"dendroïde": True,
-  u"dental": True,
-  u"dermatologique": True,
-  u"dermique": True,
-  u"despote": True,
-  u"despotique": True,
-  u"deutérocanonique": True,
-  u"diagnostique": True,
-  u"dialectal": True,
-  u"dialectique": True,
-  u"diamagnétique": True,
-  u"diamantin": True,
-  u"diamétral": True,
-  u"diaphorétique": True,
-  u"diastolique": True,
-  u"diatomique": True,
-  u"diazoïque": True,
-  u"dichromatique": True,
-  u"dictatorial": True,
-  u"différentiel": True,
-  u"digestif": True,
-  u"digital": True,
-  u"diluvien": True,
-  u"dimensionnel": True,
-  u"dimorphe": True,
-  u"diocésain": True,
-  u"dionysiaque": True,
-  u"diplomate": True,
-  u"diplomatique": True,
-  u"dipolaire": True,
-  u"diptère": True,
-  u"directif": True,
-  u"directionnel": True,
-  u"directorial": True,
-  u"disciplinaire": True,
-  u"distributionnel": True,
-  u"dithyrambique": True,
-  u"divalent": True,
-  u"divisionnaire": True,
-  u"divisionnel": True,
-  u"dizygote": True,
-  u"diététique": True,
-  u"doctoral": True,
-  u"doctrinal": True,
-  u"documentaire": True,
-  u"dogmatique": True,
-  u"dolomitique": True,
-  u"domestique": True,
-  u"domiciliaire": True,
-  u"dominicain": True,
-  u"dorien": True,
-  u"dramatique": True,
-  u"drupacé": True,
-  u"dualiste": True,
-  u"ducal": True,
-  u"duodénal": True,
-  u"durable": True,
-  u"dural": True,
-  u"dynamique": True,
-  u"dynastique": True,
-  u"dysgénique": True,
-  u"dyslexique": True,
-  u"décevant": True,
-  u"déductif": True,
-  u"déiste": True,
-  u"démagogique": True,
-  u"démographique": True,
-  u"départemental": True,
-  u"ecclésial": True,
-  u"ecclésiastique": True,
-  u"ectodermique": True,
-  u"ectopique": True,
-  u"einsteinien": True,
-  u"emblématique": True,
-  u"emphysémateux": True,
-  u"empirique": True,
-  u"endermique": True,
-  u"endocrine": True,
-  u"endocrinien": True,
-  u"endoscopique": True,
-  u"endothélial": True,
-  u"enneigé": True,
-  u"enseignant": True,
-  u"entomologique": True,
-  u"entrepreneurial": True,
-  u"entérique": True,
-  u"environnemental": True,
-  u"enzymatique": True,
-  u"ergonomique": True,
-  u"eschatologique": True,
-  u"espagnol": True,
-  u"essentiel": True,
-  u"est-allemand": True,
-  u"esthétique": True,
-  u"estonien": True,
-  u"estuarien": True,
-  u"ethnocentrique": True,
-  u"ethnographique": True,
-  u"ethnologique": True,
-  u"eucharistique": True,
-  u"eugénique": True,
-  u"euphonique": True,
-  u"eurafricain": True,
-  u"eurasiatique": True,
-  u"eurasien": True,
-  u"eurocentrique": True,
-  u"eurocentriste": True,
-  u"européen": True,
-  u"eutrophique": True,
-  u"excentrique": True,
-  u"excréteur": True,
-  u"excrétoire": True,
-  u"existentialiste": True,
-  u"existentiel": True,
-  u"exocrine": True,
-  u"expansionniste": True,
-  u"expiateur": True,
-  u"expiatoire": True,
-  u"expirateur": True,
-  u"exponentiel": True,
-  u"exponentielle": True,
-  u"expressionniste": True,
-  u"expérimental": True,
-  u"extra-linguistique": True,
-  u"extra-utérin": True,
-  u"extragalactique": True,
-  u"extralinguistique": True,
-  u"extraterrestre": True,
-  u"extéroceptif": True,
-  u"exécuteur": True,
-  u"exécutif": True,
-  u"exégétique": True,
-  u"fabien": True,
-  u"facho": True,
-  u"facial": True,
-  u"factoriel": True,
-  u"factorielle": True,
-  u"factuel": True,
-  u"faf": True,
-  u"familial": True,
-  u"farsi": True,
-  u"fascisant": True,
-  u"fasciste": True,
-  u"fataliste": True,
-  u"faustien": True,
-  u"favorable": True,
-  u"ferreux": True,
-  u"ferrique": True,
-  u"ferromagnétique": True,
-  u"ferrugineux": True,
-  u"fessier": True,
-  u"fibrineux": True,
-  u"fidjien": True,
-  u"fiduciaire": True,
-  u"filial": True,
-  u"filmique": True,
-  u"financier": True,
-  u"finlandais": True,
-  u"finnois": True,
-  u"fiscal": True,
-  u"fistuleux": True,
-  u"fiévreux": True,
-  u"flagellé": True,
-  u"flamand": True,
-  u"floral": True,
-  u"florentin": True,
-  u"fluvial": True,
-  u"fluviatile": True,
-  u"focal": True,
-  u"foliacé": True,
-  u"folié": True,
-  u"folliculaire": True,
-  u"fondamentaliste": True,
-  u"fongicide": True,
-  u"fongique": True,
-  u"fongueux": True,
-  u"formaliste": True,
-  u"formique": True,
-  u"formosan": True,
-  u"fossile": True,
-  u"fossilifère": True,
-  u"fossilisé": True,
-  u"franc": True,
-  u"franc-maçonnique": True,
-  u"franciscain": True,
-  u"franque": True,
-  u"français": True,
-  u"fraternel": True,
-  u"freudien": True,
-  u"frictionnel": True,
-  u"frison": True,
-  u"frontal": True,
-  u"fruste": True,
-  u"frutescent": True,
-  u"fugué": True,
-  u"funiculaire": True,
-  u"funèbre": True,
-  u"funéraire": True,
-  u"futur": True,
-  u"futuriste": True,
-  u"fébrile": True,
-  u"fédéral": True,
-  u"félin": True,
-  u"féministe": True,
-  u"fémoral": True,
-  u"féodal": True,
-  u"fœtal": True,
-  u"gabonais": True,
-  u"galactique": True,
-  u"galiléen": True,
-  u"gallican": True,
-  u"gallinacé": True,
-  u"gallois": True,
-  u"galvanique": True,
-  u"gambien": True,
-  u"gastrique": True,
-  u"gastro-intestinal": True,
-  u"gastronomique": True,
-  u"gaulois": True,
-  u"gaussien": True,
-  u"gaélique": True,
-  u"germain": True,
-  u"germanique": True,
-  u"gestionnaire": True,
-  u"ghanéen": True,
-  u"gibraltarien": True,
-  u"gingival": True,
-  u"glaciaire": True,
-  u"glacial": True,
-  u"glandulaire": True,
-  u"glial": True,
-  u"globulaire": True,
-  u"glomérulaire": True,
-  u"glossopharyngien": True,
-  u"glottal": True,
-  u"glottique": True,
-  u"glycogénique": True,
-  u"gnomique": True,
-  u"gonadique": True,
-  u"gonadotrope": True,
-  u"grammatical": True,
-  u"grandissant": True,
-  u"graphique": True,
-  u"gratuit": True,
-  u"gravimétrique": True,
-  u"gravitationnel": True,
-  u"grec": True,
-  u"grenadin": True,
-  u"grossissant": True,
-  u"gréco-": True,
-  u"grégorien": True,
-  u"guatémaltèque": True,
-  u"guinéen": True,
-  u"gustatif": True,
-  u"guttural": True,
-  u"guyanais": True,
-  u"gymnastique": True,
-  u"gymnosperme": True,
-  u"gynécologique": True,
-  u"gyroscopique": True,
-  u"génique": True,
-  u"génital": True,
-  u"génitif": True,
-  u"génito-urinaire": True,
-  u"génois": True,
-  u"génotypique": True,
-  u"généalogique": True,
-  u"générationnel": True,
-  u"générique": True,
-  u"géodésique": True,
-  u"géographique": True,
-  u"géologique": True,
-  u"géomorphologique": True,
-  u"géométrique": True,
-  u"géophysique": True,
-  u"géophyte": True,
-  u"géopolitique": True,
-  u"géostratégique": True,
-  u"géothermal": True,
-  u"géothermique": True,
-  u"gérontologique": True,
-  u"hadal": True,
-  u"halieutique": True,
-  u"hanovrien": True,
-  u"harmonique": True,
-  u"hassidique": True,
-  u"hawaïen": True,
-  u"haïtien": True,
-  u"hellénique": True,
-  u"hellénistique": True,
-  u"helvétique": True,
-  u"herméneutique": True,
-  u"hertzien": True,
-  u"hexadécimal": True,
-  u"hexagonal": True,
-  u"hexagone": True,
-  u"hilaire": True,
-  u"himalayen": True,
-  u"hindou": True,
-  u"hindouiste": True,
-  u"hippocratique": True,
-  u"hippomobile": True,
-  u"hircin": True,
-  u"hispanique": True,
-  u"hispano-américain": True,
-  u"histologique": True,
-  u"hitlérien": True,
-  u"hittite": True,
-  u"hiératique": True,
-  u"hiéroglyphique": True,
-  u"hollandais": True,
-  u"hollywoodien": True,
-  u"holographique": True,
-  u"homonyme": True,
-  u"homonymique": True,
-  u"homophone": True,
-  u"homéopathe": True,
-  u"homéopathique": True,
-  u"homéostatique": True,
-  u"homérique": True,
-  u"hondurien": True,
-  u"hongrois": True,
-  u"honteux": True,
-  u"horaire": True,
-  u"hormonal": True,
-  u"horticole": True,
-  u"humain": True,
-  u"humaniste": True,
-  u"humanitaire": True,
-  u"humoral": True,
-  u"hydraulique": True,
-  u"hydro-électrique": True,
-  u"hydrocéphale": True,
-  u"hydrocéphalique": True,
-  u"hydrodynamique": True,
-  u"hydrographique": True,
-  u"hydrométrique": True,
-  u"hydroponique": True,
-  u"hydrostatique": True,
-  u"hydrothérapique": True,
-  u"hydroélectrique": True,
-  u"hyménoptère": True,
-  u"hyoïde": True,
-  u"hyoïdien": True,
-  u"hyperbolique": True,
-  u"hypnotique": True,
-  u"hypodermique": True,
-  u"hypoglycémique": True,
-  u"hypophysaire": True,
-  u"hypothalamique": True,
-  u"hébraïque": True,
-  u"hégélien": True,
-  u"héliaque": True,
-  u"hématique": True,
-  u"hématologique": True,
-  u"hématopoïétique": True,
-  u"hémisphérique": True,
-  u"hémodynamique": True,
-  u"hémolytique": True,
-  u"hémophile": True,
-  u"hémorragique": True,
-  u"hémorroïdal": True,
-  u"hépatique": True,
-  u"héraldique": True,
-  u"héroïque": True,
-  u"hétérodyne": True,
-  u"héxadécimal": True,
-  u"iambique": True,
-  u"ibère": True,
-  u"ibérien": True,
-  u"ibérique": True,
-  u"iconique": True,
-  u"icosaédral": True,
-  u"idiomatique": True,
-  u"idéaliste": True,
-  u"idéographique": True,
-  u"idéologique": True,
-  u"igné": True,
-  u"iliaque": True,
-  u"illatif": True,
-  u"illettré": True,
-  u"immun": True,
-  u"immune": True,
-  u"immunitaire": True,
-  u"immuno-déprimé": True,
-  u"immunodépressif": True,
-  u"immunodéprimé": True,
-  u"immunologique": True,
-  u"immunosuppressif": True,
-  u"impaludé": True,
-  u"impressionniste": True,
-  u"impérial": True,
-  u"impérialiste": True,
-  u"incendiaire": True,
-  u"incestueux": True,
-  u"incident": True,
-  u"incitatif": True,
-  u"indicatif": True,
-  u"indigène": True,
-  u"indispensable": True,
-  u"individuel": True,
-  u"indo-européen": True,
-  u"indo-pakistanais": True,
-  u"indonésien": True,
-  u"inductif": True,
-  u"industriel": True,
-  u"inertiel": True,
-  u"infantile": True,
-  u"infectieux": True,
-  u"infernal": True,
-  u"infinitif": True,
-  u"informationnel": True,
-  u"infroissable": True,
-  u"inguinal": True,
-  u"inquisitorial": True,
-  u"insecticide": True,
-  u"inspirateur": True,
-  u"inspiratoire": True,
-  u"institutionnel": True,
-  u"instrumental": True,
-  u"insulaire": True,
-  u"insurrectionnel": True,
-  u"intensif": True,
-  u"intercellulaire": True,
-  u"intercostal": True,
-  u"interculturel": True,
-  u"interdisciplinaire": True,
-  u"intergalactique": True,
-  u"interlinéaire": True,
-  u"interlocutoire": True,
-  u"interministériel": True,
-  u"intermoléculaire": True,
-  u"interplanétaire": True,
-  u"interrogateur": True,
-  u"interrogatif": True,
-  u"intersidéral": True,
-  u"interstellaire": True,
-  u"interstitiel": True,
-  u"intertidal": True,
-  u"intervertébral": True,
-  u"intestinal": True,
-  u"intra-utérin": True,
-  u"intracellulaire": True,
-  u"intracrânien": True,
-  u"intracérébral": True,
-  u"intradermique": True,
-  u"intramoléculaire": True,
-  u"intramusculaire": True,
-  u"intraveineux": True,
-  u"intuitionniste": True,
-  u"intégral": True,
-  u"intégriste": True,
-  u"intéroceptif": True,
-  u"ioduré": True,
-  u"iodé": True,
-  u"ionien": True,
-  u"ionique": True,
-  u"irakien": True,
-  u"iranien": True,
-  u"iraqien": True,
-  u"iraquien": True,
-  u"irlandais": True,
-  u"irrationnel": True,
-  u"ischémique": True,
-  u"isentropique": True,
-  u"islamique": True,
-  u"islamiste": True,
-  u"islandais": True,
-  u"isolationniste": True,
-  u"isomorphe": True,
-  u"isomère": True,
-  u"isomérique": True,
-  u"isométrique": True,
-  u"isotonique": True,
-  u"isotope": True,
-  u"isotopique": True,
-  u"israélien": True,
-  u"israélite": True,
-  u"isthmique": True,
-  u"italien": True,
-  u"italique": True,
-  u"jacobin": True,
-  u"jacobéen": True,
-  u"jamaïcain": True,
-  u"jamaïquain": True,
-  u"japonais": True,
-  u"javanais": True,
-  u"jaïn": True,
-  u"jordanien": True,
-  u"journalistique": True,
-  u"judaïque": True,
-  u"judiciaire": True,
-  u"judéo-chrétien": True,
-  u"jugulaire": True,
-  u"juif": True,
-  u"julien": True,
-  u"jungien": True,
-  u"jurassique": True,
-  u"juridique": True,
-  u"jurisprudentiel": True,
-  u"juvénile": True,
-  u"jésuite": True,
-  u"jésuitique": True,
-  u"kafkaïen": True,
-  u"kampuchéen": True,
-  u"kantien": True,
-  u"keynésien": True,
-  u"kinesthésique": True,
-  u"kurde": True,
-  u"kényan": True,
-  u"kényen": True,
-  u"labial": True,
-  u"labyrinthien": True,
-  u"labyrinthique": True,
-  u"lacrymal": True,
-  u"lacrymogène": True,
-  u"lactaire": True,
-  u"lactique": True,
-  u"lactogène": True,
-  u"lacté": True,
-  u"lacustre": True,
-  u"lainier": True,
-  u"lamarckien": True,
-  u"lancastrien": True,
-  u"laotien": True,
-  u"lapidaire": True,
-  u"larvaire": True,
-  u"laryngé": True,
-  u"latin": True,
-  u"latino": True,
-  u"latino-américain": True,
-  u"latitudinal": True,
-  u"leibnitzien": True,
-  u"leibnizien": True,
-  u"lette": True,
-  u"letton": True,
-  u"lettonne": True,
-  u"levantin": True,
-  u"lexical": True,
-  u"lexicalisé": True,
-  u"lexicographique": True,
-  u"libanais": True,
-  u"libidinal": True,
-  u"libre-service": True,
-  u"libyen": True,
-  u"libérien": True,
-  u"lilliputien": True,
-  u"limbique": True,
-  u"limnologique": True,
-  u"lingual": True,
-  u"linguistique": True,
-  u"linnéen": True,
-  u"lithique": True,
-  u"lithographique": True,
-  u"litigieux": True,
-  u"littoral": True,
-  u"littéraire": True,
-  u"lituanien": True,
-  u"liturgique": True,
-  u"lobaire": True,
-  u"lobulaire": True,
-  u"local": True,
-  u"locomoteur": True,
-  u"locomotif": True,
-  u"logarithmique": True,
-  u"logistique": True,
-  u"lombaire": True,
-  u"lombosacré": True,
-  u"londonien": True,
-  u"longitudinal": True,
-  u"lucifuge": True,
-  u"lunaire": True,
-  u"lunisolaire": True,
-  u"lusitanien": True,
-  u"luthérien": True,
-  u"lymphatique": True,
-  u"lymphocytaire": True,
-  u"lymphoïde": True,
-  u"lyrique": True,
-  u"lysogène": True,
-  u"légal": True,
-  u"légumineux": True,
-  u"léonin": True,
-  u"lépreux": True,
-  u"macaronique": True,
-  u"machiavélique": True,
-  u"macro-économique": True,
-  u"macrobiotique": True,
-  u"macrocosmique": True,
-  u"macrocéphale": True,
-  u"macromoléculaire": True,
-  u"macroéconomique": True,
-  u"macédonien": True,
-  u"magistral": True,
-  u"magyar": True,
-  u"mahométan": True,
-  u"malais": True,
-  u"malaisien": True,
-  u"malawien": True,
-  u"malayo-polynésien": True,
-  u"malgache": True,
-  u"malien": True,
-  u"maltais": True,
-  u"malthusien": True,
-  u"mammaire": True,
-  u"mammalien": True,
-  u"mammifère": True,
-  u"managérial": True,
-  u"mandchou": True,
-  u"mandibulaire": True,
-  u"manichéen": True,
-  u"mannois": True,
-  u"manuel": True,
-  u"manxois": True,
-  u"maoïste": True,
-  u"marial": True,
-  u"marin": True,
-  u"marital": True,
-  u"maritime": True,
-  u"marmoréen": True,
-  u"marneux": True,
-  u"marocain": True,
-  u"marsupial": True,
-  u"martien": True,
-  u"marxiste": True,
-  u"marxiste-léniniste": True,
-  u"marémoteur": True,
-  u"maternel": True,
-  u"matrimonial": True,
-  u"matutinal": True,
-  u"matériel": True,
-  u"maure": True,
-  u"mauresque": True,
-  u"mauricien": True,
-  u"mauritanien": True,
-  u"maxillaire": True,
-  u"maçonnique": True,
-  u"membraneux": True,
-  u"mendélien": True,
-  u"menstruel": True,
-  u"mental": True,
-  u"mentholé": True,
-  u"mentonnier": True,
-  u"mercantile": True,
-  u"mercureux": True,
-  u"mercuriel": True,
-  u"mercurique": True,
-  u"messianique": True,
-  u"mexicain": True,
-  u"micacé": True,
-  u"micro-économique": True,
-  u"micro-électronique": True,
-  u"microbien": True,
-  u"microcosmique": True,
-  u"microcéphale": True,
-  u"microscopique": True,
-  u"microéconomique": True,
-  u"microélectronique": True,
-  u"milanais": True,
-  u"militaire": True,
-  u"millénaire": True,
-  u"millénariste": True,
-  u"minimaliste": True,
-  u"ministériel": True,
-  u"minoen": True,
-  u"minéral": True,
-  u"missionnaire": True,
-  u"mitotique": True,
-  u"mitral": True,
-  u"mnémonique": True,
-  u"mnémotechnique": True,
-  u"modal": True,
-  u"molaire": True,
-  u"moldave": True,
-  u"moléculaire": True,
-  u"mongol": True,
-  u"mongolien": True,
-  u"mongolique": True,
-  u"moniste": True,
-  u"monoatomique": True,
-  u"monocarpien": True,
-  u"monocarpique": True,
-  u"monochromatique": True,
-  u"monoclonal": True,
-  u"monophysite": True,
-  u"monozygote": True,
-  u"monumental": True,
-  u"monégasque": True,
-  u"monétaire": True,
-  u"morave": True,
-  u"more": True,
-  u"mormon": True,
-  u"morphologique": True,
-  u"mortuaire": True,
-  u"mosaïque": True,
-  u"moscovite": True,
-  u"moyen-oriental": True,
-  u"moyenne": True,
-  u"moyenâgeux": True,
-  u"mozambicain": True,
-  u"mozartien": True,
-  u"multiculturel": True,
-  u"multiniveaux": True,
-  u"municipal": True,
-  u"muqueux": True,
-  u"mural": True,
-  u"murine": True,
-  u"musculaire": True,
-  u"musical": True,
-  u"musicologique": True,
-  u"musulman": True,
-  u"mutagène": True,
-  u"mutant": True,
-  u"myalgique": True,
-  u"mycénien": True,
-  u"mystique": True,
-  u"mythique": True,
-  u"myélinisé": True,
-  u"médiateur": True,
-  u"médical": True,
-  u"méditerranéen": True,
-  u"médiéval": True,
-  u"médullaire": True,
-  u"mégalithique": True,
-  u"méiotique": True,
-  u"mélanésien": True,
-  u"méningé": True,
-  u"ménopausique": True,
-  u"ménopausée": True,
-  u"méridien": True,
-  u"méridional": True,
-  u"méritocratique": True,
-  u"mérovingien": True,
-  u"mésentérique": True,
-  u"mésoaméricain": True,
-  u"mésoblastique": True,
-  u"mésodermique": True,
-  u"mésonique": True,
-  u"mésozoïque": True,
-  u"métacarpien": True,
-  u"métallurgique": True,
-  u"métamorphique": True,
-  u"métastable": True,
-  u"métastatique": True,
-  u"métatarsien": True,
-  u"méthodiste": True,
-  u"méthodologique": True,
-  u"métrique": True,
-  u"métrologique": True,
-  u"métropolitain": True,
-  u"météorologique": True,
-  u"même": True,
-  u"nacré": True,
-  u"namibien": True,
-  u"napolitain": True,
-  u"napoléonien": True,
-  u"narcoleptique": True,
-  u"narcotique": True,
-  u"nasal": True,
-  u"natal": True,
-  u"national": True,
-  u"nativiste": True,
-  u"nautique": True,
-  u"naval": True,
-  u"nazaréen": True,
-  u"nazi": True,
-  u"nerveux": True,
-  u"nestorien": True,
-  u"neural": True,
-  u"neurasthénique": True,
-  u"neuroendocrinien": True,
-  u"neurogène": True,
-  u"neurologique": True,
-  u"neuromusculaire": True,
-  u"neuronal": True,
-  u"neurophysiologique": True,
-  u"neuropsychiatrique": True,
-  u"neurotoxique": True,
-  u"neurotrope": True,
-  u"newtonien": True,
-  u"nicaraguayen": True,
-  u"nigérien": True,
-  u"nihiliste": True,
-  u"nilotique": True,
-  u"nippon": True,
-  u"nipponne": True,
-  u"nitreux": True,
-  u"nitrique": True,
-  u"nocturne": True,
-  u"nodulaire": True,
-  u"nominal": True,
-  u"nominatif": True,
-  u"non-": True,
-  u"nord-africain": True,
-  u"nord-américain": True,
-  u"nord-coréen": True,
-  u"nord-vietnamien": True,
-  u"nordafricain": True,
-  u"nordaméricain": True,
-  u"nordique": True,
-  u"normatif": True,
-  u"norvégien": True,
-  u"nosocomial": True,
-  u"nucléé": True,
-  u"numide": True,
-  u"numineux": True,
-  u"numéral": True,
-  u"numérologique": True,
-  u"nuptial": True,
-  u"nutritif": True,
-  u"nutritionnel": True,
-  u"néandertalien": True,
-  u"néanderthalien": True,
-  u"nécrosique": True,
-  u"nécrosé": True,
-  u"nécrotique": True,
-  u"néerlandais": True,
-  u"néo-calédonien": True,
-  u"néo-natal": True,
-  u"néoformé": True,
-  u"néolithique": True,
-  u"néonatal": True,
-  u"néoplasique": True,
-  u"népalais": True,
-  u"néphrétique": True,
-  u"néritique": True,
-  u"névralgique": True,
-  u"objectif": True,
-  u"obstétrical": True,
-  u"obstétrique": True,
-  u"occipital": True,
-  u"occlusif": True,
-  u"occlusive": True,
-  u"occupationnel": True,
-  u"ocellé": True,
-  u"octal": True,
-  u"octogonal": True,
-  u"octogone": True,
-  u"oculaire": True,
-  u"officiel": True,
-  u"olfactif": True,
-  u"oligarchique": True,
-  u"olympien": True,
-  u"olympique": True,
-  u"omanais": True,
-  u"ombellifère": True,
-  u"ombellé": True,
-  u"ombilical": True,
-  u"omnidirectif": True,
-  u"omnidirectionnel": True,
-  u"oncial": True,
-  u"ondulatoire": True,
-  u"onirique": True,
-  u"onomastique": True,
-  u"onomatopéique": True,
-  u"ontogénétique": True,
-  u"ontologique": True,
-  u"operculé": True,
-  u"ophtalmique": True,
-  u"optatif": True,
-  u"optique": True,
-  u"opératique": True,
-  u"oral": True,
-  u"orbitaire": True,
-  u"orbital": True,
-  u"orchestral": True,
-  u"ordinal": True,
-  u"organisationnel": True,
-  u"oriental": True,
-  u"ornithologique": True,
-  u"orphique": True,
-  u"orthodontique": True,
-  u"orthodoxe": True,
-  u"orthographique": True,
-  u"orthoptique": True,
-  u"orthopédique": True,
-  u"orwellien": True,
-  u"osmotique": True,
-  u"osseux": True,
-  u"ossifère": True,
-  u"otique": True,
-  u"ottoman": True,
-  u"ouest-africain": True,
-  u"ougandais": True,
-  u"ovarien": True,
-  u"ovin": True,
-  u"ovulaire": True,
-  u"oxonien": True,
-  u"pacifique": True,
-  u"paillard": True,
-  u"pakistanais": True,
-  u"palatal": True,
-  u"palatin": True,
-  u"palestinien": True,
-  u"palladien": True,
-  u"palmaire": True,
-  u"paludique": True,
-  u"paludéen": True,
-  u"paléolithique": True,
-  u"paléontologique": True,
-  u"paléozoïque": True,
-  u"panaméen": True,
-  u"pancréatique": True,
-  u"panhellénique": True,
-  u"panthéiste": True,
-  u"papal": True,
-  u"papillaire": True,
-  u"papiste": True,
-  u"papou": True,
-  u"parabolique": True,
-  u"paradigmatique": True,
-  u"paraguayen": True,
-  u"paralytique": True,
-  u"paramagnétique": True,
-  u"paramilitaire": True,
-  u"paramétrique": True,
-  u"parasitaire": True,
-  u"parasite": True,
-  u"parasitique": True,
-  u"parasympathique": True,
-  u"parental": True,
-  u"parentéral": True,
-  u"parigot": True,
-  u"parisien": True,
-  u"pariétal": True,
-  u"parlementaire": True,
-  u"parodontal": True,
-  u"paroxysmal": True,
-  u"paroxysmique": True,
-  u"paroxystique": True,
-  u"participial": True,
-  u"partitif": True,
-  u"parturiente": True,
-  u"pascal": True,
-  u"passereau": True,
-  u"pastoral": True,
-  u"paternel": True,
-  u"pathologique": True,
-  u"patois": True,
-  u"patriarcal": True,
-  u"patristique": True,
-  u"patronymique": True,
-  u"paulinien": True,
-  u"pavlovien": True,
-  u"pectiné": True,
-  u"pectique": True,
-  u"pectoral": True,
-  u"pelvien": True,
-  u"pentagonal": True,
-  u"pentagone": True,
-  u"pentatonique": True,
-  u"pentavalent": True,
-  u"peptique": True,
-  u"perceptif": True,
-  u"perceptive": True,
-  u"percutant": True,
-  u"percutané": True,
-  u"persan": True,
-  u"perse": True,
-  u"persique": True,
-  u"personnel": True,
-  u"phagocytaire": True,
-  u"phalangien": True,
-  u"phallique": True,
-  u"pharaonien": True,
-  u"pharmaceutique": True,
-  u"pharmacologique": True,
-  u"pharyngal": True,
-  u"pharyngé": True,
-  u"philanthropique": True,
-  u"philatélique": True,
-  u"philharmonique": True,
-  u"philhellène": True,
-  u"philhellénique": True,
-  u"philippin": True,
-  u"philistin": True,
-  u"philologique": True,
-  u"philosophe": True,
-  u"philosophique": True,
-  u"phonique": True,
-  u"phonologique": True,
-  u"phonémique": True,
-  u"phonétique": True,
-  u"phosphoreux": True,
-  u"phosphorique": True,
-  u"phosphoré": True,
-  u"photique": True,
-  u"photo-électrique": True,
-  u"photochimique": True,
-  u"photoconducteur": True,
-  u"photographique": True,
-  u"photomécanique": True,
-  u"photométrique": True,
-  u"photosynthétique": True,
-  u"photovoltaïque": True,
-  u"photoélectrique": True,
-  u"photoémetteur": True,
-  u"phrastique": True,
-  u"phréatique": True,
-  u"phrénique": True,
-  u"phrénologique": True,
-  u"phylogénique": True,
-  u"phylogénétique": True,
-  u"phylétique": True,
-  u"physiologique": True,
-  u"physiologiste": True,
-  u"phénicien": True,
-  u"phénotypique": True,
-  u"pianistique": True,
-  u"pictographique": True,
-  u"pictural": True,
-  u"pierreux": True,
-  u"pilaire": True,
-  u"pilosébacé": True,
-  u"pinéal": True,
-  u"pituitaire": True,
-  u"piétiste": True,
-  u"piézoélectrique": True,
-  u"planctonique": True,
-  u"plantaire": True,
-  u"planétaire": True,
-  u"platonicien": True,
-  u"pleural": True,
-  u"plombifère": True,
-  u"ploutocratique": True,
-  u"pluraliste": True,
-  u"pluriculturel": True,
-  u"pneumatique": True,
-  u"pneumogastrique": True,
-  u"pneumonique": True,
-  u"polaire": True,
-  u"polonais": True,
-  u"polyatomique": True,
-  u"polydactyle": True,
-  u"polygonal": True,
-  u"polymorphe": True,
-  u"polymère": True,
-  u"polynésien": True,
-  u"polynôme": True,
-  u"polyphase": True,
-  u"polyphasé": True,
-  u"polyphonique": True,
-  u"polyèdre": True,
-  u"polyédrique": True,
-  u"pompeux": True,
-  u"pontifical": True,
-  u"poplité": True,
-  u"porcin": True,
-  u"porphyrique": True,
-  u"portugais": True,
-  u"positif": True,
-  u"positiviste": True,
-  u"possessif": True,
-  u"post-communiste": True,
-  u"post-doctoral": True,
-  u"postal": True,
-  u"postcommuniste": True,
-  u"postdoctoral": True,
-  u"postglaciaire": True,
-  u"postmoderne": True,
-  u"postmoderniste": True,
-  u"postpositif": True,
-  u"postural": True,
-  u"poétique": True,
-  u"pragmatique": True,
-  u"prime": True,
-  u"primipare": True,
-  u"primitif": True,
-  u"primé": True,
-  u"prismatique": True,
-  u"probabiliste": True,
-  u"probant": True,
-  u"procaryote": True,
-  u"processionnel": True,
-  u"procédural": True,
-  u"prodromique": True,
-  u"professionnel": True,
-  u"professoral": True,
-  u"profilé": True,
-  u"promotionnel": True,
-  u"pronominal": True,
-  u"propagandiste": True,
-  u"propitiatoire": True,
-  u"proprioceptif": True,
-  u"propulsif": True,
-  u"prosodique": True,
-  u"prostate": True,
-  u"prostatique": True,
-  u"protestant": True,
-  u"protéolytique": True,
-  u"proustien": True,
-  u"proverbial": True,
-  u"providentiel": True,
-  u"provincial": True,
-  u"prussien": True,
-  u"précancéreux": True,
-  u"préchrétien": True,
-  u"précolombien": True,
-  u"précordial": True,
-  u"préfectoral": True,
-  u"préhistorique": True,
-  u"préjudiciel": True,
-  u"prémenstruel": True,
-  u"prénuptial": True,
-  u"prépositif": True,
-  u"prépositionnel": True,
-  u"préraphaélite": True,
-  u"présidentiel": True,
-  u"présocratique": True,
-  u"prétorien": True,
-  u"psychanalytique": True,
-  u"psychiatrique": True,
-  u"psychogène": True,
-  u"psychogénétique": True,
-  u"psycholinguistique": True,
-  u"psychologique": True,
-  u"psychomoteur": True,
-  u"psychométrique": True,
-  u"psychopharmacologique": True,
-  u"psychosexuel": True,
-  u"psychothérapique": True,
-  u"ptolémaïque": True,
-  u"pubertaire": True,
-  u"pubien": True,
-  u"pubère": True,
-  u"puerpéral": True,
-  u"pugilistique": True,
-  u"pulmonaire": True,
-  u"punique": True,
-  u"pupillaire": True,
-  u"putride": True,
-  u"puéril": True,
-  u"pylorique": True,
-  u"pyogène": True,
-  u"pyrogène": True,
-  u"pyroligneux": True,
-  u"pyrotechnique": True,
-  u"pythagoricien": True,
-  u"pythagorique": True,
-  u"pécuniaire": True,
-  u"pédagogique": True,
-  u"pédale": True,
-  u"pédiatrique": True,
-  u"pélagique": True,
-  u"péloponnésien": True,
-  u"pénien": True,
-  u"péninsulaire": True,
-  u"péricardique": True,
-  u"péridural": True,
-  u"périnéal": True,
-  u"péritonéal": True,
-  u"péruvien": True,
-  u"pétaloïde": True,
-  u"qatari": True,
-  u"qatarien": True,
-  u"quadrangulaire": True,
-  u"quadratique": True,
-  u"quadriphonique": True,
-  u"quadrivalent": True,
-  u"qualitatif": True,
-  u"quantitatif": True,
-  u"quartzeux": True,
-  u"quintessenciel": True,
-  u"rabbinique": True,
-  u"rabelaisien": True,
-  u"racial": True,
-  u"radial": True,
-  u"radical": True,
-  u"radiographique": True,
-  u"radiologique": True,
-  u"radiophonique": True,
-  u"radioélectrique": True,
-  u"rapace": True,
-  u"rastafari": True,
-  u"rationaliste": True,
-  u"rationnel": True,
-  u"rayonner": True,
-  u"recombinant": True,
-  u"rectal": True,
-  u"relativiste": True,
-  u"rembranesque": True,
-  u"renouvelable": True,
-  u"reptile": True,
-  u"reptilien": True,
-  u"respiratoire": True,
-  u"restant": True,
-  u"reviviscent": True,
-  u"rhodésien": True,
-  u"rhombique": True,
-  u"rhomboïdal": True,
-  u"rhénan": True,
-  u"rhéologique": True,
-  u"riemannien": True,
-  u"ritualiste": True,
-  u"rituel": True,
-  u"riverain": True,
-  u"rivulaire": True,
-  u"rom": True,
-  u"roman": True,
-  u"romanche": True,
-  u"romantique": True,
-  u"rosacé": True,
-  u"rosicrucien": True,
-  u"rotatoire": True,
-  u"rotulien": True,
-  u"roumain": True,
-  u"rouquin": True,
-  u"roux": True,
-  u"royal": True,
-  u"ruandais": True,
-  u"ruminant": True,
-  u"runique": True,
-  u"rupestre": True,
-  u"rural": True,
-  u"russe": True,
-  u"rwandais": True,
-  u"réactogène": True,
-  u"réaliste": True,
-  u"récessionniste": True,
-  u"rédempteur": True,
-  u"réducteur": True,
-  u"réductionniste": True,
-  u"régimentaire": True,
-  u"régional": True,
-  u"régressif": True,
-  u"rémanent": True,
-  u"rénal": True,
-  u"républicain": True,
-  u"résidentiel": True,
-  u"résiduaire": True,
-  u"résiduel": True,
-  u"résigné": True,
-  u"rétinien": True,
-  u"réversible": True,
-  u"révolutionnaire": True,
-  u"sabbatique": True,
-  u"sabin": True,
-  u"sacerdotal": True,
-  u"sacral": True,
-  u"sacramentaire": True,
-  u"sacramentel": True,
-  u"sacrificatoire": True,
-  u"sacrificiel": True,
-  u"sadducéen": True,
-  u"sadomasochiste": True,
-  u"saducéen": True,
-  u"saharien": True,
-  u"salissable": True,
-  u"salivaire": True,
-  #u"salj\qide": True,
-  #u"salj\umacrqide": True,
-  u"salvadorien": True,
-  u"samoan": True,
-  u"san-marinais": True,
-  u"santoméen": True,
-  u"saoudien": True,
-  u"saponacé": True,
-  u"saprophyte": True,
-  u"sarcoïde": True,
-  u"sarde": True,
-  u"satyrique": True,
-  u"saurien": True,
-  u"savonneux": True,
-  u"saxatile": True,
-  u"saxicole": True,
-  u"saxon": True,
-  u"scalaire": True,
-  u"scalène": True,
-  u"scandinave": True,
-  u"scapulaire": True,
-  u"scapulohuméral": True,
-  u"schismatique": True,
-  u"schizophrénique": True,
-  u"schizoïde": True,
-  u"sciatique": True,
-  u"scientifique": True,
-  u"sclérosé": True,
-  u"scolastique": True,
-  u"scorbutique": True,
-  u"scripturaire": True,
-  u"scriptural": True,
-  u"scrotal": True,
-  u"sculptural": True,
-  u"scythe": True,
-  u"secondaire": True,
-  u"sectoriel": True,
-  u"seigneurial": True,
-  u"seldjoukide": True,
-  u"semi-autobiographique": True,
-  u"semi-tropical": True,
-  u"sensationnel": True,
-  u"sensorimoteur": True,
-  u"septal": True,
-  u"septique": True,
-  u"serbe": True,
-  u"sex-linked": True,
-  u"sexagésimal": True,
-  u"sexuel": True,
-  u"seychellois": True,
-  u"shakespearien": True,
-  u"shintoïste": True,
-  u"shintô": True,
-  u"shona": True,
-  u"siamois": True,
-  u"sibérien": True,
-  u"sicilien": True,
-  u"sidéral": True,
-  u"sierra-léonais": True,
-  u"sierra-léonien": True,
-  u"sigmoïde": True,
-  u"sikh": True,
-  u"siliceux": True,
-  u"silicicole": True,
-  u"simien": True,
-  u"sioniste": True,
-  u"sismologique": True,
-  u"slave": True,
-  u"slavon": True,
-  u"sociable": True,
-  u"social": True,
-  u"socio-économique": True,
-  u"socioculturel": True,
-  u"sociolinguistique": True,
-  u"sociologique": True,
-  u"sociopathe": True,
-  u"socioéconomique": True,
-  u"sociétal": True,
-  u"socratique": True,
-  u"solaire": True,
-  u"solennel": True,
-  u"somali": True,
-  u"somalien": True,
-  u"sophistique": True,
-  u"soudanais": True,
-  u"soudanien": True,
-  u"soufi": True,
-  u"sous-clavier": True,
-  u"sous-cutané": True,
-  u"sous-orbital": True,
-  u"soutenable": True,
-  u"soviétique": True,
-  u"spartiate": True,
-  u"spastique": True,
-  u"spatial": True,
-  u"spatio-temporel": True,
-  u"spatiotemporel": True,
-  u"spectral": True,
-  u"spectrographique": True,
-  u"spectroscopique": True,
-  u"spermatique": True,
-  u"spermicide": True,
-  u"sphérique": True,
-  u"spinal": True,
-  u"spirite": True,
-  u"spiritualiste": True,
-  u"splanchnique": True,
-  u"splénique": True,
-  u"spondaïque": True,
-  u"sportif": True,
-  u"sri-lankais": True,
-  u"stalinien": True,
-  u"staliniste": True,
-  u"stanneux": True,
-  u"stannique": True,
-  u"staphylin": True,
-  u"staphylococcique": True,
-  u"statique": True,
-  u"statistique": True,
-  u"statuaire": True,
-  u"statutaire": True,
-  u"stellaire": True,
-  u"sternal": True,
-  u"sternutatoire": True,
-  u"stigmatique": True,
-  u"stolonifère": True,
-  u"stomacal": True,
-  u"stomachique": True,
-  u"stratégique": True,
-  u"streptococcique": True,
-  u"structural": True,
-  u"structurel": True,
-  u"sténographique": True,
-  u"stéroïde": True,
-  u"stéréoscopique": True,
-  u"stœchiométrique": True,
-  u"subarctique": True,
-  u"subatomique": True,
-  u"subjonctif": True,
-  u"sublingual": True,
-  u"sublunaire": True,
-  u"subsaharien": True,
-  u"substantif": True,
-  u"subtropical": True,
-  u"suburbain": True,
-  u"succinique": True,
-  u"sud-africain": True,
-  u"sud-américain": True,
-  u"sud-coréen": True,
-  u"sudafricain": True,
-  u"sudaméricain": True,
-  u"sudorifique": True,
-  u"suisse": True,
-  u"sulfureux": True,
-  u"sulfurique": True,
-  u"sulfuré": True,
-  u"sumérien": True,
-  u"superficiel": True,
-  u"surrénal": True,
-  u"sus-orbitaire": True,
-  u"suédois": True,
-  u"swazi": True,
-  u"syllabique": True,
-  u"syllogistique": True,
-  u"symbolique": True,
-  u"sympathomimétique": True,
-  u"symphonique": True,
-  u"symptomatique": True,
-  u"synaptique": True,
-  u"syncrétiste": True,
-  u"synergiste": True,
-  u"synoptique": True,
-  u"synovial": True,
-  u"syntactique": True,
-  u"syntagmatique": True,
-  u"syntaxique": True,
-  u"syphilitique": True,
-  u"syrien": True,
-  u"systolique": True,
-  u"sécréteur": True,
-  u"sécrétoire": True,
-  u"séculaire": True,
-  u"sédimentaire": True,
-  u"séditieux": True,
-  u"sémantique": True,
-  u"séminal": True,
-  u"séminifère": True,
-  u"sémiotique": True,
-  u"sénatorial": True,
-  u"sénégalais": True,
-  u"sépaloïde": True,
-  u"séraphique": True,
-  u"séreux": True,
-  u"séricicole": True,
-  u"sérique": True,
-  u"sérologique": True,
-  u"tabulaire": True,
-  u"tactile": True,
-  u"tactique": True,
-  u"tahitien": True,
-  u"taiwanais": True,
-  u"tamil": True,
-  u"tamoul": True,
-  u"tangentiel": True,
-  u"tannique": True,
-  u"tantrique": True,
-  u"tanzanien": True,
-  u"taoïste": True,
-  u"tape-à-l'œil": True,
-  u"tarsien": True,
-  u"tartrique": True,
-  u"tasmanien": True,
-  u"taurine": True,
-  u"taxinomique": True,
-  u"taxonomique": True,
-  u"taïwanais": True,
-  u"tchèque": True,
-  u"tchécoslovaque": True,
-  u"tchétchène": True,
-  u"technologique": True,
-  u"technophobe": True,
-  u"tectonique": True,
-  u"tellurique": True,
-  u"temporal": True,
-  u"temporel": True,
-  u"tenable": True,
-  u"tendineux": True,
-  u"tentaculaire": True,
-  u"terminal": True,
-  u"terminologique": True,
-  u"territorial": True,
-  u"testacé": True,
-  u"testamentaire": True,
-  u"testiculaire": True,
-  u"testimonial": True,
-  u"teuton": True,
-  u"teutonique": True,
-  u"texan": True,
-  u"textile": True,
-  u"textuel": True,
-  u"thermal": True,
-  u"thermique": True,
-  u"thermodynamique": True,
-  u"thermoionique": True,
-  u"thermométrique": True,
-  u"thermostatique": True,
-  u"thermoélectrique": True,
-  u"thermoïonique": True,
-  u"thoracique": True,
-  u"thébain": True,
-  u"théiste": True,
-  u"thématique": True,
-  u"théocratique": True,
-  u"théologique": True,
-  u"théosophique": True,
-  u"thérapeutique": True,
-  u"tibial": True,
-  u"tibétain": True,
-  u"timorais": True,
-  u"titulaire": True,
-  u"tombal": True,
-  u"tomenteux": True,
-  u"tonal": True,
-  u"tonique": True,
-  u"topographique": True,
-  u"topologique": True,
-  u"toroïdal": True,
-  u"torrentiel": True,
-  u"toscan": True,
-  u"totalitaire": True,
-  u"totipotent": True,
-  u"totémique": True,
-  u"tourbeux": True,
-  u"toxicologique": True,
-  u"trachéal": True,
-  u"trachéen": True,
-  u"tractif": True,
-  u"tragi-comique": True,
-  u"tragicomique": True,
-  u"tragique": True,
-  u"transactinide": True,
-  u"transatlantique": True,
-  u"transcendant": True,
-  u"transcendantal": True,
-  u"transculturel": True,
-  u"transdermique": True,
-  u"transdisciplinaire": True,
-  u"transitionnel": True,
-  u"transitoire": True,
-  u"transocéanien": True,
-  u"transocéanique": True,
-  u"transpolaire": True,
-  u"transuranien": True,
-  u"traumatique": True,
-  u"tremblé": True,
-  u"trianguler": True,
-  u"triasique": True,
-  u"tribal": True,
-  u"tricentenaire": True,
-  u"trigonométrique": True,
-  u"trimestriel": True,
-  u"trimestriellement": True,
-  u"trinidadien": True,
-  u"trinidien": True,
-  u"triomphal": True,
-  u"trivalent": True,
-  u"trochaïque": True,
-  u"trophique": True,
-  u"tropical": True,
-  u"troyen": True,
-  u"tsariste": True,
-  u"tsigane": True,
-  u"tubaire": True,
-  u"tuberculeux": True,
-  u"tubéreux": True,
-  u"tubérisé": True,
-  u"tunisien": True,
-  u"turbiné": True,
-  u"turc": True,
-  u"turkmène": True,
-  u"tutoriel": True,
-  u"tympanique": True,
-  u"typographique": True,
-  u"tyrolien": True,
-  u"tégumentaire": True,
-  u"téléologique": True,
-  u"téléphonique": True,
-  u"tératogène": True,
-  u"tétanique": True,
-  u"tétraphonique": True,
-  u"tétravalent": True,
-  u"ukrainien": True,
-  u"ulcératif": True,
-  u"ulnaire": True,
-  u"ultramicroscopique": True,
-  u"ultramontain": True,
-  u"unguéal": True,
-  u"uniate": True,
-  u"unicellulaire": True,
-  u"unifilaire": True,
-  u"uniovulé": True,
-  u"unitaire": True,
-  u"unitarien": True,
-  u"universaliste": True,
-  u"urbain": True,
-  u"urcéiforme": True,
-  u"urcéolé": True,
-  u"urinaire": True,
-  u"urique": True,
-  u"urogénital": True,
-  u"uruguayen": True,
-  u"urémique": True,
-  u"urétral": True,
-  u"usufructuaire": True,
-  u"usufruitier": True,
-  u"utopique": True,
-  u"utérin": True,
-  u"uvulaire": True,
-  u"vacuolaire": True,
-  u"vagal": True,
-  u"vaginal": True,
-  u"valvaire": True,
-  u"valvulaire": True,
-  u"valétudinaire": True,
-  u"vanillé": True,
-  u"varioleux": True,
-  u"variolique": True,
-  u"vasculaire": True,
-  u"vascularisé": True,
-  u"vaso-moteur": True,
-  u"vasomoteur": True,
-  u"veineux": True,
-  u"ventriculaire": True,
-  u"verbal": True,
-  u"vertical": True,
-  u"vertébral": True,
-  u"vestibulaire": True,
-  u"vestimentaire": True,
-  u"viable": True,
-  u"vicennal": True,
-  u"victorien": True,
-  u"vicésimal": True,
-  u"viennois": True,
-  u"vietnamien": True,
-  u"vineux": True,
-  u"viral": True,
-  u"virginal": True,
-  u"virocide": True,
-  u"virologique": True,
-  u"viscéral": True,
-  u"visqueux": True,
-  u"visuel": True,
-  u"vitreux": True,
-  u"vocal": True,
-  u"vocalique": True,
-  u"vocatif": True,
-  u"volcanique": True,
-  u"voltaïque": True,
-  u"volumétrique": True,
-  u"vorace": True,
-  u"voyeur": True,
-  u"vulvaire": True,
-  u"védique": True,
-  u"végétatif": True,
-  u"vélaire": True,
-  u"vénitien": True,
-  u"vénérien": True,
-  u"vénézuélien": True,
-  u"vésical": True,
-  u"vésiculaire": True,
-  u"vétérinaire": True,
-  u"wagnérien": True,
-  u"wesleyen": True,
-  u"wysiwyg": True,
-  u"xérographique": True,
-  u"yogique": True,
-  u"yougoslave": True,
-  u"yéménite": True,
-  u"zambien": True,
-  u"zapotèque": True,
-  u"zaïrois": True,
-  u"zimbabwéen": True,
-  u"zodiacal": True,
-  u"zonal": True,
-  u"zoologique": True,
-  u"zoroastrien": True,
-  u"zygomatique": True,
-  u"zymotique": True,
-  u"zénithal": True,
-  u"égyptien": True,
-  u"épiscopalien": True,
-  u"économique": True,
-  u"économétrique": True,
-  u"écossais": True,
-  u"éditorial": True,
-  u"édouardien": True,
-  u"édénique": True,
-  u"égyptien": True,
-  u"égéen": True,
-  u"électoral": True,
-  u"électrique": True,
-  u"électrocardiographique": True,
-  u"électrochimique": True,
-  u"électrolytique": True,
-  u"électromagnétique": True,
-  u"électromoteur": True,
-  u"électromécanique": True,
-  u"électronique": True,
-  u"électrostatique": True,
-  u"élisabéthain": True,
-  u"élégiaque": True,
-  u"éolithique": True,
-  u"éosinophile": True,
-  u"épicurien": True,
-  u"épidermique": True,
-  u"épidural": True,
-  u"épidémiologique": True,
-  u"épigastrique": True,
-  u"épileptique": True,
-  u"épiphyte": True,
-  u"épiscopal": True,
-  u"épiscopalien": True,
-  u"épistémique": True,
-  u"épistémologique": True,
-  u"épithélial": True,
-  u"éponyme": True,
-  u"équatorial": True,
-  u"équatorien": True,
-  u"érasmien": True,
-  u"éruptif": True,
-  u"érythréen": True,
-  u"éthiopien": True,
-  u"étiologique": True,
-  u"étymologique": True,
-  u"évangélique": True,
-  u"évangélisateur": True,
-  u"évaporatoire": True,
-  u"évocateur": True,
-  u"évolutif": True,
-  u"évolutionnaire": True,
-  u"évolutionnel": True,
-  u"évolutionniste": True,
-  u"œsophagien": True
-}
+from adjr_tables import ADJR_DIRECTORY
+from adjr_tables import LazyADJRTable
+from adjr_tables import adjr_stem_ending_counts
+from adjr_tables import load_adjr_file
+from os import path
 
 ################################################################################
-french_stemmed_adjr = {}
-french_adjr_stem_ending_counts = {}
+# French relational adjectives (from WoNeF)
+#
+# The tables are loaded from the precomputed data file on first use.
+
+FRENCH_ADJR_FILEPATH = path.join(ADJR_DIRECTORY, "wonef_adjr")
+
+french_stemmer = None
+french_adjr_tables = None
+
+def french_adjr_stem(adjr):
+  """
+  Gives the stem and the stem ending of a french relational adjective (without
+  accents on the 'e's).
+
+  @param    adjr: The relational adjective.
+  @type     adjr: C{string}
+
+  @return:  The stem and the stem ending of the adjective.
+  @rtype:   C{tuple(string, string)}
+  """
+
+  global french_stemmer
+
+  if french_stemmer == None:
+    from nltk.stem import snowball
+
+    french_stemmer = snowball.FrenchStemmer()
 
-stemmer = snowball.FrenchStemmer()
-for adjr, value in french_adjr.items():
-  stem = stemmer.stem(adjr).replace(u"é", "e").replace(u"è", "e")
+  stem = french_stemmer.stem(adjr).replace(u"é", "e").replace(u"è", "e")
   stem_ending = ""
   if adjr.replace(u"é", "e").replace(u"è", "e").startswith(stem):
     stem_ending = adjr.replace(u"é", "e").replace(u"è", "e").split(stem, 1)[1]
-  #-----------------------------------------------------------------------------
-  french_stemmed_adjr[adjr] = value
-  if stem_ending != "":
-    if stem_ending not in french_adjr_stem_ending_counts:
-      french_adjr_stem_ending_counts[stem_ending] = 0.0
-    french_adjr_stem_ending_counts[stem_ending] += 1.0
 
+  return stem, stem_ending
+
+def load_french_adjr_tables():
+  """
+  Loads the french relational adjective tables, if they are not loaded yet.
+
+  @return:  The relational adjectives, the relational adjectives (indexed by
+            adjective, not by stem) and the stem ending counts.
+  @rtype:   C{tuple(dict(string, bool), dict(string, bool), dict(string,
+            float))}
+  """
+
+  global french_adjr_tables
+
+  if french_adjr_tables == None:
+    adjrs = load_adjr_file(FRENCH_ADJR_FILEPATH, french_adjr_stem)
+    adjr_dic = {}
+
+    for adjr, stem, stem_ending in adjrs:
+      adjr_dic[adjr] = True
+
+    french_adjr_tables = (adjr_dic,
+                          dict(adjr_dic),
+                          adjr_stem_ending_counts(adjrs))
+
+  return french_adjr_tables
+
+# the tables, as dictionaries loaded on first access
+french_adjr = LazyADJRTable(load_french_adjr_tables, 0)
+french_stemmed_adjr = LazyADJRTable(load_french_adjr_tables, 1)
+french_adjr_stem_ending_counts = LazyADJRTable(load_french_adjr_tables, 2)
@@ -1,3407 +1,75 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
-from nltk import stem
-
-english_adjr = {
-  u"abasic": True,
-  u"abbatial": True,
-  u"abdominal": True,
-  u"abdominovesical": True,
-  u"aberdonian": True,
-  u"abient": True,
-  u"abiogenetic": True,
-  u"abkhaz": True,
-  u"ablative": True,
-  u"abnaki": True,
-  u"abolitionary": True,
-  u"abomasal": True,
-  u"aboriginal": True,
-  u"absolutist": True,
-  u"abyssal": True,
-  u"academic": True,
-  u"acanthotic": True,
-  u"acapnic": True,
-  u"accentual": True,
-  u"accessional": True,
-  u"accipitrine": True,
-  u"accommodational": True,
-  u"acculturational": True,
-  u"accusatorial": True,
-  u"acentric": True,
-  u"acervate": True,
-  u"acetic": True,
-  u"acetonic": True,
-  u"acetylenic": True,
-  u"acetylic": True,
-  u"achaean": True,
-  u"achenial": True,
-  u"achlorhydric": True,
-  u"achondritic": True,
-  u"achondroplastic": True,
-  u"achromatinic": True,
-  u"aciculate": True,
-  u"acidimetric": True,
-  u"acidotic": True,
-  u"acinar": True,
-  u"acneiform": True,
-  u"acoustic": True,
-  u"acrocentric": True,
-  u"acrogenic": True,
-  u"acronymic": True,
-  u"actinic": True,
-  u"actinometric": True,
-  u"actinomycetal": True,
-  u"actinomycotic": True,
-  u"actuarial": True,
-  u"aculeate": True,
-  u"adactylous": True,
-  u"adamantine": True,
-  u"adenocarcinomatous": True,
-  u"adenoidal": True,
-  u"adenoid": True,
-  u"adient": True,
-  u"adjectival": True,
-  u"adjudicative": True,
-  u"administrative": True,
-  u"adnexal": True,
-  u"adolescent": True,
-  u"adonic": True,
-  u"adrenal": True,
-  u"adrenergic": True,
-  u"adrenocortical": True,
-  u"advective": True,
-  u"adventitial": True,
-  u"adventuristic": True,
-  u"adverbial": True,
-  u"aecial": True,
-  u"aegean": True,
-  u"aeolian": True,
-  u"aeriferous": True,
-  u"aerodynamic": True,
-  u"aerolitic": True,
-  u"aerological": True,
-  u"aeromechanic": True,
-  u"aeromedical": True,
-  u"aeronautical": True,
-  u"aerophilatelic": True,
-  u"aeschylean": True,
-  u"aesculapian": True,
-  u"aesthetic": True,
-  u"afebrile": True,
-  u"affine": True,
-  u"affixal": True,
-  u"afghani": True,
-  u"african": True,
-  u"afrikaans": True,
-  u"afro-asian": True,
-  u"agential": True,
-  u"agnostic": True,
-  u"agonadal": True,
-  u"agonal": True,
-  u"agonistic": True,
-  u"agranulocytic": True,
-  u"agraphic": True,
-  u"agricultural": True,
-  u"agrobiologic": True,
-  u"agrologic": True,
-  u"agronomic": True,
-  u"agrypnotic": True,
-  u"air-breathing": True,
-  u"alabaster": True,
-  u"alaskan": True,
-  u"albanian": True,
-  u"albigensian": True,
-  u"albinal": True,
-  u"albitic": True,
-  u"albuminous": True,
-  u"albuminuric": True,
-  u"alchemic": True,
-  u"alchemistic": True,
-  u"aldehydic": True,
-  u"aldermanic": True,
-  u"aleuronic": True,
-  u"aleutian": True,
-  u"alexandrian": True,
-  u"alexic": True,
-  u"algal": True,
-  u"algebraic": True,
-  u"algerian": True,
-  u"algoid": True,
-  u"algolagnic": True,
-  u"algometric": True,
-  u"algonquian": True,
-  u"alimentative": True,
-  u"alkahestic": True,
-  u"alkaloidal": True,
-  u"alkalotic": True,
-  u"alkylic": True,
-  u"allantoic": True,
-  u"allelic": True,
-  u"allergenic": True,
-  u"allergic": True,
-  u"alliaceous": True,
-  u"allied": True,
-  u"allogamous": True,
-  u"allographic": True,
-  u"allomerous": True,
-  u"allometric": True,
-  u"allomorphic": True,
-  u"allopathic": True,
-  u"allophonic": True,
-  u"allotropic": True,
-  u"alluvial": True,
-  u"allylic": True,
-  u"alopecic": True,
-  u"alphabetic": True,
-  u"alphanumeric": True,
-  u"alpine": True,
-  u"alsatian": True,
-  u"altaic": True,
-  u"altitudinal": True,
-  u"alular": True,
-  u"aluminous": True,
-  u"alveolar": True,
-  u"alvine": True,
-  u"amalgamative": True,
-  u"amaranthine": True,
-  u"amaurotic": True,
-  u"ambassadorial": True,
-  u"amblyopic": True,
-  u"ambrosian": True,
-  u"ambulacral": True,
-  u"ambulatory": True,
-  u"ameboid": True,
-  u"amenorrheic": True,
-  u"american": True,
-  u"amethystine": True,
-  u"amharic": True,
-  u"amino": True,
-  u"amitotic": True,
-  u"ammino": True,
-  u"ammoniac": True,
-  u"ammoniated": True,
-  u"ammonitic": True,
-  u"amnestic": True,
-  u"amniotic": True,
-  u"amoebic": True,
-  u"amoristic": True,
-  u"amphibious": True,
-  u"amphitheatric": True,
-  u"amphoric": True,
-  u"ampullar": True,
-  u"amygdaline": True,
-  u"amylolytic": True,
-  u"anabiotic": True,
-  u"anabolic": True,
-  u"anaclitic": True,
-  u"anacoluthic": True,
-  u"anaesthetic": True,
-  u"anaglyphic": True,
-  u"anagogic": True,
-  u"anagrammatic": True,
-  u"analphabetic": True,
-  u"anal": True,
-  u"analytic": True,
-  u"anamnestic": True,
-  u"anamorphic": True,
-  u"anapestic": True,
-  u"anaphasic": True,
-  u"anaphoric": True,
-  u"anaphylactic": True,
-  u"anaplastic": True,
-  u"anarchistic": True,
-  u"anasarcous": True,
-  u"anastigmatic": True,
-  u"anastomotic": True,
-  u"anatomic": True,
-  u"ancestral": True,
-  u"andalusian": True,
-  u"andean": True,
-  u"andorran": True,
-  u"androgenetic": True,
-  u"androgenic": True,
-  u"androgynous": True,
-  u"anecdotal": True,
-  u"anemic": True,
-  u"anemographic": True,
-  u"anemometric": True,
-  u"anencephalic": True,
-  u"aneroid": True,
-  u"anestrous": True,
-  u"aneuploid": True,
-  u"aneurysmal": True,
-  u"angelic": True,
-  u"anginal": True,
-  u"angiocarpic": True,
-  u"angiomatous": True,
-  u"angiospermous": True,
-  u"anglican": True,
-  u"anglo-catholic": True,
-  u"anglo-indian": True,
-  u"anglo-jewish": True,
-  u"anglophilic": True,
-  u"anglophobic": True,
-  u"anglo-saxon": True,
-  u"angolan": True,
-  u"anguillan": True,
-  u"anguine": True,
-  u"angular": True,
-  u"anicteric": True,
-  u"animalistic": True,
-  u"animatistic": True,
-  u"animist": True,
-  u"anionic": True,
-  u"aniseikonic": True,
-  u"anisogametic": True,
-  u"anisogamic": True,
-  u"anisometropic": True,
-  u"ankylotic": True,
-  u"annalistic": True,
-  u"annelid": True,
-  u"annexational": True,
-  u"annunciatory": True,
-  u"anodic": True,
-  u"anoperineal": True,
-  u"anopheline": True,
-  u"anorectal": True,
-  u"anorthitic": True,
-  u"anosmic": True,
-  u"anoxemic": True,
-  u"anoxic": True,
-  u"anserine": True,
-  u"antecubital": True,
-  u"antediluvian": True,
-  u"antennal": True,
-  u"antheridial": True,
-  u"anthracitic": True,
-  u"anthropic": True,
-  u"anthropocentric": True,
-  u"anthropogenetic": True,
-  u"anthropological": True,
-  u"anthropometric": True,
-  u"anthropophagous": True,
-  u"antiadrenergic": True,
-  u"anti-american": True,
-  u"antiapartheid": True,
-  u"antibacterial": True,
-  u"antibiotic": True,
-  u"anticancer": True,
-  u"anticlimactic": True,
-  u"anticoagulative": True,
-  u"anticyclonic": True,
-  u"antidotal": True,
-  u"antiferromagnetic": True,
-  u"antigenic": True,
-  u"antiguan": True,
-  u"antimonic": True,
-  u"antinomian": True,
-  u"antipodal": True,
-  u"antipollution": True,
-  u"antiquarian": True,
-  u"antisatellite": True,
-  u"anti-semitic": True,
-  u"antistrophic": True,
-  u"antithyroid": True,
-  u"antitypic": True,
-  u"antiviral": True,
-  u"anuran": True,
-  u"anuretic": True,
-  u"anxiolytic": True,
-  u"aoristic": True,
-  u"aortal": True,
-  u"aphaeretic": True,
-  u"aphakic": True,
-  u"aphanitic": True,
-  u"aphasic": True,
-  u"aphetic": True,
-  u"apian": True,
-  u"apiarian": True,
-  u"apicultural": True,
-  u"aplitic": True,
-  u"apneic": True,
-  u"apocalyptic": True,
-  u"apocryphal": True,
-  u"apocynaceous": True,
-  u"apogamic": True,
-  u"apogean": True,
-  u"apomictic": True,
-  u"aponeurotic": True,
-  u"apopemptic": True,
-  u"apophatic": True,
-  u"apophyseal": True,
-  u"apoplectic": True,
-  u"apoplectiform": True,
-  u"aposiopetic": True,
-  u"apostolic": True,
-  u"apostrophic": True,
-  u"apothecial": True,
-  u"apothegmatic": True,
-  u"appalachian": True,
-  u"appellate": True,
-  u"appellative": True,
-  u"appendicular": True,
-  u"appetitive": True,
-  u"appointive": True,
-  u"appositional": True,
-  u"appropriative": True,
-  u"apsidal": True,
-  u"aptitudinal": True,
-  u"aquatic": True,
-  u"aqueous": True,
-  u"aquicultural": True,
-  u"aquiferous": True,
-  u"arabian": True,
-  u"arabic": True,
-  u"arachnoid": True,
-  u"aramaic": True,
-  u"aramean": True,
-  u"araneidal": True,
-  u"arawakan": True,
-  u"arbitral": True,
-  u"arbitrative": True,
-  u"arborical": True,
-  u"archaeological": True,
-  u"archaistic": True,
-  u"archangelic": True,
-  u"archdiocesan": True,
-  u"archducal": True,
-  u"arched": True,
-  u"archegonial": True,
-  u"archesporial": True,
-  u"archidiaconal": True,
-  u"archiepiscopal": True,
-  u"archipelagic": True,
-  u"architectural": True,
-  u"archival": True,
-  u"archosaurian": True,
-  u"areal": True,
-  u"arenicolous": True,
-  u"areolar": True,
-  u"argentic": True,
-  u"argentine": True,
-  u"argentous": True,
-  u"argive": True,
-  u"aristotelian": True,
-  u"arithmetical": True,
-  u"armenian": True,
-  u"armillary": True,
-  u"arminian": True,
-  u"armorial": True,
-  u"aroid": True,
-  u"aromatic": True,
-  u"arsenical": True,
-  u"arsenious": True,
-  u"arterial": True,
-  u"arteriolar": True,
-  u"arteriosclerotic": True,
-  u"arteriovenous": True,
-  u"arthralgic": True,
-  u"arthromeric": True,
-  u"arthropodal": True,
-  u"arthrosporic": True,
-  u"arthurian": True,
-  u"articular": True,
-  u"articulatory": True,
-  u"artifactual": True,
-  u"artiodactyl": True,
-  u"artistic": True,
-  u"arundinaceous": True,
-  u"ascensional": True,
-  u"ascetic": True,
-  u"ascitic": True,
-  u"asclepiadaceous": True,
-  u"ascocarpous": True,
-  u"ascomycetous": True,
-  u"ascosporic": True,
-  u"asian": True,
-  u"aspectual": True,
-  u"asphyxiated": True,
-  u"assamese": True,
-  u"associational": True,
-  u"asteriated": True,
-  u"asterismal": True,
-  u"asteroidal": True,
-  u"astomatal": True,
-  u"astragalar": True,
-  u"astrocytic": True,
-  u"astrological": True,
-  u"astronautic": True,
-  u"astronomic": True,
-  u"astrophysical": True,
-  u"asymptotic": True,
-  u"asynergic": True,
-  u"ataxic": True,
-  u"ateleiotic": True,
-  u"atheist": True,
-  u"athenian": True,
-  u"atheromatous": True,
-  u"atherosclerotic": True,
-  u"athletic": True,
-  u"atlantic": True,
-  u"atmospheric": True,
-  u"atomic": True,
-  u"atonalistic": True,
-  u"atonic": True,
-  u"atrial": True,
-  u"atrioventricular": True,
-  u"atrophic": True,
-  u"attentional": True,
-  u"attic": True,
-  u"attitudinal": True,
-  u"attritional": True,
-  u"audenesque": True,
-  u"audiometric": True,
-  u"audiovisual": True,
-  u"auditory": True,
-  u"augitic": True,
-  u"augustan": True,
-  u"aural": True,
-  u"auricular": True,
-  u"auroral": True,
-  u"aurous": True,
-  u"auscultatory": True,
-  u"austenitic": True,
-  u"australasian": True,
-  u"australian": True,
-  u"australopithecine": True,
-  u"austrian": True,
-  u"austronesian": True,
-  u"autacoidal": True,
-  u"autarchic": True,
-  u"authorial": True,
-  u"autobiographical": True,
-  u"autocatalytic": True,
-  u"autodidactic": True,
-  u"autogenetic": True,
-  u"autographic": True,
-  u"autoimmune": True,
-  u"autolytic": True,
-  u"automotive": True,
-  u"autoplastic": True,
-  u"autoradiographic": True,
-  u"autosomal": True,
-  u"autotelic": True,
-  u"autotomic": True,
-  u"autotrophic": True,
-  u"autotypic": True,
-  u"auxetic": True,
-  u"auxinic": True,
-  u"avellan": True,
-  u"aversive": True,
-  u"avestan": True,
-  u"avian": True,
-  u"avifaunal": True,
-  u"avionic": True,
-  u"avitaminotic": True,
-  u"avocational": True,
-  u"avuncular": True,
-  u"award-winning": True,
-  u"axial": True,
-  u"axile": True,
-  u"axillary": True,
-  u"axiological": True,
-  u"axiomatic": True,
-  u"axonal": True,
-  u"azerbaijani": True,
-  u"azido": True,
-  u"azimuthal": True,
-  u"azotemic": True,
-  u"azotic": True,
-  u"azo": True,
-  u"baboonish": True,
-  u"babylonian": True,
-  u"baccate": True,
-  u"bacchantic": True,
-  u"bacillar": True,
-  u"back-channel": True,
-  u"bacteremic": True,
-  u"bacterial": True,
-  u"bacteriological": True,
-  u"bacteriolytic": True,
-  u"bacteriophagic": True,
-  u"bacteriostatic": True,
-  u"bacteroidal": True,
-  u"bahai": True,
-  u"bahamian": True,
-  u"bahraini": True,
-  u"balletic": True,
-  u"ballistic": True,
-  u"balsamic": True,
-  u"baltic": True,
-  u"balzacian": True,
-  u"bangladeshi": True,
-  u"bantoid": True,
-  u"bantu-speaking": True,
-  u"bantu": True,
-  u"baptismal": True,
-  u"baptistic": True,
-  u"barbadian": True,
-  u"bardic": True,
-  u"baric": True,
-  u"barographic": True,
-  u"barometric": True,
-  u"baroque": True,
-  u"barytic": True,
-  u"basaltic": True,
-  u"basidial": True,
-  u"basidiomycetous": True,
-  u"basidiosporous": True,
-  u"basilar": True,
-  u"basilican": True,
-  u"basinal": True,
-  u"basophilic": True,
-  u"batholithic": True,
-  u"bathyal": True,
-  u"bathymetric": True,
-  u"bauxitic": True,
-  u"bavarian": True,
-  u"bayesian": True,
-  u"beethovenian": True,
-  u"behavioral": True,
-  u"behavioristic": True,
-  u"belarusian": True,
-  u"belemnitic": True,
-  u"belgian": True,
-  u"benedictine": True,
-  u"benedictory": True,
-  u"beneficiary": True,
-  u"benevolent": True,
-  u"bengali": True,
-  u"beninese": True,
-  u"benthic": True,
-  u"bentonitic": True,
-  u"benzenoid": True,
-  u"benzoic": True,
-  u"benzylic": True,
-  u"bermudan": True,
-  u"betulaceous": True,
-  u"bhutanese": True,
-  u"biauricular": True,
-  u"biaxial": True,
-  u"biblical": True,
-  u"bibliographic": True,
-  u"bibliolatrous": True,
-  u"bibliomaniacal": True,
-  u"bibliophilic": True,
-  u"bibliopolic": True,
-  u"bibliothecal": True,
-  u"bibliotic": True,
-  u"bicapsular": True,
-  u"bicentennial": True,
-  u"bichromated": True,
-  u"bicipital": True,
-  u"bicylindrical": True,
-  u"biedermeier": True,
-  u"bifilar": True,
-  u"biflagellate": True,
-  u"bignoniaceous": True,
-  u"bilabial": True,
-  u"biliary": True,
-  u"bilious": True,
-  u"billiard": True,
-  u"bimetallistic": True,
-  u"bimillenial": True,
-  u"bimolecular": True,
-  u"bimorphemic": True,
-  u"binary": True,
-  u"binocular": True,
-  u"biocatalytic": True,
-  u"biochemical": True,
-  u"bioclimatic": True,
-  u"biogenetic": True,
-  u"biogenic": True,
-  u"biogenous": True,
-  u"biogeographic": True,
-  u"biographic": True,
-  u"biological": True,
-  u"biologistic": True,
-  u"biomedical": True,
-  u"bionic": True,
-  u"biosynthetic": True,
-  u"biosystematic": True,
-  u"biotic": True,
-  u"biotitic": True,
-  u"biotypic": True,
-  u"bipolar": True,
-  u"biquadratic": True,
-  u"birefringent": True,
-  u"bisectional": True,
-  u"bismarckian": True,
-  u"bismuthal": True,
-  u"bismuthic": True,
-  u"bisontine": True,
-  u"bistered": True,
-  u"bistroic": True,
-  u"bituminoid": True,
-  u"bituminous": True,
-  u"bivalent": True,
-  u"bivariate": True,
-  u"bizonal": True,
-  u"black-and-white": True,
-  u"bladdery": True,
-  u"bladed": True,
-  u"blastemal": True,
-  u"blastocoelic": True,
-  u"blastodermatic": True,
-  u"blastogenetic": True,
-  u"blastomeric": True,
-  u"blastomycotic": True,
-  u"blastoporal": True,
-  u"blastospheric": True,
-  u"bodily": True,
-  u"boeotian": True,
-  u"bogartian": True,
-  u"bohemian": True,
-  u"bolivian": True,
-  u"bolographic": True,
-  u"bolometric": True,
-  u"bolshevik": True,
-  u"boolean": True,
-  u"borated": True,
-  u"boreal": True,
-  u"boric": True,
-  u"boronic": True,
-  u"boskopoid": True,
-  u"bosnian": True,
-  u"botanic": True,
-  u"botryoid": True,
-  u"botswanan": True,
-  u"bottom-dwelling": True,
-  u"bottom-feeding": True,
-  u"botulinal": True,
-  u"boustrophedonic": True,
-  u"bovine": True,
-  u"brachial": True,
-  u"brachiopod": True,
-  u"brachyurous": True,
-  u"bracteal": True,
-  u"bracteate": True,
-  u"bracteolate": True,
-  u"brahminic": True,
-  u"branchial": True,
-  u"branchiopod": True,
-  u"brassy": True,
-  u"brazen": True,
-  u"brazilian": True,
-  u"breech-loading": True,
-  u"bregmatic": True,
-  u"bridal": True,
-  u"brimless": True,
-  u"brisant": True,
-  u"britannic": True,
-  u"british": True,
-  u"briton": True,
-  u"broadband": True,
-  u"brobdingnagian": True,
-  u"bromic": True,
-  u"bromidic": True,
-  u"bronchial": True,
-  u"bronchiolar": True,
-  u"bronchoscopic": True,
-  u"bruneian": True,
-  u"bryophytic": True,
-  u"bubaline": True,
-  u"bubonic": True,
-  u"buccal": True,
-  u"bucolic": True,
-  u"buddhist": True,
-  u"budgetary": True,
-  u"bulbaceous": True,
-  u"bulbar": True,
-  u"bulbed": True,
-  u"bulgarian": True,
-  u"bulimic": True,
-  u"bungaloid": True,
-  u"bureaucratic": True,
-  u"burglarious": True,
-  u"burlesque": True,
-  u"burmese": True,
-  u"burrlike": True,
-  u"bursal": True,
-  u"burundi": True,
-  u"buteonine": True,
-  u"butyraceous": True,
-  u"butyric": True,
-  u"byzantine": True,
-  u"cachectic": True,
-  u"cacodemonic": True,
-  u"cacodylic": True,
-  u"cadastral": True,
-  u"cadaverous": True,
-  u"caducean": True,
-  u"caecilian": True,
-  u"caesarian": True,
-  u"caesural": True,
-  u"caffeinic": True,
-  u"cairned": True,
-  u"calcaneal": True,
-  u"calcareous": True,
-  u"calceolate": True,
-  u"calcic": True,
-  u"calciferous": True,
-  u"calcific": True,
-  u"calcitic": True,
-  u"calculous": True,
-  u"calcuttan": True,
-  u"calendric": True,
-  u"calico": True,
-  u"californian": True,
-  u"calisthenic": True,
-  u"calligraphic": True,
-  u"callithumpian": True,
-  u"caloric": True,
-  u"calorimetric": True,
-  u"calvinist": True,
-  u"calyceal": True,
-  u"calycular": True,
-  u"calyculate": True,
-  u"calyptrate": True,
-  u"cambial": True,
-  u"cambodian": True,
-  u"cameroonian": True,
-  u"campanulate": True,
-  u"camphoraceous": True,
-  u"camphoric": True,
-  u"canadian": True,
-  u"canalicular": True,
-  u"cancroid": True,
-  u"canicular": True,
-  u"canine": True,
-  u"cannibalistic": True,
-  u"canonic": True,
-  u"canonist": True,
-  u"cantonal": True,
-  u"capacitive": True,
-  u"capetian": True,
-  u"capillary": True,
-  u"capitalist": True,
-  u"capitular": True,
-  u"cappadocian": True,
-  u"caprine": True,
-  u"capsular": True,
-  u"carangid": True,
-  u"carbocyclic": True,
-  u"carbolated": True,
-  u"carbonaceous": True,
-  u"carboniferous": True,
-  u"carbonyl": True,
-  u"carboxyl": True,
-  u"carcinogenic": True,
-  u"carcinomatous": True,
-  u"cardiac": True,
-  u"cardiographic": True,
-  u"cardiologic": True,
-  u"cardiopulmonary": True,
-  u"cardiovascular": True,
-  u"carinal": True,
-  u"carmelite": True,
-  u"carnal": True,
-  u"carnivorous": True,
-  u"caroline": True,
-  u"carolingian": True,
-  u"carotid": True,
-  u"carpal": True,
-  u"carpellary": True,
-  u"carpetbag": True,
-  u"carposporic": True,
-  u"carposporous": True,
-  u"carroty": True,
-  u"cartesian": True,
-  u"carthaginian": True,
-  u"carthusian": True,
-  u"cartilaginous": True,
-  u"cartographic": True,
-  u"caruncular": True,
-  u"carunculate": True,
-  u"caryophyllaceous": True,
-  u"cash-and-carry": True,
-  u"casuistic": True,
-  u"catabolic": True,
-  u"catachrestic": True,
-  u"catalan": True,
-  u"catalatic": True,
-  u"cataleptic": True,
-  u"catalytic": True,
-  u"cataphatic": True,
-  u"cataplastic": True,
-  u"catapultic": True,
-  u"catarrhal": True,
-  u"catatonic": True,
-  u"catechetical": True,
-  u"catechismal": True,
-  u"catechistic": True,
-  u"categorial": True,
-  u"categorical": True,
-  u"cathectic": True,
-  u"cathedral": True,
-  u"cathodic": True,
-  u"catholic": True,
-  u"cationic": True,
-  u"catkinate": True,
-  u"catoptric": True,
-  u"caucasian": True,
-  u"caudal": True,
-  u"cecal": True,
-  u"celebratory": True,
-  u"celestial": True,
-  u"celiac": True,
-  u"cellular": True,
-  u"cellulosid": True,
-  u"celtic": True,
-  u"cementitious": True,
-  u"cenobitic": True,
-  u"cenogenetic": True,
-  u"cenozoic": True,
-  u"censorial": True,
-  u"centennial": True,
-  u"centesimal": True,
-  u"centigrade": True,
-  u"central_american": True,
-  u"centralist": True,
-  u"centroidal": True,
-  u"centromeric": True,
-  u"centrosomic": True,
-  u"cephalic": True,
-  u"cephalopod": True,
-  u"ceramic": True,
-  u"cercarial": True,
-  u"cereal": True,
-  u"cerebellar": True,
-  u"cerebral": True,
-  u"cerebrospinal": True,
-  u"cerebrovascular": True,
-  u"ceric": True,
-  u"cerous": True,
-  u"ceruminous": True,
-  u"cervical": True,
-  u"cervine": True,
-  u"cesarean": True,
-  u"cetacean": True,
-  u"chadian": True,
-  u"chaetal": True,
-  u"chaetognathan": True,
-  u"chaffy": True,
-  u"chaldean": True,
-  u"chalybeate": True,
-  u"chancroidal": True,
-  u"chancrous": True,
-  u"chaotic": True,
-  u"charitable": True,
-  u"chartaceous": True,
-  u"chauvinistic": True,
-  u"chechen": True,
-  u"chelate": True,
-  u"cheliceral": True,
-  u"chelicerous": True,
-  u"cheliferous": True,
-  u"chelonian": True,
-  u"chemical": True,
-  u"chemiluminescent": True,
-  u"chemoreceptive": True,
-  u"chemotherapeutic": True,
-  u"cherty": True,
-  u"chian": True,
-  u"chiasmal": True,
-  u"childbearing": True,
-  u"chilean": True,
-  u"chimeric": True,
-  u"chinese": True,
-  u"chippendale": True,
-  u"chiromantic": True,
-  u"chirpy": True,
-  u"chitinous": True,
-  u"chlamydial": True,
-  u"chlorophyllose": True,
-  u"chlorotic": True,
-  u"choleraic": True,
-  u"choragic": True,
-  u"choral": True,
-  u"chordal": True,
-  u"chordate": True,
-  u"choreographic": True,
-  u"choric": True,
-  u"chorionic": True,
-  u"christian": True,
-  u"christological": True,
-  u"chromatic": True,
-  u"chromatinic": True,
-  u"chromatographic": True,
-  u"chromosomal": True,
-  u"chronological": True,
-  u"churchillian": True,
-  u"chylaceous": True,
-  u"chyliferous": True,
-  u"chylific": True,
-  u"ciliary": True,
-  u"cinematic": True,
-  u"cinerary": True,
-  u"circadian": True,
-  u"circulative": True,
-  u"circulatory": True,
-  u"citric": True,
-  u"citrous": True,
-  u"civic": True,
-  u"civil": True,
-  u"clamatorial": True,
-  u"classical": True,
-  u"classicistic": True,
-  u"classificatory": True,
-  u"clausal": True,
-  u"cleistogamous": True,
-  u"clerical": True,
-  u"client-server": True,
-  u"climatic": True,
-  u"clinical": True,
-  u"clitoral": True,
-  u"clonal": True,
-  u"clonic": True,
-  u"closed-circuit": True,
-  u"cloven-hoofed": True,
-  u"cloze": True,
-  u"coastal": True,
-  u"coccal": True,
-  u"coccygeal": True,
-  u"cochlear": True,
-  u"cockney": True,
-  u"coeliac": True,
-  u"cogitative": True,
-  u"cognitive": True,
-  u"coin-operated": True,
-  u"coital": True,
-  u"coleridgian": True,
-  u"collagenous": True,
-  u"collarless": True,
-  u"collegial": True,
-  u"collegiate": True,
-  u"colloidal": True,
-  u"colombian": True,
-  u"colonial": True,
-  u"colonic": True,
-  u"colorectal": True,
-  u"colorimetric": True,
-  u"columbian": True,
-  u"comatose": True,
-  u"cometary": True,
-  u"comic": True,
-  u"commemorative": True,
-  u"commensal": True,
-  u"commercial": True,
-  u"communal": True,
-  u"communicative": True,
-  u"communist": True,
-  u"comparative": True,
-  u"composite": True,
-  u"computational": True,
-  u"conceptualistic": True,
-  u"concessive": True,
-  u"concretistic": True,
-  u"condylar": True,
-  u"configurational": True,
-  u"confrontational": True,
-  u"confucian": True,
-  u"congeneric": True,
-  u"congestive": True,
-  u"congolese": True,
-  u"congregational": True,
-  u"congressional": True,
-  u"conic": True,
-  u"conjugal": True,
-  u"conjunctival": True,
-  u"consonantal": True,
-  u"conspecific": True,
-  u"conspiratorial": True,
-  u"constitutional": True,
-  u"consubstantial": True,
-  u"consular": True,
-  u"contextual": True,
-  u"continental": True,
-  u"contractual": True,
-  u"contrapuntal": True,
-  u"coptic": True,
-  u"copular": True,
-  u"cordless": True,
-  u"coreferential": True,
-  u"corinthian": True,
-  u"cormous": True,
-  u"corneal": True,
-  u"cornish": True,
-  u"coronary": True,
-  u"corporate": True,
-  u"corporatist": True,
-  u"corpuscular": True,
-  u"correlational": True,
-  u"corsican": True,
-  u"cortical": True,
-  u"cortico-hypothalamic": True,
-  u"corvine": True,
-  u"corymbose": True,
-  u"cosmic": True,
-  u"cosmologic": True,
-  u"costal": True,
-  u"costa_rican": True,
-  u"counterinsurgent": True,
-  u"counterrevolutionary": True,
-  u"counterterror": True,
-  u"covalent": True,
-  u"cranial": True,
-  u"craniometric": True,
-  u"creaseproof": True,
-  u"creedal": True,
-  u"creole": True,
-  u"cretaceous": True,
-  u"criminological": True,
-  u"crinoid": True,
-  u"critical": True,
-  u"croatian": True,
-  u"cromwellian": True,
-  u"cross-cultural": True,
-  u"cross-linguistic": True,
-  u"cross-modal": True,
-  u"cross-ply": True,
-  u"cross-pollinating": True,
-  u"cross-sectional": True,
-  u"cross-sentential": True,
-  u"croupy": True,
-  u"cruciferous": True,
-  u"crural": True,
-  u"crustaceous": True,
-  u"crustal": True,
-  u"crustose": True,
-  u"cryogenic": True,
-  u"cryonic": True,
-  u"cryptanalytic": True,
-  u"cryptobiotic": True,
-  u"cryptogamic": True,
-  u"ctenoid": True,
-  u"cuban": True,
-  u"cubist": True,
-  u"cubital": True,
-  u"cucurbitaceous": True,
-  u"culinary": True,
-  u"cultural": True,
-  u"cuneiform": True,
-  u"cupric": True,
-  u"curatorial": True,
-  u"curricular": True,
-  u"custard-like": True,
-  u"cutaneous": True,
-  u"cuticular": True,
-  u"cyanobacterial": True,
-  u"cybernetic": True,
-  u"cyclic": True,
-  u"cyclonic": True,
-  u"cyclopean": True,
-  u"cyclothymic": True,
-  u"cyprian": True,
-  u"cyprinid": True,
-  u"cyrillic": True,
-  u"cystic": True,
-  u"cytoarchitectural": True,
-  u"cytogenetic": True,
-  u"cytokinetic": True,
-  u"cytological": True,
-  u"cytolytic": True,
-  u"cytophotometric": True,
-  u"cytoplasmic": True,
-  u"cytoplastic": True,
-  u"cytotoxic": True,
-  u"czarist": True,
-  u"czech": True,
-  u"dacitic": True,
-  u"dactylic": True,
-  u"daisylike": True,
-  u"dalmatian": True,
-  u"damascene": True,
-  u"danish": True,
-  u"dantean": True,
-  u"darwinian": True,
-  u"deconstructionist": True,
-  u"deductive": True,
-  u"defervescent": True,
-  u"deformational": True,
-  u"deictic": True,
-  u"deist": True,
-  u"deliverable": True,
-  u"delphic": True,
-  u"demagogic": True,
-  u"democratic": True,
-  u"demographic": True,
-  u"demosthenic": True,
-  u"demotic": True,
-  u"dendritic": True,
-  u"denominational": True,
-  u"dental": True,
-  u"departmental": True,
-  u"dermal": True,
-  u"dermatologic": True,
-  u"despotic": True,
-  u"developmental": True,
-  u"deweyan": True,
-  u"diabetic": True,
-  u"diagnostic": True,
-  u"diagonalizable": True,
-  u"dialectal": True,
-  u"dialectic": True,
-  u"diamagnetic": True,
-  u"diamantine": True,
-  u"diametral": True,
-  u"diaphoretic": True,
-  u"diaphyseal": True,
-  u"diastolic": True,
-  u"diatomic": True,
-  u"diazo": True,
-  u"dicarboxylic": True,
-  u"dichromatic": True,
-  u"dickensian": True,
-  u"dictatorial": True,
-  u"dictyopteran": True,
-  u"dietary": True,
-  u"differentiable": True,
-  u"differential": True,
-  u"digestive": True,
-  u"digital": True,
-  u"diluvian": True,
-  u"dimensional": True,
-  u"dimorphic": True,
-  u"diocesan": True,
-  u"dionysian": True,
-  u"diplomatic": True,
-  u"dipolar": True,
-  u"dipterous": True,
-  u"dipylon": True,
-  u"directional": True,
-  u"disciplinary": True,
-  u"discomycetous": True,
-  u"distributional": True,
-  u"dithyrambic": True,
-  u"divisional": True,
-  u"dizygotic": True,
-  u"djiboutian": True,
-  u"doctoral": True,
-  u"doctrinal": True,
-  u"documentary": True,
-  u"dogmatic": True,
-  u"dolomitic": True,
-  u"domestic": True,
-  u"domiciliary": True,
-  u"dominical": True,
-  u"dominican": True,
-  u"donatist": True,
-  u"donnean": True,
-  u"dorian": True,
-  u"doric": True,
-  u"dostoevskian": True,
-  u"dot-com": True,
-  u"draconian": True,
-  u"dramatic": True,
-  u"dramaturgic": True,
-  u"drupaceous": True,
-  u"dualistic": True,
-  u"ducal": True,
-  u"ductless": True,
-  u"dumpy": True,
-  u"duodenal": True,
-  u"dural": True,
-  u"dutch": True,
-  u"dyadic": True,
-  u"dynamic": True,
-  u"dynastic": True,
-  u"dysgenic": True,
-  u"dyslexic": True,
-  u"dysplastic": True,
-  u"dystopian": True,
-  u"earthen": True,
-  u"earthy": True,
-  u"east_african": True,
-  u"east_german": True,
-  u"east_indian": True,
-  u"ebionite": True,
-  u"ebracteate": True,
-  u"ecclesiastical": True,
-  u"ecological": True,
-  u"econometric": True,
-  u"economic": True,
-  u"ectodermal": True,
-  u"ectopic": True,
-  u"ecuadorian": True,
-  u"editorial": True,
-  u"educational": True,
-  u"edwardian": True,
-  u"egyptian": True,
-  u"einsteinian": True,
-  u"electoral": True,
-  u"electrical": True,
-  u"electric": True,
-  u"electrocardiographic": True,
-  u"electrochemical": True,
-  u"electroencephalographic": True,
-  u"electrolytic": True,
-  u"electromagnetic": True,
-  u"electromechanical": True,
-  u"electromotive": True,
-  u"electronic": True,
-  u"electron_microscopic": True,
-  u"electrophoretic": True,
-  u"electrostatic": True,
-  u"elegiac": True,
-  u"elemental": True,
-  u"elementary": True,
-  u"elfin": True,
-  u"elizabethan": True,
-  u"elocutionary": True,
-  u"elysian": True,
-  u"embolic": True,
-  u"emotional": True,
-  u"emphysematous": True,
-  u"empiric": True,
-  u"empyrean": True,
-  u"emulous": True,
-  u"encysted": True,
-  u"endermic": True,
-  u"endocrine": True,
-  u"endodontic": True,
-  u"endogenous": True,
-  u"endometrial": True,
-  u"endoparasitic": True,
-  u"endoscopic": True,
-  u"endothelial": True,
-  u"english": True,
-  u"enolic": True,
-  u"enteric": True,
-  u"entomological": True,
-  u"entozoan": True,
-  u"entrepreneurial": True,
-  u"environmental": True,
-  u"enzymatic": True,
-  u"eolithic": True,
-  u"eonian": True,
-  u"eosinophilic": True,
-  u"eparchial": True,
-  u"epenthetic": True,
-  u"ephesian": True,
-  u"epicarpal": True,
-  u"epic": True,
-  u"epicurean": True,
-  u"epicyclic": True,
-  u"epidemiologic": True,
-  u"epidural": True,
-  u"epigastric": True,
-  u"epileptic": True,
-  u"epilithic": True,
-  u"epiphyseal": True,
-  u"epiphytic": True,
-  u"episcopal": True,
-  u"epistemic": True,
-  u"epithelial": True,
-  u"epitheliod": True,
-  u"epizoan": True,
-  u"eponymous": True,
-  u"equatorial": True,
-  u"equestrian": True,
-  u"equine": True,
-  u"equinoctial": True,
-  u"erasmian": True,
-  u"eremitic": True,
-  u"ergonomic": True,
-  u"ergotic": True,
-  u"ergotropic": True,
-  u"eritrean": True,
-  u"eruptive": True,
-  u"erythematous": True,
-  u"erythroid": True,
-  u"erythropoietic": True,
-  u"eschatological": True,
-  u"esophageal": True,
-  u"essene": True,
-  u"essential": True,
-  u"estonian": True,
-  u"estrogenic": True,
-  u"estuarine": True,
-  u"ethereal": True,
-  u"ethical": True,
-  u"ethiopian": True,
-  u"ethnocentric": True,
-  u"ethnographic": True,
-  u"ethnological": True,
-  u"etiological": True,
-  u"etymological": True,
-  u"eucharistic": True,
-  u"euclidian": True,
-  u"eudemonic": True,
-  u"eugenic": True,
-  u"eukaryotic": True,
-  u"euphonic": True,
-  u"eurafrican": True,
-  u"eurasian": True,
-  u"eurocentric": True,
-  u"european": True,
-  u"eutherian": True,
-  u"eutrophic": True,
-  u"evangelical": True,
-  u"evangelistic": True,
-  u"evaporative": True,
-  u"evidentiary": True,
-  u"evolutionary": True,
-  u"excrescent": True,
-  u"excretory": True,
-  u"executive": True,
-  u"exegetic": True,
-  u"exilic": True,
-  u"existentialist": True,
-  u"existential": True,
-  u"exocrine": True,
-  u"exodontic": True,
-  u"expansionist": True,
-  u"experiential": True,
-  u"experimental": True,
-  u"expiatory": True,
-  u"expiratory": True,
-  u"exponential": True,
-  u"expressionist": True,
-  u"exteroceptive": True,
-  u"extracellular": True,
-  u"extragalactic": True,
-  u"extralinguistic": True,
-  u"extrasystolic": True,
-  u"extraterrestrial": True,
-  u"extropic": True,
-  u"exuvial": True,
-  u"fabian": True,
-  u"facial": True,
-  u"factor_analytical": True,
-  u"factorial": True,
-  u"factual": True,
-  u"facultative": True,
-  u"fahrenheit": True,
-  u"falconine": True,
-  u"falstaffian": True,
-  u"familial": True,
-  u"fanged": True,
-  u"fascist": True,
-  u"fatalist": True,
-  u"faucal": True,
-  u"faustian": True,
-  u"febrile": True,
-  u"federal": True,
-  u"feline": True,
-  u"feminist": True,
-  u"femoral": True,
-  u"fenestral": True,
-  u"ferial": True,
-  u"fermentable": True,
-  u"ferric": True,
-  u"ferromagnetic": True,
-  u"fetal": True,
-  u"feudal": True,
-  u"feudatory": True,
-  u"fiber-optic": True,
-  u"fibrillose": True,
-  u"fibrinous": True,
-  u"fibrocalcific": True,
-  u"fibrocartilaginous": True,
-  u"fictile": True,
-  u"fictional": True,
-  u"fiducial": True,
-  u"fiduciary": True,
-  u"field-crop": True,
-  u"fijian": True,
-  u"filarial": True,
-  u"filariid": True,
-  u"filar": True,
-  u"filial": True,
-  u"filipino": True,
-  u"finnish": True,
-  u"firmamental": True,
-  u"fiscal": True,
-  u"fisheye": True,
-  u"fishy": True,
-  u"fistulous": True,
-  u"flagellate": True,
-  u"flaky": True,
-  u"flemish": True,
-  u"fleshy": True,
-  u"flinty": True,
-  u"floral": True,
-  u"florentine": True,
-  u"floricultural": True,
-  u"flowery": True,
-  u"fluvial": True,
-  u"focal": True,
-  u"foliaceous": True,
-  u"foliate": True,
-  u"follicular": True,
-  u"forcipate": True,
-  u"formalistic": True,
-  u"formic": True,
-  u"formulary": True,
-  u"fossiliferous": True,
-  u"fossil": True,
-  u"fourhanded": True,
-  u"four-wheel": True,
-  u"franciscan": True,
-  u"frankish": True,
-  u"fraternal": True,
-  u"french": True,
-  u"fretted": True,
-  u"freudian": True,
-  u"frictional": True,
-  u"frictionless": True,
-  u"frisian": True,
-  u"frontal": True,
-  u"frostian": True,
-  u"fugal": True,
-  u"functional": True,
-  u"fundamentalist": True,
-  u"funerary": True,
-  u"fungal": True,
-  u"fungicidal": True,
-  u"fungoid": True,
-  u"funicular": True,
-  u"future": True,
-  u"futuristic": True,
-  u"gabonese": True,
-  u"galactic": True,
-  u"galilean": True,
-  u"gallican": True,
-  u"gallic": True,
-  u"gallinaceous": True,
-  u"galwegian": True,
-  u"gambian": True,
-  u"gandhian": True,
-  u"garlicky": True,
-  u"gastric": True,
-  u"gastroduodenal": True,
-  u"gastroesophageal": True,
-  u"gastrointestinal": True,
-  u"gastronomic": True,
-  u"gauguinesque": True,
-  u"gaussian": True,
-  u"gemmiferous": True,
-  u"genealogic": True,
-  u"generational": True,
-  u"generic": True,
-  u"genetic": True,
-  u"genial": True,
-  u"genic": True,
-  u"genital": True,
-  u"genitourinary": True,
-  u"genoese": True,
-  u"genotypical": True,
-  u"gentile": True,
-  u"geodetic": True,
-  u"geographic": True,
-  u"geological": True,
-  u"geometric": True,
-  u"geomorphologic": True,
-  u"geophysical": True,
-  u"geophytic": True,
-  u"geopolitical": True,
-  u"georgian": True,
-  u"geostrategic": True,
-  u"geothermal": True,
-  u"geriatric": True,
-  u"german-american": True,
-  u"germanic": True,
-  u"german": True,
-  u"gerundial": True,
-  u"gestational": True,
-  u"ghanaian": True,
-  u"gibraltarian": True,
-  u"gilbertian": True,
-  u"gingival": True,
-  u"glabellar": True,
-  u"glacial": True,
-  u"gladiatorial": True,
-  u"glandular": True,
-  u"glaswegian": True,
-  u"glial": True,
-  u"glomerular": True,
-  u"glossopharyngeal": True,
-  u"glottal": True,
-  u"glottochronological": True,
-  u"gluteal": True,
-  u"glycogenic": True,
-  u"gnomic": True,
-  u"gnostic": True,
-  u"goethean": True,
-  u"gonadal": True,
-  u"gonadotropic": True,
-  u"gothic": True,
-  u"grammatical": True,
-  u"granuliferous": True,
-  u"granulocytic": True,
-  u"granulomatous": True,
-  u"grapelike": True,
-  u"graphic": True,
-  u"gravitational": True,
-  u"greek": True,
-  u"greenhouse": True,
-  u"greenside": True,
-  u"green": True,
-  u"gregorian": True,
-  u"grenadian": True,
-  u"growing": True,
-  u"grubby": True,
-  u"guatemalan": True,
-  u"gubernatorial": True,
-  u"guinean": True,
-  u"gustatory": True,
-  u"guttural": True,
-  u"guyanese": True,
-  u"gymnastic": True,
-  u"gymnosophical": True,
-  u"gymnospermous": True,
-  u"gynecological": True,
-  u"gyral": True,
-  u"gyroscopic": True,
-  u"hadal": True,
-  u"haemophilic": True,
-  u"hair-shirt": True,
-  u"haitian": True,
-  u"handelian": True,
-  u"hanoverian": True,
-  u"haptic": True,
-  u"harmonic": True,
-  u"hasidic": True,
-  u"hawaiian": True,
-  u"heathlike": True,
-  u"hebraic": True,
-  u"hebridean": True,
-  u"hegelian": True,
-  u"heliacal": True,
-  u"hellenic": True,
-  u"hemal": True,
-  u"hematologic": True,
-  u"hematopoietic": True,
-  u"hemic": True,
-  u"hemingwayesque": True,
-  u"hemiparasitic": True,
-  u"hemispherical": True,
-  u"hemispheric": True,
-  u"hemodynamic": True,
-  u"hemolytic": True,
-  u"hemorrhagic": True,
-  u"hepatic": True,
-  u"heraldic": True,
-  u"herbal": True,
-  u"hermeneutic": True,
-  u"heroic": True,
-  u"hertzian": True,
-  u"heterodyne": True,
-  u"heterosporous": True,
-  u"hexadecimal": True,
-  u"hexangular": True,
-  u"hidrotic": True,
-  u"hieratic": True,
-  u"hieroglyphic": True,
-  u"high-energy": True,
-  u"hilar": True,
-  u"himalayan": True,
-  u"hindustani": True,
-  u"hindu": True,
-  u"hiplength": True,
-  u"hippocratic": True,
-  u"hircine": True,
-  u"hispanic": True,
-  u"hispaniolan": True,
-  u"histological": True,
-  u"historical": True,
-  u"hitlerian": True,
-  u"hittite": True,
-  u"hmong": True,
-  u"hollywood": True,
-  u"holographic": True,
-  u"homeopathic": True,
-  u"homeostatic": True,
-  u"homeric": True,
-  u"home": True,
-  u"homiletic": True,
-  u"homonymic": True,
-  u"homophonous": True,
-  u"homosporous": True,
-  u"homostylous": True,
-  u"honduran": True,
-  u"hooflike": True,
-  u"horary": True,
-  u"hormonal": True,
-  u"horse-drawn": True,
-  u"horticultural": True,
-  u"hugoesque": True,
-  u"humanistic": True,
-  u"humanist": True,
-  u"humanitarian": True,
-  u"human": True,
-  u"humic": True,
-  u"humified": True,
-  u"humoral": True,
-  u"hungarian": True,
-  u"huxleyan": True,
-  u"hyaloplasmic": True,
-  u"hydraulic": True,
-  u"hydrocephalic": True,
-  u"hydrodynamic": True,
-  u"hydroelectric": True,
-  u"hydrographic": True,
-  u"hydrokinetic": True,
-  u"hydrolyzable": True,
-  u"hydrometric": True,
-  u"hydropathic": True,
-  u"hydrostatic": True,
-  u"hydroxy": True,
-  u"hymenal": True,
-  u"hymeneal": True,
-  u"hymenopterous": True,
-  u"hyoid": True,
-  u"hyperbolic": True,
-  u"hyperemic": True,
-  u"hyperthermal": True,
-  u"hypnotic": True,
-  u"hypodermal": True,
-  u"hypodermic": True,
-  u"hypoglycemic": True,
-  u"hypophyseal": True,
-  u"hypothalamic": True,
-  u"hypothermic": True,
-  u"hypovolemic": True,
-  u"iambic": True,
-  u"iberian": True,
-  u"ibsenian": True,
-  u"icelandic": True,
-  u"ichorous": True,
-  u"iconic": True,
-  u"icosahedral": True,
-  u"ictal": True,
-  u"icterogenic": True,
-  u"ideal": True,
-  u"ideographic": True,
-  u"ideological": True,
-  u"idiomatic": True,
-  u"idiopathic": True,
-  u"idolatrous": True,
-  u"igneous": True,
-  u"iliac": True,
-  u"immune": True,
-  u"immunochemical": True,
-  u"immunocompromised": True,
-  u"immunological": True,
-  u"immunosuppressed": True,
-  u"immunosuppressive": True,
-  u"immunotherapeutic": True,
-  u"imperative": True,
-  u"imperialistic": True,
-  u"imperial": True,
-  u"impetiginous": True,
-  u"implicational": True,
-  u"impressionistic": True,
-  u"impressionist": True,
-  u"incan": True,
-  u"incendiary": True,
-  u"incestuous": True,
-  u"incident": True,
-  u"indexical": True,
-  u"indexless": True,
-  u"indian": True,
-  u"indicative": True,
-  u"indo-european": True,
-  u"indonesian": True,
-  u"inductive": True,
-  u"indusial": True,
-  u"industrial": True,
-  u"inertial": True,
-  u"infantile": True,
-  u"infectious": True,
-  u"inferential": True,
-  u"infernal": True,
-  u"infinitival": True,
-  u"informational": True,
-  u"inguinal": True,
-  u"inhalant": True,
-  u"ink-jet": True,
-  u"inquisitorial": True,
-  u"inscriptive": True,
-  u"insectan": True,
-  u"insecticidal": True,
-  u"inspiratory": True,
-  u"institutional": True,
-  u"instructional": True,
-  u"instrumental": True,
-  u"insular": True,
-  u"insurrectional": True,
-  u"integral": True,
-  u"integumentary": True,
-  u"intensive": True,
-  u"intercellular": True,
-  u"intercostal": True,
-  u"interdepartmental": True,
-  u"interdisciplinary": True,
-  u"interest-bearing": True,
-  u"interfacial": True,
-  u"intergalactic": True,
-  u"interlinear": True,
-  u"interlobular": True,
-  u"interlocutory": True,
-  u"intermolecular": True,
-  u"interoceptive": True,
-  u"interplanetary": True,
-  u"interrogative": True,
-  u"interstellar": True,
-  u"interstitial": True,
-  u"intertidal": True,
-  u"intertribal": True,
-  u"intervertebral": True,
-  u"intestinal": True,
-  u"intimal": True,
-  u"intracellular": True,
-  u"intracerebral": True,
-  u"intracranial": True,
-  u"intradepartmental": True,
-  u"intradermal": True,
-  u"intralinguistic": True,
-  u"intralobular": True,
-  u"intramolecular": True,
-  u"intramuscular": True,
-  u"intrapulmonary": True,
-  u"intrasentential": True,
-  u"intrauterine": True,
-  u"intravenous": True,
-  u"intraventricular": True,
-  u"intuitionist": True,
-  u"invitational": True,
-  u"involucrate": True,
-  u"iodinated": True,
-  u"ionian": True,
-  u"ionic": True,
-  u"iranian": True,
-  u"iraqi": True,
-  u"iridaceous": True,
-  u"iridic": True,
-  u"irish": True,
-  u"iritic": True,
-  u"irrational": True,
-  u"ischemic": True,
-  u"isentropic": True,
-  u"ismaili": True,
-  u"isolationist": True,
-  u"isomeric": True,
-  u"isometric": True,
-  u"isomorphous": True,
-  u"isopteran": True,
-  u"isothermic": True,
-  u"isotonic": True,
-  u"isotopic": True,
-  u"israeli": True,
-  u"isthmian": True,
-  u"italian": True,
-  u"italic": True,
-  u"jacksonian": True,
-  u"jacobean": True,
-  u"jacobinic": True,
-  u"jain": True,
-  u"jamaican": True,
-  u"jamesian": True,
-  u"japanese": True,
-  u"javanese": True,
-  u"jeffersonian": True,
-  u"jesuitical": True,
-  u"jet-propelled": True,
-  u"jewish": True,
-  u"jihadi": True,
-  u"jittery": True,
-  u"jordanian": True,
-  u"journalistic": True,
-  u"jovian": True,
-  u"judaic": True,
-  u"judeo-christian": True,
-  u"judicial": True,
-  u"jugular": True,
-  u"julian": True,
-  u"jumentous": True,
-  u"jungian": True,
-  u"jurassic": True,
-  u"juridical": True,
-  u"jurisprudential": True,
-  u"juvenile": True,
-  u"kafkaesque": True,
-  u"kantian": True,
-  u"karyokinetic": True,
-  u"kashmiri": True,
-  u"katharobic": True,
-  u"kazakhstani": True,
-  u"kenyan": True,
-  u"keynesian": True,
-  u"kinesthetic": True,
-  u"kinetic": True,
-  u"kiplingesque": True,
-  u"knee-length": True,
-  u"kokka": True,
-  u"koranic": True,
-  u"korean": True,
-  u"kurdish": True,
-  u"kuwaiti": True,
-  u"kyrgyzstani": True,
-  u"labial": True,
-  u"labyrinthine": True,
-  u"lacrimal": True,
-  u"lacrimatory": True,
-  u"lacteal": True,
-  u"lactic": True,
-  u"lactogenic": True,
-  u"lacustrine": True,
-  u"lamarckian": True,
-  u"lancastrian": True,
-  u"laotian": True,
-  u"lao": True,
-  u"lapidary": True,
-  u"laputan": True,
-  u"large-capitalization": True,
-  u"larval": True,
-  u"laryngeal": True,
-  u"laryngopharyngeal": True,
-  u"lathery": True,
-  u"latin-american": True,
-  u"latinate": True,
-  u"latin": True,
-  u"latitudinal": True,
-  u"latvian": True,
-  u"leaden": True,
-  u"lebanese": True,
-  u"legal": True,
-  u"legislative": True,
-  u"leguminous": True,
-  u"leibnizian": True,
-  u"lenten": True,
-  u"leonardesque": True,
-  u"leonine": True,
-  u"leprous": True,
-  u"levantine": True,
-  u"levitical": True,
-  u"lexicalized": True,
-  u"lexical": True,
-  u"lexicographic": True,
-  u"lexicostatistic": True,
-  u"liberian": True,
-  u"libidinal": True,
-  u"libyan": True,
-  u"liechtensteiner": True,
-  u"life-support": True,
-  u"liliaceous": True,
-  u"lilliputian": True,
-  u"limacine": True,
-  u"limbic": True,
-  u"limnological": True,
-  u"lincolnesque": True,
-  u"lingual": True,
-  u"linguistic": True,
-  u"linnaean": True,
-  u"literary": True,
-  u"lithic": True,
-  u"lithographic": True,
-  u"lithomantic": True,
-  u"lithophytic": True,
-  u"lithuanian": True,
-  u"litigious": True,
-  u"littoral": True,
-  u"liturgical": True,
-  u"liverpudlian": True,
-  u"living": True,
-  u"lobar": True,
-  u"lobate": True,
-  u"lobeliaceous": True,
-  u"lobular": True,
-  u"local": True,
-  u"locker-room": True,
-  u"locomotive": True,
-  u"logarithmic": True,
-  u"logistic": True,
-  u"logogrammatic": True,
-  u"long-chain": True,
-  u"long-distance": True,
-  u"longitudinal": True,
-  u"loopy": True,
-  u"lucifugous": True,
-  u"lumbar": True,
-  u"lumbosacral": True,
-  u"lunar": True,
-  u"lung-like": True,
-  u"lunisolar": True,
-  u"lupine": True,
-  u"lusitanian": True,
-  u"luteal": True,
-  u"lutheran": True,
-  u"luxembourgian": True,
-  u"luxemburger": True,
-  u"lymphatic": True,
-  u"lymphocytic": True,
-  u"lymphoid": True,
-  u"lyric": True,
-  u"lysogenic": True,
-  u"macaronic": True,
-  u"macedonian": True,
-  u"macerative": True,
-  u"machiavellian": True,
-  u"machine_readable": True,
-  u"macrencephalic": True,
-  u"macrobiotic": True,
-  u"macrocephalic": True,
-  u"macrocosmic": True,
-  u"macroeconomic": True,
-  u"macromolecular": True,
-  u"madagascan": True,
-  u"magisterial": True,
-  u"magnetic": True,
-  u"malarial": True,
-  u"malawian": True,
-  u"malayo-polynesian": True,
-  u"malaysian": True,
-  u"malay": True,
-  u"malian": True,
-  u"maltese": True,
-  u"malthusian": True,
-  u"mammalian": True,
-  u"mammary": True,
-  u"managerial": True,
-  u"manchurian": True,
-  u"mancunian": True,
-  u"mandaean": True,
-  u"mandibular": True,
-  u"mandibulate": True,
-  u"mandibulofacial": True,
-  u"manichaean": True,
-  u"manorial": True,
-  u"manual": True,
-  u"manx": True,
-  u"maoist": True,
-  u"marian": True,
-  u"marine": True,
-  u"marital": True,
-  u"markovian": True,
-  u"marly": True,
-  u"marmorean": True,
-  u"marsupial": True,
-  u"martian": True,
-  u"marxist-leninist": True,
-  u"marxist": True,
-  u"masonic": True,
-  u"masoretic": True,
-  u"mass-spectrometric": True,
-  u"mass_spectroscopic": True,
-  u"masted": True,
-  u"mastoid": True,
-  u"maternal": True,
-  u"mathematical": True,
-  u"maturational": True,
-  u"matutinal": True,
-  u"mauritanian": True,
-  u"maxillary": True,
-  u"maxillodental": True,
-  u"maxillofacial": True,
-  u"maxillomandibular": True,
-  u"mayoral": True,
-  u"mealy": True,
-  u"mechanical": True,
-  u"mechanistic": True,
-  u"mecopterous": True,
-  u"mediatorial": True,
-  u"mediatory": True,
-  u"medical": True,
-  u"medicolegal": True,
-  u"medieval": True,
-  u"mediterranean": True,
-  u"medullary": True,
-  u"medusoid": True,
-  u"megakaryocytic": True,
-  u"megalithic": True,
-  u"megaloblastic": True,
-  u"meiotic": True,
-  u"melanesian": True,
-  u"melodic": True,
-  u"membranous": True,
-  u"mendelian": True,
-  u"meningeal": True,
-  u"menopausal": True,
-  u"mensal": True,
-  u"menstrual": True,
-  u"mensural": True,
-  u"mental": True,
-  u"mentholated": True,
-  u"mercantile": True,
-  u"mercurial": True,
-  u"mercuric": True,
-  u"meretricious": True,
-  u"meridian": True,
-  u"meridional": True,
-  u"meritocratic": True,
-  u"merovingian": True,
-  u"mesenteric": True,
-  u"mesoamerican": True,
-  u"mesoblastic": True,
-  u"mesolithic": True,
-  u"mesonic": True,
-  u"mesozoic": True,
-  u"messianic": True,
-  u"metabolic": True,
-  u"metacarpal": True,
-  u"metacentric": True,
-  u"metallurgical": True,
-  u"metamorphic": True,
-  u"metaphysical": True,
-  u"metastable": True,
-  u"metastatic": True,
-  u"metatarsal": True,
-  u"meteoric": True,
-  u"meteoritic": True,
-  u"meteorologic": True,
-  u"methodist": True,
-  u"methodological": True,
-  u"methylated": True,
-  u"metric": True,
-  u"metrological": True,
-  u"metropolitan": True,
-  u"mexican": True,
-  u"micaceous": True,
-  u"michelangelesque": True,
-  u"microbial": True,
-  u"microcephalic": True,
-  u"microcosmic": True,
-  u"microeconomic": True,
-  u"microelectronic": True,
-  u"micrometeoric": True,
-  u"micrometeoritic": True,
-  u"micropylar": True,
-  u"microscopic": True,
-  u"microsomal": True,
-  u"middle_eastern": True,
-  u"migrational": True,
-  u"milanese": True,
-  u"milch": True,
-  u"military": True,
-  u"millenarian": True,
-  u"millenary": True,
-  u"millennial": True,
-  u"mineral": True,
-  u"minimalist": True,
-  u"ministerial": True,
-  u"minoan": True,
-  u"minty": True,
-  u"miotic": True,
-  u"mishnaic": True,
-  u"missionary": True,
-  u"mithraic": True,
-  u"mitotic": True,
-  u"mitral": True,
-  u"mnemonic": True,
-  u"modal": True,
-  u"molal": True,
-  u"molar": True,
-  u"moldovan": True,
-  u"molecular": True,
-  u"monacan": True,
-  u"monatomic": True,
-  u"moneran": True,
-  u"monetary": True,
-  u"mongolian": True,
-  u"mongoloid": True,
-  u"mongol": True,
-  u"monistic": True,
-  u"monocarboxylic": True,
-  u"monocarpic": True,
-  u"monochromatic": True,
-  u"monoclonal": True,
-  u"monometallic": True,
-  u"monomorphemic": True,
-  u"monophysite": True,
-  u"monotypic": True,
-  u"monozygotic": True,
-  u"montane": True,
-  u"montserratian": True,
-  u"monumental": True,
-  u"moorish": True,
-  u"moraceous": True,
-  u"moravian": True,
-  u"morbilliform": True,
-  u"mormon": True,
-  u"moroccan": True,
-  u"morphemic": True,
-  u"morphologic": True,
-  u"morphophonemic": True,
-  u"mortuary": True,
-  u"mosaic": True,
-  u"most-favored-nation": True,
-  u"motional": True,
-  u"motivational": True,
-  u"mousy": True,
-  u"mozambican": True,
-  u"mozartian": True,
-  u"muciferous": True,
-  u"mucinoid": True,
-  u"mucinous": True,
-  u"mucocutaneous": True,
-  u"mucoid": True,
-  u"mucopurulent": True,
-  u"mucosal": True,
-  u"mucous": True,
-  u"mud-brick": True,
-  u"muhammadan": True,
-  u"multicultural": True,
-  u"multilevel": True,
-  u"multinucleate": True,
-  u"multiphase": True,
-  u"municipal": True,
-  u"mural": True,
-  u"murine": True,
-  u"muscovite": True,
-  u"muscular": True,
-  u"musculoskeletal": True,
-  u"musical": True,
-  u"musicological": True,
-  u"muslim": True,
-  u"mutafacient": True,
-  u"mutagenic": True,
-  u"mutant": True,
-  u"mutational": True,
-  u"mutative": True,
-  u"muzzle-loading": True,
-  u"myalgic": True,
-  u"mycenaean": True,
-  u"myelic": True,
-  u"myelinated": True,
-  u"myelinic": True,
-  u"myeloid": True,
-  u"myocardial": True,
-  u"myoid": True,
-  u"myopathic": True,
-  u"myotonic": True,
-  u"myrmecophytic": True,
-  u"mystic": True,
-  u"mythic": True,
-  u"nacreous": True,
-  u"namibian": True,
-  u"napoleonic": True,
-  u"narcoleptic": True,
-  u"narcotic": True,
-  u"narial": True,
-  u"nasopharyngeal": True,
-  u"natal": True,
-  u"national_socialist": True,
-  u"national": True,
-  u"nativist": True,
-  u"natriuretic": True,
-  u"naturistic": True,
-  u"nauruan": True,
-  u"nautical": True,
-  u"naval": True,
-  u"navigational": True,
-  u"nazarene": True,
-  u"nazi": True,
-  u"neanderthal": True,
-  u"neapolitan": True,
-  u"nebular": True,
-  u"necromantic": True,
-  u"necrotic": True,
-  u"nectariferous": True,
-  u"nectar-rich": True,
-  u"neoclassicist": True,
-  u"neocortical": True,
-  u"neo-darwinian": True,
-  u"neo-lamarckian": True,
-  u"neolithic": True,
-  u"neonatal": True,
-  u"neoplastic": True,
-  u"neotenic": True,
-  u"nepalese": True,
-  u"nephritic": True,
-  u"neritic": True,
-  u"nervous": True,
-  u"nestorian": True,
-  u"neuralgic": True,
-  u"neural": True,
-  u"neurasthenic": True,
-  u"neuroanatomic": True,
-  u"neurobiological": True,
-  u"neuroendocrine": True,
-  u"neurogenic": True,
-  u"neuroglial": True,
-  u"neurological": True,
-  u"neuromatous": True,
-  u"neuromuscular": True,
-  u"neurophysiological": True,
-  u"neuropsychiatric": True,
-  u"neuropsychological": True,
-  u"neurotic": True,
-  u"neurotoxic": True,
-  u"neurotropic": True,
-  u"new_caledonian": True,
-  u"newtonian": True,
-  u"new_zealander": True,
-  u"nicaean": True,
-  u"nicaraguan": True,
-  u"nigerian": True,
-  u"nihilistic": True,
-  u"nilotic": True,
-  u"nilpotent": True,
-  u"nitrogen-fixing": True,
-  u"nitrogenous": True,
-  u"noachian": True,
-  u"nocturnal": True,
-  u"nodular": True,
-  u"nominalistic": True,
-  u"nominal": True,
-  u"nominative": True,
-  u"noncaloric": True,
-  u"nonenzymatic": True,
-  u"nonfictional": True,
-  u"nonfinancial": True,
-  u"nonharmonic": True,
-  u"nonionic": True,
-  u"nonlexical": True,
-  u"nonlinguistic": True,
-  u"non-metric": True,
-  u"nonparametric": True,
-  u"nonpasserine": True,
-  u"nonphotosynthetic": True,
-  u"nonruminant": True,
-  u"nonspatial": True,
-  u"nonspherical": True,
-  u"nonsteroidal": True,
-  u"nonsuppurative": True,
-  u"nonsurgical": True,
-  u"nonthermal": True,
-  u"nontranslational": True,
-  u"nordic": True,
-  u"norman": True,
-  u"normative": True,
-  u"north_african": True,
-  u"north_american": True,
-  u"north_korean": True,
-  u"north_vietnamese": True,
-  u"norwegian": True,
-  u"nosocomial": True,
-  u"nuclear": True,
-  u"nucleated": True,
-  u"numeral": True,
-  u"numerological": True,
-  u"numidian": True,
-  u"numinous": True,
-  u"nutritional": True,
-  u"oaten": True,
-  u"objective": True,
-  u"obligational": True,
-  u"obstetric": True,
-  u"occipital": True,
-  u"occlusive": True,
-  u"occupational": True,
-  u"oceanic": True,
-  u"ocellated": True,
-  u"octal": True,
-  u"octangular": True,
-  u"ocular": True,
-  u"official": True,
-  u"ohmic": True,
-  u"oleaceous": True,
-  u"olfactory": True,
-  u"oligarchic": True,
-  u"olympian": True,
-  u"olympic": True,
-  u"omani": True,
-  u"omissive": True,
-  u"omnidirectional": True,
-  u"oncological": True,
-  u"one-humped": True,
-  u"oneiric": True,
-  u"onomastic": True,
-  u"onomatopoeic": True,
-  u"on-the-job": True,
-  u"ontogenetic": True,
-  u"ontological": True,
-  u"open-hearth": True,
-  u"open-source": True,
-  u"operatic": True,
-  u"operationalist": True,
-  u"operational": True,
-  u"operculate": True,
-  u"ophthalmic": True,
-  u"optative": True,
-  u"optical": True,
-  u"oracular": True,
-  u"oral": True,
-  u"orbital": True,
-  u"orb-weaving": True,
-  u"orchestral": True,
-  u"orchestrated": True,
-  u"ordinal": True,
-  u"organicistic": True,
-  u"organismal": True,
-  u"organizational": True,
-  u"ornithological": True,
-  u"oropharyngeal": True,
-  u"orphic": True,
-  u"orthodontic": True,
-  u"orthodox": True,
-  u"orthographic": True,
-  u"orthopedic": True,
-  u"orthoptic": True,
-  u"orwellian": True,
-  u"oscine": True,
-  u"osmotic": True,
-  u"osseous": True,
-  u"ossicular": True,
-  u"ossiferous": True,
-  u"osteal": True,
-  u"otic": True,
-  u"ottoman": True,
-  u"outdoor": True,
-  u"ovarian": True,
-  u"ovine": True,
-  u"ovular": True,
-  u"oxonian": True,
-  u"pachydermatous": True,
-  u"pacific": True,
-  u"packable": True,
-  u"pakistani": True,
-  u"palatal": True,
-  u"palatial": True,
-  u"palatine": True,
-  u"palatoglossal": True,
-  u"paleoanthropological": True,
-  u"paleocortical": True,
-  u"paleolithic": True,
-  u"paleontological": True,
-  u"paleozoic": True,
-  u"palestinian": True,
-  u"palingenetic": True,
-  u"palladian": True,
-  u"palmar": True,
-  u"palpatory": True,
-  u"palpebrate": True,
-  u"panamanian": True,
-  u"pancreatic": True,
-  u"panhellenic": True,
-  u"panicled": True,
-  u"paniculate": True,
-  u"pantheist": True,
-  u"papal": True,
-  u"papillary": True,
-  u"papillate": True,
-  u"papilliform": True,
-  u"papuan": True,
-  u"parabolic": True,
-  u"paradigmatic": True,
-  u"paraguayan": True,
-  u"paralytic": True,
-  u"paramagnetic": True,
-  u"parametric": True,
-  u"paramilitary": True,
-  u"paranasal": True,
-  u"parasitic": True,
-  u"parasympathetic": True,
-  u"parasympathomimetic": True,
-  u"parental": True,
-  u"parenteral": True,
-  u"parhelic": True,
-  u"parietal": True,
-  u"parisian": True,
-  u"parliamentary": True,
-  u"parochial": True,
-  u"parotid": True,
-  u"parous": True,
-  u"paroxysmal": True,
-  u"parthian": True,
-  u"participial": True,
-  u"particularistic": True,
-  u"partitive": True,
-  u"parturient": True,
-  u"paschal": True,
-  u"passerine": True,
-  u"pasteurian": True,
-  u"pastoral": True,
-  u"patellar": True,
-  u"paternal": True,
-  u"pathological": True,
-  u"patriarchal": True,
-  u"patristic": True,
-  u"patronymic": True,
-  u"pauline": True,
-  u"pavlovian": True,
-  u"peacekeeping": True,
-  u"peaty": True,
-  u"pectic": True,
-  u"pectineal": True,
-  u"pectoral": True,
-  u"pedagogical": True,
-  u"pedal": True,
-  u"pediatric": True,
-  u"peloponnesian": True,
-  u"pelvic": True,
-  u"pemphigous": True,
-  u"penal": True,
-  u"penicillin-resistant": True,
-  u"penile": True,
-  u"peninsular": True,
-  u"pentangular": True,
-  u"pentatonic": True,
-  u"pentavalent": True,
-  u"pentecostal": True,
-  u"penumbral": True,
-  u"peptic": True,
-  u"perceptive": True,
-  u"perceptual": True,
-  u"percussive": True,
-  u"perianal": True,
-  u"pericardial": True,
-  u"perigonal": True,
-  u"perinasal": True,
-  u"perineal": True,
-  u"periodontic": True,
-  u"perithelial": True,
-  u"peritoneal": True,
-  u"peroneal": True,
-  u"personal": True,
-  u"peruvian": True,
-  u"petaloid": True,
-  u"phagocytic": True,
-  u"phalangeal": True,
-  u"phallic": True,
-  u"pharaonic": True,
-  u"pharmaceutical": True,
-  u"pharmacological": True,
-  u"pharyngeal": True,
-  u"phenomenal": True,
-  u"phenotypical": True,
-  u"philanthropic": True,
-  u"philatelic": True,
-  u"philharmonic": True,
-  u"philhellenic": True,
-  u"philistine": True,
-  u"philological": True,
-  u"philosophic": True,
-  u"phocine": True,
-  u"phoenician": True,
-  u"phonemic": True,
-  u"phonetic": True,
-  u"phonic": True,
-  u"phonogramic": True,
-  u"phonological": True,
-  u"phosphorous": True,
-  u"photic": True,
-  u"photochemical": True,
-  u"photoconductive": True,
-  u"photoelectric": True,
-  u"photoemissive": True,
-  u"photographic": True,
-  u"photomechanical": True,
-  u"photometric": True,
-  u"photosynthetic": True,
-  u"photovoltaic": True,
-  u"phrasal": True,
-  u"phreatic": True,
-  u"phrenic": True,
-  u"phrenological": True,
-  u"phyllodial": True,
-  u"phylogenetic": True,
-  u"physical": True,
-  u"physicochemical": True,
-  u"physiological": True,
-  u"physiotherapeutic": True,
-  u"piagetian": True,
-  u"pianistic": True,
-  u"pictographic": True,
-  u"pictorial": True,
-  u"pietistic": True,
-  u"piezoelectric": True,
-  u"pilar": True,
-  u"pilosebaceous": True,
-  u"pineal": True,
-  u"piratical": True,
-  u"piscatorial": True,
-  u"piscine": True,
-  u"pituitary": True,
-  u"plagioclastic": True,
-  u"plane-polarized": True,
-  u"planetal": True,
-  u"planetary": True,
-  u"planktonic": True,
-  u"planographic": True,
-  u"plantal": True,
-  u"plantar": True,
-  u"platonic": True,
-  u"platonistic": True,
-  u"pleochroic": True,
-  u"pleomorphic": True,
-  u"pleural": True,
-  u"plumbaginaceous": True,
-  u"plumbic": True,
-  u"pluralistic": True,
-  u"plutocratic": True,
-  u"pneumatic": True,
-  u"pneumococcal": True,
-  u"pneumogastric": True,
-  u"pneumonic": True,
-  u"poetic": True,
-  u"point-of-sale": True,
-  u"polarographic": True,
-  u"polar": True,
-  u"polemoniaceous": True,
-  u"polish": True,
-  u"politically_correct": True,
-  u"politically_incorrect": True,
-  u"political": True,
-  u"polyatomic": True,
-  u"polydactyl": True,
-  u"polygonal": True,
-  u"polyhedral": True,
-  u"polymeric": True,
-  u"polymorphemic": True,
-  u"polymorphic": True,
-  u"polymorphous": True,
-  u"polynesian": True,
-  u"polynomial": True,
-  u"polyphonic": True,
-  u"pompous": True,
-  u"popliteal": True,
-  u"porcine": True,
-  u"porphyritic": True,
-  u"portuguese": True,
-  u"positionable": True,
-  u"positional": True,
-  u"positivist": True,
-  u"possessive": True,
-  u"postal": True,
-  u"postbiblical": True,
-  u"post-communist": True,
-  u"postdiluvian": True,
-  u"postdoctoral": True,
-  u"postexilic": True,
-  u"postganglionic": True,
-  u"postglacial": True,
-  u"postictal": True,
-  u"postmenopausal": True,
-  u"postmillennial": True,
-  u"postmodernist": True,
-  u"postnuptial": True,
-  u"postpositive": True,
-  u"postural": True,
-  u"pouched": True,
-  u"praetorian": True,
-  u"pragmatic": True,
-  u"prakritic": True,
-  u"prandial": True,
-  u"preanal": True,
-  u"precancerous": True,
-  u"pre-christian": True,
-  u"preclinical": True,
-  u"pre-columbian": True,
-  u"precordial": True,
-  u"predestinarian": True,
-  u"prefectural": True,
-  u"prehistoric": True,
-  u"prejudicial": True,
-  u"pre-jurassic": True,
-  u"prelapsarian": True,
-  u"premedical": True,
-  u"premenopausal": True,
-  u"premenstrual": True,
-  u"prenuptial": True,
-  u"prepositional": True,
-  u"pre-raphaelite": True,
-  u"presentational": True,
-  u"presidential": True,
-  u"presocratic": True,
-  u"pressor": True,
-  u"priestly": True,
-  u"prime": True,
-  u"primiparous": True,
-  u"prismatic": True,
-  u"pro-american": True,
-  u"probabilistic": True,
-  u"procedural": True,
-  u"processional": True,
-  u"proconsular": True,
-  u"procrustean": True,
-  u"prodromal": True,
-  u"professional": True,
-  u"professorial": True,
-  u"progestational": True,
-  u"prokaryotic": True,
-  u"prolusory": True,
-  u"promissory": True,
-  u"promotional": True,
-  u"pronominal": True,
-  u"propagandist": True,
-  u"propagative": True,
-  u"proprioceptive": True,
-  u"propulsive": True,
-  u"prosodic": True,
-  u"prostate": True,
-  u"prosthetic": True,
-  u"prosthodontic": True,
-  u"proteinaceous": True,
-  u"proteolytic": True,
-  u"protestant": True,
-  u"protozoal": True,
-  u"protozoological": True,
-  u"proustian": True,
-  u"provencal": True,
-  u"proverbial": True,
-  u"providential": True,
-  u"provincial": True,
-  u"prussian": True,
-  u"psychiatric": True,
-  u"psychoanalytical": True,
-  u"psychogenetic": True,
-  u"psycholinguistic": True,
-  u"psychological": True,
-  u"psychometric": True,
-  u"psychomotor": True,
-  u"psychopharmacological": True,
-  u"psychosexual": True,
-  u"psychotherapeutic": True,
-  u"pteridological": True,
-  u"ptolemaic": True,
-  u"pubertal": True,
-  u"pubic": True,
-  u"pudendal": True,
-  u"puerile": True,
-  u"puerperal": True,
-  u"pugilistic": True,
-  u"pupillary": True,
-  u"puranic": True,
-  u"purgatorial": True,
-  u"puritanical": True,
-  u"putrid": True,
-  u"pyemic": True,
-  u"pyknotic": True,
-  u"pyloric": True,
-  u"pyogenic": True,
-  u"pyrectic": True,
-  u"pyrochemical": True,
-  u"pyroelectric": True,
-  u"pyrogallic": True,
-  u"pyrogenic": True,
-  u"pyrographic": True,
-  u"pyroligneous": True,
-  u"pyrolytic": True,
-  u"pyrotechnic": True,
-  u"pyrrhic": True,
-  u"pythagorean": True,
-  u"qatari": True,
-  u"quadrangular": True,
-  u"quadraphonic": True,
-  u"quadratic": True,
-  u"qualitative": True,
-  u"quantal": True,
-  u"quantitative": True,
-  u"quartan": True,
-  u"quarterly": True,
-  u"quartzose": True,
-  u"quebecois": True,
-  u"quechuan": True,
-  u"quincentennial": True,
-  u"quintessential": True,
-  u"rabbinical": True,
-  u"rabelaisian": True,
-  u"rabid": True,
-  u"racial": True,
-  u"radial-ply": True,
-  u"radial": True,
-  u"radical": True,
-  u"radiographic": True,
-  u"radiological": True,
-  u"radiotelephonic": True,
-  u"radio": True,
-  u"raptorial": True,
-  u"rastafarian": True,
-  u"rationalistic": True,
-  u"rationalist": True,
-  u"rational": True,
-  u"ratlike": True,
-  u"ratty": True,
-  u"rayless": True,
-  u"realistic": True,
-  u"real-time": True,
-  u"recessional": True,
-  u"recessionary": True,
-  u"recoilless": True,
-  u"recombinant": True,
-  u"recreational": True,
-  u"rectal": True,
-  u"rectosigmoid": True,
-  u"redemptive": True,
-  u"reductionist": True,
-  u"refractive": True,
-  u"refractory-lined": True,
-  u"regimental": True,
-  u"regional": True,
-  u"relativistic": True,
-  u"rembrandtesque": True,
-  u"rental": True,
-  u"reptilian": True,
-  u"republican": True,
-  u"residential": True,
-  u"residual": True,
-  u"residuary": True,
-  u"resinated": True,
-  u"resinlike": True,
-  u"resistive": True,
-  u"respiratory": True,
-  u"responsive": True,
-  u"retentive": True,
-  u"retinal": True,
-  u"revenant": True,
-  u"reversionary": True,
-  u"revivalistic": True,
-  u"revolutionary": True,
-  u"rhenish": True,
-  u"rheologic": True,
-  u"rhetorical": True,
-  u"rhinal": True,
-  u"rhizoidal": True,
-  u"rhizomatous": True,
-  u"rhodesian": True,
-  u"rhombic": True,
-  u"rhomboid": True,
-  u"rickettsial": True,
-  u"riemannian": True,
-  u"riparian": True,
-  u"ritualistic": True,
-  u"ritual": True,
-  u"robotic": True,
-  u"rocket-propelled": True,
-  u"roentgenographic": True,
-  u"romaic": True,
-  u"romance": True,
-  u"romanian": True,
-  u"romansh": True,
-  u"romantic": True,
-  u"roman": True,
-  u"romany": True,
-  u"rooseveltian": True,
-  u"ropy": True,
-  u"rosaceous": True,
-  u"rosicrucian": True,
-  u"rotary": True,
-  u"rotational": True,
-  u"rotatory": True,
-  u"rousseauan": True,
-  u"royal": True,
-  u"ruminant": True,
-  u"runic": True,
-  u"rupestral": True,
-  u"rural": True,
-  u"ruritanian": True,
-  u"russian": True,
-  u"rwandan": True,
-  u"sabahan": True,
-  u"sabbatarian": True,
-  u"sabbatical": True,
-  u"sabine": True,
-  u"saccadic": True,
-  u"sacculated": True,
-  u"sacerdotal": True,
-  u"sacral": True,
-  u"sacramental": True,
-  u"sacrificial": True,
-  u"sadducean": True,
-  u"sadomasochistic": True,
-  u"saharan": True,
-  u"salamandriform": True,
-  u"salivary": True,
-  u"salvadoran": True,
-  u"salvific": True,
-  u"samoan": True,
-  u"san_marinese": True,
-  u"sapiens": True,
-  u"saponaceous": True,
-  u"sapphirine": True,
-  u"saprobic": True,
-  u"saprophytic": True,
-  u"sarawakian": True,
-  u"sarcolemmal": True,
-  u"sarcolemmic": True,
-  u"sarcosomal": True,
-  u"sardinian": True,
-  u"sartorial": True,
-  u"satanic": True,
-  u"satyric": True,
-  u"saudi-arabian": True,
-  u"saurian": True,
-  u"saxicolous": True,
-  u"saxon": True,
-  u"scalar": True,
-  u"scalene": True,
-  u"scalic": True,
-  u"scandinavian": True,
-  u"scapular": True,
-  u"scapulohumeral": True,
-  u"scenic": True,
-  u"schismatic": True,
-  u"schizoid": True,
-  u"scholastic": True,
-  u"sciatic": True,
-  u"scientific": True,
-  u"sclerotic": True,
-  u"scopal": True,
-  u"scorbutic": True,
-  u"scotomatous": True,
-  u"scots": True,
-  u"scriptural": True,
-  u"scrotal": True,
-  u"sculptural": True,
-  u"scurfy": True,
-  u"scythian": True,
-  u"secretarial": True,
-  u"secretory": True,
-  u"sectarian": True,
-  u"sectional": True,
-  u"sectorial": True,
-  u"secular": True,
-  u"sedimentary": True,
-  u"seismological": True,
-  u"self-aggrandizing": True,
-  u"self-induced": True,
-  u"self-limited": True,
-  u"self-pollinating": True,
-  u"self-renewing": True,
-  u"self-service": True,
-  u"self": True,
-  u"seljuk": True,
-  u"semantic": True,
-  u"semiautobiographical": True,
-  u"semicentennial": True,
-  u"seminal": True,
-  u"seminiferous": True,
-  u"semiotic": True,
-  u"semiparasitic": True,
-  u"semiterrestrial": True,
-  u"semite": True,
-  u"semitic": True,
-  u"semi-tuberous": True,
-  u"senatorial": True,
-  u"senecan": True,
-  u"senegalese": True,
-  u"sensational": True,
-  u"sensorimotor": True,
-  u"sensorineural": True,
-  u"sentential": True,
-  u"sepaloid": True,
-  u"septal": True,
-  u"septic": True,
-  u"sepulchral": True,
-  u"seraphic": True,
-  u"serbian": True,
-  u"serial": True,
-  u"sericultural": True,
-  u"serologic": True,
-  u"serous": True,
-  u"servomechanical": True,
-  u"sexagesimal": True,
-  u"sex-limited": True,
-  u"sex-linked": True,
-  u"sexual": True,
-  u"seychellois": True,
-  u"shakedown": True,
-  u"shakespearian": True,
-  u"shallow-draft": True,
-  u"shamanist": True,
-  u"shambolic": True,
-  u"shaped": True,
-  u"sharp-pointed": True,
-  u"shavian": True,
-  u"shelflike": True,
-  u"shinto": True,
-  u"shona": True,
-  u"short-handled": True,
-  u"short-order": True,
-  u"shouldered": True,
-  u"shrubby": True,
-  u"shuha": True,
-  u"siberian": True,
-  u"sicilian": True,
-  u"sidearm": True,
-  u"sidereal": True,
-  u"side-to-side": True,
-  u"sierra_leonean": True,
-  u"sigmoid": True,
-  u"sikh": True,
-  u"siliceous": True,
-  u"simian": True,
-  u"singaporean": True,
-  u"singhalese": True,
-  u"single-stranded": True,
-  u"sinhala": True,
-  u"sinitic": True,
-  u"siouan": True,
-  u"sisyphean": True,
-  u"skeletal": True,
-  u"skinnerian": True,
-  u"skinny": True,
-  u"slavonic": True,
-  u"slav": True,
-  u"slovakian": True,
-  u"slovenian": True,
-  u"small-capitalization": True,
-  u"snow-capped": True,
-  u"social": True,
-  u"sociobiologic": True,
-  u"sociocultural": True,
-  u"socioeconomic": True,
-  u"sociolinguistic": True,
-  u"sociological": True,
-  u"sociopathic": True,
-  u"socratic": True,
-  u"soft-finned": True,
-  u"soft-nosed": True,
-  u"solanaceous": True,
-  u"solar": True,
-  u"solomonic": True,
-  u"somalian": True,
-  u"somatosensory": True,
-  u"sophistic": True,
-  u"soteriological": True,
-  u"sotho": True,
-  u"south_african": True,
-  u"south_american": True,
-  u"south_korean": True,
-  u"soviet": True,
-  u"spanish": True,
-  u"spartan": True,
-  u"spastic": True,
-  u"spatial": True,
-  u"spatiotemporal": True,
-  u"specialistic": True,
-  u"specific": True,
-  u"spectral": True,
-  u"spectrographic": True,
-  u"spectrometric": True,
-  u"spectroscopic": True,
-  u"spermicidal": True,
-  u"spermous": True,
-  u"spherical": True,
-  u"sphingine": True,
-  u"spicate": True,
-  u"spinal": True,
-  u"spiny-finned": True,
-  u"spiritualistic": True,
-  u"splashy": True,
-  u"splenic": True,
-  u"splintery": True,
-  u"spondaic": True,
-  u"sporogenous": True,
-  u"sporting": True,
-  u"sportive": True,
-  u"spousal": True,
-  u"spring-loaded": True,
-  u"squint-eyed": True,
-  u"squinty": True,
-  u"sri_lankan": True,
-  u"stagflationary": True,
-  u"stainable": True,
-  u"stalinist": True,
-  u"stannic": True,
-  u"staphylococcal": True,
-  u"statistical": True,
-  u"statuary": True,
-  u"statutory": True,
-  u"stearic": True,
-  u"stellar": True,
-  u"stemmatic": True,
-  u"stenographic": True,
-  u"stereoscopic": True,
-  u"sternal": True,
-  u"sternutatory": True,
-  u"steroidal": True,
-  u"stigmatic": True,
-  u"stingless": True,
-  u"stipendiary": True,
-  u"stoichiometric": True,
-  u"stoic": True,
-  u"stoloniferous": True,
-  u"stomatal": True,
-  u"stored-program": True,
-  u"stovepiped": True,
-  u"strategic": True,
-  u"stravinskyan": True,
-  u"streptococcal": True,
-  u"striate": True,
-  u"structural": True,
-  u"subarctic": True,
-  u"subatomic": True,
-  u"subclavian": True,
-  u"subclinical": True,
-  u"subcortical": True,
-  u"subdural": True,
-  u"subjunctive": True,
-  u"sublingual": True,
-  u"sublittoral": True,
-  u"sublunar": True,
-  u"suborbital": True,
-  u"sub-saharan": True,
-  u"substantival": True,
-  u"subtropical": True,
-  u"suburban": True,
-  u"succinic": True,
-  u"suctorial": True,
-  u"sudanese": True,
-  u"sufi": True,
-  u"sulcate": True,
-  u"sulfurous": True,
-  u"sulphuretted": True,
-  u"sulphuric": True,
-  u"sumatran": True,
-  u"sumerian": True,
-  u"superficial": True,
-  u"supernaturalist": True,
-  u"supervisory": True,
-  u"suppurative": True,
-  u"supraorbital": True,
-  u"surficial": True,
-  u"surgical": True,
-  u"sustainable": True,
-  u"sustentacular": True,
-  u"swazi": True,
-  u"swedish": True,
-  u"swiss": True,
-  u"syllabic": True,
-  u"syllogistic": True,
-  u"symbolic": True,
-  u"sympathetic": True,
-  u"symphonic": True,
-  u"symptomatic": True,
-  u"synaptic": True,
-  u"syncretic": True,
-  u"synergistic": True,
-  u"synesthetic": True,
-  u"synoptic": True,
-  u"synovial": True,
-  u"syntactic": True,
-  u"syntagmatic": True,
-  u"syphilitic": True,
-  u"syrian": True,
-  u"systolic": True,
-  u"tabular": True,
-  u"tactical": True,
-  u"tahitian": True,
-  u"taiwanese": True,
-  u"tajikistani": True,
-  u"tamil": True,
-  u"tangential": True,
-  u"tannic": True,
-  u"tantric": True,
-  u"tanzanian": True,
-  u"taoist": True,
-  u"tarsal": True,
-  u"tartaric": True,
-  u"tasmanian": True,
-  u"taurine": True,
-  u"taxonomic": True,
-  u"technical": True,
-  u"technophilic": True,
-  u"technophobic": True,
-  u"tectonic": True,
-  u"tegular": True,
-  u"telegraphic": True,
-  u"telemetered": True,
-  u"teleological": True,
-  u"telephonic": True,
-  u"tellurian": True,
-  u"telluric": True,
-  u"telocentric": True,
-  u"temperamental": True,
-  u"temporal": True,
-  u"tendinous": True,
-  u"tendril-climbing": True,
-  u"tensile": True,
-  u"tensional": True,
-  u"tentacled": True,
-  u"tentacular": True,
-  u"teratogenic": True,
-  u"terminal": True,
-  u"terminological": True,
-  u"terpsichorean": True,
-  u"territorial": True,
-  u"tertian": True,
-  u"testaceous": True,
-  u"testamentary": True,
-  u"testicular": True,
-  u"testimonial": True,
-  u"tetanic": True,
-  u"tetragonal": True,
-  u"tetrametric": True,
-  u"tetravalent": True,
-  u"teutonic": True,
-  u"texan": True,
-  u"textile": True,
-  u"textual": True,
-  u"thai": True,
-  u"thalamocortical": True,
-  u"thalassic": True,
-  u"thalloid": True,
-  u"thallophytic": True,
-  u"theatrical": True,
-  u"theban": True,
-  u"theist": True,
-  u"thematic": True,
-  u"thenal": True,
-  u"theocratic": True,
-  u"theological": True,
-  u"theosophical": True,
-  u"therapeutic": True,
-  u"thermal": True,
-  u"thermionic": True,
-  u"thermodynamic": True,
-  u"thermoelectric": True,
-  u"thermohydrometric": True,
-  u"thermometric": True,
-  u"thermostatic": True,
-  u"thespian": True,
-  u"thoreauvian": True,
-  u"thracian": True,
-  u"threaded": True,
-  u"three-wheel": True,
-  u"thyroid": True,
-  u"thyrotoxic": True,
-  u"tibetan": True,
-  u"tibial": True,
-  u"tidal": True,
-  u"tiered": True,
-  u"time-release": True,
-  u"timorese": True,
-  u"tinny": True,
-  u"titular": True,
-  u"tobagonian": True,
-  u"togolese": True,
-  u"toll-free": True,
-  u"tomentose": True,
-  u"tongan": True,
-  u"tonic": True,
-  u"tonsorial": True,
-  u"topical": True,
-  u"topographical": True,
-  u"topological": True,
-  u"toroidal": True,
-  u"torrential": True,
-  u"tortious": True,
-  u"totalitarian": True,
-  u"totemic": True,
-  u"totipotent": True,
-  u"toxicological": True,
-  u"trabecular": True,
-  u"tracheal": True,
-  u"tractive": True,
-  u"tragicomic": True,
-  u"tragic": True,
-  u"transactinide": True,
-  u"transatlantic": True,
-  u"transcendental": True,
-  u"transcultural": True,
-  u"transdermal": True,
-  u"transitional": True,
-  u"translational": True,
-  u"translunar": True,
-  u"transoceanic": True,
-  u"transpolar": True,
-  u"transuranic": True,
-  u"trapezoidal": True,
-  u"traumatic": True,
-  u"triangulate": True,
-  u"triassic": True,
-  u"tribal": True,
-  u"tricentenary": True,
-  u"trigonometric": True,
-  u"trihydroxy": True,
-  u"trinidadian": True,
-  u"triumphal": True,
-  u"trivalent": True,
-  u"trochaic": True,
-  u"trojan": True,
-  u"trophic": True,
-  u"trophoblastic": True,
-  u"trophotropic": True,
-  u"tropical": True,
-  u"tubal": True,
-  u"tubercular": True,
-  u"tuberculate": True,
-  u"tuberculoid": True,
-  u"tuberous": True,
-  u"tudor": True,
-  u"tunisian": True,
-  u"turbinate": True,
-  u"turkic": True,
-  u"turkish": True,
-  u"turkmen": True,
-  u"tuscan": True,
-  u"tutorial": True,
-  u"two-humped": True,
-  u"two-wheel": True,
-  u"tympanic": True,
-  u"tympanitic": True,
-  u"typographic": True,
-  u"tyrolean": True,
-  u"ugandan": True,
-  u"ukrainian": True,
-  u"ulcerative": True,
-  u"ulnar": True,
-  u"ultramicroscopic": True,
-  u"ultramontane": True,
-  u"umbellate": True,
-  u"umbelliferous": True,
-  u"umbelliform": True,
-  u"umbilical": True,
-  u"uncial": True,
-  u"undescended": True,
-  u"undulatory": True,
-  u"unfretted": True,
-  u"ungual": True,
-  u"uniate": True,
-  u"unicellular": True,
-  u"unifilar": True,
-  u"uninucleate": True,
-  u"uniovular": True,
-  u"unitarian": True,
-  u"unitary": True,
-  u"universalistic": True,
-  u"unmyelinated": True,
-  u"unpigmented": True,
-  u"unthematic": True,
-  u"urban": True,
-  u"urceolate": True,
-  u"urethral": True,
-  u"uricosuric": True,
-  u"uric": True,
-  u"urinary": True,
-  u"urogenital": True,
-  u"ursine": True,
-  u"uruguayan": True,
-  u"usufructuary": True,
-  u"uterine": True,
-  u"utopian": True,
-  u"uveal": True,
-  u"uvular": True,
-  u"uzbekistani": True,
-  u"vacuolate": True,
-  u"vagal": True,
-  u"vaginal": True,
-  u"valedictory": True,
-  u"valent": True,
-  u"valetudinarian": True,
-  u"valved": True,
-  u"valvular": True,
-  u"vanilla": True,
-  u"varicelliform": True,
-  u"variolar": True,
-  u"vascular": True,
-  u"vasomotor": True,
-  u"vedic": True,
-  u"vegetative": True,
-  u"vehicular": True,
-  u"veinal": True,
-  u"velar": True,
-  u"venetian": True,
-  u"venezuelan": True,
-  u"venous": True,
-  u"ventilatory": True,
-  u"ventricular": True,
-  u"verbal": True,
-  u"vertebral": True,
-  u"vertical": True,
-  u"vesical": True,
-  u"vesicular": True,
-  u"vestal": True,
-  u"vestiary": True,
-  u"vestibular": True,
-  u"vestmental": True,
-  u"veterinary": True,
-  u"viatical": True,
-  u"vibrational": True,
-  u"vibrionic": True,
-  u"vicarial": True,
-  u"vicennial": True,
-  u"vice-presidential": True,
-  u"viceregal": True,
-  u"vicinal": True,
-  u"victorian": True,
-  u"viennese": True,
-  u"vietnamese": True,
-  u"vigesimal": True,
-  u"vinous": True,
-  u"viral": True,
-  u"virginal": True,
-  u"viricidal": True,
-  u"virological": True,
-  u"visceral": True,
-  u"viscometric": True,
-  u"vitiliginous": True,
-  u"vitreous": True,
-  u"vocalic": True,
-  u"vocal": True,
-  u"vocational": True,
-  u"vocative": True,
-  u"volcanic": True,
-  u"voltaic": True,
-  u"voltarian": True,
-  u"volumed": True,
-  u"volumetric": True,
-  u"voyeuristic": True,
-  u"vulpine": True,
-  u"vulvar": True,
-  u"wagnerian": True,
-  u"washingtonian": True,
-  u"waxen": True,
-  u"weatherly": True,
-  u"wedge-shaped": True,
-  u"welsh": True,
-  u"west_african": True,
-  u"wheaten": True,
-  u"wiccan": True,
-  u"wilsonian": True,
-  u"wiry": True,
-  u"wittgensteinian": True,
-  u"wolflike": True,
-  u"woolen": True,
-  u"wordsworthian": True,
-  u"wysiwyg": True,
-  u"xerographic": True,
-  u"x-linked": True,
-  u"yeasty": True,
-  u"yeatsian": True,
-  u"yemeni": True,
-  u"yogistic": True,
-  u"yugoslavian": True,
-  u"yuman": True,
-  u"zairean": True,
-  u"zambian": True,
-  u"zapotec": True,
-  u"zenithal": True,
-  u"zero": True,
-  u"zimbabwean": True,
-  u"zionist": True,
-  u"zodiacal": True,
-  u"zoic": True,
-  u"zolaesque": True,
-  u"zonal": True,
-  u"zoological": True,
-  u"zoonotic": True,
-  u"zoroastrian": True,
-  u"zygomatic": True,
-  u"zygotic": True,
-  u"zymoid": True,
-  u"zymotic": True
-}
+from adjr_tables import ADJR_DIRECTORY
+from adjr_tables import LazyADJRTable
+from adjr_tables import adjr_stem_ending_counts
+from adjr_tables import load_adjr_file
+from os import path
 
 ################################################################################
-english_stemmed_adjr = {}
-english_adjr_stem_ending_counts = {}
+# English relational adjectives (from WordNet)
+#
+# The tables are loaded from the precomputed data file on first use.
+
+ENGLISH_ADJR_FILEPATH = path.join(ADJR_DIRECTORY, "wordnet_adjr")
+
+english_stemmer = None
+english_adjr_tables = None
+
+def english_adjr_stem(adjr):
+  """
+  Gives the stem and the stem ending of an english relational adjective.
+
+  @param    adjr: The relational adjective.
+  @type     adjr: C{string}
+
+  @return:  The stem and the stem ending of the adjective.
+  @rtype:   C{tuple(string, string)}
+  """
+
+  global english_stemmer
+
+  if english_stemmer == None:
+    from nltk.stem import PorterStemmer
+
+    english_stemmer = PorterStemmer()
 
-stemmer = stem.PorterStemmer()
-for adjr, value in english_adjr.items():
-  stem = stemmer.stem(adjr)
+  stem = english_stemmer.stem(adjr)
   stem_ending = ""
   if adjr.startswith(stem):
     stem_ending = adjr.split(stem, 1)[1]
-  #-----------------------------------------------------------------------------
-  english_stemmed_adjr[stem] = value
-  if stem_ending != "":
-    if stem_ending not in english_adjr_stem_ending_counts:
-      english_adjr_stem_ending_counts[stem_ending] = 0.0
-    english_adjr_stem_ending_counts[stem_ending] += 1.0
 
+  return stem, stem_ending
+
+def load_english_adjr_tables():
+  """
+  Loads the english relational adjective tables, if they are not loaded yet.
+
+  @return:  The relational adjectives, the relational adjectives indexed by
+            stem and the stem ending counts.
+  @rtype:   C{tuple(dict(string, bool), dict(string, bool), dict(string,
+            float))}
+  """
+
+  global english_adjr_tables
+
+  if english_adjr_tables == None:
+    adjrs = load_adjr_file(ENGLISH_ADJR_FILEPATH, english_adjr_stem)
+    adjr_dic = {}
+    stemmed_adjr = {}
+
+    for adjr, stem, stem_ending in adjrs:
+      adjr_dic[adjr] = True
+      stemmed_adjr[stem] = True
+
+    english_adjr_tables = (adjr_dic,
+                           stemmed_adjr,
+                           adjr_stem_ending_counts(adjrs))
+
+  return english_adjr_tables
+
+# the tables, as dictionaries loaded on first access
+english_adjr = LazyADJRTable(load_english_adjr_tables, 0)
+english_stemmed_adjr = LazyADJRTable(load_english_adjr_tables, 1)
+english_adjr_stem_ending_counts = LazyADJRTable(load_english_adjr_tables, 2)